@@ -1,14 +1,23 @@
+from decouple import config
+from flask import request
+
 from config import create_app
-from db import db
+from db import db, has_writes
+
+# Methods that should not change anything. They are only committed when they did, e.g. a first GET creating the cart.
+SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
 
-app = create_app()
+app = create_app(config("APP_CONFIG", default="config.DevelopmentConfig"))
 
 
 @app.after_request
 def return_resp(resp):
-    db.session.commit()
+    # A read-only request skips the commit, and with it the flush and the expiry of everything it loaded. The
+    # session's teardown ends its transaction instead.
+    if request.method not in SAFE_METHODS or has_writes(db.session):
+        db.session.commit()
     return resp
 
 
 if __name__ == "__main__":
-    app.run(debug=True)
+    app.run(debug=app.debug)
@@ -0,0 +1,91 @@
+"""Compare loading catalog listings as full JacketModel entities with the column-projected rows the catalog uses now
+(managers.catalog.LIST_COLUMNS).
+
+The script creates the tables with --jackets jackets in the database configured in .env / the environment (DB_NAME
+etc.), and drops them again at the end, so point it at a scratch database. Each case loads the listing in a fresh
+session and serializes it like GET /jacket does:
+
+  page     one catalog page of MAX_PAGE_SIZE jackets, --pages times
+  all      every jacket at once, like a large stream batch
+
+Times are the best of --repeat runs; memory is the peak of Python allocations while loading (tracemalloc, measured
+in a separate, untimed run).
+
+    python benchmarks/catalog_rows.py [--jackets 10000] [--pages 50] [--repeat 5]
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from common.constants import MAX_PAGE_SIZE  # noqa: E402
+from config import create_app  # noqa: E402
+from db import db  # noqa: E402
+from managers.catalog import LIST_COLUMNS  # noqa: E402
+from models import JacketModel, JacketSizes, JacketStatus, UserModel, UserRole  # noqa: E402
+from schemas.responses.jacket import jacket_serializer  # noqa: E402
+
+
+def seed(count):
+    db.create_all()
+    user = UserModel(first_name="Load", last_name="Test", email="load@test.com", phone="100000", password="password",
+                     iban="BG80BNBG96611020345678", role=UserRole.creator, wise_key="token")
+    db.session.add(user)
+    db.session.flush()
+    sizes = list(JacketSizes)
+    db.session.execute(JacketModel.__table__.insert(), [
+        dict(photo_url=f"https://example.com/{number}.jpg", brand="Marccain",
+             description="A warm, well made jacket. " * 20, size=sizes[number % len(sizes)], price=10 + number % 500,
+             creator_id=user.id, pic_hash=f"{number:064x}", status=JacketStatus.available, version=1,
+             thumbnails={"webp": {"320": f"https://example.com/{number}-320.webp"}})
+        for number in range(count)
+    ])
+    db.session.commit()
+
+
+def load(columns, limit, pages):
+    for _ in range(pages):
+        query = db.session.query(*columns).filter(JacketModel.status == JacketStatus.available)
+        jacket_serializer.dump(query.order_by(JacketModel.created_on, JacketModel.id).limit(limit).all(), many=True)
+        db.session.remove()
+
+
+def measure(columns, limit, pages, repeat):
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        load(columns, limit, pages)
+        times.append(time.perf_counter() - started)
+    tracemalloc.start()
+    load(columns, limit, 1)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return min(times), peak
+
+
+def main(args):
+    app = create_app("config.ProductionConfig")
+    with app.app_context():
+        seed(args.jackets)
+        try:
+            cases = {"page": (MAX_PAGE_SIZE, args.pages), "all": (args.jackets, 1)}
+            print(f"{args.jackets} jackets, best of {args.repeat} ('page' is {args.pages} pages of {MAX_PAGE_SIZE})")
+            print(f"{'case':>5} {'loaded as':>9} {'ms':>8} {'peak MB':>8}")
+            for name, (limit, pages) in cases.items():
+                for label, columns in (("entities", (JacketModel,)), ("rows", LIST_COLUMNS)):
+                    seconds, peak = measure(columns, limit, pages, args.repeat)
+                    print(f"{name:>5} {label:>9} {seconds * 1000:>8.1f} {peak / 2 ** 20:>8.2f}")
+        finally:
+            db.session.remove()
+            db.drop_all()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--jackets", type=int, default=10000)
+    parser.add_argument("--pages", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=5)
+    main(parser.parse_args())
@@ -0,0 +1,89 @@
+"""Compare the old temp-file photo ingestion with the streaming Base64Stream pipeline.
+
+Each run happens in a fresh subprocess so peak RSS is not polluted by earlier runs. The upload is simulated by
+reading the source in multipart-sized parts into a sink, which is what boto3 does with either source. The streaming
+pipeline is the one JacketManager._process_image runs: the photo is hashed while it uploads. The copy to its
+content-hash key that follows happens inside S3 and is not measured. Besides the RSS growth, the peak of Python
+allocations made by the pipeline is reported (tracemalloc, measured in a second, untimed run), which is not hidden by
+memory the allocator already holds.
+
+    python benchmarks/image_ingestion.py [sizes in MB, default 10 25 50]
+"""
+import base64
+import hashlib
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from utils.encryptor import Base64Stream  # noqa: E402
+
+PART_SIZE = 8 * 1024 * 1024
+
+
+def upload(fileobj):
+    while fileobj.read(PART_SIZE):
+        pass
+
+
+def temp_file_pipeline(encoded):
+    # What JacketManager did before: decode everything, write it out, hash it, then let boto3 read it again.
+    with tempfile.NamedTemporaryFile(delete=False) as file:
+        file.write(base64.b64decode(encoded.encode("utf-8")))
+    hasher = hashlib.sha256()
+    with open(file.name, "rb") as photo:
+        while True:
+            data = photo.read(8192)
+            if not data:
+                break
+            hasher.update(data)
+    with open(file.name, "rb") as photo:
+        upload(photo)
+    os.remove(file.name)
+    return hasher.hexdigest()
+
+
+def streaming_pipeline(encoded):
+    stream = Base64Stream(encoded)
+    upload(stream)
+    return stream.hexdigest()
+
+
+PIPELINES = {"temp-file": temp_file_pipeline, "streaming": streaming_pipeline}
+
+
+def run_child(pipeline, size_mb):
+    encoded = base64.b64encode(os.urandom(size_mb * 1024 * 1024)).decode()
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    started = time.perf_counter()
+    PIPELINES[pipeline](encoded)
+    elapsed = time.perf_counter() - started
+    # ru_maxrss is in KiB on Linux.
+    rss = (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - baseline) / 1024
+
+    tracemalloc.start()
+    PIPELINES[pipeline](encoded)
+    allocated = tracemalloc.get_traced_memory()[1] / 1024 / 1024
+    tracemalloc.stop()
+    print(f"{elapsed:.3f} {rss:.1f} {allocated:.1f}")
+
+
+def main(sizes):
+    print(f"{'size':>6} {'pipeline':>10} {'seconds':>8} {'RSS growth MiB':>15} {'peak alloc MiB':>15}")
+    for size_mb in sizes:
+        for pipeline in PIPELINES:
+            output = subprocess.check_output([sys.executable, __file__, "--child", pipeline, str(size_mb)], text=True)
+            elapsed, rss, allocated = output.split()
+            print(f"{size_mb:>4}MB {pipeline:>10} {elapsed:>8} {rss:>15} {allocated:>15}")
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--child"]:
+        run_child(sys.argv[2], int(sys.argv[3]))
+    else:
+        main([int(size) for size in sys.argv[1:]] or [10, 25, 50])
@@ -0,0 +1,84 @@
+"""A local stand-in for the Wise API endpoints used by WiseService, with a fixed latency per call.
+
+    python benchmarks/mock_wise.py [port, default 8099] [latency in ms, default 50]
+"""
+import itertools
+import json
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+ROUTES = [
+    ("GET", re.compile(r"^/v1/profiles$"), lambda ids: [{"id": 101, "type": "business"}, {"id": 100, "type": "personal"}]),
+    ("POST", re.compile(r"^/v2/quotes$"), lambda ids: {"id": f"quote-{next(ids)}"}),
+    ("POST", re.compile(r"^/v1/accounts$"), lambda ids: {"id": next(ids)}),
+    ("POST", re.compile(r"^/v1/transfers$"), lambda ids: {"id": next(ids)}),
+    ("POST", re.compile(r"^/v3/profiles/\d+/transfers/\d+/payments$"), lambda ids: {"status": "COMPLETED"}),
+]
+
+
+class MockWiseServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, port=0, latency=0.05):
+        super().__init__(("127.0.0.1", port), MockWiseHandler)
+        self.latency = latency
+        self.ids = itertools.count(1)
+        self.calls = Counter()
+        self.lock = threading.Lock()
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def start(self):
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+
+class MockWiseHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes. Without this, Nagle and delayed ACKs add ~40ms to every response
+    # on a kept-alive connection, which real servers do not.
+    disable_nagle_algorithm = True
+
+    def _handle(self, method):
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+        time.sleep(self.server.latency)
+
+        for route_method, pattern, respond in ROUTES:
+            if route_method == method and pattern.match(self.path):
+                with self.server.lock:
+                    self.server.calls[pattern.pattern] += 1
+                    body = json.dumps(respond(self.server.ids)).encode()
+                self.send_response(200)
+                break
+        else:
+            body = b"{}"
+            self.send_response(404)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        self._handle("GET")
+
+    def do_POST(self):
+        self._handle("POST")
+
+    def log_message(self, format, *args):
+        pass
+
+
+if __name__ == "__main__":
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else 8099
+    latency = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    server = MockWiseServer(port, latency / 1000)
+    print(f"Mock Wise listening on {server.url} with {latency}ms latency")
+    server.serve_forever()
@@ -0,0 +1,96 @@
+"""Measure the CPU time spent validating the bodies of POST /jacket and POST /auth/register, per request.
+
+  before   how requests used to be validated: restx validated /auth bodies against the JSON schema of the model
+           (validate=True), then validate_schema built a new schema, converted the size by hand, validated and threw
+           the result away, and the handler read the raw JSON again
+  after    validate_schema as it is: one load with a schema built once, the typed data is left on g.request_data
+
+Each request runs in its own request context, so the JSON is parsed every time, like in the app. The cost of the
+request context alone is measured separately and subtracted. No database is needed.
+
+    python benchmarks/request_validation.py [--requests 5000] [--photo-kb 100]
+"""
+import argparse
+import base64
+import os
+import sys
+import time
+
+from flask import Flask, g, request
+from marshmallow_enum import EnumField
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from models import JacketSizes  # noqa: E402
+from models.models_restx import auth_model  # noqa: E402
+from schemas.requests.auth import RegisterSchemaRequest  # noqa: E402
+from schemas.requests.jacket import JacketSchemaRequest  # noqa: E402
+from utils.decorators import validate_schema  # noqa: E402
+
+
+class OldJacketSchemaRequest(JacketSchemaRequest):
+    # The size field as it was, which accepted the JacketSizes member the old validate_schema put in the body.
+    size = EnumField(JacketSizes, by_value=True)
+
+
+def before(schema_class, restx_model=None):
+    def handler():
+        data = request.get_json()
+        if restx_model is not None:
+            restx_model.validate(data)
+        if "size" in data:
+            data["size"] = JacketSizes[data["size"]]
+        errors = schema_class().validate(data)
+        assert not errors, errors
+        return request.get_json()
+
+    return handler
+
+
+def after(schema_class):
+    return validate_schema(schema_class)(lambda: g.request_data)
+
+
+def cpu_per_request(app, payload, handler, count):
+    started = time.process_time()
+    for _ in range(count):
+        with app.test_request_context(method="POST", json=payload):
+            if handler:
+                handler()
+    return (time.process_time() - started) / count
+
+
+def main(args):
+    app = Flask(__name__)
+    photo = base64.b64encode(os.urandom(args.photo_kb * 1024)).decode()
+    cases = {
+        "POST /jacket": (
+            {"photo": photo, "extension": "jpg", "brand": "Marccain", "description": "This is a great jacket!",
+             "size": "l", "price": 100},
+            # restx never validated jacket bodies (validate=False).
+            before(OldJacketSchemaRequest),
+            after(JacketSchemaRequest),
+        ),
+        "POST /auth/register": (
+            {"first_name": "Test", "last_name": "Testov", "email": "test@test.com", "phone": "11111111111111",
+             "password": "12345@assd1", "role": "creator", "iban": "DE89370400440532013000",
+             "wise_key": "8db48ad2-7b7c-44d1-bcf6-fc300481c851"},
+            before(RegisterSchemaRequest, auth_model),
+            after(RegisterSchemaRequest),
+        ),
+    }
+
+    print(f"{args.requests} requests per case, {args.photo_kb} KB photo, CPU time per request")
+    print(f"{'endpoint':>20} {'before us':>10} {'after us':>9} {'speedup':>8}")
+    for name, (payload, old, new) in cases.items():
+        baseline = cpu_per_request(app, payload, None, args.requests)
+        old_cpu = cpu_per_request(app, payload, old, args.requests) - baseline
+        new_cpu = cpu_per_request(app, payload, new, args.requests) - baseline
+        print(f"{name:>20} {old_cpu * 1e6:>10.1f} {new_cpu * 1e6:>9.1f} {old_cpu / new_cpu:>7.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--photo-kb", type=int, default=100)
+    main(parser.parse_args())
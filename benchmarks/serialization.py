@@ -0,0 +1,78 @@
+"""Compare marshmallow's dump of jacket responses with the compiled serializer (schemas.compiled.CompiledSchema).
+
+No database is needed: the jackets are built in memory, with thumbnails, like a catalog listing loaded from it.
+
+  list     a listing of all the jackets, as JSON
+  cart     a shopping cart holding all the jackets, as JSON
+  page     20 jackets, one catalog page; the marshmallow side builds its schema per call, as the resources used to
+
+The outputs are checked to be identical before anything is timed. Times are the best of --repeat runs.
+
+    python benchmarks/serialization.py [--jackets 10000] [--repeat 5]
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from models import JacketModel, JacketSizes, ShoppingCartModel  # noqa: E402
+from schemas.responses.jacket import JacketSchemaResponse, jacket_serializer  # noqa: E402
+from schemas.responses.shopping_cart import ShoppingCartSchemaResponse, shopping_cart_serializer  # noqa: E402
+
+
+def make_jackets(count):
+    created_on = datetime(2023, 5, 1, 12, 0, 0, 123456)
+    sizes = list(JacketSizes)
+    return [
+        JacketModel(id=number, photo_url=f"https://example.com/{number}.jpg", brand="Marccain",
+                    description="This is a great jacket!", size=sizes[number % len(sizes)], price=10 + number % 500,
+                    created_on=created_on + timedelta(minutes=number),
+                    thumbnails={"webp": {"320": f"https://example.com/{number}-320.webp",
+                                         "640": f"https://example.com/{number}-640.webp"}})
+        for number in range(1, count + 1)
+    ]
+
+
+def best_of(repeat, func):
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - started)
+    return min(times)
+
+
+def main(args):
+    jackets = make_jackets(args.jackets)
+    shopping_cart = ShoppingCartModel(id=1, user_id=1, amount=sum(jacket.price for jacket in jackets))
+    shopping_cart.jackets = jackets
+    page = jackets[:20]
+    page_calls = max(1, args.jackets // 20)
+
+    cases = {
+        "list": (lambda: json.dumps(JacketSchemaResponse().dump(jackets, many=True)),
+                 lambda: json.dumps(jacket_serializer.dump(jackets, many=True))),
+        "cart": (lambda: json.dumps(ShoppingCartSchemaResponse().dump(shopping_cart)),
+                 lambda: json.dumps(shopping_cart_serializer.dump(shopping_cart))),
+        "page": (lambda: [json.dumps(JacketSchemaResponse().dump(page, many=True)) for _ in range(page_calls)],
+                 lambda: [json.dumps(jacket_serializer.dump(page, many=True)) for _ in range(page_calls)]),
+    }
+
+    print(f"{args.jackets} jackets, best of {args.repeat} ('page' is {page_calls} calls of 20 jackets)")
+    print(f"{'case':>6} {'marshmallow ms':>15} {'compiled ms':>12} {'speedup':>8}")
+    for name, (marshmallow_dump, compiled_dump) in cases.items():
+        assert marshmallow_dump() == compiled_dump(), f"{name}: outputs differ"
+        slow = best_of(args.repeat, marshmallow_dump)
+        fast = best_of(args.repeat, compiled_dump)
+        print(f"{name:>6} {slow * 1000:>15.1f} {fast * 1000:>12.1f} {slow / fast:>7.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--jackets", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    main(parser.parse_args())
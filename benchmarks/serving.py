@@ -0,0 +1,142 @@
+"""Load-test the app under the flask development server and under gunicorn (gunicorn.conf.py).
+
+Both servers run the same code against the database configured in .env / the environment (DB_NAME etc.). The
+script creates the tables with a user and some jackets, and drops them again at the end, so point it at a scratch
+database. Each server is hammered by concurrent keep-alive clients for a few seconds per endpoint:
+
+  /jacket          catalog page, mostly answered from the response cache
+  /shopping_cart   an authenticated read that goes to the database
+
+    python benchmarks/serving.py [--clients 32] [--seconds 10] [--workers N] [--threads N]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import threading
+import time
+
+import requests
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+
+ENDPOINTS = ("/jacket", "/shopping_cart")
+
+
+def seed():
+    from config import create_app
+    from db import db
+    from managers.auth import AuthManager
+    from models import JacketModel, JacketSizes, UserModel, UserRole
+    from utils.encryptor import CryptoHelper
+
+    app = create_app("config.ProductionConfig")
+    with app.app_context():
+        db.create_all()
+        user = UserModel(first_name="Load", last_name="Test", email="load@test.com", phone="100000",
+                         password="password", iban="BG80BNBG96611020345678", role=UserRole.creator,
+                         wise_key=CryptoHelper().encrypt("token"))
+        db.session.add(user)
+        db.session.flush()
+        db.session.add_all([
+            JacketModel(photo_url=f"https://example.com/{n}.jpg", brand="Marccain", description="A great jacket",
+                        size=JacketSizes.m, price=10 + n, creator_id=user.id, pic_hash=str(n))
+            for n in range(50)
+        ])
+        db.session.commit()
+        return app, AuthManager.encode_token(user)
+
+
+def drop(app):
+    from db import db
+
+    with app.app_context():
+        db.session.remove()
+        db.drop_all()
+
+
+def start(name, port, args):
+    env = {**os.environ, "APP_CONFIG": "config.ProductionConfig", "FLASK_APP": "wsgi.py",
+           "GUNICORN_BIND": f"127.0.0.1:{port}", "GUNICORN_ACCESS_LOG": "/dev/null"}
+    if args.workers:
+        env["GUNICORN_WORKERS"] = str(args.workers)
+    if args.threads:
+        env["GUNICORN_THREADS"] = str(args.threads)
+    if name == "flask run":
+        command = ["flask", "run", "--port", str(port)]
+    else:
+        command = ["gunicorn", "-c", "gunicorn.conf.py", "wsgi:app"]
+    server = subprocess.Popen(command, cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    url = f"http://127.0.0.1:{port}"
+    for _ in range(100):
+        try:
+            requests.get(f"{url}/api-docs", timeout=1)
+            return server, url
+        except requests.ConnectionError:
+            time.sleep(0.1)
+    server.terminate()
+    raise RuntimeError(f"{name} did not start")
+
+
+def hammer(url, headers, clients, seconds):
+    latencies = []
+    errors = []
+    deadline = time.perf_counter() + seconds
+
+    def client():
+        session = requests.Session()
+        own = []
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            resp = session.get(url, headers=headers)
+            own.append(time.perf_counter() - started)
+            if resp.status_code != 200:
+                errors.append(resp.status_code)
+        latencies.extend(own)
+
+    threads = [threading.Thread(target=client) for _ in range(clients)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    latencies.sort()
+    return {
+        "rps": len(latencies) / seconds,
+        "p50": statistics.median(latencies) * 1000,
+        "p99": latencies[int(len(latencies) * 0.99)] * 1000,
+        "errors": len(errors),
+    }
+
+
+def main(args):
+    app, token = seed()
+    headers = {"Authorization": f"Bearer {token}"}
+    print(f"{args.clients} clients, {args.seconds}s per endpoint")
+    print(f"{'server':>10} {'endpoint':>15} {'req/s':>8} {'p50 ms':>8} {'p99 ms':>8} {'errors':>7}")
+    try:
+        for port, name in ((5101, "flask run"), (5102, "gunicorn")):
+            server, url = start(name, port, args)
+            try:
+                for endpoint in ENDPOINTS:
+                    # Warm up connections and caches first.
+                    hammer(f"{url}{endpoint}", headers, args.clients, 1)
+                    result = hammer(f"{url}{endpoint}", headers, args.clients, args.seconds)
+                    print(f"{name:>10} {endpoint:>15} {result['rps']:>8.0f} {result['p50']:>8.1f} "
+                          f"{result['p99']:>8.1f} {result['errors']:>7}")
+            finally:
+                server.terminate()
+                server.wait()
+    finally:
+        drop(app)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--clients", type=int, default=32)
+    parser.add_argument("--seconds", type=int, default=10)
+    parser.add_argument("--workers", type=int, help="Defaults to gunicorn.conf.py, one per core plus one")
+    parser.add_argument("--threads", type=int, help="Defaults to gunicorn.conf.py")
+    main(parser.parse_args())
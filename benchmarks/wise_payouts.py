@@ -0,0 +1,98 @@
+"""Time the payouts of a purchase against a local mock Wise server.
+
+  sequential   how purchase() used to pay: one payout after another, each with a fresh WiseService that looks up
+               the profile and creates the recipient again, over new connections
+  concurrent   the same payouts on a thread pool
+  cold         OrderManager.issue_payouts on a first purchase: pooled session, nothing cached yet
+  warm         issue_payouts when the creators were paid before: profile id and recipients are cached
+
+    python benchmarks/wise_payouts.py [cart sizes, default 1 5 10] [--latency ms, default 50]
+"""
+import os
+import sys
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import requests
+from cryptography.fernet import Fernet
+from flask import Flask
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from mock_wise import MockWiseServer  # noqa: E402
+
+
+def setup(latency):
+    server = MockWiseServer(latency=latency).start()
+    os.environ["WISE_URL"] = server.url
+    os.environ.setdefault("DECRYPT_KEY", Fernet.generate_key().decode())
+    return server
+
+
+def legacy_payout(url, token, amount, full_name, iban):
+    headers = {"Content-Type": "application/json", "Authorization": f"Bearer {token}"}
+    profiles = requests.get(f"{url}/v1/profiles", headers=headers).json()
+    profile_id = [profile["id"] for profile in profiles if profile["type"] == "personal"][0]
+    quote_id = requests.post(f"{url}/v2/quotes", headers=headers, json={"targetAmount": amount}).json()["id"]
+    recipient_id = requests.post(f"{url}/v1/accounts", headers=headers,
+                                 json={"accountHolderName": full_name, "details": {"iban": iban}}).json()["id"]
+    transfer_id = requests.post(f"{url}/v1/transfers", headers=headers,
+                                json={"targetAccount": recipient_id, "quoteUuid": quote_id}).json()["id"]
+    requests.post(f"{url}/v3/profiles/{profile_id}/transfers/{transfer_id}/payments", headers=headers,
+                  json={"type": "BALANCE"})
+    return {"amount": amount}
+
+
+def main(sizes, latency):
+    server = setup(latency)
+    # Imported after setup, so any config they read sees the mock server.
+    from db import db
+    from managers.order import PAYOUT_WORKERS, OrderManager
+    from models import WiseRecipientModel
+    from utils.encryptor import CryptoHelper
+
+    app = Flask(__name__)
+    app.config.update(SQLALCHEMY_DATABASE_URI="sqlite://", SQLALCHEMY_TRACK_MODIFICATIONS=False)
+    db.init_app(app)
+
+    def sequential(token, payouts):
+        return [legacy_payout(server.url, token, *payout[:3]) for payout in payouts]
+
+    def concurrent(token, payouts):
+        with ThreadPoolExecutor(max_workers=min(PAYOUT_WORKERS, len(payouts))) as executor:
+            return list(executor.map(lambda payout: legacy_payout(server.url, token, *payout[:3]), payouts))
+
+    def pooled(token, payouts):
+        user = SimpleNamespace(wise_key=CryptoHelper().encrypt(token))
+        return OrderManager.issue_payouts(user, payouts, 1)
+
+    print(f"Mock Wise latency {latency * 1000:.0f}ms per call")
+    print(f"{'jackets':>8} {'strategy':>11} {'seconds':>8} {'Wise calls':>11}")
+    with app.app_context():
+        db.create_all()
+        for size in sizes:
+            payouts = [(10 * (n + 1), f"Creator {n}", f"BG80BNBG96611020345{n:03}", str(uuid.uuid4()))
+                       for n in range(size)]
+            # A new token per size, so the first pooled run starts without a cached profile id.
+            token = str(uuid.uuid4())
+            WiseRecipientModel.query.delete()
+            for name, strategy in (("sequential", sequential), ("concurrent", concurrent),
+                                   ("cold", pooled), ("warm", pooled)):
+                server.calls.clear()
+                started = time.perf_counter()
+                results = strategy(token, payouts)
+                elapsed = time.perf_counter() - started
+                assert [result["amount"] for result in results] == [amount for amount, *_ in payouts]
+                print(f"{size:>8} {name:>11} {elapsed:>8.3f} {sum(server.calls.values()):>11}")
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    latency = 50
+    if "--latency" in args:
+        index = args.index("--latency")
+        latency = int(args[index + 1])
+        del args[index:index + 2]
+    main([int(size) for size in args] or [1, 5, 10], latency / 1000)
@@ -0,0 +1,12 @@
+import click
+from flask.cli import with_appcontext
+
+from managers.order import OrderManager
+
+
+@click.command("resume-orders")
+@with_appcontext
+def resume_orders_command():
+    """Process every order that is due now, without waiting for a server's job queue to pick them up."""
+    count = OrderManager.resume_orders()
+    click.echo(f"Processed {count} orders")
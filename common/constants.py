@@ -1,4 +1,20 @@
 import os
 
 ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname( __file__ ), '..'))
-TEMP_DIR = os.path.join(ROOT_DIR, 'temp_files')
+
+# Catalog listing page sizes. Requests above MAX_PAGE_SIZE are clamped.
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 100
+# Rows fetched per round-trip from the server-side cursor when streaming the catalog.
+STREAM_BATCH_SIZE = 500
+
+# Jackets one bulk request to /shopping_cart/jackets may add or remove.
+MAX_CART_BATCH_SIZE = 100
+
+# Photo extensions accepted for direct uploads and the content type S3 stores them with.
+PHOTO_CONTENT_TYPES = {
+    "jpg": "image/jpeg",
+    "jpeg": "image/jpeg",
+    "png": "image/png",
+    "webp": "image/webp",
+}
@@ -1,14 +1,47 @@
-from decouple import config
+from decouple import Csv, config
 from flask import Flask
 from flask_cors import CORS
 from flask_migrate import Migrate
 from flask_restx import Api
 
+from commands import resume_orders_command
 from db import db
+from managers.auth import principal_cache
 from resources.auth import auth_ns
 from resources.jacket import jacket_ns
+from resources.metrics import metrics_ns
+from resources.order import order_ns
 from resources.routes import routes
 from resources.shopping_cart import shopping_cart_ns
+from services.cache import response_cache
+from services.jobs import job_queue
+from services.pool import MeteredQueuePool
+from services.replicas import REPLICA_PREFIX, replica_router
+from services.s3 import S3Service
+
+
+def engine_options():
+    # Every process has its own pool, so with gunicorn workers * (DB_POOL_SIZE + DB_MAX_OVERFLOW) has to fit in the
+    # database's max_connections. A pool should hold about one connection per thread that uses the database (the
+    # gunicorn threads plus the job queue workers); /metrics/pool shows whether requests wait for one.
+    return {
+        "poolclass": MeteredQueuePool,
+        "pool_size": config("DB_POOL_SIZE", default=5, cast=int),
+        "max_overflow": config("DB_MAX_OVERFLOW", default=10, cast=int),
+        "pool_timeout": config("DB_POOL_TIMEOUT", default=30, cast=float),
+        # Connections are replaced before servers or proxies in between drop them as idle.
+        "pool_recycle": config("DB_POOL_RECYCLE", default=1800, cast=int),
+        # Checks a connection with a cheap round-trip before handing it out, so a restarted database costs a
+        # reconnect rather than a failed request.
+        "pool_pre_ping": config("DB_POOL_PRE_PING", default=True, cast=bool),
+    }
+
+
+def replica_binds():
+    # DB_REPLICA_URLS: comma separated database URLs of read replicas of the primary. Read-only handlers use them,
+    # see services.replicas.
+    urls = config("DB_REPLICA_URLS", default="", cast=Csv())
+    return {f"{REPLICA_PREFIX}_{number}": url for number, url in enumerate(urls)}
 
 
 class ProductionConfig:
@@ -17,8 +50,10 @@ class ProductionConfig:
     TESTING = False
     SQLALCHEMY_DATABASE_URI = (
         f"postgresql://{config('DB_USER')}:{config('DB_PASSWORD')}"
-        f"@localhost:{config('DB_PORT')}/{config('DB_NAME')}"
+        f"@{config('DB_HOST', default='localhost')}:{config('DB_PORT')}/{config('DB_NAME')}"
     )
+    SQLALCHEMY_ENGINE_OPTIONS = engine_options()
+    SQLALCHEMY_BINDS = replica_binds()
 
 
 class DevelopmentConfig:
@@ -27,8 +62,10 @@ class DevelopmentConfig:
     TESTING = True
     SQLALCHEMY_DATABASE_URI = (
         f"postgresql://{config('DB_USER')}:{config('DB_PASSWORD')}"
-        f"@localhost:{config('DB_PORT')}/{config('DB_NAME')}"
+        f"@{config('DB_HOST', default='localhost')}:{config('DB_PORT')}/{config('DB_NAME')}"
     )
+    SQLALCHEMY_ENGINE_OPTIONS = engine_options()
+    SQLALCHEMY_BINDS = replica_binds()
 
 
 class TestConfig:
@@ -37,14 +74,24 @@ class TestConfig:
     TESTING = True
     SQLALCHEMY_DATABASE_URI = (
         f"postgresql://{config('TEST_DB_USER')}:{config('TEST_DB_PASSWORD')}"
-        f"@localhost:{config('TEST_DB_PORT')}/{config('TEST_DB_NAME')}"
+        f"@{config('TEST_DB_HOST', default='localhost')}:{config('TEST_DB_PORT')}/{config('TEST_DB_NAME')}"
     )
+    SQLALCHEMY_ENGINE_OPTIONS = engine_options()
+    # Background jobs only run when a test drains the queue.
+    JOB_QUEUE_WORKERS = 0
+    # Failed orders are due again at once, so drain() runs all their attempts.
+    JOB_RETRY_DELAY = 0
 
 
 def create_app(config="config.DevelopmentConfig"):
     app = Flask(__name__)
     db.init_app(app)
     app.config.from_object(config)
+    response_cache.init_app(app)
+    principal_cache.init_app(app)
+    job_queue.init_app(app)
+    replica_router.init_app(app)
+    S3Service.init_app(app)
     migrate = Migrate(app, db)
     CORS(app)
     api = Api(app, doc='/api-docs')
@@ -52,5 +99,8 @@ def create_app(config="config.DevelopmentConfig"):
     api.add_namespace(auth_ns)
     api.add_namespace(jacket_ns)
     api.add_namespace(shopping_cart_ns)
+    api.add_namespace(metrics_ns)
+    api.add_namespace(order_ns)
     [api.add_resource(*route_data) for route_data in routes]
+    app.cli.add_command(resume_orders_command)
     return app
\ No newline at end of file
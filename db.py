@@ -1,3 +1,67 @@
-from flask_sqlalchemy import SQLAlchemy
+from flask_sqlalchemy import SQLAlchemy, SignallingSession, get_state
+from sqlalchemy import event, orm
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
 
-db = SQLAlchemy()
+
+class RoutingSession(SignallingSession):
+    # Sends plain reads to the replica bind set in session.info["replica"], if any (see utils.decorators.read_replica).
+    # Everything else goes to the primary: flushes, INSERT/UPDATE/DELETE, locking reads, connection() calls, and
+    # every statement once the session has written, so a request always reads its own writes.
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        replica = self.info.get("replica")
+        if (replica and isinstance(clause, Select) and clause._for_update_arg is None and not self._flushing
+                and not has_writes(self)):
+            return get_state(self.app).db.get_engine(self.app, bind=replica)
+        return super().get_bind(mapper, clause)
+
+
+class RoutingSQLAlchemy(SQLAlchemy):
+    def create_session(self, options):
+        return orm.sessionmaker(class_=RoutingSession, db=self, **options)
+
+
+db = RoutingSQLAlchemy()
+
+
+def has_writes(session):
+    # Whether committing would change anything: ORM changes not flushed yet, statements that wrote, or callbacks
+    # waiting for the commit.
+    return bool(session.new or session.dirty or session.deleted or session.info.get("writes")
+                or session.info.get("on_commit"))
+
+
+def on_commit(callback):
+    # Run callback once the current transaction commits, e.g. to invalidate caches only for writes that happened.
+    db.session.info.setdefault("on_commit", []).append(callback)
+
+
+@event.listens_for(Session, "after_commit")
+def _run_on_commit_callbacks(session):
+    for callback in session.info.pop("on_commit", []):
+        callback()
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_on_commit_callbacks(session, previous_transaction):
+    # Savepoint rollbacks keep the callbacks of the enclosing transaction.
+    if previous_transaction.parent is None:
+        session.info.pop("on_commit", None)
+
+
+@event.listens_for(Session, "after_flush")
+def _record_flush(session, flush_context):
+    session.info["writes"] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _record_write_statement(orm_execute_state):
+    # INSERT, UPDATE and DELETE sent with session.execute(), which bypass the unit of work.
+    if not orm_execute_state.is_select:
+        orm_execute_state.session.info["writes"] = True
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _forget_writes(session, transaction):
+    if transaction.parent is None:
+        session.info.pop("writes", None)
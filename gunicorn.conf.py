@@ -0,0 +1,48 @@
+# Production server settings, read by gunicorn:  gunicorn -c gunicorn.conf.py wsgi:app
+# Every setting can be overridden from the environment, e.g. GUNICORN_WORKERS=4. Names defined here are read as
+# gunicorn settings, which is why decouple.config is not imported by name.
+import multiprocessing
+
+import decouple
+
+bind = decouple.config("GUNICORN_BIND", default="0.0.0.0:5000")
+
+# Requests mostly wait on Postgres, S3 and Wise, so every process serves several requests at once on threads.
+# Processes are what add CPU, hence one per core plus one. Each thread can hold a database connection, so
+# workers * threads should stay within the database's connection limit.
+worker_class = "gthread"
+workers = decouple.config("GUNICORN_WORKERS", default=multiprocessing.cpu_count() + 1, cast=int)
+threads = decouple.config("GUNICORN_THREADS", default=4, cast=int)
+
+# The app is imported once in the master and forked, so the workers share its memory and a broken build fails
+# before any worker starts. The app opens no connections at import, and post_fork below makes sure of it.
+preload_app = True
+
+timeout = decouple.config("GUNICORN_TIMEOUT", default=60, cast=int)
+# On SIGTERM, or when a worker is recycled, in-flight requests get this long to finish.
+graceful_timeout = decouple.config("GUNICORN_GRACEFUL_TIMEOUT", default=30, cast=int)
+keepalive = decouple.config("GUNICORN_KEEPALIVE", default=5, cast=int)
+# Workers are replaced one at a time after this many requests, which bounds any slow memory growth.
+max_requests = decouple.config("GUNICORN_MAX_REQUESTS", default=2000, cast=int)
+max_requests_jitter = max_requests // 10
+
+accesslog = decouple.config("GUNICORN_ACCESS_LOG", default="-")
+errorlog = "-"
+
+# Reloading: SIGHUP starts new workers and stops the old ones gracefully, but with preload_app they run the code
+# the master loaded. To deploy new code without dropping requests, send SIGUSR2 (starts a new master with the new
+# code next to the old one), then SIGWINCH and SIGTERM to the old master.
+
+
+def post_fork(server, worker):
+    # A forked worker must never use a connection its parent opened. Dropping the inherited pool without closing
+    # it leaves the parent's connections alone; the worker opens its own on first use. The S3 client and the Wise
+    # session are already created per process.
+    from db import db
+    from services.jobs import job_queue
+    from wsgi import app
+
+    db.get_engine(app).dispose(close=False)
+    # Job workers also pick up orders left behind by a worker that was recycled or crashed, so they start right
+    # away instead of with the first request.
+    job_queue.start(app)
@@ -1,27 +1,40 @@
+import hashlib
+import itertools
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
+from functools import partial
 
 import jwt
 from decouple import config
+from flask import current_app, has_app_context
 from flask_httpauth import HTTPTokenAuth
 from jwt.exceptions import ExpiredSignatureError, InvalidTokenError
+from sqlalchemy import event
+from sqlalchemy.orm import make_transient_to_detached
 from werkzeug.exceptions import Unauthorized
 
+from db import db, on_commit
 from models import UserModel
+from services.cache import LRUCache
+
+# Read once at import instead of on every encode/decode.
+JWT_SECRET = config("JWT_SECRET")
 
 
 class AuthManager:
     @staticmethod
     def encode_token(user):
         payload = {"sub": user.id, "exp": datetime.utcnow() + timedelta(days=2)}
-        return jwt.encode(payload, key=config("JWT_SECRET"), algorithm="HS256")
+        return jwt.encode(payload, key=JWT_SECRET, algorithm="HS256")
 
     @staticmethod
-    def decode_token(token):
+    def decode_payload(token):
         if not token:
             raise Unauthorized("Missing token")
         try:
-            payload = jwt.decode(token, key=config("JWT_SECRET"), algorithms=["HS256"])
-            return payload["sub"]
+            return jwt.decode(token, key=JWT_SECRET, algorithms=["HS256"])
         except ExpiredSignatureError:
             raise Unauthorized("Token expired")
         except InvalidTokenError:
@@ -29,11 +42,118 @@ class AuthManager:
         except Exception:
             raise Unauthorized("Invalid token")
 
+    @staticmethod
+    def decode_token(token):
+        return AuthManager.decode_payload(token)["sub"]
+
+
+class LocalGenerations:
+    # Generations of the users changed in this process. A generation only matters while entries cached before its
+    # bump can still be read, so it is forgotten once they have all expired. Values come from one counter, so a
+    # forgotten generation is never handed out again.
+    def __init__(self, ttl):
+        self.ttl = ttl
+        self._generations = OrderedDict()
+        self._counter = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def generation(self, namespace):
+        entry = self._generations.get(namespace)
+        return 0 if entry is None else entry[0]
+
+    def bump_generation(self, namespace):
+        now = time.monotonic()
+        with self._lock:
+            self._generations.pop(namespace, None)
+            self._generations[namespace] = (next(self._counter), now)
+            while next(iter(self._generations.values()))[1] < now - self.ttl:
+                self._generations.popitem(last=False)
+
+    def __len__(self):
+        return len(self._generations)
+
+
+class PrincipalCache:
+    # Maps a token hash to the column values of its user, so authenticated requests skip both the JWT decode and
+    # the user lookup. Entries never outlive the token. Updating or deleting a user bumps its generation, which
+    # makes every cached entry for that user stale.
+    # With the Redis cache backend the generations live in Redis, so a change made by one process reaches them all.
+    # Without it every process only sees its own changes, so entries are kept a few seconds at most.
+    def init_app(self, app):
+        shared = app.config["CACHE_BACKEND"] == "redis"
+        app.config.setdefault("AUTH_CACHE_TTL", config("AUTH_CACHE_TTL", default=60 if shared else 5, cast=int))
+        app.config.setdefault("AUTH_CACHE_MAX_ENTRIES", config("AUTH_CACHE_MAX_ENTRIES", default=10000, cast=int))
+        ttl = app.config["AUTH_CACHE_TTL"]
+        app.extensions["principal_cache"] = {
+            "principals": LRUCache(app.config["AUTH_CACHE_MAX_ENTRIES"], ttl),
+            "generations": app.extensions["response_cache"]["backend"] if shared else LocalGenerations(ttl),
+        }
+
+    @staticmethod
+    def _state():
+        return current_app.extensions["principal_cache"]
+
+    @staticmethod
+    def _key(token):
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def generation(self, user_id):
+        return self._state()["generations"].generation(f"principal:{user_id}")
+
+    def get(self, token):
+        state = self._state()
+        entry = state["principals"].get(self._key(token))
+        if entry is None:
+            return None
+        columns, generation = entry
+        if self.generation(columns["id"]) != generation:
+            return None
+
+        # Re-attach without a query. merge() returns the instance already in the session if there is one.
+        user = UserModel(**columns)
+        make_transient_to_detached(user)
+        return db.session.merge(user, load=False)
+
+    def set(self, token, user, expires_at, generation):
+        # generation is the one read before the user was loaded: if the user changed since, the loaded row may be
+        # the old one and is not cached.
+        state = self._state()
+        ttl = min(state["principals"].ttl, expires_at - time.time())
+        if ttl <= 0 or self.generation(user.id) != generation:
+            return
+        columns = {column.key: getattr(user, column.key) for column in UserModel.__table__.columns}
+        state["principals"].set(self._key(token), (columns, generation), ttl)
+
+    def evict_user(self, user_id):
+        self._state()["generations"].bump_generation(f"principal:{user_id}")
+
+
+principal_cache = PrincipalCache()
+
+
+@event.listens_for(UserModel, "after_update")
+@event.listens_for(UserModel, "after_delete")
+def _evict_cached_principal(mapper, connection, target):
+    if has_app_context() and "principal_cache" in current_app.extensions:
+        principal_cache.evict_user(target.id)
+        # And again once committed: until then other requests still load the old row, and may cache it under the
+        # generation bumped above.
+        on_commit(partial(principal_cache.evict_user, target.id))
+
 
 auth = HTTPTokenAuth()
 
 
 @auth.verify_token
 def verify(token):
-    user_id = AuthManager.decode_token(token)
-    return UserModel.query.filter_by(id=user_id).first()
+    if token:
+        user = principal_cache.get(token)
+        if user is not None:
+            return user
+
+    payload = AuthManager.decode_payload(token)
+    generation = principal_cache.generation(payload["sub"])
+    user = UserModel.query.filter_by(id=payload["sub"]).first()
+    if user is not None:
+        principal_cache.set(token, user, payload["exp"], generation)
+    return user
@@ -0,0 +1,134 @@
+from flask import current_app
+from sqlalchemy import tuple_, update
+from sqlalchemy.exc import SQLAlchemyError
+from werkzeug.exceptions import BadRequest
+
+from common.constants import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, STREAM_BATCH_SIZE
+from db import db, on_commit
+from models import JacketModel, JacketSizes, JacketStatus, CatalogVersionModel
+from services.cache import response_cache
+from utils.pagination import encode_cursor, decode_cursor
+
+# Every sort key is paired with the primary key so the ordering is total and the keyset cursor is unambiguous.
+# Each pair is backed by a composite index (see JacketModel.__table_args__).
+SORT_COLUMNS = {
+    "created_on": JacketModel.created_on,
+    "price": JacketModel.price,
+}
+# What list views show of a jacket (see JacketSchemaResponse). Listings and search load only these columns, as plain
+# rows: no entities in the identity map, no change tracking, and none of the other columns.
+LIST_COLUMNS = (
+    JacketModel.id,
+    JacketModel.brand,
+    JacketModel.description,
+    JacketModel.size,
+    JacketModel.price,
+    JacketModel.created_on,
+    JacketModel.photo_url,
+    JacketModel.thumbnails,
+)
+# Response cache namespace holding serialized catalog pages and search results.
+CATALOG_CACHE = "catalog"
+
+
+def catalog_version():
+    return db.session.query(CatalogVersionModel.version).filter_by(id=1).scalar() or 0
+
+
+def _bump_catalog_version():
+    # In its own short transaction: every catalog write bumps this one row, and holding its lock until the write
+    # commits would run them all one at a time. The write is committed by then, so a failure here must not fail the
+    # request: it is logged, and the cached pages are still dropped. Only ETags lag until the next write.
+    try:
+        with db.engine.begin() as connection:
+            connection.execute(
+                update(CatalogVersionModel.__table__).where(CatalogVersionModel.id == 1).values(
+                    version=CatalogVersionModel.version + 1
+                )
+            )
+    except SQLAlchemyError:
+        current_app.logger.exception("Could not bump the catalog version")
+    response_cache.invalidate(CATALOG_CACHE)
+
+
+def invalidate_catalog():
+    # Invalidate now so the rest of this request reads its own write. The version moves once the write is committed:
+    # a reader never sees the new version with the old catalog, and one that cached the old catalog in between is
+    # dropped with it.
+    response_cache.invalidate(CATALOG_CACHE)
+    on_commit(_bump_catalog_version)
+
+
+class CatalogQuery:
+    def __init__(self, brand=None, size=None, min_price=None, max_price=None, creator_id=None, sort="created_on"):
+        self.brand = brand
+        self.size = JacketSizes[size] if size else None
+        self.min_price = min_price
+        self.max_price = max_price
+        self.creator_id = creator_id
+        self.sort = sort or "created_on"
+        self.descending = self.sort.startswith("-")
+        self.sort_key = self.sort.lstrip("-")
+        if self.sort_key not in SORT_COLUMNS:
+            raise BadRequest(f"Cannot sort by {self.sort_key}")
+
+    @classmethod
+    def from_args(cls, args):
+        return cls(
+            brand=args.get("brand"),
+            size=args.get("size"),
+            min_price=args.get("min_price"),
+            max_price=args.get("max_price"),
+            creator_id=args.get("creator_id"),
+            sort=args.get("sort"),
+        )
+
+    def _filtered(self):
+        query = db.session.query(*LIST_COLUMNS).filter(JacketModel.status == JacketStatus.available)
+        if self.brand:
+            query = query.filter(JacketModel.brand == self.brand)
+        if self.size:
+            query = query.filter(JacketModel.size == self.size)
+        if self.creator_id is not None:
+            query = query.filter(JacketModel.creator_id == self.creator_id)
+        if self.min_price is not None:
+            query = query.filter(JacketModel.price >= self.min_price)
+        if self.max_price is not None:
+            query = query.filter(JacketModel.price <= self.max_price)
+        return query
+
+    def _ordered(self, query):
+        sort_column = SORT_COLUMNS[self.sort_key]
+        if self.descending:
+            return query.order_by(sort_column.desc(), JacketModel.id.desc())
+        return query.order_by(sort_column, JacketModel.id)
+
+    def _after(self, query, cursor):
+        value, jacket_id = decode_cursor(cursor, self.sort)
+        key = tuple_(SORT_COLUMNS[self.sort_key], JacketModel.id)
+        if self.descending:
+            return query.filter(key < tuple_(value, jacket_id))
+        return query.filter(key > tuple_(value, jacket_id))
+
+    def page(self, limit=None, cursor=None):
+        limit = DEFAULT_PAGE_SIZE if limit is None else min(limit, MAX_PAGE_SIZE)
+        if limit < 1:
+            raise BadRequest("Limit must be a positive number")
+
+        query = self._filtered()
+        if cursor:
+            query = self._after(query, cursor)
+
+        # Fetch one extra row to know whether there is a next page without running a count.
+        jackets = self._ordered(query).limit(limit + 1).all()
+        next_cursor = None
+        if len(jackets) > limit:
+            jackets = jackets[:limit]
+            last = jackets[-1]
+            next_cursor = encode_cursor(self.sort, getattr(last, self.sort_key), last.id)
+        return jackets, next_cursor
+
+    def stream(self):
+        # stream_results makes psycopg2 use a server-side cursor, so only one batch is held in memory at a time.
+        query = self._ordered(self._filtered()).execution_options(stream_results=True)
+        return query.yield_per(STREAM_BATCH_SIZE)
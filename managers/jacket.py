@@ -1,13 +1,18 @@
-import os
 import uuid
 
-from werkzeug.exceptions import Unauthorized
+from sqlalchemy import func, select
+from sqlalchemy.orm.exc import StaleDataError
+from werkzeug.exceptions import BadRequest, Conflict, Unauthorized
 
-from common.constants import TEMP_DIR
+from common.constants import PHOTO_CONTENT_TYPES
 from db import db
-from models import JacketModel
-from services.s3 import S3Service
-from utils.encryptor import decode_file, generate_image_hash
+from managers.catalog import CatalogQuery, invalidate_catalog
+from managers.shopping_cart import ShoppingCartManager
+from managers.thumbnail import ThumbnailManager
+from models import JacketModel, JacketStatus
+from services.jobs import job_queue
+from services.s3 import S3Service, UPLOAD_PREFIX
+from utils.encryptor import Base64Stream
 
 
 class JacketManager:
@@ -16,50 +21,158 @@ class JacketManager:
         return db.session.query(JacketModel).filter(JacketModel.id == jacket_id).first()
 
     @staticmethod
-    def _decode_and_save_temp_image(photo, extension):
-        file_name = f"{str(uuid.uuid4())}.{extension}"
-        path = os.path.join(TEMP_DIR, file_name)
-        decode_file(path, photo)
-        return file_name, path
+    def _flush():
+        # The jacket was reserved, sold or edited by another transaction after it was loaded here.
+        try:
+            db.session.flush()
+        except StaleDataError:
+            raise Conflict("Jacket was changed in the meantime, please try again")
 
     @staticmethod
-    def _process_image(photo, extension, old_photo_url=None):
-        file_name, path = JacketManager._decode_and_save_temp_image(photo, extension)
-        pic_hash = generate_image_hash(path)
+    def _lock_photo(pic_hash):
+        # Held until commit. Taking a stored photo into use and deleting its last copy both take it first, so the
+        # cleanup job never deletes a photo a jacket being created is about to reference.
+        db.session.execute(select(func.pg_advisory_xact_lock(func.hashtext(pic_hash))))
 
-        s3 = S3Service()
+    @staticmethod
+    def _find_photo_url(pic_hash):
+        # Any jacket with the same photo already points at a stored copy of it.
+        JacketManager._lock_photo(pic_hash)
+        row = db.session.query(JacketModel.photo_url).filter(JacketModel.pic_hash == pic_hash).first()
+        return row.photo_url if row else None
 
-        if old_photo_url:
-            old_photo_name = old_photo_url.split("/")[-1]
-            s3.delete_photo(old_photo_name)
+    @staticmethod
+    def _release_photo(pic_hash, photo_url):
+        # S3 is only touched once the release is committed, off the request.
+        job_queue.enqueue_on_commit(JacketManager.delete_unused_photo, pic_hash, photo_url)
 
-        photo_url = s3.upload_photo(path, file_name)
-        os.remove(path)
+    @staticmethod
+    def delete_unused_photo(pic_hash, photo_url):
+        # Background job. Photos are shared by every jacket with the same content, so the object is removed with its
+        # last reference only, checked when the job runs since the photo may have been taken into use again.
+        JacketManager._lock_photo(pic_hash)
+        still_used = db.session.query(JacketModel.id).filter(
+            JacketModel.pic_hash == pic_hash, JacketModel.photo_url == photo_url
+        ).first()
+        if not still_used:
+            s3 = S3Service()
+            s3.delete_photo(s3.key_from_url(photo_url))
+            if not db.session.query(JacketModel.id).filter(JacketModel.pic_hash == pic_hash).first():
+                ThumbnailManager.delete(pic_hash)
 
+    @staticmethod
+    def _process_image(photo, extension, user_id):
+        # One streaming pass, without a temp file: the photo is decoded, hashed and uploaded to a scratch key as it
+        # is read. Its hash is only known at the end, so it is then moved to the content-hash key with a copy inside
+        # S3, unless that photo is already stored.
+        s3 = S3Service()
+        scratch_key = f"{UPLOAD_PREFIX}/{user_id}/{uuid.uuid4()}.{extension}"
+        stream = Base64Stream(photo)
+        s3.upload_photo(stream, scratch_key, PHOTO_CONTENT_TYPES.get(extension))
+        pic_hash = stream.hexdigest()
+
+        photo_url = JacketManager._find_photo_url(pic_hash)
+        if not photo_url:
+            photo_url = s3.copy_photo(scratch_key, f"{pic_hash}.{extension}")
+        # Not needed whether or not the request commits.
+        job_queue.enqueue(s3.delete_photo, scratch_key)
         return pic_hash, photo_url
 
     @staticmethod
-    def get_jackets(user):
-        return JacketModel.query.all()
+    def _verify_uploaded_photo(photo_key, user_id):
+        # Only the uploader may attach an upload, and it has to actually be in the bucket. The jacket references it
+        # under its upload key, which stands in for the hash until store_upload has read the photo.
+        if not photo_key.startswith(f"{UPLOAD_PREFIX}/{user_id}/"):
+            raise BadRequest("Unknown photo upload")
+        s3 = S3Service()
+        if s3.head_photo(photo_key) is None:
+            raise BadRequest("Photo has not been uploaded yet")
+        return photo_key, s3.photo_url(photo_key)
 
     @staticmethod
-    def get_jackets_by_brand(user, brand):
-        return JacketModel.query.filter_by(creator_id=user.id, brand=brand).all()
+    def _schedule_photo(jacket_id, pic_hash):
+        # After a jacket got a new photo: an upload is stored first, which then schedules the thumbnails.
+        if pic_hash.startswith(f"{UPLOAD_PREFIX}/"):
+            job_queue.enqueue_on_commit(JacketManager.store_upload, jacket_id, pic_hash)
+        else:
+            ThumbnailManager.schedule(jacket_id, pic_hash)
+
+    @staticmethod
+    def store_upload(jacket_id, photo_key):
+        # Background job. The upload is stored like a base64 photo: hashed with SHA-256 and kept under its content
+        # hash, so the same photo sent either way is stored once. This runs here so API workers never read the
+        # bytes of a direct upload.
+        still_attached = db.session.query(JacketModel.id).filter(
+            JacketModel.id == jacket_id, JacketModel.pic_hash == photo_key
+        ).first()
+        if not still_attached:
+            # Edited or deleted since, which released the upload.
+            return
+
+        s3 = S3Service()
+        pic_hash = s3.hash_photo(photo_key)
+        # Same lock order as edit: the carts, the photo, then the jacket.
+        ShoppingCartManager.touch_carts_with([jacket_id])
+        photo_url = JacketManager._find_photo_url(pic_hash)
+        jacket = db.session.query(JacketModel).filter(
+            JacketModel.id == jacket_id, JacketModel.pic_hash == photo_key
+        ).with_for_update().first()
+        if jacket is None:
+            return
+
+        if not photo_url:
+            extension = photo_key.rsplit(".", 1)[-1]
+            photo_url = s3.copy_photo(photo_key, f"{pic_hash}.{extension}")
+        jacket.pic_hash, jacket.photo_url = pic_hash, photo_url
+        jacket.thumbnails_due = ThumbnailManager.due_at()
+        db.session.flush()
+        job_queue.enqueue_on_commit(s3.delete_photo, photo_key)
+        ThumbnailManager.schedule(jacket_id, pic_hash)
+        invalidate_catalog()
+
+    @staticmethod
+    def store_due_upload():
+        # Poller of the job queue, for uploads whose store_upload job was lost. Returns whether there was one.
+        jacket = ThumbnailManager.claim_due(JacketModel.pic_hash.startswith(f"{UPLOAD_PREFIX}/"))
+        if jacket is None:
+            return False
+        JacketManager.store_upload(jacket.id, jacket.pic_hash)
+        return True
+
+    @staticmethod
+    def create_upload(user, extension):
+        key = f"{UPLOAD_PREFIX}/{user.id}/{uuid.uuid4()}.{extension}"
+        upload = S3Service().generate_upload_post(key, PHOTO_CONTENT_TYPES[extension])
+        return {"key": key, "url": upload["url"], "fields": upload["fields"]}
+
+    @staticmethod
+    def get_jackets(user, filters, limit=None, cursor=None):
+        return CatalogQuery.from_args(filters).page(limit, cursor)
+
+    @staticmethod
+    def stream_jackets(user, filters):
+        return CatalogQuery.from_args(filters).stream()
 
     @staticmethod
     def create(data, user):
         data["creator_id"] = user.id
-        extension = data.pop("extension")
-        photo = data.pop("photo")
+        photo_key = data.pop("photo_key", None)
 
-        pic_hash, photo_url = JacketManager._process_image(photo, extension)
+        if photo_key:
+            pic_hash, photo_url = JacketManager._verify_uploaded_photo(photo_key, user.id)
+        else:
+            extension = data.pop("extension")
+            photo = data.pop("photo")
+            pic_hash, photo_url = JacketManager._process_image(photo, extension, user.id)
 
         data['pic_hash'] = pic_hash
         data["photo_url"] = photo_url
 
-        jacket = JacketModel(**data)
+        jacket = JacketModel(**data, thumbnails_due=ThumbnailManager.due_at())
         db.session.add(jacket)
         db.session.flush()
+        JacketManager._schedule_photo(jacket.id, jacket.pic_hash)
+        invalidate_catalog()
         return jacket
 
     @staticmethod
@@ -70,18 +183,21 @@ class JacketManager:
 
         if jacket.creator_id != user:
             raise Unauthorized("You do not own this jacket")
-
-        extension = data.pop("extension")
-        photo = data.pop("photo")
-        file_name, path = JacketManager._decode_and_save_temp_image(photo, extension)
-        new_pic_hash = generate_image_hash(path)
-
-        if new_pic_hash != jacket.pic_hash:
-            new_photo_url = JacketManager._process_image(photo, extension, jacket.photo_url)
-            jacket.pic_hash = new_pic_hash
-            jacket.photo_url = new_photo_url
+        if jacket.status != JacketStatus.available:
+            raise Conflict("Jackets in an order can no longer be edited")
+        # Before the jacket is written: carts are locked before jackets, see ShoppingCartManager._carts_with.
+        ShoppingCartManager.touch_carts_with([jacket.id])
+
+        old_photo = (jacket.pic_hash, jacket.photo_url)
+        new_photo = None
+        photo_key = data.pop("photo_key", None)
+        if photo_key:
+            new_photo = JacketManager._verify_uploaded_photo(photo_key, user)
         else:
-            os.remove(path)
+            extension = data.pop("extension")
+            photo = data.pop("photo")
+            # The same photo again comes back as the jacket's own and counts as no change.
+            new_photo = JacketManager._process_image(photo, extension, user)
 
         editable_fields = ['brand', 'description', 'size']
 
@@ -89,19 +205,34 @@ class JacketManager:
             if key in editable_fields:
                 setattr(jacket, key, value)
 
-        db.session.flush()
+        photo_changed = new_photo is not None and new_photo != old_photo
+        if photo_changed:
+            jacket.pic_hash, jacket.photo_url = new_photo
+            jacket.thumbnails = None
+            jacket.thumbnails_due = ThumbnailManager.due_at()
+        JacketManager._flush()
+        if photo_changed:
+            JacketManager._release_photo(*old_photo)
+            JacketManager._schedule_photo(jacket.id, jacket.pic_hash)
+        invalidate_catalog()
         return jacket
 
     @staticmethod
     def delete(jacket_id, user_id):
-        s3 = S3Service()
         # In this request I make sure the owner is same as user who requests delete.
-        jacket = JacketModel.query.filter_by(id=jacket_id, creator_id=user_id).first()
+        # Jackets that are reserved or sold belong to an order and stay.
+        jacket = JacketModel.query.filter_by(id=jacket_id, creator_id=user_id, status=JacketStatus.available).first()
         if jacket:
-            photo_name = jacket.photo_url.split("/")[-1]
-            s3.delete_photo(photo_name)
+            photo = (jacket.pic_hash, jacket.photo_url)
+            # The jacket leaves the carts it is in, which lowers their amounts, before it is gone.
+            ShoppingCartManager.drop_jackets([jacket.id])
+            db.session.expire(jacket, ["shopping_carts"])
             db.session.delete(jacket)
-            db.session.flush()
+            JacketManager._flush()
+            JacketManager._release_photo(*photo)
+            invalidate_catalog()
             return True
         return False
 
+
+job_queue.poll(JacketManager.store_due_upload)
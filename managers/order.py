@@ -0,0 +1,274 @@
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+from decouple import config
+from flask import current_app
+from sqlalchemy import or_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import joinedload
+from werkzeug.exceptions import Conflict
+
+from db import db
+from managers.catalog import invalidate_catalog
+from managers.shopping_cart import ShoppingCartManager
+from models import JacketModel, JacketStatus, OrderModel, OrderStatus, TransactionModel, WiseRecipientModel
+from models.order import order_jackets
+from services.jobs import job_queue
+from services.wise import WiseService
+from utils.encryptor import CryptoHelper
+
+# Upper bound on payouts sent to Wise at the same time for one order.
+PAYOUT_WORKERS = config("WISE_PAYOUT_WORKERS", default=4, cast=int)
+# How long a worker may hold an order. An order whose worker died is picked up again after this.
+ORDER_LEASE = timedelta(seconds=config("ORDER_LEASE_SECONDS", default=300, cast=int))
+# Payout ids are derived from the order and the creator, so a retried payout reaches Wise with the same
+# customerTransactionId and is not paid twice.
+PAYOUT_NAMESPACE = uuid.UUID("a403411f-283e-44b8-8671-75f09f51add9")
+
+
+class OrderManager:
+    @staticmethod
+    def place_order(user):
+        shopping_cart = ShoppingCartManager.get_shopping_cart(user, lock=True)
+        jackets = list(shopping_cart.jackets)
+        if not jackets:
+            return None
+
+        # Jackets are reserved with a conditional update, so two orders can never hold the same jacket.
+        jacket_ids = [jacket.id for jacket in jackets]
+        with db.session.begin_nested():
+            reserved = JacketModel.query.filter(
+                JacketModel.id.in_(jacket_ids), JacketModel.status == JacketStatus.available
+            ).update({JacketModel.status: JacketStatus.reserved, JacketModel.version: JacketModel.version + 1},
+                     synchronize_session="fetch")
+            if reserved != len(jacket_ids):
+                raise Conflict("Some jackets in your cart are no longer available")
+
+        order = OrderModel(
+            user_id=user.id,
+            shopping_cart_id=shopping_cart.id,
+            amount=sum(jacket.price for jacket in jackets),
+            jackets=jackets,
+        )
+        db.session.add(order)
+        shopping_cart.jackets = []
+        shopping_cart.amount = 0
+        shopping_cart.version += 1
+        db.session.flush()
+        # Reserved jackets are no longer listed.
+        invalidate_catalog()
+        job_queue.enqueue_on_commit(OrderManager.process_order, order.id)
+        return order
+
+    @staticmethod
+    def get_order(user, order_id):
+        return OrderModel.query.filter_by(id=order_id, user_id=user.id).first()
+
+    @staticmethod
+    def process_order(order_id=None):
+        # Background job, and the poller of the job queue: the orders table is the durable queue of payouts, and
+        # without an id this takes the next order that is due. Payouts already made for the order are recorded and
+        # skipped, so it is safe to run again. Returns whether there was an order to process.
+        order = OrderManager._claim(order_id)
+        if order is None:
+            return False
+
+        order_id = order.id
+        try:
+            OrderManager._pay_out(order)
+        except Exception as ex:
+            db.session.rollback()
+            OrderManager._record_failure(order_id, ex)
+            return True
+
+        OrderManager._settle(order, [jacket.id for jacket in order.jackets], OrderStatus.completed)
+        return True
+
+    @staticmethod
+    def resume_orders():
+        # Processes every order that is due right here, e.g. when no server is running. Returns how many.
+        count = 0
+        while OrderManager.process_order():
+            count += 1
+        return count
+
+    @staticmethod
+    def _claim(order_id=None):
+        # The next order that is pending, or whose lease or retry delay is over. SKIP LOCKED lets workers that
+        # look at the same time each take a different order instead of waiting for each other.
+        now = datetime.utcnow()
+        query = OrderModel.query.filter(
+            OrderModel.status.in_([OrderStatus.pending, OrderStatus.processing]),
+            or_(OrderModel.locked_until.is_(None), OrderModel.locked_until <= now),
+        )
+        if order_id is not None:
+            query = query.filter(OrderModel.id == order_id)
+        order = query.order_by(OrderModel.id).with_for_update(skip_locked=True).first()
+        if order is None:
+            return None
+
+        order.status = OrderStatus.processing
+        order.attempts += 1
+        order.locked_until = now + ORDER_LEASE
+        db.session.commit()
+        return order
+
+    @staticmethod
+    def _payout_id(order_id, creator_id):
+        return str(uuid.uuid5(PAYOUT_NAMESPACE, f"order-{order_id}-creator-{creator_id}"))
+
+    @staticmethod
+    def _paid_jacket_ids(order):
+        return [jacket.id for transaction in order.transactions for jacket in transaction.jackets]
+
+    @staticmethod
+    def _payout_groups(order):
+        # The order's unpaid jackets per creator, in the order of each creator's first jacket. A creator is paid
+        # for all their jackets with one transfer, so their jackets are either all paid or none are.
+        paid = set(OrderManager._paid_jacket_ids(order))
+        jackets = JacketModel.query.options(joinedload(JacketModel.creator)).join(
+            order_jackets, order_jackets.c.jacket_id == JacketModel.id
+        ).filter(order_jackets.c.order_id == order.id).order_by(JacketModel.id).all()
+
+        groups = {}
+        for jacket in jackets:
+            if jacket.id not in paid:
+                groups.setdefault(jacket.creator_id, []).append(jacket)
+        return list(groups.values())
+
+    @staticmethod
+    def _pay_out(order):
+        groups = OrderManager._payout_groups(order)
+        payouts = [
+            (
+                sum(jacket.price for jacket in jackets),
+                f"{jackets[0].creator.first_name} {jackets[0].creator.last_name}",
+                jackets[0].creator.iban,
+                OrderManager._payout_id(order.id, jackets[0].creator_id),
+            )
+            for jackets in groups
+        ]
+        results = OrderManager.issue_payouts(order.user, payouts, order.shopping_cart_id)
+
+        # Payouts that went through are kept even when another one failed, so a retry does not repeat them.
+        for jackets, result in zip(groups, results):
+            if not isinstance(result, Exception):
+                db.session.add(TransactionModel(**result, order_id=order.id, jackets=jackets))
+        db.session.commit()
+
+        failures = [result for result in results if isinstance(result, Exception)]
+        if failures:
+            raise failures[0]
+
+    @staticmethod
+    def _record_failure(order_id, ex):
+        order = OrderModel.query.get(order_id)
+        order.error = str(ex) or ex.__class__.__name__
+        if order.attempts < current_app.config["JOB_MAX_ATTEMPTS"]:
+            # Retried by whichever worker polls once the delay is over, with exponential backoff.
+            current_app.logger.warning("Payouts of order %s failed, retrying", order_id, exc_info=ex)
+            order.status = OrderStatus.pending
+            order.locked_until = datetime.utcnow() + timedelta(
+                seconds=current_app.config["JOB_RETRY_DELAY"] * 2 ** (order.attempts - 1)
+            )
+            db.session.commit()
+            return
+
+        # Out of attempts: what was paid for is sold, the rest goes back on sale.
+        current_app.logger.error("Payouts of order %s failed after %s attempts", order_id, order.attempts, exc_info=ex)
+        OrderManager._settle(order, OrderManager._paid_jacket_ids(order), OrderStatus.failed)
+
+    @staticmethod
+    def _settle(order, sold_jacket_ids, status):
+        order_jacket_ids = [jacket.id for jacket in order.jackets]
+        unsold_jacket_ids = [jacket_id for jacket_id in order_jacket_ids if jacket_id not in sold_jacket_ids]
+        if sold_jacket_ids:
+            # Carts first: dropping the jackets locks the carts they are in, and a checkout of one of those carts
+            # holds the cart while it reserves jackets.
+            ShoppingCartManager.drop_jackets(sold_jacket_ids)
+            JacketModel.query.filter(JacketModel.id.in_(sold_jacket_ids)).update(
+                {JacketModel.status: JacketStatus.sold, JacketModel.version: JacketModel.version + 1},
+                synchronize_session="fetch",
+            )
+        if unsold_jacket_ids:
+            JacketModel.query.filter(JacketModel.id.in_(unsold_jacket_ids)).update(
+                {JacketModel.status: JacketStatus.available, JacketModel.version: JacketModel.version + 1},
+                synchronize_session="fetch",
+            )
+            invalidate_catalog()
+        order.status = status
+        order.locked_until = None
+        if status == OrderStatus.completed:
+            order.error = None
+        db.session.commit()
+
+    @staticmethod
+    def issue_payouts(user, payouts, shopping_cart_id):
+        # Payouts do not depend on each other, so they are sent in parallel. The worker threads only talk to Wise
+        # and never touch the session: everything they need is read here first, and what they learn is saved here
+        # afterwards. Results come back in payout order, with the exception in place of a payout that failed.
+        if not payouts:
+            return []
+        wise = WiseService(CryptoHelper().decrypt(user.wise_key))
+        recipients = OrderManager._known_recipients(wise.profile_id, {payout[2] for payout in payouts})
+
+        with ThreadPoolExecutor(max_workers=min(PAYOUT_WORKERS, len(payouts))) as executor:
+            futures = [
+                executor.submit(OrderManager.issue_transaction, wise, amount, full_name, iban, shopping_cart_id,
+                                recipients.get(iban), payout_id)
+                for amount, full_name, iban, payout_id in payouts
+            ]
+            results = []
+            for future in futures:
+                try:
+                    results.append(future.result())
+                except Exception as ex:
+                    # Payouts that have not started yet are not sent once one has failed.
+                    for pending in futures:
+                        pending.cancel()
+                    results.append(ex)
+
+        for (_, _, iban, _), result in zip(payouts, results):
+            if iban not in recipients and not isinstance(result, Exception):
+                recipients[iban] = result["recipient_id"]
+                OrderManager._remember_recipient(wise.profile_id, iban, result["recipient_id"])
+        return results
+
+    @staticmethod
+    def _known_recipients(profile_id, ibans):
+        rows = db.session.query(WiseRecipientModel.iban, WiseRecipientModel.recipient_id).filter(
+            WiseRecipientModel.profile_id == profile_id, WiseRecipientModel.iban.in_(ibans)
+        )
+        return {row.iban: row.recipient_id for row in rows}
+
+    @staticmethod
+    def _remember_recipient(profile_id, iban, recipient_id):
+        # A concurrent order may have saved the same recipient first, which is just as good.
+        try:
+            with db.session.begin_nested():
+                db.session.add(WiseRecipientModel(profile_id=profile_id, iban=iban, recipient_id=recipient_id))
+        except IntegrityError:
+            pass
+
+    @staticmethod
+    def issue_transaction(wise, amount, full_name, iban, shopping_cart_id, recipient_id=None, payout_id=None):
+        quote_id = wise.create_quote("EUR", "EUR", amount)
+        if recipient_id is None:
+            recipient_id = wise.create_recipient(full_name, iban)
+        customer_transaction_id = payout_id or str(uuid.uuid4())
+        transfer_id = wise.create_transfer(recipient_id, quote_id, customer_transaction_id)["id"]
+        data = {
+            "quote_id": quote_id,
+            "recipient_id": recipient_id,
+            "transfer_id": transfer_id,
+            "target_account_id": customer_transaction_id,
+            "amount": amount,
+            "shopping_cart_id": shopping_cart_id,
+        }
+
+        wise.fund_transfer(transfer_id)
+        return data
+
+
+job_queue.poll(OrderManager.process_order)
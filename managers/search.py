@@ -0,0 +1,58 @@
+from sqlalchemy import func, literal_column
+from werkzeug.exceptions import BadRequest
+
+from common.constants import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from db import db
+from managers.catalog import LIST_COLUMNS
+from models import JacketModel, JacketStatus
+from models.jacket import SEARCH_VECTOR_COLUMN
+from utils.search import InvertedIndex
+
+# Generated tsvector column, see models.jacket.SEARCH_VECTOR_SQL. It is not mapped on the model so the schema
+# still works on databases without full-text search.
+SEARCH_VECTOR = literal_column(f"jacket.{SEARCH_VECTOR_COLUMN}")
+# Brand matches outrank description matches, mirroring the weights of the generated column.
+BRAND_WEIGHT = 2.0
+
+
+class SearchManager:
+    @staticmethod
+    def search_jackets(text, limit=None):
+        limit = DEFAULT_PAGE_SIZE if limit is None else min(limit, MAX_PAGE_SIZE)
+        if limit < 1:
+            raise BadRequest("Limit must be a positive number")
+        if not text or not text.strip():
+            raise BadRequest("Search query must not be empty")
+
+        if db.session().get_bind(JacketModel.__mapper__).dialect.name == "postgresql":
+            return SearchManager._search_postgres(text, limit)
+        return SearchManager._search_in_memory(text, limit)
+
+    @staticmethod
+    def _search_postgres(text, limit):
+        ts_query = func.websearch_to_tsquery("english", text)
+        rank = func.ts_rank(SEARCH_VECTOR, ts_query)
+        return (
+            db.session.query(*LIST_COLUMNS)
+            .filter(SEARCH_VECTOR.op("@@")(ts_query), JacketModel.status == JacketStatus.available)
+            .order_by(rank.desc(), JacketModel.id)
+            .limit(limit)
+            .all()
+        )
+
+    @staticmethod
+    def _search_in_memory(text, limit):
+        index = InvertedIndex()
+        for jacket_id, brand, description in db.session.query(
+            JacketModel.id, JacketModel.brand, JacketModel.description
+        ).filter(JacketModel.status == JacketStatus.available):
+            index.add(jacket_id, brand, BRAND_WEIGHT)
+            index.add(jacket_id, description)
+
+        jacket_ids = index.search(text, limit)
+        if not jacket_ids:
+            return []
+        jackets = {
+            jacket.id: jacket for jacket in db.session.query(*LIST_COLUMNS).filter(JacketModel.id.in_(jacket_ids))
+        }
+        return [jackets[jacket_id] for jacket_id in jacket_ids]
@@ -1,98 +1,174 @@
-import uuid
-
-from flask import abort
+from sqlalchemy import delete, exists, func, literal, select, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import joinedload
 
 from db import db
-from models import ShoppingCartModel, JacketModel, TransactionModel
-from services.wise import WiseService
-from utils.encryptor import CryptoHelper
+from models import ShoppingCartModel, JacketModel, JacketStatus
+from models.shopping_cart import shopping_cart_jackets
 
 
 class ShoppingCartManager:
 
     @staticmethod
-    def get_shopping_cart(user):
-        shopping_cart = ShoppingCartModel.query.filter_by(user_id=user.id).first()
+    def get_shopping_cart(user, lock=False):
+        # The jackets come with the cart in the same query. Every caller needs them, and the loaded collection is
+        # what later reads in the request use, instead of another lazy load.
+        query = ShoppingCartModel.query.options(joinedload(ShoppingCartModel.jackets)).filter_by(user_id=user.id)
+        if lock:
+            # Checkout holds the cart row until it commits. Cart edits lock that row first too, so they wait for the
+            # checkout instead of changing the cart between reading and emptying it.
+            db.session.query(ShoppingCartModel.id).filter_by(user_id=user.id).with_for_update().first()
+            query = query.populate_existing()
+        shopping_cart = query.first()
         if shopping_cart is None:
-            shopping_cart = ShoppingCartModel(user_id=user.id)
-            db.session.add(shopping_cart)
-            db.session.flush()
+            # A user's first requests may all get here at once. user_id is unique, so only one of them creates the
+            # cart and the others wait for it and read it.
+            db.session.execute(insert(ShoppingCartModel.__table__).values(user_id=user.id, amount=0)
+                               .on_conflict_do_nothing(index_elements=["user_id"]))
+            shopping_cart = query.first()
         return shopping_cart
 
+    @staticmethod
+    def get_cart_version(user):
+        # Reads only the version so an unchanged cart can be answered with 304 without loading its jackets.
+        return db.session.query(ShoppingCartModel.id, ShoppingCartModel.version).filter_by(user_id=user.id).first()
+
+    @staticmethod
+    def _cart_id(user):
+        # Locks the cart row first, before the link rows. Checkout takes its locks in the same order, so an edit and
+        # a checkout of the same cart wait for each other instead of deadlocking.
+        cart_id = ShoppingCartManager._lock_cart(user)
+        if cart_id is None:
+            ShoppingCartManager.get_shopping_cart(user)
+            cart_id = ShoppingCartManager._lock_cart(user)
+        return cart_id
+
+    @staticmethod
+    def _lock_cart(user):
+        return db.session.query(ShoppingCartModel.id).filter_by(user_id=user.id).with_for_update().scalar()
+
+    @staticmethod
+    def _carts_with(jacket_ids):
+        # Locks every cart holding one of the jackets, in id order so two callers never wait on each other. Callers
+        # take these locks before they lock any jacket or link row, like checkout does.
+        cart = ShoppingCartModel.__table__
+        cart_ids = select(shopping_cart_jackets.c.shopping_cart_id).where(
+            shopping_cart_jackets.c.jacket_id.in_(jacket_ids)
+        )
+        return select(cart.c.id).where(cart.c.id.in_(cart_ids)).order_by(cart.c.id).with_for_update()
+
+    @staticmethod
+    def _lock_carts_with(jacket_ids):
+        return db.session.execute(ShoppingCartManager._carts_with(jacket_ids)).scalars().all()
+
+    @staticmethod
+    def touch_carts_with(jacket_ids):
+        # A cart shows its jackets, so a change to one of them is a change to every cart holding it: their versions,
+        # and with them their ETags, move on.
+        cart = ShoppingCartModel.__table__
+        db.session.execute(
+            update(cart).where(cart.c.id.in_(ShoppingCartManager._carts_with(jacket_ids))).values(
+                version=cart.c.version + 1
+            )
+        )
+
+    @staticmethod
+    def _reload(user):
+        # The cart was changed with SQL, so whatever the session holds for it is refreshed.
+        return ShoppingCartModel.query.options(joinedload(ShoppingCartModel.jackets)).filter_by(
+            user_id=user.id
+        ).populate_existing().first()
+
     @staticmethod
     def add_jacket(user, jacket_id):
-        shopping_cart = ShoppingCartManager.get_shopping_cart(user)
-        jacket = JacketModel.query.get(jacket_id)
-        if jacket and jacket not in shopping_cart.jackets:
-            shopping_cart.jackets.append(jacket)
-            shopping_cart.amount += jacket.price
-            db.session.flush()
-            return shopping_cart
-        return None
+        cart_id = ShoppingCartManager._cart_id(user)
+        if not ShoppingCartManager._add(cart_id, [jacket_id]):
+            return None
+        return ShoppingCartManager._reload(user)
 
     @staticmethod
     def remove_jacket(user, jacket_id):
-        shopping_cart = ShoppingCartManager.get_shopping_cart(user)
-        jacket = JacketModel.query.get(jacket_id)
-        if jacket and jacket in shopping_cart.jackets:
-            shopping_cart.jackets.remove(jacket)
-            shopping_cart.amount -= jacket.price
-            db.session.flush()
-            return shopping_cart
-        return None
-
-    @staticmethod
-    def purchase(user):
-        shopping_cart = ShoppingCartManager.get_shopping_cart(user)
-        if shopping_cart.jackets:
-            try:
-                # Get jackets' IDs
-                jacket_ids = [jacket.id for jacket in shopping_cart.jackets]
-
-                # Query jackets with their creators' data
-                jackets = JacketModel.query.options(joinedload(JacketModel.creator)).filter(JacketModel.id.in_(jacket_ids)).all()
-
-                for jacket in jackets:
-                    creator = jacket.creator
-                    transaction_data = ShoppingCartManager.issue_transaction(
-                        user,
-                        jacket.price,
-                        f"{creator.first_name} {creator.last_name}",
-                        creator.iban,
-                        shopping_cart.id
-                    )
-                    transaction = TransactionModel(**transaction_data)
-
-                    db.session.delete(jacket)
-                    db.session.add(transaction)
-
-                shopping_cart.jackets = []
-                shopping_cart.amount = 0
-                db.session.flush()
-                return True
-            except Exception:
-                # raise a 400 error with the exception message
-                abort(400, "Your WISE key or IBAN are wrong")
-        return False
-
-    @staticmethod
-    def issue_transaction(user, amount, full_name, iban, shopping_cart_id):
-        crypto_helper = CryptoHelper()
-        decrypted_wise_key = crypto_helper.decrypt(user.wise_key)
-        wise = WiseService(decrypted_wise_key)
-        quote_id = wise.create_quote("EUR", "EUR", amount)
-        recipient_id = wise.create_recipient(full_name, iban)
-        customer_transaction_id = str(uuid.uuid4())
-        transfer_id = wise.create_transfer(recipient_id, quote_id, customer_transaction_id)["id"]
-        data = {
-            "quote_id": quote_id,
-            "recipient_id": recipient_id,
-            "transfer_id": transfer_id,
-            "target_account_id": customer_transaction_id,
-            "amount": amount,
-            "shopping_cart_id": shopping_cart_id,
-        }
-
-        wise.fund_transfer(transfer_id)
-        return data
+        cart_id = ShoppingCartManager._cart_id(user)
+        if not ShoppingCartManager._remove(cart_id, [jacket_id]):
+            return None
+        return ShoppingCartManager._reload(user)
+
+    @staticmethod
+    def add_jackets(user, jacket_ids):
+        # Adds any number of jackets with the same single statement as add_jacket. Returns the cart and the outcome
+        # for every requested jacket: added, already_in_cart or not_available.
+        jacket_ids = list(dict.fromkeys(jacket_ids))
+        cart_id = ShoppingCartManager._cart_id(user)
+        added = ShoppingCartManager._add(cart_id, jacket_ids)
+        shopping_cart = ShoppingCartManager._reload(user)
+        in_cart = {jacket.id for jacket in shopping_cart.jackets}
+        results = [
+            {"jacket_id": jacket_id,
+             "status": "added" if jacket_id in added else "already_in_cart" if jacket_id in in_cart else "not_available"}
+            for jacket_id in jacket_ids
+        ]
+        return shopping_cart, results
+
+    @staticmethod
+    def remove_jackets(user, jacket_ids):
+        # Returns the cart and the outcome for every requested jacket: removed or not_in_cart.
+        jacket_ids = list(dict.fromkeys(jacket_ids))
+        cart_id = ShoppingCartManager._cart_id(user)
+        removed = ShoppingCartManager._remove(cart_id, jacket_ids)
+        results = [{"jacket_id": jacket_id, "status": "removed" if jacket_id in removed else "not_in_cart"}
+                   for jacket_id in jacket_ids]
+        return ShoppingCartManager._reload(user), results
+
+    @staticmethod
+    def _add(cart_id, jacket_ids):
+        # Link rows are only inserted for available jackets that are not in the cart yet.
+        added = insert(shopping_cart_jackets).from_select(
+            ["shopping_cart_id", "jacket_id"],
+            select(literal(cart_id), JacketModel.id).where(
+                JacketModel.id.in_(jacket_ids), JacketModel.status == JacketStatus.available
+            ),
+        ).on_conflict_do_nothing().returning(shopping_cart_jackets.c.jacket_id).cte("added")
+        return ShoppingCartManager._apply(cart_id, added, 1)
+
+    @staticmethod
+    def _remove(cart_id, jacket_ids):
+        removed = delete(shopping_cart_jackets).where(
+            shopping_cart_jackets.c.shopping_cart_id == cart_id, shopping_cart_jackets.c.jacket_id.in_(jacket_ids)
+        ).returning(shopping_cart_jackets.c.jacket_id).cte("removed")
+        return ShoppingCartManager._apply(cart_id, removed, -1)
+
+    @staticmethod
+    def _apply(cart_id, changed, sign):
+        # Runs the insert or delete in `changed` and, in the same statement, moves the cart's amount by the prices of
+        # the jackets it touched and bumps its version when there were any. Neither the cart's jackets nor the
+        # jackets themselves are loaded. Returns the ids of the jackets that were added or removed.
+        cart = ShoppingCartModel.__table__
+        jackets = JacketModel.__table__
+        changed_ids = select(changed.c.jacket_id)
+        price = select(func.coalesce(func.sum(jackets.c.price), 0)).where(
+            jackets.c.id.in_(changed_ids)
+        ).scalar_subquery()
+        updated = update(cart).where(cart.c.id == cart_id, exists(changed_ids)).values(
+            amount=cart.c.amount + sign * price, version=cart.c.version + 1
+        ).returning(cart.c.id).cte("updated")
+        return {row.jacket_id for row in db.session.execute(changed_ids.add_cte(updated))}
+
+    @staticmethod
+    def drop_jackets(jacket_ids):
+        # Sold jackets leave every cart they are still in. Each cart's amount goes down by the prices of the jackets
+        # it lost, in the same statement, so it cannot race with the cart's owner editing it.
+        if not ShoppingCartManager._lock_carts_with(jacket_ids):
+            return
+        cart = ShoppingCartModel.__table__
+        jackets = JacketModel.__table__
+        removed = delete(shopping_cart_jackets).where(shopping_cart_jackets.c.jacket_id.in_(jacket_ids)).returning(
+            shopping_cart_jackets.c.shopping_cart_id, shopping_cart_jackets.c.jacket_id
+        ).cte("removed")
+        totals = select(removed.c.shopping_cart_id, func.sum(jackets.c.price).label("price")).join(
+            jackets, jackets.c.id == removed.c.jacket_id
+        ).group_by(removed.c.shopping_cart_id).subquery()
+        db.session.execute(
+            update(cart).add_cte(removed).where(cart.c.id == totals.c.shopping_cart_id).values(
+                amount=cart.c.amount - totals.c.price, version=cart.c.version + 1
+            )
+        )
@@ -0,0 +1,115 @@
+import io
+import tempfile
+from datetime import datetime, timedelta
+
+from decouple import config
+from sqlalchemy import select, update
+
+from db import db
+from managers.catalog import invalidate_catalog
+from managers.shopping_cart import ShoppingCartManager
+from models import JacketModel
+from services.jobs import job_queue
+from services.s3 import S3Service, UPLOAD_PREFIX
+from services.thumbnails import THUMBNAIL_FORMATS, THUMBNAIL_WIDTHS, make_thumbnails, thumbnail_key
+
+# Originals up to this size are downloaded into memory, larger ones spill to a temp file.
+DOWNLOAD_SPOOL_SIZE = 8 * 1024 * 1024
+# How long the queued job, or a try of the sweep, has before the sweep tries (again).
+THUMBNAIL_LEASE = timedelta(seconds=config("THUMBNAIL_LEASE_SECONDS", default=900, cast=int))
+
+
+class ThumbnailManager:
+    @staticmethod
+    def due_at():
+        # For JacketModel.thumbnails_due of a jacket with a new photo, which gets its job with schedule().
+        return datetime.utcnow() + THUMBNAIL_LEASE
+
+    @staticmethod
+    def schedule(jacket_id, pic_hash):
+        job_queue.enqueue_on_commit(ThumbnailManager.generate, jacket_id, pic_hash)
+
+    @staticmethod
+    def claim_due(*criteria):
+        # The jacket most overdue for thumbnails, with its due time pushed back by THUMBNAIL_LEASE and committed, so
+        # it is tried again at most once per lease. None if there is none.
+        now = datetime.utcnow()
+        jacket = (
+            db.session.query(JacketModel.id, JacketModel.pic_hash)
+            .filter(JacketModel.thumbnails_due <= now, *criteria)
+            .order_by(JacketModel.thumbnails_due)
+            .with_for_update(skip_locked=True)
+            .first()
+        )
+        if jacket is None:
+            return None
+
+        db.session.execute(
+            update(JacketModel).where(JacketModel.id == jacket.id).values(thumbnails_due=now + THUMBNAIL_LEASE)
+        )
+        db.session.commit()
+        return jacket
+
+    @staticmethod
+    def generate_due():
+        # Poller of the job queue. The queued job is lost with its process and gives up after a few attempts, so
+        # jackets still without thumbnails once they are due are found here. Uploads that are not stored yet are
+        # left to JacketManager.store_due_upload. Returns whether there was one.
+        jacket = ThumbnailManager.claim_due(~JacketModel.pic_hash.startswith(f"{UPLOAD_PREFIX}/"))
+        if jacket is None:
+            return False
+        ThumbnailManager.generate(jacket.id, jacket.pic_hash)
+        return True
+
+    @staticmethod
+    def generate(jacket_id, pic_hash):
+        # Runs as a background job. The jacket may have been deleted or given another photo since it was queued.
+        jacket = db.session.query(JacketModel.photo_url).filter(
+            JacketModel.id == jacket_id, JacketModel.pic_hash == pic_hash
+        ).first()
+        if not jacket:
+            return
+
+        # Thumbnails are keyed by the photo hash like the photo itself, so jackets sharing a photo share them too.
+        shared = db.session.query(JacketModel.thumbnails).filter(
+            JacketModel.pic_hash == pic_hash, JacketModel.thumbnails.isnot(None)
+        ).first()
+        if shared:
+            thumbnails = shared.thumbnails
+        else:
+            thumbnails = ThumbnailManager._upload_thumbnails(jacket.photo_url, pic_hash)
+
+        # Listings and carts show the thumbnails, so both get new versions. Carts are locked before the jackets,
+        # like in JacketManager.edit.
+        waiting = (JacketModel.pic_hash == pic_hash, JacketModel.thumbnails.is_(None))
+        ShoppingCartManager.touch_carts_with(select(JacketModel.id).where(*waiting))
+        updated = db.session.execute(
+            update(JacketModel)
+            .where(*waiting)
+            .values(thumbnails=thumbnails, thumbnails_due=None)
+            .returning(JacketModel.id)
+        ).scalars().all()
+        if updated:
+            invalidate_catalog()
+
+    @staticmethod
+    def _upload_thumbnails(photo_url, pic_hash):
+        s3 = S3Service()
+        thumbnails = {}
+        with tempfile.SpooledTemporaryFile(max_size=DOWNLOAD_SPOOL_SIZE) as original:
+            s3.download_photo(s3.key_from_url(photo_url), original)
+            original.seek(0)
+            for width, image_format, data in make_thumbnails(original):
+                content_type = THUMBNAIL_FORMATS[image_format][2]
+                url = s3.upload_photo(io.BytesIO(data), thumbnail_key(pic_hash, width, image_format), content_type)
+                thumbnails.setdefault(image_format, {})[str(width)] = url
+        return thumbnails
+
+    @staticmethod
+    def delete(pic_hash):
+        S3Service().delete_photos(
+            [thumbnail_key(pic_hash, width, image_format) for width in THUMBNAIL_WIDTHS for image_format in THUMBNAIL_FORMATS]
+        )
+
+
+job_queue.poll(ThumbnailManager.generate_due)
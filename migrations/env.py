@@ -7,6 +7,8 @@ from flask import current_app
 
 from alembic import context
 
+from models.jacket import SEARCH_VECTOR_COLUMN, SEARCH_VECTOR_INDEX
+
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
 config = context.config
@@ -26,6 +28,17 @@ config.set_main_option(
         '%', '%%'))
 target_metadata = current_app.extensions['migrate'].db.metadata
 
+
+def include_object(object, name, type_, reflected, compare_to):
+    # The full-text search column and its index are created with raw DDL (models.jacket.SEARCH_VECTOR_SQL), so they
+    # are not in the metadata and would be dropped by every autogenerated migration.
+    if type_ == "column" and object.table.name == "jacket" and name == SEARCH_VECTOR_COLUMN:
+        return False
+    if type_ == "index" and object.table.name == "jacket" and name == SEARCH_VECTOR_INDEX:
+        return False
+    return True
+
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -46,7 +59,8 @@ def run_migrations_offline():
     """
     url = config.get_main_option("sqlalchemy.url")
     context.configure(
-        url=url, target_metadata=target_metadata, literal_binds=True
+        url=url, target_metadata=target_metadata, literal_binds=True,
+        include_object=include_object
     )
 
     with context.begin_transaction():
@@ -78,6 +92,7 @@ def run_migrations_online():
             connection=connection,
             target_metadata=target_metadata,
             process_revision_directives=process_revision_directives,
+            include_object=include_object,
             **current_app.extensions['migrate'].configure_args
         )
 
@@ -0,0 +1,53 @@
+"""jacket version, one shopping cart per user
+
+Revision ID: 0b7d3e6f9a24
+Revises: c5e19a7b3d82
+Create Date: 2026-10-18 18:05:44.903162
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0b7d3e6f9a24'
+down_revision = 'c5e19a7b3d82'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('jacket', sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+
+    # Concurrent first requests of a user could create several carts. They are merged into the oldest one.
+    op.execute("""
+        CREATE TEMPORARY TABLE duplicate_carts ON COMMIT DROP AS
+        SELECT id, min(id) OVER (PARTITION BY user_id) AS kept_id FROM shopping_cart
+    """)
+    op.execute("DELETE FROM duplicate_carts WHERE id = kept_id")
+    op.execute("""
+        INSERT INTO shopping_cart_jackets (shopping_cart_id, jacket_id)
+        SELECT duplicate_carts.kept_id, shopping_cart_jackets.jacket_id
+        FROM shopping_cart_jackets JOIN duplicate_carts ON duplicate_carts.id = shopping_cart_jackets.shopping_cart_id
+        ON CONFLICT DO NOTHING
+    """)
+    op.execute("DELETE FROM shopping_cart_jackets USING duplicate_carts "
+               "WHERE shopping_cart_jackets.shopping_cart_id = duplicate_carts.id")
+    for table in ('transactions', 'orders'):
+        op.execute(f"UPDATE {table} SET shopping_cart_id = duplicate_carts.kept_id FROM duplicate_carts "
+                   f"WHERE {table}.shopping_cart_id = duplicate_carts.id")
+    op.execute("""
+        UPDATE shopping_cart SET version = version + 1, amount = (
+            SELECT coalesce(sum(jacket.price), 0) FROM shopping_cart_jackets
+            JOIN jacket ON jacket.id = shopping_cart_jackets.jacket_id
+            WHERE shopping_cart_jackets.shopping_cart_id = shopping_cart.id
+        )
+        WHERE id IN (SELECT kept_id FROM duplicate_carts)
+    """)
+    op.execute("DELETE FROM shopping_cart USING duplicate_carts WHERE shopping_cart.id = duplicate_carts.id")
+    op.create_unique_constraint('shopping_cart_user_id_key', 'shopping_cart', ['user_id'])
+
+
+def downgrade():
+    op.drop_constraint('shopping_cart_user_id_key', 'shopping_cart', type_='unique')
+    op.drop_column('jacket', 'version')
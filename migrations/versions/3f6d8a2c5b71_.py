@@ -0,0 +1,24 @@
+"""index jacket pic_hash
+
+Revision ID: 3f6d8a2c5b71
+Revises: e7b3c9d41f08
+Create Date: 2026-10-18 13:02:44.518203
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f6d8a2c5b71'
+down_revision = 'e7b3c9d41f08'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(op.f('ix_jacket_pic_hash'), 'jacket', ['pic_hash'], unique=False)
+
+
+def downgrade():
+    op.drop_index(op.f('ix_jacket_pic_hash'), table_name='jacket')
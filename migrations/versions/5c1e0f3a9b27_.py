@@ -0,0 +1,34 @@
+"""catalog filter indexes
+
+Revision ID: 5c1e0f3a9b27
+Revises: 231cf710704b
+Create Date: 2026-10-18 09:12:40.118204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5c1e0f3a9b27'
+down_revision = '231cf710704b'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('ix_jacket_created_on_id', 'jacket', ['created_on', 'id'], unique=False)
+    op.create_index('ix_jacket_price_id', 'jacket', ['price', 'id'], unique=False)
+    op.create_index('ix_jacket_brand_created_on_id', 'jacket', ['brand', 'created_on', 'id'], unique=False)
+    op.create_index('ix_jacket_brand_price_id', 'jacket', ['brand', 'price', 'id'], unique=False)
+    op.create_index('ix_jacket_size_created_on_id', 'jacket', ['size', 'created_on', 'id'], unique=False)
+    op.create_index('ix_jacket_creator_id_created_on_id', 'jacket', ['creator_id', 'created_on', 'id'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_jacket_creator_id_created_on_id', table_name='jacket')
+    op.drop_index('ix_jacket_size_created_on_id', table_name='jacket')
+    op.drop_index('ix_jacket_brand_price_id', table_name='jacket')
+    op.drop_index('ix_jacket_brand_created_on_id', table_name='jacket')
+    op.drop_index('ix_jacket_price_id', table_name='jacket')
+    op.drop_index('ix_jacket_created_on_id', table_name='jacket')
@@ -0,0 +1,64 @@
+"""orders and jacket status
+
+Revision ID: 6a0f2d8e4b19
+Revises: d41c7e9a2f35
+Create Date: 2026-10-18 15:22:17.630584
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '6a0f2d8e4b19'
+down_revision = 'd41c7e9a2f35'
+branch_labels = None
+depends_on = None
+
+jacket_status = sa.Enum('available', 'reserved', 'sold', name='jacketstatus')
+order_status = sa.Enum('pending', 'processing', 'completed', 'failed', name='orderstatus')
+
+
+def upgrade():
+    jacket_status.create(op.get_bind())
+    op.add_column('jacket', sa.Column('status', jacket_status, server_default='available', nullable=False))
+    op.create_table('orders',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('shopping_cart_id', sa.Integer(), nullable=False),
+    sa.Column('amount', sa.Integer(), nullable=False),
+    sa.Column('status', order_status, nullable=False),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('error', sa.Text(), nullable=True),
+    sa.Column('locked_until', sa.DateTime(), nullable=True),
+    sa.Column('created_on', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_on', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['shopping_cart_id'], ['shopping_cart.id'], ),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_orders_status'), 'orders', ['status'], unique=False)
+    op.create_index(op.f('ix_orders_user_id'), 'orders', ['user_id'], unique=False)
+    op.create_table('order_jackets',
+    sa.Column('order_id', sa.Integer(), nullable=False),
+    sa.Column('jacket_id', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['jacket_id'], ['jacket.id'], ),
+    sa.ForeignKeyConstraint(['order_id'], ['orders.id'], ),
+    sa.PrimaryKeyConstraint('order_id', 'jacket_id')
+    )
+    op.add_column('transactions', sa.Column('order_id', sa.Integer(), nullable=True))
+    op.create_index(op.f('ix_transactions_order_id'), 'transactions', ['order_id'], unique=False)
+    op.create_foreign_key('transactions_order_id_fkey', 'transactions', 'orders', ['order_id'], ['id'])
+
+
+def downgrade():
+    op.drop_constraint('transactions_order_id_fkey', 'transactions', type_='foreignkey')
+    op.drop_index(op.f('ix_transactions_order_id'), table_name='transactions')
+    op.drop_column('transactions', 'order_id')
+    op.drop_table('order_jackets')
+    op.drop_index(op.f('ix_orders_user_id'), table_name='orders')
+    op.drop_index(op.f('ix_orders_status'), table_name='orders')
+    op.drop_table('orders')
+    op.drop_column('jacket', 'status')
+    order_status.drop(op.get_bind())
+    jacket_status.drop(op.get_bind())
@@ -0,0 +1,30 @@
+"""jacket full-text search vector
+
+Revision ID: 9a4d2b7e6c13
+Revises: 5c1e0f3a9b27
+Create Date: 2026-10-18 10:03:17.502961
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9a4d2b7e6c13'
+down_revision = '5c1e0f3a9b27'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute(
+        "ALTER TABLE jacket ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ("
+        "setweight(to_tsvector('english', coalesce(brand, '')), 'A') || "
+        "setweight(to_tsvector('english', coalesce(description, '')), 'B')) STORED"
+    )
+    op.execute("CREATE INDEX ix_jacket_search_vector ON jacket USING gin (search_vector)")
+
+
+def downgrade():
+    op.drop_index('ix_jacket_search_vector', table_name='jacket')
+    op.drop_column('jacket', 'search_vector')
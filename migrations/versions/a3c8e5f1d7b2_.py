@@ -0,0 +1,29 @@
+"""jacket thumbnails due
+
+Revision ID: a3c8e5f1d7b2
+Revises: 0b7d3e6f9a24
+Create Date: 2026-10-18 21:12:37.418265
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a3c8e5f1d7b2'
+down_revision = '0b7d3e6f9a24'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('jacket', sa.Column('thumbnails_due', sa.DateTime(), nullable=True))
+    # Jackets whose thumbnails are missing are due now.
+    op.execute("UPDATE jacket SET thumbnails_due = now() AT TIME ZONE 'utc' WHERE thumbnails IS NULL")
+    op.create_index('ix_jacket_thumbnails_due', 'jacket', ['thumbnails_due'], unique=False,
+                    postgresql_where=sa.text('thumbnails_due IS NOT NULL'))
+
+
+def downgrade():
+    op.drop_index('ix_jacket_thumbnails_due', table_name='jacket')
+    op.drop_column('jacket', 'thumbnails_due')
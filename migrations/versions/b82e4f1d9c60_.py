@@ -0,0 +1,24 @@
+"""jacket thumbnails
+
+Revision ID: b82e4f1d9c60
+Revises: 3f6d8a2c5b71
+Create Date: 2026-10-18 13:41:09.227614
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b82e4f1d9c60'
+down_revision = '3f6d8a2c5b71'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('jacket', sa.Column('thumbnails', sa.JSON(none_as_null=True), nullable=True))
+
+
+def downgrade():
+    op.drop_column('jacket', 'thumbnails')
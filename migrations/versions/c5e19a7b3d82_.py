@@ -0,0 +1,53 @@
+"""transaction line items
+
+Revision ID: c5e19a7b3d82
+Revises: 6a0f2d8e4b19
+Create Date: 2026-10-18 16:41:05.218377
+
+"""
+import uuid
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c5e19a7b3d82'
+down_revision = '6a0f2d8e4b19'
+branch_labels = None
+depends_on = None
+
+# managers.order.PAYOUT_NAMESPACE. Until now an order paid every jacket separately, with a payout id made from
+# the order and the jacket, which is how those transactions are matched to their jacket here.
+PAYOUT_NAMESPACE = uuid.UUID("a403411f-283e-44b8-8671-75f09f51add9")
+
+
+def upgrade():
+    op.create_table('transaction_jackets',
+    sa.Column('transaction_id', sa.Integer(), nullable=False),
+    sa.Column('jacket_id', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['jacket_id'], ['jacket.id'], ),
+    sa.ForeignKeyConstraint(['transaction_id'], ['transactions.id'], ),
+    sa.PrimaryKeyConstraint('transaction_id', 'jacket_id')
+    )
+
+    bind = op.get_bind()
+    transactions = {
+        row.target_account_id: row.id
+        for row in bind.execute(sa.text(
+            "SELECT id, target_account_id FROM transactions WHERE order_id IS NOT NULL"
+        ))
+    }
+    line_items = []
+    for row in bind.execute(sa.text("SELECT order_id, jacket_id FROM order_jackets")):
+        payout_id = str(uuid.uuid5(PAYOUT_NAMESPACE, f"order-{row.order_id}-jacket-{row.jacket_id}"))
+        if payout_id in transactions:
+            line_items.append({"transaction_id": transactions[payout_id], "jacket_id": row.jacket_id})
+    if line_items:
+        bind.execute(sa.text(
+            "INSERT INTO transaction_jackets (transaction_id, jacket_id) VALUES (:transaction_id, :jacket_id)"
+        ), line_items)
+
+
+def downgrade():
+    op.drop_table('transaction_jackets')
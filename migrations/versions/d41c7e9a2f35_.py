@@ -0,0 +1,32 @@
+"""wise recipients
+
+Revision ID: d41c7e9a2f35
+Revises: b82e4f1d9c60
+Create Date: 2026-10-18 14:37:52.106338
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd41c7e9a2f35'
+down_revision = 'b82e4f1d9c60'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('wise_recipients',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('profile_id', sa.BigInteger(), nullable=False),
+    sa.Column('iban', sa.String(length=34), nullable=False),
+    sa.Column('recipient_id', sa.BigInteger(), nullable=False),
+    sa.Column('created_on', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('profile_id', 'iban', name='uq_wise_recipients_profile_id_iban')
+    )
+
+
+def downgrade():
+    op.drop_table('wise_recipients')
@@ -0,0 +1,38 @@
+"""partial catalog indexes
+
+Revision ID: e2f7b4a9c6d1
+Revises: a3c8e5f1d7b2
+Create Date: 2026-10-18 21:48:09.502716
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e2f7b4a9c6d1'
+down_revision = 'a3c8e5f1d7b2'
+branch_labels = None
+depends_on = None
+
+CATALOG_INDEXES = (
+    ('ix_jacket_created_on_id', ['created_on', 'id']),
+    ('ix_jacket_price_id', ['price', 'id']),
+    ('ix_jacket_brand_created_on_id', ['brand', 'created_on', 'id']),
+    ('ix_jacket_brand_price_id', ['brand', 'price', 'id']),
+    ('ix_jacket_size_created_on_id', ['size', 'created_on', 'id']),
+    ('ix_jacket_creator_id_created_on_id', ['creator_id', 'created_on', 'id']),
+)
+
+
+def upgrade():
+    # Only available jackets are listed, so the catalog indexes only hold those.
+    for name, columns in CATALOG_INDEXES:
+        op.drop_index(name, table_name='jacket')
+        op.create_index(name, 'jacket', columns, unique=False, postgresql_where=sa.text("status = 'available'"))
+
+
+def downgrade():
+    for name, columns in CATALOG_INDEXES:
+        op.drop_index(name, table_name='jacket')
+        op.create_index(name, 'jacket', columns, unique=False)
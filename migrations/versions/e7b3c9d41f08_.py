@@ -0,0 +1,31 @@
+"""catalog and shopping cart versions
+
+Revision ID: e7b3c9d41f08
+Revises: 9a4d2b7e6c13
+Create Date: 2026-10-18 11:26:05.930441
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e7b3c9d41f08'
+down_revision = '9a4d2b7e6c13'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('catalog_version',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('version', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.execute("INSERT INTO catalog_version (id, version) VALUES (1, 0)")
+    op.add_column('shopping_cart', sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+
+
+def downgrade():
+    op.drop_column('shopping_cart', 'version')
+    op.drop_table('catalog_version')
@@ -2,3 +2,6 @@ from models.jacket import *
 from models.user import *
 from models.shopping_cart import *
 from models.transaction import *
+from models.catalog import *
+from models.wise_recipient import *
+from models.order import *
@@ -0,0 +1,15 @@
+from sqlalchemy import DDL, event
+
+from db import db
+
+
+class CatalogVersionModel(db.Model):
+    __tablename__ = 'catalog_version'
+
+    # Single row, bumped after every write to the catalog commits. Cheap to read, so it backs the catalog ETags.
+    id = db.Column(db.Integer, primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=0)
+
+
+event.listen(CatalogVersionModel.__table__, "after_create",
+             DDL("INSERT INTO catalog_version (id, version) VALUES (1, 0)"))
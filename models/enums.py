@@ -14,3 +14,17 @@ class JacketSizes(Enum):
     s = "Small"
     m = "Medium"
     l = "Large"
+
+
+class JacketStatus(Enum):
+    available = "available"
+    # Held by an order whose payouts are still being made.
+    reserved = "reserved"
+    sold = "sold"
+
+
+class OrderStatus(Enum):
+    pending = "pending"
+    processing = "processing"
+    completed = "completed"
+    failed = "failed"
@@ -1,11 +1,28 @@
-from sqlalchemy import func
+from sqlalchemy import DDL, event, func, text
 
 from db import db
-from models.enums import JacketSizes
+from models.enums import JacketSizes, JacketStatus
+
+
+# The catalog only lists available jackets, so its indexes leave out the reserved and sold ones, which pile up.
+CATALOG_INDEX_WHERE = text("status = 'available'")
 
 
 class JacketModel(db.Model):
     __tablename__ = 'jacket'
+    # Composite indexes for the catalog filters. Each ends with the keyset pagination columns so a filtered,
+    # sorted page is a single index range scan.
+    __table_args__ = (
+        db.Index('ix_jacket_created_on_id', 'created_on', 'id', postgresql_where=CATALOG_INDEX_WHERE),
+        db.Index('ix_jacket_price_id', 'price', 'id', postgresql_where=CATALOG_INDEX_WHERE),
+        db.Index('ix_jacket_brand_created_on_id', 'brand', 'created_on', 'id', postgresql_where=CATALOG_INDEX_WHERE),
+        db.Index('ix_jacket_brand_price_id', 'brand', 'price', 'id', postgresql_where=CATALOG_INDEX_WHERE),
+        db.Index('ix_jacket_size_created_on_id', 'size', 'created_on', 'id', postgresql_where=CATALOG_INDEX_WHERE),
+        db.Index('ix_jacket_creator_id_created_on_id', 'creator_id', 'created_on', 'id',
+                 postgresql_where=CATALOG_INDEX_WHERE),
+        # Only jackets waiting for thumbnails are in it.
+        db.Index('ix_jacket_thumbnails_due', 'thumbnails_due', postgresql_where=text('thumbnails_due IS NOT NULL')),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     photo_url = db.Column(db.String(255), nullable=False)
@@ -15,8 +32,39 @@ class JacketModel(db.Model):
     size = db.Column(db.Enum(JacketSizes), nullable=False, default=JacketSizes.m)
     price = db.Column(db.Integer, nullable=False, default=0)
     creator_id = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=False)
-    pic_hash = db.Column(db.String(), nullable=False)
+    # Only available jackets are listed and can be put in a cart.
+    status = db.Column(db.Enum(JacketStatus), nullable=False, default=JacketStatus.available,
+                       server_default=JacketStatus.available.name)
+    # Bumped by every edit and status change. The ORM only updates or deletes a jacket at the version it loaded, so
+    # a jacket reserved or changed by another transaction meanwhile raises StaleDataError instead of being overwritten.
+    # Bulk updates of the status bump it themselves.
+    version = db.Column(db.Integer, nullable=False, default=1, server_default="1")
+    # Photos are stored once per hash and shared, so this is looked up on every photo upload and release.
+    pic_hash = db.Column(db.String(), nullable=False, index=True)
+    # {format: {width: url}}, filled in by a background job after the photo is stored.
+    thumbnails = db.Column(db.JSON(none_as_null=True))
+    # Until thumbnails are made: when the job queue's sweep (ThumbnailManager.generate_due) should make them, in
+    # case the job queued for it does not.
+    thumbnails_due = db.Column(db.DateTime)
     # In case I want to get the creator of the jacket without a join statement:
     creator = db.relationship("UserModel")
     # Get all shopping carts an instance of this model is in by jacket.shopping_carts
     shopping_carts = db.relationship("ShoppingCartModel", secondary="shopping_cart_jackets", back_populates="jackets")
+
+    __mapper_args__ = {"version_id_col": version}
+
+
+# Full-text search column. It is created with raw DDL, only on PostgreSQL, so the model stays portable; the same
+# statements run in the migration that introduced it. Neither is in the metadata, so migrations/env.py leaves them
+# out of autogenerate, which would otherwise drop them.
+SEARCH_VECTOR_COLUMN = "search_vector"
+SEARCH_VECTOR_INDEX = "ix_jacket_search_vector"
+SEARCH_VECTOR_SQL = (
+    f"ALTER TABLE jacket ADD COLUMN {SEARCH_VECTOR_COLUMN} tsvector GENERATED ALWAYS AS ("
+    "setweight(to_tsvector('english', coalesce(brand, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'B')) STORED",
+    f"CREATE INDEX {SEARCH_VECTOR_INDEX} ON jacket USING gin ({SEARCH_VECTOR_COLUMN})",
+)
+
+for statement in SEARCH_VECTOR_SQL:
+    event.listen(JacketModel.__table__, "after_create", DDL(statement).execute_if(dialect="postgresql"))
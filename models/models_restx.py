@@ -1,12 +1,17 @@
-from flask_restx import Namespace, fields, reqparse
+from flask_restx import Namespace, fields, inputs, reqparse
+
+from models.enums import JacketSizes
 
 jacket_ns = Namespace("jacket", description="Jacket related operations")
 jacket_model = jacket_ns.model('jacket', {'photo': fields.String('Base64 codified image.'),
                                           'extension': fields.String('File extension of image'),
+                                          'photo_key': fields.String('Key returned by /jacket/upload, '
+                                                                     'instead of photo and extension'),
                                           'brand': fields.String('Sample brand'),
                                           'description': fields.String('Description of jacket'),
                                           'size': fields.String('xs,s,m,l'),
                                           'price': fields.Integer()})
+photo_upload_model = jacket_ns.model('photo_upload', {'extension': fields.String('jpg, jpeg, png or webp')})
 
 shopping_cart_ns = Namespace("shopping_cart", description="Shopping cart related operations")
 
@@ -21,6 +26,23 @@ jacket_id_model = shopping_cart_ns.model('jacket_id', {
     'jacket_id': fields.Integer(description='The jacket identifier', required=True)
 })
 
+jacket_ids_model = shopping_cart_ns.model('jacket_ids', {
+    'jacket_ids': fields.List(fields.Integer, description='Up to 100 jacket identifiers', required=True)
+})
+
+cart_item_result_model = shopping_cart_ns.model('cart_item_result', {
+    'jacket_id': fields.Integer(description='The jacket identifier'),
+    'status': fields.String(description='added, already_in_cart or not_available; removed or not_in_cart')
+})
+
+shopping_cart_bulk_model = shopping_cart_ns.inherit('shopping_cart_bulk', shopping_cart_model, {
+    'results': fields.List(fields.Nested(cart_item_result_model), description='Outcome for every requested jacket')
+})
+
+metrics_ns = Namespace("metrics", description="Operational metrics, admins only")
+
+order_ns = Namespace("orders", description="Checked out shopping carts and their payouts")
+
 auth_ns = Namespace("auth", description="Authentication related operations")
 auth_model = auth_ns.model('user', {'first_name': fields.String('Ivan'),
                                     'last_name': fields.String('Ivanov'),
@@ -37,5 +59,23 @@ auth_model_login = auth_ns.model('login', {'email': fields.String('Email of user
 
 
 # Define the query parameters parser
-brand_parser = reqparse.RequestParser()
-brand_parser.add_argument('brand', type=str, help='Filter jackets by brand')
\ No newline at end of file
+jacket_list_parser = reqparse.RequestParser()
+jacket_list_parser.add_argument('brand', type=str, location='args', help='Filter jackets by brand')
+jacket_list_parser.add_argument('size', type=str, location='args', choices=[size.name for size in JacketSizes],
+                                help='Filter jackets by size')
+jacket_list_parser.add_argument('min_price', type=int, location='args', help='Lowest price to include')
+jacket_list_parser.add_argument('max_price', type=int, location='args', help='Highest price to include')
+jacket_list_parser.add_argument('creator_id', type=int, location='args', help='Filter jackets by creator')
+jacket_list_parser.add_argument('sort', type=str, location='args', default='created_on',
+                                choices=['created_on', '-created_on', 'price', '-price'],
+                                help='Sort order, prefix with - for descending')
+jacket_list_parser.add_argument('limit', type=int, location='args', help='Page size, at most 100')
+jacket_list_parser.add_argument('cursor', type=str, location='args',
+                                help='Value of the X-Next-Cursor header of the previous page')
+jacket_list_parser.add_argument('stream', type=inputs.boolean, location='args', default=False,
+                                help='Stream the whole catalog as NDJSON instead of a page')
+
+jacket_search_parser = reqparse.RequestParser()
+jacket_search_parser.add_argument('q', type=str, location='args', required=True,
+                                  help='Words to look for in the brand and description')
+jacket_search_parser.add_argument('limit', type=int, location='args', help='Number of results, at most 100')
@@ -0,0 +1,30 @@
+from sqlalchemy import func
+
+from db import db
+from models.enums import OrderStatus
+
+
+class OrderModel(db.Model):
+    # A checked out cart. Its payouts are made by a background job, see OrderManager.process_order.
+    __tablename__ = "orders"
+
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=False, index=True)
+    shopping_cart_id = db.Column(db.Integer, db.ForeignKey("shopping_cart.id"), nullable=False)
+    amount = db.Column(db.Integer, nullable=False)
+    status = db.Column(db.Enum(OrderStatus), nullable=False, default=OrderStatus.pending, index=True)
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    error = db.Column(db.Text)
+    # Set while a worker is making the payouts. An order whose lease ran out is picked up again.
+    locked_until = db.Column(db.DateTime)
+    created_on = db.Column(db.DateTime, nullable=False, server_default=func.now())
+    updated_on = db.Column(db.DateTime, nullable=False, server_default=func.now(), onupdate=func.now())
+    user = db.relationship("UserModel")
+    jackets = db.relationship("JacketModel", secondary="order_jackets", order_by="JacketModel.id")
+    transactions = db.relationship("TransactionModel", back_populates="order")
+
+
+order_jackets = db.Table('order_jackets',
+                         db.Column('order_id', db.Integer, db.ForeignKey('orders.id'), primary_key=True),
+                         db.Column('jacket_id', db.Integer, db.ForeignKey('jacket.id'), primary_key=True)
+                         )
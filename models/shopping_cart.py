@@ -5,8 +5,10 @@ class ShoppingCartModel(db.Model):
     __tablename__ = 'shopping_cart'
 
     id = db.Column(db.Integer, primary_key=True)
-    user_id = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=False)
+    user_id = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=False, unique=True)
     amount = db.Column(db.Integer, default=0)
+    # Bumped on every change to the cart, used as its ETag.
+    version = db.Column(db.Integer, nullable=False, default=1, server_default="1")
     user = db.relationship("UserModel", back_populates="shopping_cart")
     jackets = db.relationship("JacketModel", secondary="shopping_cart_jackets", back_populates="shopping_carts")
 
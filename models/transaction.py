@@ -15,3 +15,14 @@ class TransactionModel(db.Model):
     created_on = db.Column(db.DateTime, server_default=func.now())
     shopping_cart_id = db.Column(db.Integer, db.ForeignKey("shopping_cart.id"), nullable=False)
     shopping_cart = db.relationship("ShoppingCartModel")
+    order_id = db.Column(db.Integer, db.ForeignKey("orders.id"), index=True)
+    order = db.relationship("OrderModel", back_populates="transactions")
+    # The jackets paid for by this transfer. A creator gets one transfer for all their jackets in an order.
+    jackets = db.relationship("JacketModel", secondary="transaction_jackets", order_by="JacketModel.id")
+
+
+transaction_jackets = db.Table('transaction_jackets',
+                               db.Column('transaction_id', db.Integer, db.ForeignKey('transactions.id'),
+                                         primary_key=True),
+                               db.Column('jacket_id', db.Integer, db.ForeignKey('jacket.id'), primary_key=True)
+                               )
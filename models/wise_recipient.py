@@ -0,0 +1,15 @@
+from sqlalchemy import func
+
+from db import db
+
+
+class WiseRecipientModel(db.Model):
+    # Wise recipient accounts already created for an IBAN, so repeat payouts to a creator skip creating it again.
+    __tablename__ = "wise_recipients"
+    __table_args__ = (db.UniqueConstraint("profile_id", "iban", name="uq_wise_recipients_profile_id_iban"),)
+
+    id = db.Column(db.Integer, primary_key=True)
+    profile_id = db.Column(db.BigInteger, nullable=False)
+    iban = db.Column(db.String(34), nullable=False)
+    recipient_id = db.Column(db.BigInteger, nullable=False)
+    created_on = db.Column(db.DateTime, server_default=func.now())
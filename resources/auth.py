@@ -1,4 +1,4 @@
-from flask import request
+from flask import g
 from flask_api import status
 from flask_restx import Resource
 
@@ -10,11 +10,11 @@ from utils.decorators import validate_schema
 
 @auth_ns.route("/register")
 class RegisterResource(Resource):
-    @auth_ns.expect(auth_model, validate=True)
+    @auth_ns.expect(auth_model, validate=False)
     @auth_ns.response(201, 'Token is returned')
     @validate_schema(RegisterSchemaRequest)
     def post(self):
-        data = request.get_json()
+        data = g.request_data
         existing_user = GuestManager.get_user_by_email(data['email'])
         if existing_user:
             return {'message': 'Email already exists'}, 409
@@ -25,10 +25,10 @@ class RegisterResource(Resource):
 
 @auth_ns.route("/login")
 class LoginResource(Resource):
-    @auth_ns.expect(auth_model_login, validate=True)
+    @auth_ns.expect(auth_model_login, validate=False)
     @auth_ns.response(200, 'Token is returned')
     @validate_schema(LoginSchemaRequest)
     def post(self):
-        data = request.get_json()
+        data = g.request_data
         token = GuestManager.login(data)
         return {"token": token}, status.HTTP_200_OK
@@ -1,34 +1,67 @@
-from flask import request
+import json
+
+from flask import g, Response, stream_with_context
 from flask_api import status
 from flask_restx import Resource
 
 from managers.auth import auth
+from managers.catalog import CATALOG_CACHE, catalog_version
 from managers.jacket import JacketManager
+from managers.search import SearchManager
 from models import UserRole
-from models.models_restx import jacket_ns, jacket_model, brand_parser
-from schemas.requests.jacket import JacketSchemaRequest
-from schemas.responses.jacket import JacketSchemaResponse
-from utils.decorators import permission_required, validate_schema
+from models.models_restx import jacket_ns, jacket_model, jacket_list_parser, jacket_search_parser, \
+    photo_upload_model
+from schemas.requests.jacket import JacketSchemaRequest, PhotoUploadSchemaRequest
+from schemas.responses.jacket import jacket_serializer
+from services.cache import response_cache
+from services.replicas import replica_router
+from utils.etag import make_etag, etag_headers, not_modified
+from utils.decorators import permission_required, read_replica, validate_schema
 
 
 @jacket_ns.route("")
 class JacketsResource(Resource):
     @jacket_ns.doc('get_jackets', responses={200: ('Jackets', jacket_model)})
-    @jacket_ns.expect(brand_parser, validate=False)
+    @jacket_ns.expect(jacket_list_parser, validate=False)
     @auth.login_required
+    @read_replica
     def get(self):
         user = auth.current_user()
-        brand = request.args.get('brand', None)
+        args = jacket_list_parser.parse_args()
 
-        if brand:
-            jackets = JacketManager.get_jackets_by_brand(user, brand)
-        else:
-            jackets = JacketManager.get_jackets(user)
+        if args['stream']:
+            return self._stream(user, args)
 
-        if jackets:
-            return JacketSchemaResponse().dump(jackets, many=True)
+        # Pages are cached per catalog version too, so a lagging replica cannot cache a stale page as the current one.
+        version = catalog_version()
+        etag = make_etag('list', version, args)
+        cached_on_client = not_modified(etag)
+        if cached_on_client:
+            return cached_on_client
+
+        def load_page():
+            jackets, next_cursor = JacketManager.get_jackets(user, args, args['limit'], args['cursor'])
+            return {'jackets': jacket_serializer.dump(jackets, many=True), 'next_cursor': next_cursor}
+
+        page, hit = response_cache.get_or_set(CATALOG_CACHE, dict(args, view='list', version=version), load_page)
+        headers = {'X-Cache': 'HIT' if hit else 'MISS', **etag_headers(etag)}
+        if page['next_cursor']:
+            headers['X-Next-Cursor'] = page['next_cursor']
+
+        if page['jackets']:
+            return page['jackets'], status.HTTP_200_OK, headers
         else:
-            return f"No jackets yet"
+            return f"No jackets yet", status.HTTP_200_OK, headers
+
+    @staticmethod
+    def _stream(user, filters):
+        # Runs after get() has returned, when read_replica no longer routes the session.
+        def generate():
+            with replica_router.reads_for(user):
+                for jacket in JacketManager.stream_jackets(user, filters):
+                    yield json.dumps(jacket_serializer.dump(jacket)) + "\n"
+
+        return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
 
     @jacket_ns.expect(jacket_model, validate=False)
     @jacket_ns.response(201, 'Jacket created')
@@ -36,10 +69,50 @@ class JacketsResource(Resource):
     @permission_required(UserRole.creator)
     @validate_schema(JacketSchemaRequest)
     def post(self):
-        data = request.get_json()
+        data = g.request_data
         current_user = auth.current_user()
         new_jacket = JacketManager.create(data, current_user)
-        return JacketSchemaResponse().dump(new_jacket), status.HTTP_201_CREATED
+        return jacket_serializer.dump(new_jacket), status.HTTP_201_CREATED
+
+
+@jacket_ns.route("/upload")
+class PhotoUploadResource(Resource):
+    @jacket_ns.expect(photo_upload_model, validate=False)
+    @jacket_ns.response(201, 'Presigned POST to upload the photo to, and the photo_key to create the jacket with')
+    @auth.login_required
+    @permission_required(UserRole.creator)
+    @validate_schema(PhotoUploadSchemaRequest)
+    def post(self):
+        data = g.request_data
+        upload = JacketManager.create_upload(auth.current_user(), data['extension'])
+        return upload, status.HTTP_201_CREATED
+
+
+@jacket_ns.route("/search")
+class JacketSearchResource(Resource):
+    @jacket_ns.doc('search_jackets', responses={200: ('Jackets ranked by relevance', jacket_model)})
+    @jacket_ns.expect(jacket_search_parser, validate=False)
+    @auth.login_required
+    @read_replica
+    def get(self):
+        args = jacket_search_parser.parse_args()
+        version = catalog_version()
+        etag = make_etag('search', version, args)
+        cached_on_client = not_modified(etag)
+        if cached_on_client:
+            return cached_on_client
+
+        def load_results():
+            return jacket_serializer.dump(SearchManager.search_jackets(args['q'], args['limit']), many=True)
+
+        jackets, hit = response_cache.get_or_set(CATALOG_CACHE, dict(args, view='search', version=version),
+                                                 load_results)
+        headers = {'X-Cache': 'HIT' if hit else 'MISS', **etag_headers(etag)}
+
+        if jackets:
+            return jackets, status.HTTP_200_OK, headers
+        else:
+            return f"No jackets found", status.HTTP_200_OK, headers
 
 
 # I create a separate class for working with requests for specific jackets because Flask won't let me use the same class
@@ -63,13 +136,13 @@ class JacketEditResource(Resource):
     @validate_schema(JacketSchemaRequest)
     def put(self, jacket_id):
         user = auth.current_user()
-        data = request.get_json()
+        data = g.request_data
 
         edited_jacket = JacketManager.edit(jacket_id, data, user.id)
         if edited_jacket is None:
             return {'message': 'Jacket not found'}, status.HTTP_404_NOT_FOUND
 
-        return JacketSchemaResponse().dump(edited_jacket), status.HTTP_200_OK
+        return jacket_serializer.dump(edited_jacket), status.HTTP_200_OK
 
     @jacket_ns.doc('delete_jacket',
                    responses={200: 'Jacket successfully deleted', 404: 'Jacket not found or not owned by the user'})
@@ -0,0 +1,28 @@
+from flask_api import status
+from flask_restx import Resource
+
+from db import db
+from managers.auth import auth
+from models import UserRole
+from models.models_restx import metrics_ns
+from services.cache import response_cache
+from utils.decorators import permission_required
+
+
+@metrics_ns.route("/cache")
+class CacheMetricsResource(Resource):
+    @metrics_ns.doc('cache_metrics', responses={200: 'Response cache hit/miss counters'})
+    @auth.login_required
+    @permission_required(UserRole.admin)
+    def get(self):
+        return response_cache.stats(), status.HTTP_200_OK
+
+
+@metrics_ns.route("/pool")
+class PoolMetricsResource(Resource):
+    @metrics_ns.doc('pool_metrics', responses={200: 'Database connection pool usage and checkout wait times of this '
+                                                    'worker process'})
+    @auth.login_required
+    @permission_required(UserRole.admin)
+    def get(self):
+        return db.engine.pool.stats(), status.HTTP_200_OK
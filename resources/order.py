@@ -0,0 +1,19 @@
+from flask_api import status
+from flask_restx import Resource
+
+from managers.auth import auth
+from managers.order import OrderManager
+from models.models_restx import order_ns
+from schemas.responses.order import OrderSchemaResponse
+
+
+@order_ns.route("/<int:order_id>")
+@order_ns.param('order_id', 'The order identifier returned by the checkout')
+class OrderResource(Resource):
+    @order_ns.doc('get_order', responses={200: 'Order and the progress of its payouts', 404: 'Order not found'})
+    @auth.login_required
+    def get(self, order_id):
+        order = OrderManager.get_order(auth.current_user(), order_id)
+        if order is None:
+            return {'message': 'Order not found'}, status.HTTP_404_NOT_FOUND
+        return OrderSchemaResponse().dump(order), status.HTTP_200_OK
@@ -1,11 +1,20 @@
 from resources.auth import RegisterResource, LoginResource
-from resources.jacket import JacketsResource, JacketEditResource
-from resources.shopping_cart import ShoppingCartResource
+from resources.jacket import JacketsResource, JacketEditResource, JacketSearchResource, \
+    PhotoUploadResource
+from resources.metrics import CacheMetricsResource, PoolMetricsResource
+from resources.order import OrderResource
+from resources.shopping_cart import ShoppingCartResource, ShoppingCartJacketsResource
 
 routes = (
     (RegisterResource, "/auth/register"),
     (LoginResource, "/auth/login"),
     (JacketsResource, "/jacket"),
     (JacketEditResource, "/jacket/<int:jacket_id>"),
+    (JacketSearchResource, "/jacket/search"),
+    (PhotoUploadResource, "/jacket/upload"),
     (ShoppingCartResource, "/shopping_cart"),
+    (ShoppingCartJacketsResource, "/shopping_cart/jackets"),
+    (CacheMetricsResource, "/metrics/cache"),
+    (PoolMetricsResource, "/metrics/pool"),
+    (OrderResource, "/orders/<int:order_id>"),
 )
@@ -1,13 +1,17 @@
-from flask import request
+from flask import g, request
 from flask_api import status
 from flask_restx import Resource
 
 from managers.auth import auth
+from managers.order import OrderManager
 from managers.shopping_cart import ShoppingCartManager
-from models.models_restx import shopping_cart_ns, shopping_cart_model, jacket_id_model
-from schemas.responses.shopping_cart import ShoppingCartSchemaResponse
+from models.models_restx import shopping_cart_ns, shopping_cart_model, jacket_id_model, jacket_ids_model, \
+    shopping_cart_bulk_model
+from schemas.requests.shopping_cart import ShoppingCartJacketsSchemaRequest
+from schemas.responses.shopping_cart import shopping_cart_serializer
 from schemas.shopping_cart_base import ShoppingCartBase
-from utils.decorators import validate_schema
+from utils.decorators import read_replica, validate_schema
+from utils.etag import make_etag, etag_headers, not_modified
 
 
 @shopping_cart_ns.route("")
@@ -15,24 +19,34 @@ class ShoppingCartResource(Resource):
     @shopping_cart_ns.doc('get_shopping_cart',
                           responses={200: ('Shopping Cart', shopping_cart_model), 204: 'Your shopping cart is empty'})
     @auth.login_required
+    @read_replica
     def get(self):
         user = auth.current_user()
+        # Checking the version first only pays off when the client has a copy to compare it with.
+        cart_version = ShoppingCartManager.get_cart_version(user) if request.if_none_match else None
+        if cart_version:
+            etag = make_etag('cart', *cart_version)
+            cached_on_client = not_modified(etag)
+            if cached_on_client:
+                return cached_on_client
+
         shopping_cart = ShoppingCartManager.get_shopping_cart(user)
+        headers = etag_headers(make_etag('cart', shopping_cart.id, shopping_cart.version))
         if len(shopping_cart.jackets) >= 1:
-            return ShoppingCartSchemaResponse().dump(shopping_cart), status.HTTP_200_OK
+            return shopping_cart_serializer.dump(shopping_cart), status.HTTP_200_OK, headers
         else:
-            return {'message': 'Your shopping cart is empty'}
+            return {'message': 'Your shopping cart is empty'}, status.HTTP_200_OK, headers
 
     @shopping_cart_ns.doc('add_jacket_to_cart', responses={200: ('Jacket added', shopping_cart_model), 404: 'Jacket not found or already in the cart'})
     @shopping_cart_ns.expect(jacket_id_model, validate=False)
     @auth.login_required
     @validate_schema(ShoppingCartBase)
     def put(self):
-        data = request.get_json()
+        data = g.request_data
         user = auth.current_user()
         shopping_cart = ShoppingCartManager.add_jacket(user, data['jacket_id'])
         if shopping_cart:
-            return ShoppingCartSchemaResponse().dump(shopping_cart), status.HTTP_200_OK
+            return shopping_cart_serializer.dump(shopping_cart), status.HTTP_200_OK
         else:
             return {'message': 'Jacket not found or already in the cart'}, status.HTTP_404_NOT_FOUND
 
@@ -41,20 +55,46 @@ class ShoppingCartResource(Resource):
     @auth.login_required
     @validate_schema(ShoppingCartBase)
     def delete(self):
-        data = request.get_json()
+        data = g.request_data
         user = auth.current_user()
         shopping_cart = ShoppingCartManager.remove_jacket(user, data['jacket_id'])
         if shopping_cart:
-            return ShoppingCartSchemaResponse().dump(shopping_cart), status.HTTP_200_OK
+            return shopping_cart_serializer.dump(shopping_cart), status.HTTP_200_OK
         else:
             return {'message': 'Jacket not found in the cart'}, status.HTTP_404_NOT_FOUND
 
-    @shopping_cart_ns.doc('purchase', responses={200: 'Purchase successful', 400: 'Purchase failed'})
+    @shopping_cart_ns.doc('purchase', responses={202: 'Order placed, payouts are made in the background',
+                                                 400: 'Purchase failed',
+                                                 409: 'Some jackets in your cart are no longer available'})
     @auth.login_required
     def post(self):
         user = auth.current_user()
-        success = ShoppingCartManager.purchase(user)
-        if success:
-            return {'message': 'Purchase successful'}, status.HTTP_200_OK
+        order = OrderManager.place_order(user)
+        if order:
+            return {'message': 'Order placed', 'order_id': order.id, 'status': order.status.value}, \
+                status.HTTP_202_ACCEPTED, {'Location': f'/orders/{order.id}'}
         else:
             return {'message': 'Purchase failed'}, status.HTTP_400_BAD_REQUEST
+
+
+@shopping_cart_ns.route("/jackets")
+class ShoppingCartJacketsResource(Resource):
+    # Bulk version of PUT and DELETE /shopping_cart, e.g. to restore a saved cart in one request. Every jacket gets
+    # its own status, and the request succeeds even if some of them could not be added or removed.
+    @shopping_cart_ns.doc('add_jackets_to_cart', responses={200: ('Jackets added', shopping_cart_bulk_model)})
+    @shopping_cart_ns.expect(jacket_ids_model, validate=False)
+    @auth.login_required
+    @validate_schema(ShoppingCartJacketsSchemaRequest)
+    def put(self):
+        data = g.request_data
+        shopping_cart, results = ShoppingCartManager.add_jackets(auth.current_user(), data['jacket_ids'])
+        return {**shopping_cart_serializer.dump(shopping_cart), 'results': results}, status.HTTP_200_OK
+
+    @shopping_cart_ns.doc('remove_jackets_from_cart', responses={200: ('Jackets removed', shopping_cart_bulk_model)})
+    @shopping_cart_ns.expect(jacket_ids_model, validate=False)
+    @auth.login_required
+    @validate_schema(ShoppingCartJacketsSchemaRequest)
+    def delete(self):
+        data = g.request_data
+        shopping_cart, results = ShoppingCartManager.remove_jackets(auth.current_user(), data['jacket_ids'])
+        return {**shopping_cart_serializer.dump(shopping_cart), 'results': results}, status.HTTP_200_OK
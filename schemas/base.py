@@ -12,5 +12,6 @@ class AuthBase(Schema):
 class JacketBase(Schema):
     brand = fields.Str(required=True)
     description = fields.Str(required=True)
-    size = EnumField(JacketSizes, by_value=True)
+    # Requests send the size's name (xs, s, m, l), responses show its value.
+    size = EnumField(JacketSizes, load_by=EnumField.NAME, dump_by=EnumField.VALUE)
     price = fields.Int(required=True)
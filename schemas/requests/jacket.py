@@ -1,7 +1,25 @@
+from marshmallow import Schema, fields, validate, validates_schema, ValidationError
+
+from common.constants import PHOTO_CONTENT_TYPES
 from schemas.base import JacketBase
-from marshmallow import fields
 
 
 class JacketSchemaRequest(JacketBase):
-    photo = fields.String(required=True)
-    extension = fields.String(required=True)
+    # Either a base64 photo with its extension, or the key of a photo uploaded through /jacket/upload.
+    photo = fields.String()
+    extension = fields.String()
+    photo_key = fields.String()
+
+    @validates_schema
+    def validate_photo(self, data, **kwargs):
+        if "photo_key" in data:
+            if "photo" in data:
+                raise ValidationError("Send either photo or photo_key, not both.", "photo")
+            return
+        for field_name in ("photo", "extension"):
+            if field_name not in data:
+                raise ValidationError("Missing data for required field.", field_name)
+
+
+class PhotoUploadSchemaRequest(Schema):
+    extension = fields.String(required=True, validate=validate.OneOf(PHOTO_CONTENT_TYPES))
@@ -0,0 +1,8 @@
+from marshmallow import Schema, fields, validate
+
+from common.constants import MAX_CART_BATCH_SIZE
+
+
+class ShoppingCartJacketsSchemaRequest(Schema):
+    jacket_ids = fields.List(fields.Integer(), required=True,
+                             validate=validate.Length(min=1, max=MAX_CART_BATCH_SIZE))
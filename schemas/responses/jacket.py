@@ -1,9 +1,16 @@
 from marshmallow import fields
 
 from schemas.base import JacketBase
+from schemas.compiled import CompiledSchema
 
 
 class JacketSchemaResponse(JacketBase):
     id = fields.Int(required=True)
     created_on = fields.DateTime(required=True)
     photo_url = fields.String(required=True)
+    thumbnails = fields.Dict(keys=fields.String(), values=fields.Dict(keys=fields.String(), values=fields.String()),
+                             allow_none=True)
+
+
+# Shared by every request: building a schema per request is wasted work, and the compiled dump is much faster.
+jacket_serializer = CompiledSchema(JacketSchemaResponse())
@@ -0,0 +1,16 @@
+from marshmallow import Schema, fields
+from marshmallow_enum import EnumField
+
+from models import OrderStatus
+from schemas.responses.jacket import JacketSchemaResponse
+
+
+class OrderSchemaResponse(Schema):
+    id = fields.Integer()
+    status = EnumField(OrderStatus, by_value=True)
+    amount = fields.Integer()
+    jacket_ids = fields.Pluck(JacketSchemaResponse, "id", many=True, attribute="jackets")
+    attempts = fields.Integer()
+    error = fields.String(allow_none=True)
+    created_on = fields.DateTime()
+    updated_on = fields.DateTime()
@@ -1,4 +1,5 @@
 from marshmallow import Schema, fields
+from schemas.compiled import CompiledSchema
 from schemas.responses.jacket import JacketSchemaResponse
 
 
@@ -7,3 +8,6 @@ class ShoppingCartSchemaResponse(Schema):
     user_id = fields.Integer()
     jackets = fields.Nested(JacketSchemaResponse(many=True))
     amount = fields.Integer()
+
+
+shopping_cart_serializer = CompiledSchema(ShoppingCartSchemaResponse())
@@ -0,0 +1,149 @@
+import json
+import threading
+import time
+from collections import OrderedDict
+
+from decouple import config
+from flask import current_app
+
+try:
+    import redis
+except ImportError:  # Redis is optional, the in-process backend needs nothing extra.
+    redis = None
+
+
+class LRUCache:
+    def __init__(self, max_entries=1024, ttl=60):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._generations = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl=None):
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def generation(self, namespace):
+        return self._generations.get(namespace, 0)
+
+    def bump_generation(self, namespace):
+        with self._lock:
+            self._generations[namespace] = self._generations.get(namespace, 0) + 1
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class RedisCache:
+    def __init__(self, url, ttl=60):
+        if redis is None:
+            raise RuntimeError("CACHE_BACKEND=redis requires the redis package (pip install -r requirements.txt)")
+        self.client = redis.Redis.from_url(url)
+        self.ttl = ttl
+
+    def get(self, key):
+        value = self.client.get(key)
+        return None if value is None else json.loads(value)
+
+    def set(self, key, value, ttl=None):
+        self.client.set(key, json.dumps(value), ex=self.ttl if ttl is None else ttl)
+
+    def delete(self, key):
+        self.client.delete(key)
+
+    def generation(self, namespace):
+        return int(self.client.get(f"cache:generation:{namespace}") or 0)
+
+    def bump_generation(self, namespace):
+        self.client.incr(f"cache:generation:{namespace}")
+
+    def __len__(self):
+        return self.client.dbsize()
+
+
+class ResponseCache:
+    # Entries are grouped in namespaces. Invalidating a namespace bumps its generation, which is part of every key,
+    # so stale entries are never read again and simply age out. This works the same across processes with Redis.
+    def __init__(self, app=None):
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault("CACHE_BACKEND", config("CACHE_BACKEND", default="memory"))
+        app.config.setdefault("CACHE_TTL", config("CACHE_TTL", default=60, cast=int))
+        app.config.setdefault("CACHE_MAX_ENTRIES", config("CACHE_MAX_ENTRIES", default=1024, cast=int))
+        app.config.setdefault("CACHE_REDIS_URL", config("CACHE_REDIS_URL", default="redis://localhost:6379/0"))
+
+        if app.config["CACHE_BACKEND"] == "redis":
+            backend = RedisCache(app.config["CACHE_REDIS_URL"], app.config["CACHE_TTL"])
+        else:
+            backend = LRUCache(app.config["CACHE_MAX_ENTRIES"], app.config["CACHE_TTL"])
+
+        app.extensions["response_cache"] = {
+            "backend": backend,
+            "stats": {"hits": 0, "misses": 0, "invalidations": 0},
+            "lock": threading.Lock(),
+        }
+
+    @staticmethod
+    def _state():
+        return current_app.extensions["response_cache"]
+
+    def _count(self, name):
+        state = self._state()
+        with state["lock"]:
+            state["stats"][name] += 1
+
+    @staticmethod
+    def make_key(namespace, generation, params):
+        normalized = {key: value for key, value in params.items() if value is not None}
+        return f"cache:{namespace}:{generation}:{json.dumps(normalized, sort_keys=True, default=str)}"
+
+    def get_or_set(self, namespace, params, loader):
+        backend = self._state()["backend"]
+        key = self.make_key(namespace, backend.generation(namespace), params)
+
+        value = backend.get(key)
+        if value is not None:
+            self._count("hits")
+            return value, True
+
+        self._count("misses")
+        value = loader()
+        backend.set(key, value)
+        return value, False
+
+    def invalidate(self, namespace):
+        self._state()["backend"].bump_generation(namespace)
+        self._count("invalidations")
+
+    def stats(self):
+        state = self._state()
+        with state["lock"]:
+            stats = dict(state["stats"])
+        stats["entries"] = len(state["backend"])
+        return stats
+
+
+response_cache = ResponseCache()
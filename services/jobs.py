@@ -0,0 +1,144 @@
+import os
+import queue
+import threading
+
+from decouple import config
+from flask import current_app
+
+from db import db, on_commit
+
+
+class JobQueue:
+    # In-process background jobs. A job is a plain function called with plain arguments (ids, not model instances)
+    # inside an app context, and is committed like a request. Failed jobs are retried with exponential backoff, so
+    # jobs have to be safe to run twice. Every process runs its own workers, started with its first request or job.
+    # With JOB_QUEUE_WORKERS=0 jobs wait for drain(), which tests use.
+    # The queue itself is lost with the process. Work that must survive a restart is kept in the database and found
+    # by a poller (see poll), which idle workers call every JOB_POLL_INTERVAL seconds; a queued job for it only
+    # gets it started sooner.
+    def __init__(self):
+        self._pollers = []
+
+    def init_app(self, app):
+        app.config.setdefault("JOB_QUEUE_WORKERS", config("JOB_QUEUE_WORKERS", default=2, cast=int))
+        app.config.setdefault("JOB_MAX_ATTEMPTS", config("JOB_MAX_ATTEMPTS", default=5, cast=int))
+        app.config.setdefault("JOB_RETRY_DELAY", config("JOB_RETRY_DELAY", default=1.0, cast=float))
+        app.config.setdefault("JOB_POLL_INTERVAL", config("JOB_POLL_INTERVAL", default=5.0, cast=float))
+        app.extensions["job_queue"] = {"queue": queue.Queue(), "pid": None, "lock": threading.Lock()}
+        app.before_request(self.start)
+
+    def poll(self, func):
+        # Registers a poller: a function that does one unit of due work, if there is any, and returns whether it
+        # did. It is called again right away as long as it finds work.
+        self._pollers.append(func)
+        return func
+
+    def start(self, app=None):
+        # Starts this process's workers unless they are running already.
+        app = app or current_app._get_current_object()
+        self._ensure_workers(app, app.extensions["job_queue"])
+
+    def _ensure_workers(self, app, state):
+        if state["pid"] == os.getpid():
+            return
+        with state["lock"]:
+            if state["pid"] == os.getpid():
+                return
+            for _ in range(app.config["JOB_QUEUE_WORKERS"]):
+                threading.Thread(target=self._work, args=(app, state["queue"]), daemon=True).start()
+            state["pid"] = os.getpid()
+
+    def _put(self, app, job):
+        state = app.extensions["job_queue"]
+        self._ensure_workers(app, state)
+        state["queue"].put(job)
+
+    def enqueue(self, func, *args, **kwargs):
+        self._put(current_app._get_current_object(), (func, args, kwargs, 1))
+
+    def enqueue_on_commit(self, func, *args, **kwargs):
+        # Jobs read what the request wrote, so they are only queued once that is committed.
+        on_commit(lambda: self.enqueue(func, *args, **kwargs))
+
+    def _retry(self, app, job):
+        func, args, kwargs, attempt = job
+        if not app.config["JOB_QUEUE_WORKERS"]:
+            self._put(app, job)
+            return
+        delay = app.config["JOB_RETRY_DELAY"] * 2 ** (attempt - 2)
+        timer = threading.Timer(delay, self._put, args=(app, job))
+        timer.daemon = True
+        timer.start()
+
+    def _run(self, app, job):
+        func, args, kwargs, attempt = job
+        try:
+            func(*args, **kwargs)
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            if attempt < app.config["JOB_MAX_ATTEMPTS"]:
+                app.logger.warning("Background job %s failed, retrying", func.__name__, exc_info=True)
+                self._retry(app, (func, args, kwargs, attempt + 1))
+            else:
+                app.logger.exception("Background job %s failed after %s attempts", func.__name__, attempt)
+
+    def _poll(self, app):
+        # Calls every poller until none of them finds work. Returns whether any did.
+        found = False
+        while True:
+            busy = False
+            for poller in self._pollers:
+                try:
+                    busy = bool(poller()) or busy
+                    db.session.commit()
+                except Exception:
+                    db.session.rollback()
+                    app.logger.exception("Poller %s failed", poller.__name__)
+            if not busy:
+                return found
+            found = True
+
+    def _work(self, app, jobs):
+        while True:
+            try:
+                job = jobs.get(timeout=app.config["JOB_POLL_INTERVAL"])
+            except queue.Empty:
+                with app.app_context():
+                    try:
+                        self._poll(app)
+                    finally:
+                        db.session.remove()
+                continue
+            with app.app_context():
+                try:
+                    self._run(app, job)
+                finally:
+                    db.session.remove()
+                    jobs.task_done()
+
+    def join(self):
+        # Waits until every queued job is done, running them here when there are no workers.
+        app = current_app._get_current_object()
+        if app.config["JOB_QUEUE_WORKERS"]:
+            app.extensions["job_queue"]["queue"].join()
+        else:
+            self.drain()
+
+    def drain(self):
+        # Runs every queued job and all due work the pollers find in the calling thread, including retries and jobs
+        # queued by those jobs.
+        app = current_app._get_current_object()
+        jobs = app.extensions["job_queue"]["queue"]
+        while True:
+            try:
+                job = jobs.get_nowait()
+            except queue.Empty:
+                if not self._poll(app) and jobs.empty():
+                    return
+                continue
+            self._run(app, job)
+            jobs.task_done()
+
+
+job_queue = JobQueue()
@@ -0,0 +1,57 @@
+import os
+import threading
+import time
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+
+
+class MeteredQueuePool(QueuePool):
+    # QueuePool that also counts how long requests waited for a connection. The counters are per process, like the
+    # pool itself: with gunicorn every worker reports its own.
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._stats_lock = threading.Lock()
+        self._checkouts = 0
+        self._timeouts = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._metering = threading.local()
+
+    def _do_get(self):
+        # QueuePool retries a checkout by calling _do_get again, e.g. when another thread took the overflow slot it
+        # was about to use. Only the outermost call is counted, with all of its wait.
+        if getattr(self._metering, "active", False):
+            return super()._do_get()
+        self._metering.active = True
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            with self._stats_lock:
+                self._timeouts += 1
+            raise
+        finally:
+            self._metering.active = False
+            waited = time.perf_counter() - started
+            with self._stats_lock:
+                self._checkouts += 1
+                self._wait_total += waited
+                self._wait_max = max(self._wait_max, waited)
+
+    def stats(self):
+        with self._stats_lock:
+            return {
+                "pid": os.getpid(),
+                "size": self.size(),
+                "max_overflow": self._max_overflow,
+                "checked_out": self.checkedout(),
+                "checked_in": self.checkedin(),
+                # Negative while the pool has not opened all of its size connections yet.
+                "overflow": self.overflow(),
+                "checkouts": self._checkouts,
+                "timeouts": self._timeouts,
+                "wait_seconds_total": round(self._wait_total, 6),
+                "wait_seconds_max": round(self._wait_max, 6),
+                "wait_seconds_avg": round(self._wait_total / self._checkouts, 6) if self._checkouts else 0.0,
+            }
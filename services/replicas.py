@@ -0,0 +1,96 @@
+import itertools
+import threading
+from contextlib import contextmanager
+
+from decouple import config
+from flask import current_app, g, has_request_context
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from db import db
+from managers.auth import auth
+
+# Binds in SQLALCHEMY_BINDS whose key starts with this are read replicas of the primary database.
+REPLICA_PREFIX = "replica"
+
+
+class ReplicaRouter:
+    # Picks the replica for read requests, round robin. A user who just wrote something reads from the primary for
+    # DB_REPLICA_STICKY_SECONDS, longer than replication usually lags, so they see their own changes. Which users
+    # are sticky is kept in the response cache's backend, which has to be Redis: a user's next request may well be
+    # served by another process. DB_REPLICA_STICKY_LOCAL allows the in-process backend for a single process.
+    def init_app(self, app):
+        app.config.setdefault("DB_REPLICA_STICKY_SECONDS", config("DB_REPLICA_STICKY_SECONDS", default=10, cast=int))
+        app.config.setdefault("DB_REPLICA_STICKY_LOCAL", config("DB_REPLICA_STICKY_LOCAL", default=False, cast=bool))
+        replicas = sorted(key for key in (app.config.get("SQLALCHEMY_BINDS") or {}) if key.startswith(REPLICA_PREFIX))
+        if replicas and app.config["CACHE_BACKEND"] != "redis" and not app.config["DB_REPLICA_STICKY_LOCAL"]:
+            raise RuntimeError("Read replicas require CACHE_BACKEND=redis to share which users read from the primary")
+        app.extensions["replica_router"] = {
+            "replicas": replicas,
+            "next": itertools.cycle(replicas),
+            "lock": threading.Lock(),
+        }
+
+    @staticmethod
+    def _state():
+        return current_app.extensions["replica_router"]
+
+    @staticmethod
+    def _sticky_key(user_id):
+        return f"replica:sticky:{user_id}"
+
+    def enabled(self):
+        return bool(self._state()["replicas"])
+
+    def choose(self, user):
+        # The replica bind to read from for this user, or None for the primary.
+        state = self._state()
+        if not state["replicas"]:
+            return None
+        backend = current_app.extensions["response_cache"]["backend"]
+        if user is not None and backend.get(self._sticky_key(user.id)) is not None:
+            return None
+        with state["lock"]:
+            return next(state["next"])
+
+    @contextmanager
+    def reads_for(self, user):
+        # Plain reads of the session inside the block go to the replica chosen for the user, if any.
+        replica = self.choose(user)
+        if replica is None:
+            yield
+            return
+        session = db.session()
+        session.info["replica"] = replica
+        try:
+            yield
+        finally:
+            session.info.pop("replica", None)
+
+    def stick(self, user_id):
+        backend = current_app.extensions["response_cache"]["backend"]
+        backend.set(self._sticky_key(user_id), 1, ttl=current_app.config["DB_REPLICA_STICKY_SECONDS"])
+
+
+replica_router = ReplicaRouter()
+
+
+def _stick_current_user():
+    # Called on every write. Marks the user once per request.
+    if not has_request_context() or not replica_router.enabled():
+        return
+    user = auth.current_user()
+    if user is not None and g.get("replica_sticky_user") != user.id:
+        replica_router.stick(user.id)
+        g.replica_sticky_user = user.id
+
+
+@event.listens_for(Session, "after_flush")
+def _stick_after_flush(session, flush_context):
+    _stick_current_user()
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _stick_after_write_statement(orm_execute_state):
+    if not orm_execute_state.is_select:
+        _stick_current_user()
@@ -1,21 +1,138 @@
+import hashlib
+import os
+import threading
+
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from botocore.exceptions import ClientError
 from decouple import config
+from flask import current_app
 from werkzeug.exceptions import InternalServerError
 
+# Browser uploads go straight to S3 under this prefix and are only referenced by a jacket once verified.
+UPLOAD_PREFIX = "uploads"
+UPLOAD_URL_EXPIRES_IN = 15 * 60
+MAX_PHOTO_SIZE = 50 * 1024 * 1024
+# Streams are sent as multipart uploads. Memory held per upload is bounded by roughly
+# chunk size * (concurrency + 1), whatever the photo size.
+STREAM_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=2,
+)
+
 
 class S3Service:
+    # Building a client resolves credentials and endpoints and opens a new connection pool, so there is one client
+    # per app and process, created on first use. boto3 clients are thread safe: request threads, job workers and
+    # the multipart transfer threads all share it. The pool has to cover all of them at once.
+    @staticmethod
+    def init_app(app):
+        app.config.setdefault("AWS_KEY", config("AWS_KEY", default=None))
+        app.config.setdefault("AWS_SECRET_KEY", config("AWS_SECRET_KEY", default=None))
+        app.config.setdefault("S3_REGION", config("S3_REGION", default=None))
+        app.config.setdefault("S3_BUCKET_NAME", config("S3_BUCKET_NAME", default=None))
+        app.config.setdefault("S3_MAX_POOL_CONNECTIONS", config("S3_MAX_POOL_CONNECTIONS", default=25, cast=int))
+        app.config.setdefault("S3_MAX_ATTEMPTS", config("S3_MAX_ATTEMPTS", default=5, cast=int))
+        app.config.setdefault("S3_TIMEOUT", config("S3_TIMEOUT", default=30, cast=int))
+        app.extensions["s3"] = {"client": None, "pid": None, "lock": threading.Lock()}
+
     def __init__(self):
-        key = config("AWS_KEY")
-        secret = config("AWS_SECRET_KEY")
-        self.region = config("S3_REGION")
-        self.bucket = config("S3_BUCKET_NAME")
-        self.s3 = boto3.client('s3', region_name=self.region, aws_access_key_id=key, aws_secret_access_key=secret)
+        self.config = current_app.config
+        self.state = current_app.extensions["s3"]
+        self.region = self.config["S3_REGION"]
+        self.bucket = self.config["S3_BUCKET_NAME"]
+
+    @property
+    def s3(self):
+        # A client inherited through fork would share its sockets with the parent, so every process builds its own.
+        state = self.state
+        if state["pid"] != os.getpid():
+            with state["lock"]:
+                if state["pid"] != os.getpid():
+                    state["client"] = self._create_client()
+                    state["pid"] = os.getpid()
+        return state["client"]
+
+    def _create_client(self):
+        client_config = Config(
+            max_pool_connections=self.config["S3_MAX_POOL_CONNECTIONS"],
+            retries={"max_attempts": self.config["S3_MAX_ATTEMPTS"], "mode": "standard"},
+            connect_timeout=self.config["S3_TIMEOUT"],
+            read_timeout=self.config["S3_TIMEOUT"],
+        )
+        return boto3.session.Session().client(
+            's3',
+            region_name=self.region,
+            aws_access_key_id=self.config["AWS_KEY"],
+            aws_secret_access_key=self.config["AWS_SECRET_KEY"],
+            config=client_config,
+        )
+
+    def photo_url(self, key):
+        return f"https://{self.bucket}.s3.{self.region}.amazonaws.com/{key}"
+
+    def key_from_url(self, url):
+        return url.split(".amazonaws.com/", 1)[-1]
+
+    def upload_photo(self, fileobj, key, content_type=None):
+        extra_args = {"ContentType": content_type} if content_type else None
+        try:
+            self.s3.upload_fileobj(fileobj, self.bucket, key, ExtraArgs=extra_args, Config=STREAM_TRANSFER_CONFIG)
+            return self.photo_url(key)
+        except ClientError as ex:
+            raise InternalServerError("S3 is not available at the moment")
+
+    def generate_upload_post(self, key, content_type):
+        # A presigned POST, unlike a presigned PUT, lets S3 itself enforce the size limit and content type.
+        try:
+            return self.s3.generate_presigned_post(
+                self.bucket,
+                key,
+                Fields={"Content-Type": content_type},
+                Conditions=[{"Content-Type": content_type}, ["content-length-range", 1, MAX_PHOTO_SIZE]],
+                ExpiresIn=UPLOAD_URL_EXPIRES_IN,
+            )
+        except ClientError as ex:
+            raise InternalServerError("S3 is not available at the moment")
+
+    def head_photo(self, key):
+        try:
+            return self.s3.head_object(Bucket=self.bucket, Key=key)
+        except ClientError as ex:
+            if ex.response["Error"]["Code"] in ("404", "NoSuchKey"):
+                return None
+            raise InternalServerError("S3 is not available at the moment")
+
+    def hash_photo(self, key):
+        # SHA-256 of the stored object, read in chunks.
+        digest = hashlib.sha256()
+        try:
+            body = self.s3.get_object(Bucket=self.bucket, Key=key)["Body"]
+            for chunk in body.iter_chunks(STREAM_TRANSFER_CONFIG.multipart_chunksize):
+                digest.update(chunk)
+        except ClientError as ex:
+            raise InternalServerError("S3 is not available at the moment")
+        return digest.hexdigest()
+
+    def copy_photo(self, source_key, key):
+        # Copied within S3, in parts for large objects. The content type is copied along.
+        try:
+            self.s3.copy({"Bucket": self.bucket, "Key": source_key}, self.bucket, key, Config=STREAM_TRANSFER_CONFIG)
+            return self.photo_url(key)
+        except ClientError as ex:
+            raise InternalServerError("S3 is not available at the moment")
+
+    def download_photo(self, key, fileobj):
+        try:
+            self.s3.download_fileobj(self.bucket, key, fileobj, Config=STREAM_TRANSFER_CONFIG)
+        except ClientError as ex:
+            raise InternalServerError("S3 is not available at the moment")
 
-    def upload_photo(self, path, key):
+    def delete_photos(self, keys):
         try:
-            self.s3.upload_file(path, self.bucket, key)
-            return f"https://{self.bucket}.s3.{self.region}.amazonaws.com/{key}"
+            self.s3.delete_objects(Bucket=self.bucket, Delete={"Objects": [{"Key": key} for key in keys], "Quiet": True})
         except ClientError as ex:
             raise InternalServerError("S3 is not available at the moment")
 
@@ -23,4 +140,4 @@ class S3Service:
         try:
             self.s3.delete_object(Bucket=self.bucket, Key=key)
         except ClientError as ex:
-            raise InternalServerError("S3 is not available at the moment")
\ No newline at end of file
+            raise InternalServerError("S3 is not available at the moment")
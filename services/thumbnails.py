@@ -0,0 +1,36 @@
+import io
+
+from PIL import Image, ImageOps
+
+THUMBNAIL_WIDTHS = (160, 320, 640)
+# Format name as stored in jacket.thumbnails -> (Pillow format, file extension, content type, save options)
+THUMBNAIL_FORMATS = {
+    "webp": ("WEBP", "webp", "image/webp", {"quality": 80, "method": 4}),
+    "jpeg": ("JPEG", "jpg", "image/jpeg", {"quality": 80, "optimize": True, "progressive": True}),
+}
+
+
+def thumbnail_key(pic_hash, width, image_format):
+    return f"thumbnails/{pic_hash}/{width}.{THUMBNAIL_FORMATS[image_format][1]}"
+
+
+def make_thumbnails(fileobj):
+    # Yields (width, format, encoded bytes) for every width in THUMBNAIL_WIDTHS below the original width. Photos
+    # are never upscaled: the first width that is not below the original gets the photo at its own size, so the
+    # keys of a photo's thumbnails never depend on its dimensions.
+    with Image.open(fileobj) as original:
+        # For JPEGs this lets the decoder scale down while decoding, which is much cheaper than a full decode.
+        original.draft("RGB", (max(THUMBNAIL_WIDTHS), max(THUMBNAIL_WIDTHS)))
+        image = ImageOps.exif_transpose(original).convert("RGB")
+
+    widths = [width for width in THUMBNAIL_WIDTHS if width < image.width]
+    widths += [width for width in THUMBNAIL_WIDTHS if width >= image.width][:1]
+    # Largest first, so each size is resized from the previous one instead of from the original.
+    for width in sorted(widths, reverse=True):
+        if width < image.width:
+            height = max(1, round(image.height * width / image.width))
+            image = image.resize((width, height), Image.Resampling.LANCZOS)
+        for image_format, (pil_format, _, _, options) in THUMBNAIL_FORMATS.items():
+            buffer = io.BytesIO()
+            image.save(buffer, pil_format, **options)
+            yield width, image_format, buffer.getvalue()
@@ -1,8 +1,50 @@
+import hashlib
+import os
+import threading
+from http.cookiejar import DefaultCookiePolicy
+
 import requests
 from decouple import config
+from requests.adapters import HTTPAdapter
+
+from services.cache import LRUCache
+
+# (connect, read) timeout in seconds for every Wise call, so a stuck payout cannot hold a request forever.
+WISE_TIMEOUT = (
+    config("WISE_CONNECT_TIMEOUT", default=5, cast=float),
+    config("WISE_READ_TIMEOUT", default=20, cast=float),
+)
+# Keep-alive connections kept open to Wise, enough for every payout worker of a few concurrent purchases.
+WISE_POOL_SIZE = config("WISE_POOL_SIZE", default=16, cast=int)
+
+# Profile ids do not change, so they are looked up once per token (by hash, the token itself is not kept).
+profile_ids = LRUCache(max_entries=1024, ttl=config("WISE_PROFILE_CACHE_TTL", default=3600, cast=int))
+
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+
+def get_session():
+    # One pooled session per process, shared by all threads. A forked process must not reuse the parent's sockets.
+    pid = os.getpid()
+    session = _sessions.get(pid)
+    if session is None:
+        with _sessions_lock:
+            session = _sessions.get(pid)
+            if session is None:
+                session = requests.Session()
+                # Shared by every user's token, so nothing a response sets may stick to later requests.
+                session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+                session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=WISE_POOL_SIZE))
+                session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=WISE_POOL_SIZE))
+                _sessions.clear()
+                _sessions[pid] = session
+    return session
 
 
 class WiseService:
+    # Every call raises requests.HTTPError when Wise answers with an error, e.g. a transfer it could not fund, so the
+    # payout fails and its order is retried instead of completed.
     def __init__(self, token):
         self.token = token
         self.headers = {
@@ -10,11 +52,21 @@ class WiseService:
             "Authorization": f"Bearer {self.token}",
         }
         self.main_url = config("WISE_URL")
-        self.profile_id = self._get_profile_id()
+        self.session = get_session()
+        self.profile_id = self._cached_profile_id()
+
+    def _cached_profile_id(self):
+        key = hashlib.sha256(self.token.encode()).hexdigest()
+        profile_id = profile_ids.get(key)
+        if profile_id is None:
+            profile_id = self._get_profile_id()
+            profile_ids.set(key, profile_id)
+        return profile_id
 
     def _get_profile_id(self):
         url = f"{self.main_url}/v1/profiles"
-        resp = requests.get(url, headers=self.headers)
+        resp = self.session.get(url, headers=self.headers, timeout=WISE_TIMEOUT)
+        resp.raise_for_status()
         data = resp.json()
         profile_id = [o["id"] for o in data if o["type"] == "personal"][0]
         return profile_id
@@ -27,7 +79,8 @@ class WiseService:
             "targetAmount": amount,
             "profile": self.profile_id,
         }
-        resp = requests.post(url, json=data, headers=self.headers)
+        resp = self.session.post(url, json=data, headers=self.headers, timeout=WISE_TIMEOUT)
+        resp.raise_for_status()
         return resp.json()["id"]
 
     def create_recipient(
@@ -41,7 +94,8 @@ class WiseService:
             "accountHolderName": full_name,
             "details": {"legalType": "PRIVATE", "iban": iban},
         }
-        resp = requests.post(url, json=data, headers=self.headers)
+        resp = self.session.post(url, json=data, headers=self.headers, timeout=WISE_TIMEOUT)
+        resp.raise_for_status()
         return resp.json()["id"]
 
     def create_transfer(self, recipient_account_id, quote_id, customer_transaction_id):
@@ -51,13 +105,15 @@ class WiseService:
                "quoteUuid": quote_id,
                "customerTransactionId": customer_transaction_id,
         }
-        resp = requests.post(url, json=data, headers=self.headers)
+        resp = self.session.post(url, json=data, headers=self.headers, timeout=WISE_TIMEOUT)
+        resp.raise_for_status()
         return resp.json()
 
     def fund_transfer(self, transfer_id):
         url = f"{self.main_url}/v3/profiles/{self.profile_id}/transfers/{transfer_id}/payments"
         data = {"type": "BALANCE"}
-        resp = requests.post(url, json=data, headers=self.headers)
+        resp = self.session.post(url, json=data, headers=self.headers, timeout=WISE_TIMEOUT)
+        resp.raise_for_status()
         return resp
 
 
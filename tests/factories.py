@@ -4,6 +4,7 @@ import factory
 
 from db import db
 from models import UserModel, UserRole
+from utils.encryptor import CryptoHelper
 
 
 class BaseFactory(factory.Factory):
@@ -17,7 +18,8 @@ class BaseFactory(factory.Factory):
     phone = str(randint(100000, 200000))
     password = factory.Faker("password")
     iban = factory.Faker("iban")
-    wise_key = "8db48ad2-7b7c-44d1-bcf6-fc300481c851"
+    # Stored encrypted, like GuestManager.register does.
+    wise_key = factory.LazyFunction(lambda: CryptoHelper().encrypt("8db48ad2-7b7c-44d1-bcf6-fc300481c851"))
 
     @classmethod
     def create(cls, **kwargs):
@@ -34,3 +36,6 @@ class GuestFactory(BaseFactory):
 class CreatorFactory(BaseFactory):
     role = UserRole.creator
 
+
+class AdminFactory(BaseFactory):
+    role = UserRole.admin
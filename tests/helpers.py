@@ -1,4 +1,10 @@
+from unittest.mock import patch
+
+from sqlalchemy import event
+
+from db import db
 from managers.auth import AuthManager
+from services.s3 import S3Service
 
 
 def generate_token(user):
@@ -6,4 +12,32 @@ def generate_token(user):
     return token
 
 
+def mock_photo_storage(test_case):
+    # For tests that mock S3Service.upload_photo: a new photo is also copied to its content-hash key and its scratch
+    # upload deleted, which must not reach S3 either.
+    for name in ("copy_photo", "delete_photo"):
+        patcher = patch.object(S3Service, name, return_value="some.s3.url")
+        patcher.start()
+        test_case.addCleanup(patcher.stop)
+
+
+class QueryRecorder:
+    # Records every SQL statement sent to the database inside the with block.
+    def __init__(self):
+        self.statements = []
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    def __enter__(self):
+        event.listen(db.engine, "before_cursor_execute", self._record)
+        return self
+
+    def __exit__(self, *exc_info):
+        event.remove(db.engine, "before_cursor_execute", self._record)
+
+    def touching(self, table):
+        return [statement for statement in self.statements if f"FROM {table}" in statement]
+
+
 sample_pic_of_cat = "/9j/4AAQSkZJRgABAQEASABIAAD//gA7Q1JFQVRPUjogZ2QtanBlZyB2MS4wICh1c2luZyBJSkcgSlBFRyB2NjIpLCBxdWFsaXR5ID0gODAK/9sAQwAGBAUGBQQGBgUGBwcGCAoQCgoJCQoUDg8MEBcUGBgXFBYWGh0lHxobIxwWFiAsICMmJykqKRkfLTAtKDAlKCko/9sAQwEHBwcKCAoTCgoTKBoWGigoKCgoKCgoKCgoKCgoKCgoKCgoKCgoKCgoKCgoKCgoKCgoKCgoKCgoKCgoKCgoKCgo/8IAEQgDWAP/AwEiAAIRAQMRAf/EABwAAQACAwEBAQAAAAAAAAAAAAABBQMEBgIHCP/EABkBAQEBAQEBAAAAAAAAAAAAAAABAgMEBf/aAAwDAQACEAMQAAAB+qAAAAAAAAiUEokAAAAEEegAAAAAAAAiUEgAAAAQkAAAAAAAARIIEgAAAAeZkAAAAAAAARIIkAAAAECYkAAAAAAAAAARIPPoAAECQAAAAAAAAAAhIIkAAQkAAAAAAAAAAAiUEokAAQkAAAAAAAAAARIIEgAEBIAAAAAAAAAAAARII8nsgSAAAAAAAAAAAACJBAmEgAAAAAAAAAAAACJgl49EwkAAAAAAAAAAAAAiUEokiQAAAAAAAAAAAAAEGOcg8ewAAAAAAAAAAAAAQk8pEgAAAAAAAAAAAAAY/cmNkAAAAAAAAAAAAAAERIiUgAAAAAAAAAAAAAgj0AERp6WdXar3kzDUAAAAAAAAAAQkAAhIIkAAAAAAAAAAAeXoAAiUEgAAAAAAAAAAEAkARIiYEgAAAAAAAAAAECQAAqdPJX8PRYJG1YUS56Biy9eIUAAAAAAAhIAY/EZ2LLQCJBEgAAAAAAAACEgAAAEJBEgAAAAAAAAgEgAAAESgkABEgAAAAAAgSAAAFdyna8R5/Vc71JYGXxmwXODoKfWOpaOz24ZRYAAAARB6jz7DHz+dW9bpZ+PYzY7ZuububmzHbgAiREoJAAAAAAAhIAAAAAAiQRIAAAAAAeYPUgAAAAABCQRIiQRIAAAAIEgAAABHF9ryXH0U9lobXH03ePXnr580eMiMmjaplsea0d8+0cb43ntXPjoFRmSx863uszzIxeOaxvJ5x5uPox2MbGs4dfJXzc3nOdMlkPR5AAAIlBKJAAAAEJAAAAAAAAESIlBIAABBCBMT6AAAAAAAAESAESIlBIAEAkAAAAAFLdVfPpxXvY8eT6W/t6vvt5PDZstYrN2cdzlrtmpTFj5nq153Xrt7UtLp5hY6NoZrLQmK7TxaGe157a9b2tg1ZrPrV2fn3sut5Hs9+faHp8YAAACJBEgAgmEgAAAAAAAAAAESgkCJ8kwgekgAAAAAAAAAAAABEHqI9ESAAAAAADn+gqefTntGx5fw/T6foKm29Xha+TBrnhxbOMx0F9pmpt5dFaGyy7VWfCfQeSTdvo9Rky+fJ4prnLNc3t5qudMNTuV09G5vVm7z3edpznS9vCHfzgAAAACCXkSkAAAAAAAAAAAAAHgSB6AAAAAAAAAAAAAAgI9CJQSAAAAAABgz4o5ik6DY8vr9bGWOvDHjzea18uxgSoz1fTzXK+cW1Vd0/KW0uXzveDYmJR7ZjB5zjzq7EVzXOdvxnP132zz3S8e231/OdH6vnh14gAAAAISeZkESAAAAAAAAAAAAIeQBPoAAAAAAAAAAAAAIBIAARLyegAAAAAKjcq8a2c+nt41Pnz5rPr1fPS93X1FwY7TQ2DkdTPVrbZq7qIvOX6rmLLOz1stmjn8bB4x7EmGtusBQc71/Nc+65ruox0s9k9fgCgAABAJAAESCJAAAAAAAAAAEQCPRHoAISCJAAAAAAAAAAEJIkAAAAITBKJAAABBW12xWcutpo8h5jttLxzc166X3Tefenv8AF95m9VoaVn6eVLQdPSTWe+q9qryq3ecuLym4az5dOw6L5lm3PpWLHPTnm9evFnjDl8y1Fjsastyie3IAAAQCQAAABEiJQSAAAAAAADySePSSPQAAAIkESAAAAAAAAECQAAAAAAIkESAAPPrFHP8AAdHm5dqTucEy7PGdNspyVnwdz5uuxbVfF8d9f3/zn6V7eNT4t4sobPY2Sn+b3vLY12vyT7H87zz+t8T3/A8O17a7Gr7eezY/NbDWe6wSkyxg2K2trX2OnMKAECQAAAAAAAiUEokAAAAAEEPQAAAAAARIiUEgAAAAAQkAAAAAAAAARIiUEgYsvg4LrMe/w61GTcxy1GN5Xep8mQrstrq51UdtTbNll51NaLTWjWs4HmvonV28J0OJ5utbk63Y689rV0fHbn5+e/RqY5W+3Oct73c47sWbP3E9OYUIEgAAAAAAAAAiQRIAAAIEgAAAAAAAABEoJRIAAIJhIAAAAAAAAAAABEoJ8e4OVvOfxcO15HGec67Wn2MJrbG5qnuz9+4q+QuOSx2vvOtUY79fecB9K7+OhsrakZzedTBZvYJ9Vg9a9pLG7i3rnWwWkHzXo8LV7bLy3SdOWUixIAAAAAAAAAAAIkECQCBIAAAAAAAAAAAIkESCBIAAAAAAAAAAAAAARE+SjWFJx63OXV2c33HudZ18Gzqy6mzr58by8N2+tXzTa3e9nXUsNfy5e9PJt6zSRvbC8q6erlsNSor7OiuuAH0zX4PxZf5dHZ1OX6LkLKvpW7857TfOyFgAAAAAAAAAAACJgifPoSAAAAAAAAAAAAADx6xnv1hzAAAAAAAAAAAAAACEiJHikvq/Oqm0waPLpc62pZJm18/rWaz1nx43h1N6krS6Ll+ma2fHvDJOCfUbG1OtvGz59+zBi2cOa19/HWjpbNXW3S3/ADFVebY01zZ6zer6JafJul1y7RUb+psIkAAAAAAAAAECQAIkAAAAAAAAAAAAQEgEEokAAAAAAAAAAAAQkAAY8grauz9cevP7U0mN9VuUFhrNhi1N7WdGLPzZU47fxLq+s3s1veeTW2vXlJnBgl2MWnqS2dZX5Vw2Waps91+7hXHW3vNVq39R1Rz+hl1bM1lZb8eOipaDWfpjhen1mzefVgAAAAAAgSAACJBAkAAAAAAAAACEgAACJBEgAAAAAAAABEiEgAAA8mhobdPy6XOjisJa7Y2fMupstCLjYo9vebJR7Flm14jZxV+hNW+li3M2s17XJNU7oPGs4s+Gh1nPR7e4uXFs+oz8X23B1ddDW3KfO9TawW9fc811Ma9NfapwO560jtum+S9RZ3vvkrzeLEWAACCSBIAAAAARKCQAAAAAAAISAAAAAIkRKCQRKCQAAACCYgRMeiQAAAMGevjBWWVdy621dY+7KxmiXRrulxRR7/vIvnX26838nP6svY463XsvfdL5S/wa2jqbWvoc0thy+LLXQdLzvRZt1X7mhc5Pn/b8ovUXdXZp830ui5xeo6rjO1MWHb8xz9J21Icj0urrL1PLbU1b9n8XsN4+wKa51giCfMwT6iQAAAAAACEgiQAAAABCQAAAAAAACJQSCEgiQAgT5QE+iJAAAABS3VTLWWPN9by6Vu9gqDo/Gnup5jPFa2HexRqNxLo+9zyaNdfYyi8X+CtHJkq7K/hr2st1d9bS73X622zq6OH2upz/AEFOd3nwe2eT5a85q66bteM7bL3k8rNSrz6EtfSdNzzXTZdK0Ti9exrtNn6T8t3NZ+xxT3OucekgAAAAAAAACJBAkAACI9AAAAAAAAAAAACJAggglMgAAAAACvsMEfO+24jc5du25no/DPH9DqaWd9Nl5y41jbxYx7nGJ8eMR718HIr1NTzmhXU0+rfy1lhe5Tmr7d20mmzcTZadJz/SrQ2NL2Zk09uvTjue6Hmbe/6fiOxy2fU47mq5+25Sb6Gu9bhlzU+zLvU3Xc/ZS489buW/0z4vf3P1liy6wAAAAAAAAAAiREgA8zIAAAAAAAAAAAAA8+vJAJmJJAAAAAAAxZfMfNqnueE5d+06P493qdHXWflnnpucedaGfL4rDqbVVLsaetgrWpLvIV9xbXKUu9vebI8zXWbdJW80bm5ody1FP5q0tex5y+MeLLgkoOL+k8Pba9dwHYRceJwJQ8n0/NNbVvy3Qr6s8udLDHVWKc1VdfFvLO2lNLvPl3V7x041kAAAAAAAAAB5kRKQAAAAAAAAAAAAAeRHqBMhEgiQAAAAAADR4fvtHl0+Q7e/TZ6fR7j5L6Z+q+vnXTlvg08Bd4NHYMjFsJhzZNOt2KmqTo9flKa3quZrtSrLBudTLi2oqU85NPpjJbcV1cb3iciaVHY6S8l1XM31dTi1t2KPku642tDoKK2XrsLxJyvU61iuXYrcyWHn3jsw0916lsrTlul688gsAAAAAAAAeXoARIIEgAAAAAAAAAAREEwkegAARIIEgAAAAA1fTW57x0XTsa+V4vqXqa4Dd67wcfHVeTmtXqtaXg891z2puVrHZoY7PJVP6vdwpLG39S+rXPrpU1HjHZZsWFY77kuzhgy42eWp7PnLdq2ob1clrz/TSZ+X6vkKptuK+3p+i+fbub9D86NkzylghbmcZPeviol7DX5jZs+jqa568gAAAAAAHl6AAAAIlBIAAAAAAAB5PURBJISAAAAAIlBIAAAAIrLSixqwnRsee4jXg2IhZj18fjOt7H69WRh9Qa+vvYzQ97+M0cGzmWpvJ10raG8o6rfOS1trM+9dRhudHwmaqx8zWxUPFZOg57opdHreG6tOg+e/R+ROQx7muvjY0va9j2HA95JoZbTCmtQbnF1Z2PJWC7W/OnHVdnw3Xb57g3kAAAABCQAAAAACEgiQAAAAAB59eSfM+gAAAAAAACEgiQAABXWODN5vfsavj13POHeD1FmHxnxkecmM16y6xy1fu28mhr7+Ax56/aEVtLqY671d25cdt6jHvZtJKPDWe7cVb4w2ZcXvwT0lBblbc0trL31ZaeJOAr+65C2kja1DpO8+cfQIt8OxpXPI8xfUTWDLM12Ohtb+Wtbcbaan09499OQAAACEgAAAAAAACJBEgAAAAgSAAAAAAAAAACJBEgADU2sUchPM6HHv2ttyfVRZ4/Pi5waOxkzrZyYdfWd2KStXrMHJV51VLgsSqrbovPe+isLI2dgmjZetSsPM4Kc8Yffimtnwnv152azbGTQjH1/JdvLfVe/zcm/y/Say8Tr7+pV99A4rvoyU+/z9zzNZta116y6/o6655zpcuH39G1rv7fi+z6cZRNAAISAAAAAAAAAAIkRLyegADyPQAAAAAAAAAAAAIkHiDJCREji7G188ulJRdzjl5C0y4863dzVyWedGwxFROPjF7XP84606bT4+ks+h+vlcn1f38tuzssnO7pY0Ovtldt9FmOMpu746yq2MfUlFaW2NeercfrWbbsud6jFy85nkz4rLlzl8GfLp1Hc8j1WU8F2HFWU/jDF1nxQLjsvn3YxV3WDULL6N8077fPeifOs+mP2TEgAAAAAAAAAAAACJeT08+jz6AAAAAAAAAAAAAAQeGQePYAeK60oca9eN7TxvZqbb0VFnKJ1vcWcVs9bnmuLw954T5zo/TsC/Jqr7Fz1fO8ltR6m5bc3vnRXfD7UvaZedzRacjY09m53/ADfVGLjOt42znrHBvl3dVPvNrOj5zpBxHUcPqatrUdtLc3evKcnyfS8wvjzh9aZJw+zZv+cvo7bjel5GXpOk5z3rH0jH7neMc+wAAAAAAAAAAAAAIEeh59AAAAAAAAAAAAAAIEgAiQQJ1tnxHO3FdR8+nXNfZTz4yQV+GwqM6ss9Jc2ZJj1Zrcv1FLnevb+N6KDgPrFBXyvXvqHpncyaGwb2PV9S7G1X753Xqnp4t6nJrGtdUlnZdVNrSS9RsVnuKLnd2t1M/fcz10trpZ+cjnqax09NfFs4ax+/I2+i5roo6bk+z4mOjqbGgs+55qS76cwIlBKJAAAAAAAAAABAkAESIlBIAAAAAAAAAACAkAAAAIT5MXPdHo89c/v0/OZ6fTvdLts72KfZpZ/fiX37xrM0efREZMZr6evycribGr219nHOplx54jFlx5DN51ZLrHW5VydPzd/JOX3sxtcxccka8Yuptsuq0NrLzzFvqnH63V1dc/O3rVp+cuOvdpUbJ9HoMuHLYqd25LD6D8V+0dOfoWAIkESAAAAAAAACBIAAAARKCUSAESAAAAAAIBIAAAAAAY6q45jGq3l+tpufWn6bn6/U+jWPH2MnRqzdPPrQ2Y2vepks2Kmy0D5ZoXlNd4llYJU3GfrI+Z4fpOrZwXrvMx8/0fpdNXGTZ6da13Xk6Ldimy0qfP703O15DqcW72W0YcO1iTlqH6BVLyGj1/P1Ratpo6mvnxbJ1l9oX+NcVb62hqan1/5R2Gsd+NZAARIIEgAAAAEExEHtEgAAAAACJBEiJBAkAAACEkSAAAAAAAEVNvpZvHVXeUnLrR6VnzlZs1Rls6q14fejsfFNsl/p7WOzP709iOU5v6h6muatLhc1nnfql2I1ch78vJl16+iLqrr8ta2j6zazvUt9x0e/WvYW3vQcnizey98dvy9zs8F0iW+P1ppo0dhy1uGu2tXUw7GtkXvun4nqsPHFdTVVHmxptZ+zziy7wAAABEoJAAAPIgJTIAAAAAAAAiQABEoJAAhIAAAAAAAAApLvns3Qrear+fS95rxp6Y8up6svbTkt+W/zR5k6O05LIdfjqt3N3rLl+gsz4orzR5/1x1vT7/zS1r6lrUfQ5cNU95RW83g6nXuaTotKxs1uYzaxlhlX3m1diXN4380uTp6qwjdrvFbZFTZeSl1brBVPkzeLOku+V3M3Vmr2NO2qtqcvpW1V2nXkAAAABCQBBBMIHpIAAAAAAAAAAAAAh5PcR6AAAAAAAAAAGhv4Y+KVX0LkefahxdFlTl8m/l1Knesa6zJ5w6pu9fyf2aXmsfSc3i7OWo9S2fnBhKflrui3nB6w5NTYvOdZ19CxcRmPU6Xm5uvU+ooPd9otYLC9uM3lbPo8sVWLpMNnKLjUNPzs1tmHY8wunSb+Sqn3681szh9GP08nX+sPrL6FcUd515AAAAAAI8egiSPYAAAAAAAAAAAAAISIkRKCQAAAAAAAAAPPqI0a25x891WO1w5vJavX4bed4/6bUHzDX6Sl3L/7B8/+jpoU3RVubyvN9tx01oaN90Nnzbd76yPl+r9f0U+T4/oXPVReLbern7K8wRn3bXHjWlsWu8aVlGwniMmSzFq7mGqzRuecK7TuNUiuwVa7mmmzL5jKuP3Z2JzHi9oa6bNr6cfT+h5PrOnIAAAABEQCRMgiQAAAAAAAAAAABCQAACJQSiQAAAAAAAAeTHrZa7nvaiYzfGLL5lw4NvXKao6jXlsr7Dm7csNdbaObR8d3lTjpw3WU+/V7uczCdRi5GoPoPjh+iLLHpcuXmnx/0mzPttrOnvzKY9/S3Dz6yRZGPLhs1a/DjXVrdPxXitsNWXS8b3itbfr9s6bpeX6OPPzn6Pw9ljW79QfRO4+ZfTd8woAAgT5AeiJABEgiQAAAAAAAAABCQAAAACEgiQAAAAAAB59eDT5rodXnv3ly+cax+PGGXPi8YSd+n6OzeHfl519rFm1c5fPPepT9DVy8NU9ZT6c5q33myim+0qrNi27GOd7mv38X1k9zK9e8lkevU2evM4qmotqExaNluFBpXHPmPV0sVuSccHjJhzlz0NJay7vM23PWZauxq7Lr7V+ef0DrGUWAAeZ8yQn0efQAAAIkECQAAAAAAAIj0AAAAAAAIkECQAAAACCfMya3jJVc92GLJ4xarTudPG2PB7qel5jq+mPY683j35jQx5dfntg1POd5/FNjL2NKws84tnGYaex0JdzfjKm15mbPOWR5xZ/BOB6prbeFMNFuVC0WHNWVnr8uM8efUKYvVXF3Rddlu8n1HO2adXb1daX3L4X9AufqDW2dZAECPQAAAAAAAiUEgAAAAAeXoAAAAAAAAAAiUEgAAEBIAwch2urz1i8ZsWN4NbZ1s60ojUl6W3qbb0cA1Hn1EaPMdPzHLppVVLWtWOlo+dZ3ev4nIv1XV+ZxHd3FPdZuzlx5kzeo92evHqCJ9+BMrNfD58y46yw1l5mi9e9NLNk1Ex61hp15yRdnrqNHVl1s/MWlnmvu+bSLmn2K+hdJ8k6DN+rZvl2bWfpc8nY2XbX2LAAAAAAAAISCJAAAEJAAAAAAAAAAAAISABAkAAPOHJq89Tj8RjWLQ3dDG9LTz+Guz3fPr0+YKRMRo/Pfo/E8unObtd1C83S/TNU+fYOx9W8f2NziyZ9XYjczamazaza+az168eTJq4PJGfSxy72Sn1a6Kp5zlrOh2uP9V9C16a7jJqdD4OGv9znq2KDX1682epmNyhtqpJz+d8y7m/6iuybXhfVJsVlbV3y/s+kX3xxZ98y/ArJPtb5RY2fRnznwfSXy/GfVHyKtPt8fCt8+zuE3I69wkV3kUVhZvMeQAQkAAAAAAAAAAAAAAiEHqYkAAAr+Wsdfl05rudfPnWPUz6eNUG3WdZqdXJ6OAAGvoWFfx6VFfZeM6wbOvlXNETZqaW5rxhyxjmt7PX7SWOfR2tZzeHizFo5dKX1XObqzw47CufqfovN2cr62dXU2L6gyS/T89Bc5eeQ7TVXkKX6PzVVPnDv2a2Db20wWuxby1epbIw+7HVKaltqetR48VljWzm5daV9Jk5joOcqv1k08YYrLuav0CTB2eTBm+eFjj6sNTWjTbs6P2n3Lo/z/APSrnuMmvsAAAAAAAAAAAAAACEgAgkBhrsascNVV51V9Txe3nXYYtDZjzq+9Oa5z6F8z+sdMbw68gAOaz5Ob4drCK7el8+5xGVixWZJ1N2NbDt68s5sGQ3NjRz6zsY8WlLYV3qusnS0sGmenuKgz6unFmCcE6mb1G0bnXc1fZ10vjFEmTn7umritzR263LNuSbthr7crLjyGPTy+Dmq7t6I5tY6taGtde7PNzOxFXy/QUNa2ruRWnn2cye/p/wA/7TNtqn185l9Uc5d51/eeKxREL62NXMn0/wCj/KvqVxsIlQAAAAAAAAAABAJAAAIx5aXFyaevk5dsWHfqSMmLXzbiK7ZrDWbNFZk+tcl1HXlneJ1n0jye8fjTzeX5vb1efWr6/V2rLCcWaXS1djDHrbyedRjya8uL3rJd3NXekz1uSvW4pc2Iqul5G21OvyU8RW0/QYLOR1exo95xb+tcLcZdHJLs6tbWx2vmq2rOU2fW5Zk96EZtpv8AMZZetyc1bmTPG1Zr4LXTNSquvBSZbbJWpsR4Sv5jra2yo282ytV5zbqbvSUtjnXA0nTaOpWX2boyh1Om2peN5r69yKcMzYdy2+5fn77Tc9nEggSAAAAAAAAA8+iEgAAABTXNbjVLjxVnLrbVezWy72DUL6yaWpZtWXP9TvHUZKjJrFqqxZ+NCZc2pm0OfSro+x1jhOj9LM9npbMePEZK3/GSNZwYNjDLpau7rS6/nY3Cv2r/ANRTLLWlrNS407KnJu4a19lr2bGnm0LKK01/WpnxeEvrSy7NbefQ2Ur93X6E0c3RWScVj+gyfN/P0LUl5zf3MZXbO7rnmvsM5r2dZumfX24Ob1LLUIyaFYZt+n3VuMdTSS7NZq+NTJ48LPeXW8pe7vLe1vqHd1jH9H+dfQtY+uIkAiUEgiUEokAAAHk9R5k8+o9EgAAAAefQpeU+iY835Th+rYZfkM/WfMvyPL9byWfOL/rfZzmS/wARSrLCannP7xrU96W9nVdXWvIS7m/v56r8mXRiMvO9FvO94w+LMuHx4XLaTa5a/jV2pfeHa8WaGNuS6/rP5sr9Wz1ihqOqqNGfNWJsYrGusw0djo6nrPXWZHqwt0pu7zXVz5zFoAAAEeffkYKP5/L3nG8prZ3b1WvjMmGPNnrY0vRaRXpfevm8WY4mLPXmYICZc+G0mtD6Lyn0PWe8CAARKCQIkESAHmR5kQn0AAAAAAAAIlEJEJipRIB4wbSKjxvVnPehm08uOlbynT8RZ9M1cHrN80ObzqZbyw3+nOi89BBz+xa+c3xgrub59ew2qnfTd1tvmrLC2qd2vel75c1MHO7Ond+KvcTLrWN1rHMY+53LngH0XJZwVr1c1U72wIkUAAAABxHZfK5ea0fOPO3h4s8+cmGp8IREhMelh6gjxlg8eo9J585IM3R1nRS7X1Hmuy1gAAAAABEgiAQSmQAAAAAAAAAAABEggSQMeUU9d1KOK0PoY+c2nZjnbvOTzMrYx5Ualfb0ObRcL1fF56dx0nzjtM6teD6v52z3O9zNmvnjOsvOnP511Xc7G81FhtZpMWWZtj0AAAAAAAAAGP5P9b+by/NsebFNePMxZ4TJ485fB59RlI9eol8+MuEQmzzkj3Li2tvrNZru6s+gZxZxQAAAAAHn14BImPQAAAAAAAAAAAAAIISEgAAAAAAAwZxU8v3yT5Lm+qQvyuo+1yfH+s7RVft5SYpkqUiQAAAAAAAAAA88x1I+JUX6I1z874v0NgPz/sfcvJ8Lw/dpPhXr7r5Phj7j6j4TP3rYr4Nn+85j4z1/fekpbPOAUAAAAAAjyT59CPYIkESAAAAAAAAAAACBIAQkESAAAAAAAAAACCfMSeZn0ARKCUSAAAAAAAAAAAISAIkRKCQAAAAAAAAAAQiBMD1IAAIkRKCQAAAAAAAAIBIAAAIkECQAAAAAAAInyT5CZ8+wAABEgiQAAAAAAAABCQAAACJQSiQAAAAAAAAeSJCZAAAAACJAAAAAAABAJAAAAAACJAAAAAAACPITISAAAABASAAAAAAABASAAAAABASAAAAAAACJD//EADIQAAICAgEDAgQGAwADAQEBAAECAAMEERIFEyEiMRAUQFAgIzAyQWAGFTMkNEJwFoD/2gAIAQEAAQUC+u9/v/v/AFT2+1+/0nt/+Se3/wCQ+39hJm/vxM3/AEBvf+F+uM/j61veL9aYYIPb/wDHPf7/AO/9A9/w3sRFcCLdoq4P3f3/AKNlnTA7hgI2l3lW5fXe303v9p9vruoeHrbyGhI+C2Gso4YfS8xO4sDg/wBizk50oSJVqaEYEQ+RVa1dlVgcfRWXhY15abJOtRW1KW5L9l9vvd3/ADs8WV2ACqwvGIgYQ8TEbsWq8R1cfp/z8HYIMrJLRQqgNuDxDG98L9v3T+fpPb6c+RevrMp5QACMNwMI05Gtj4NF/KA7/TEssFYNzXMqADnsquxZDGMwP2fdR9szU42b2KbAs5NOXKcRGb0LYGmPrhk1cXqN4a/OupGP1V7XfONcr6khi59LBcyloL0aK6t8bLdSyw2FjW04DauqDmNWnwzeCZgj8r7T7feOoJ4s3tHiOkMewSvZY16dRxjNtbN6tasImMFlubzs5PY2Ly2a7KBYl1tqY/brCu0/bXc/qp4LOHhdsCjTl241vjnuCYX/AB/sPULO1QAL37AWUhAG9cXDXaqqK2uJIED8kzbiK8dLLszM38tVzUpd25hY+rOpZSLR023eOtkVxLSWTIISYoJbShDayAZqTIunOJK5jDVP6nt/Ves/+quseg5ImIBfO2NF5YYD63B0f2dRYmYWL2RmndRq7cwKRzGwOqDnl9NxTU3HkVEHpbIrQgYpriNqVOhOYvCbgiaExhyZRof2HqS8sbNQlnqbl0+rsqTyDLGE0TGUmKClWTaKVxi7Jn/l33cWs6chdX0qXYy35VXhF3B7knmCeLjlMmkx+6q5LWou9wGUqScFNN9t391uHKrJ32qB3XrXQ0IZ7Tyy6CC23jkitXlGS1uZmuObeg0oqVZwayvBr1UQRAJ42PKk7nHj8LAwOTUGi7Y41aavApPSma7J/sVnhGDWrRQEgnia82eJVrjlDaVVm+8r6cWvXU8p/VjcrLM+5kpwKXpxrn7YXyjVca0YGDxNTQB46J9Qygio1vJqrW3Z6un9ETWP/Yshu7B4gEPsPPwMT0zMOlwxG/bRuvqfU7NN0ogY/Td5WXrxnrq7FUMrft4kNxI+H88fF6sI6reMhV7uLQAclSuLj19mn6L2+rA+z+36uQ3FD6RUdqvsYCBMzqK0Q9ZeY3V67ZcveRdxm8Zdf/nZ41k1ntYPSqRRQfbJ33ccHg7am/hxgAEGjLV8Mlms6t0fCG2CbyPtR+8ZB2zNuKQit1GlWa+txk5YqqxMZ+oOcSuqpKqrDg3vjQS8lY9fqYbuqqHZpfxv0mnlZbl1Uz/d4xmP1Ci0r5h+P8allYefLdpsduVv2r+BB+j7fbbTuWXLUMrOa6Y2A10TDWudf/Jx+jqBgf5VlNRidGtd7bAWxek5XzOJeNoTDX+aD6McQ+3Vc/5dRjvY2HiVX25nSnobpnUHosVw4A1BCZsTl5M/ZZ/Wfb9BvbIsFa5N7ZDYeJ6qxwX+f8oqJp/x3M5Y3WcQZuN07pxor6lcKML/ABazYcbTgTO3qMumpTS5l4oo6eTlZPXR8n09LGR8M97E/wAhrFZ6XzGL8+iLV1Gl4lgcERoplg8Y/wDy/sFn7ep28zhYnFeHFbH0EcbvrXJoyMTI6dkUdYGm6tUq9QzbMx/8bHas8MOIE47DJ54+P8lu1V0Wz83PT5zGxukZNmTjV9qr/IbBdkdOo7eFkYvMZWJ8u3TMwpFZSPEr8TWxQNJ/Rff6uz9lNJszOGkq2Q6+G8FLDWRbXcMjo2PbE6DQDk4FFVfSa/8AyV9IBm/Mss4TO7mXa2PbjWYfU63WrqFKzM6sWnSumO9h0By85q868hO09XUbkmJ1TnZvyp3E/b/YH/bR76gXUuXY9TErxB1sWNxW6wDIJaY1PYVrQX7gA7w5I+zcQ0xhwnZququ6Fjuaug4ymjEx8ePeqh7dr4M4/ltho7/IIBmYorPSMtdLoge31ft/RW9muNdyWqy2ZCLK70JvWMHU/vjegIjWGuha5n2BKlyWSHM8DJQzFyOTLRzjVGuxLCB32WNaWnq3GTlF5c0s5nj4q9a5FAsXLxzTdgZAZaztf7AfbNo7lq49qrk02s1WHcSldgQY1kC8V/e1RQLsMOp03cjd/wCToRra2txbRTdjnasoaWgox8xrNT1wv6le0vXUxHa0EX0KJwnUqBywa1UU5TB63Vx/YMoHeOw4gAziJxngQgNPlq91UUVSpURW1OtY2icgE9L6R3pj4NFEdhXX82ny/eryawPN1Z0LHoK3KbUNaLdn1JB1CrdN6uOYluQlcyr1uI/Kprt/NozWWU2rYPvm5v7FkAxHYNWQ04CAD4dxSz1bZcVBYKtT2l7VsmJhVfOKBx5EBshFj5dSN2K+38pbWi/mL29y7ptbG7p1pjdKt2/TrEFNltcfKuMVLr5jVCo5jcKd+v3OJc1Mx8lLB9b/AD9YfYT+fsLDxbVsqxQq3gsRDU10RVrRy0PLa898dy79uKVNy75LYrQrWxsoptj4nNhcan4o7ducWhJEWxTCoMalIKq1ljGVqGmc22KzfpWzxXe1VmFkrfX/AF60Hk9SrHySkXIDSt+QC+Wh3PMcgTIJeV1FHqfkNCLSBOw1daW2VuClyNSyFGLLCJwGwNRyJbZqbZyxFdeT5PHa3eIkROcS18d8fqw1Vn02QXIQDv6r2/oLjY1LKFYpj+rv8Wru5wfArGr2e1DUIUIKzjPWsZRaoXg+/h7xjqcozalt82LCmqxdaLGtZge2VXL9k98ZRMqsJE9U0QaA7GvLeg4uWl4/rVvpYqDMrlxW3zVaNi3wt4LK4Pw1NTU4zUI8anuDOcayfM6DsLALWMFbORWoFln5iUcY6qUWl1ryZipyd0FdWQ+zUdP2q7EoHjgrS2p6HxOouJTl12AMD949vsF58V3BY6ixflwgSkVgaCIirAwWB4DN/gJ8cvHe1LsoVNfdxIJcnFJi4bKy1gzgEGddpE4yl+KEnk//AAyfbpKechfy7oPfBYsnFYa9jOB1y9XdAOFl2OtVykBgf6qx0LG9FS8lqLqyWhy2iCoMKyxfKNo9yWWtFc73D7WM/YFrutRLQ0IyJjrxSsLNgTnHfUyM4Y8x7KMt3rNZRPC65ZK/kZO1PST6MzfbvP5lj7nTrdQbZZfxZWpr5WEKUMxLG0mUaZjZSXj+p2/tu/5YrHk6bDrqK2224FtlkZriUJWKY/sPYNpe7FMqC8wPSDGljjibNy24IMnN3CTY2KhWY7mEelfTZlv6Mg+vo49Fw9GYD3T79OCma8aEK7U4qk5uPxatG3hXARkR0bnRZhdXIlNq2r+Df3L2+rym4qnqrC8bUflD5joYi6GtziIatlV1Gh9izJKxc0xWfkthDXZHG3vlgl4MFmrLLDXMnL5R3BNIO6mLDDp1LLOKI25kupN+NYX6aPy7dgZVamW/u6Z+5YZ/HiZhErLWNlqKji5RMzAGExsqzHbBzUyF/qHUiRVhWFlNex5SIdr/ABqcZqa1DAIa/BqEFeoV0zY/i3HZ7Pln41U6bIVQM2wWY9h8oGlK7mNW26NgZjArja45K8Ig3fin0XaMzSgaxtzpluisEGjLhqXfmCzjG2zYOOON1KE3Lp5j5D0P0/PTJX6f2/S9/rd/D+f4/n9TqA/K6efzUPKZa+mvI1FuUqp3+ArB8P5mvJ928Q+72cRdkqFRzXlvUQ6KRKEHOlNL/F9jM2xXXewfHwKjbcvolh0vUbJ7npnkj2Ef2yLGWK/dbM5up/LfHu5A6dMyvi4B46mG/bvwMtcir+frvf7fmKDVsUvjNutgGGdV6cdWVaLAwB/Afgxh8qjRrwrZVul+eXb5fhbCxvqJV6uQ7UxaPAPGZmRwlJ52e65VnF8GlRD6RY2p1Py3LbdLVSPUJ5jb1lO6ju8SbPS1SsaVKQnbPVzDo6s57Shlc0Zj4tuHeL6vrff7CP17f29SB73TskmxT4ZAZfXAxSV3nasdM0J0Nzc5DkG85DcVyczmlt9ny7lrGSslqsbcTH9FdWlXHgGplXBVyLe6enVxuSoym+6peNbezr56igU/z01iQrmIfDuJlFI3ENRaGD7Ve9Ka/KL4zxpjpY402p0vNbGtrcOv1fv9afh/P0Nn7eohlbGsao4OUbADuFdy2mCngF5brY7fyXfxVb6e/wAF+YItuzH7No3Kqe5jY+HxKYgWJXoLNhYz8Tm5XbF1zXNjYpZqwK1zMlycAsXH7bD8Oo1BldPPTDFM34JGsyxTP/qu9knJrZ8v68VCsDaN9dVgv9zUQRUd2VFJ0bqEHn6ofX+/xH0B9uooO3YDwouap+n5YsVTsNOO46bgQLCPLL4ZCA6MwKM4ags1uGTMLH4VBQBD4mxLLBMzK0brnc49e2pBqrybu4ybJpAU78N+1SZcgtTKTt2YnINS5g3LtcbrDLjyfQ3isONY3LkNlddhlTiWqGerF5TsaHZU13YZSdIy+6n9MtUGZ1LE2IRMa96zg5XcHcBnME78s2pyOzGSCsaWscjVqcQ09gY50O8N5ORwbLy9vYxux61YHBpAmRkEhiJhgq9dg7rtK9SxCJ6SuXjqZWzU3UMdIWlqMRbQ6i7kr2MWmFVqD0rk8xWW3fQ/pAie25/Fo0LKTU2DebqvpPf7P7fQN+/KT05WM/cdOIqyzStvUXaYXUTtMoEfMrO6WHzGgbgIt47hb1b8NYFdsysyzqYA/wBhxa/JO1sZr3UscRG7NWOurLUqlrFJTyZ9qtdblbkJZEAA0N5ZCTuBkv8A34lhNdVkJHFjoZQ3d8vxNDOtqPtLVrc2URF4BsnUqsRp41yhsM/gM9Do3Jfovf7xd7DyLKgZfgiw5eAwdOmWNE6XxnypUcGMNbRNyxzBkGt06i226mxi5T2XNcxgYzzOJ3j1+tMbUxqwFOtZJVV/caPTLLTKWPep81ldqPQM8yt9S31zE2qCw92mxjLK+UsrsAXkbuRFtNiytxAeJd9TJNjNituKNhlM91ruEs9sPIYXfQ+/2D+P5+nuG0q9oRuGsTgANeWr3DSIaxDR5bGDnI6dsWdOeLhPpcZkenFLAYp2uG28fE03bFZWuxrErCpaVKXnnZ/zlPmXsWswa2ZkAUExzOpAkKSITMV+KWtqzH5WDJD9vIa5b7WLIlhB73iq9pi3EhiJnusx1ixn1O9ylvJbFyog7p6fk91P1/f70YfQ+9gTfwA+BhPqiiaBnATtrtsdSVxVU9gQIFZ142U1lrOARbskleJ3a3FqxyHHZ4cjhrxm9yx9G3I85F7897I98bfEjWRh2MZlEGrLYx+SQQmVsJg2ExP23Udw118IzcJl5YUNlktyWxLqmU4RO8a7t5I/W9/uHt+pnNwmJeLFjvokxT43L24yvfEbntOWmZtEsqzuAtuNaAzHlErniWNuFAkyH3FrJIXitNPla1mwoLiX38Tbcds25uKRug6TIdlu6bcjL4YZtHEWjzoxgNofOB+6nUZASw1MvyttnKBpS3kryVPy7G9VeLZ3aP6Tk1ho2I1cosacdztwe0ZdzXn4N7OzOwqOq6+EPmdvlB4nPx5LWOFXNyvK7sOPXoXDziiOeAycjz3vTe/KNNQyseoM1deX+7p1nlQeFy8q78f8yyhtMNRTMKY58R9zqF47j+okSs6OI4dMyni2Bbtektwv+t9vtlk8S6tt0MdA7+B+AI37zU4wIN8Yw8uPUfco3JdLLsntzKyBZK0JNWLwia0tfkDQyXCrd4uYjg59UEbUpGzY3i7TDp6EtV5RtcrvQcmqxi6nj43i+Ti8xBL24zqDu7+JxiDzhqZksGrqtNVteR28tTtftHv9R7foZP8Az/2HCunqHzA4lDivtRCfL2jmlncuVvG/B9+Q1zENyzIyFAbqakf7XdYzbCbrXlNPdGPSOIGpxJca45NorGTk8h3DC0/gtBCNzHXRySAV2z9OSa0GdXlhbjkVMrWWPsHzhA8sX9pIEzWUpkbHw3F98O0iZSi6mwcLG/5dNt7mL9n9/sLrteo1NTeDeJiZfclRRQHHEjyKPCVcIfE7kuyNWd+xQ2RZ2zXfa64TmDAXi/TByTpmmXpwBpxxUw9yvkaEyH4pfk84fMKTUI8e54ytYNKth2ah56enGWOawX/MVnl4sUXOGi8N9OU8k9rDo5uQVN1nMzlFMwW8trhl/wDakcqehXEH7B7fi9/sfU8flfXjL27cFTMjEfmMh2KZHprfxyjRk5EY2p6REesylhYDpRbegnz1ayvL5BctC1reO5uG3Ue4cWuaxlwyWfDjYktrCwmIm52jKqeK5D+K/JqXTY/mWP6a1KMp2cqw8La2Jq8t03w1R2trKwzfy2JngzyPhiNo1OOOeqrZ07iUrY4/Uh9l9/riZ5g/BkJyC+FDbjoGF2MCFpAK8R8NbjjUy8nt1WZDXCkvKsxKVuzytz3NzewxbuIS/cTNeLko8sdSl22bHqBigbOtZXDWRwMWstMSr0GjzlN2ktclq/MxELMnpXLyNDFDEelV6he1ZNyRBtsL2U8VynBTLawAzcDzcqOphWh51KjadNfUzRMOzuY8JnmD7+feL+BvZPe7dYquZpsEXrYZjDXxv/b8q95Tpvrswo2BPkdO2G0NBjJwPD0sx1VfxgtIlbiJYBO4VK3bN5XV2xMP1NSnEPqdVbU/eRXMIRX0uQd24y8VuYNM103wBONSScEELxHDqLsksJ3sfgQzCfTtp6a/Rk5a/k9Cs5Ysb3i/Wn7TlBUtGirV7KrqMm4E1DCZ4aBJxnEQoIUE7YMfGVpk9O2b8F6odiD2WzQRtii4gpepHd4i67cfbN06iftFlgnUGR5SkPpfCHixwSENz0/t6iSK7re+tQ9WCoMrrEu0FyrHU2+TNmbgimYf7mLGtiRk2IxXol5pyv6L7fguAK0Xju+/4CJaIjagYb+Nh4i7NZZVkNZYV9OTj8ly8fgzpqeUYOsL6ZrA07hgPIYq8mxk0ttyFRYWmbw1X4BUaxz2hk+oYo3XbYtdd+QHe5VZqPfArCgkCZNQavMVuUJPw3AYnviR9sl+ua8mxMfIerMqO0/pBmRSFgzbAaX5J8WG5dW3JN7T2HwtTkHwwbK6Ap1DM3FDHNxmrJ9k1G9puKQJjuAwy/GTcztSxC5ZV0xCWn8L5G+b4o9FlnJclU2Ad4NPKVrZWjMOOTfapsYF2ca4EzXxrMwn9bruq9StuG5rXJO7ukW93C+ye32VhuZePyPfaqVZAIB+JE7flfE3B8NfFhLiDM61Xqs8QytxxYcTubgnd8cpXdxXfKU8q7FKX1hya6hzZHVJ1O5Vez1SmvZw17QoYGXsplzWx0vYsvADjtl8FSPjj2cTi3K1eeD3KfWmTXwf/GbvH9JMtmeeC4zNTbTkKUWzZDfA/ATlN/FjoZGVxl+b3DbbuthOO/h4I47nsdqJ5+AMB8B9HG5NHTydKt9gspvsZgo5HCpCylfQTpX9TWYpc24bBbMcafxH4iO25v4VnzhGZG5iNpr6xfV0m/5bPHt+L2/oRlp82rysygd41zKUygJRZyi2bgMMDciYs3NzOsZa8uxzdy8v7L+7Hq5G/A2jY7LOw0NTFa8Z2j4jCFCIPhyImBYWZrHBNm8a3JQxmd2xqfFIBVK/ApGhSDHrZRmO+n8g83D1li1ZWEfCv3wR6bKto9fGyh9rkAi3pd3ewvtXt9cZnMUs5CWIGl+Po7ZbMXI449dw7ddvgnanaStgywNPeZaMUtoVXUeVr7j14coxil1Y9NmOrT5UaGOFIxwIaBrOw9xsdgeB2aZWjVOrS8tXZd2y1I1CbO5iLyiemBpucdy2kNDjKscDt382jbaN4+FXv09BoruvqFBpmM43nqVn+MX7T6gfccivnLccrL+SQttm4OLfStN+5Vbznf8AAYNE9BbyobjFbaCZ+I5GNhMxpxABXjcV7IhGoIfEbUHt+4OqlTUji6hRLBxNflw3GmzI5D/rKV3MYeQ9dc+Z1KslDK7Q05mbJlnFhbWOWTxqOTk8oeB+FQ2enbWMQy5Ch67K+27r3cfordnqA/S9v1P5H3JvDOBLaRzdNNktxQ3esa0lhQrd5W8cqrw9ieVKefUhB3NB52hOMMYyxvKvOW4g3G8S3K0Lcp4Mz1fPy+zm9Q5C8LZja/NTxEZBFYCC07F7cku5Ctm5Y9lmu4BL31Gv3Mi1mjV7UpqGV7mBd57kss4G4iyY9alF1TnV/s/pGc/anzgafNDVmQDLn51l/K2alFnOUjmeLLaQ9TLkeiuz8vw0Yytvix8ZVxQfM7AzQZRk7KvMr1LbyUlvMbxMdwDinxfZxQeZ44ATwIhjEiLveMgdqQEhvqEa3RuR7GspbZqYQqYZX74oltnAW2Eyi2UEkZVXG/G/4/rn7z1gbxS5FXJuJc8R+0zXgNxNVrSq/uRckpO6gWqxjMWw9y0yu3dvL08/S9szrdtfbtQ0qtmHmjj4l+OLJZg6PY4B6wZ43ZqlLLN/DW4tZacWErr2ey8SiV4zTi+mxyymjiOKsWr1HSgyykRoPfHfi2XkFoTKm80EAZfrr6cxbE/pGWoenPVlttYhXabM/isExlIjsaa6bWYW3iypbSV6bjsy1jg91hEq8yy300XsYzbXKTcvX1lIo1A8x81llebuXZINduQ3PfJcUfm9TfZVPHsEqOkrdgKdyjFBnZ4xhxnddCmRY8Bfdtp0922HFlupMdOJ94IIfIifurU9n99HSv8A0v1t/Yf5+of26nj7NlDErh7DYXCWUFGNfryAba6yLFsYVwLo4VPO+qrVT0qBmVxHPD5jjEtqDHIUW5uVLLeQE5TxNxbSsN2iQSE7hlJbtdvvFqQqU45ZqMeY+OFj442lSwoCDUJZih2NPCPmIrNbXz0jIU2jlgRxtVwUMHxHvhWcUyNCvo//AKP63v8AejHQNHxlgpURqVJysQNZTjcXsx1rGcNS2znBOiVs2SPZ5em5bXqXqQeZVK2bkyO7Jh2sWxHhrMK6+C62dgpvl8sONNPJMgBVNG0oxhEr8qsKzjLB4OxGc6ynIXJVMhaqmqZdLLrD3bPfcLGa3Paahg98D2ytLT0NuWB/SD8DCJqMm4ojV7GRiqwycPjO0Qf8fxDy1GEtEuHjqD6NaiyJioDXiqGFfGdtZbhVNMjpgMswHWfKNtMFiK8IICTZeF4V0rzsCwKN1gchPae8HtqW1SxrqmrUbKbl3cqljFotrTwQNgJEpLSnG5TLxu2v80j8nIc8P8bO+n/c/b6YxnAm9w+3tNRhD6hdSI2GpPSqu3TGlglizqiecZyrU5I4o83NxmAJ1vUNQh4g5jVcei07e0chUnEAeFHqSLGi+2vNk5S4lVFtLC6tYTYstTTFZ4m5R5mP6RSVdcsKKtbtUBKsg7T/ABZt4v8ASNy06ncBMPxMaEiAbapQtftDLBHEzMXup8g6t8t258yqOc1QP9iCLeoHlj9QIWrNR0fMrAzc4a7ncbAUpia/MHl28BfdB8CPCQxpk2NSXyVNWZjpzFpIKskNuwo8OniUnzjW+adCZKHgU4XWsdZBn+J2fnfon9L2+6/zkfsrDKULGa/ARCJjVefi/mMsT2tSX+mZJUlxtSsbZi7WCxhGsYzHoe5sTCVbVHpU+tPCj1OR5EE34jTvae8l0TgYcUiWrUo9IWwjR2pDGMTtR5pBWV2R7Nwt+ba3nIbY/wAft7fUvx/z/PwH2z2+izN9nHrYV6+Dtqdyco1mp3CZib7fxcR4ns0tqDy/APG/DsWDCtafIWGDpdktxnEx+mtZKscUV46+QebcYR5QerWzBDBH9QuUWMgZLCqcci1eFj92dz1d1p3vSGDRpU3nHcCJpluHEXMeQO5kAg4zmu6pudf4/wCR9d7/AGK39g9oZkqStCnUZYFG6Rqv4tHg8RiIQBDuDRnFZxSaSdhTCgUPYGatNKg1NTXmAedef5B2P/oyysEnXHIZqnuyODi9lNvbtB2p18CYDKvM4MoAFleUn5vgWZLbKHTdGt7mB9N7fr+/2O//AJ494ZNwxo/iBztiZWPWo0vxaN8Gc9xrpbmai9QGkykeL5hAnAA5JPGiv1oIP3Q+fgp+K723iajMIxKy/nYltXixGWIxeNNeAfgJjTGQld9pMrbWeGOUvGLOhXvWabluT7H7/ZLhuvDx37uvBhj/AALCY1I/CY8uyDXkWZcyb9x/MPLaWXo2H1AmDIVhbl1qKss3vX+3+U91+Ps38mfyw8D9tohIMuYCPkKZsLawIY8XU7WH4KPOKkFnamXfpwedKb45TfmLMVyj4ubsL1ALKrUtH2D3+ymcdfAwxjHjNudPLGv8B9nmcq2CwPXbYXM5PObCc3EGS4jZTmVO9r4NPbrBG1i+YIvv/wDTQiEbELaFlgScuQ7LMMijkmQjB0xzYtlLRVOyjaKmIvmnH2tVYU5F4FRclsZ/y29KW/8ARYDEeYl5EyTfMbqOWsr6vK+p4ryu6uz+hGfxDGjxzOW2xF41fgMeZ78MhfzB8mCl2GwnaBmuEsrUynDew42ElIX2UfAewg9zDOXh7QALS0G2jUqYoCqblUX5aCXWozY1oE4papxFJTGWZWErQY5V0/LTJs7UyLFthmMdBn5U/wAxRuJSdCsCM1qSozmGlp9YbjKOq5VUp6/KOq4lsSxHH6W/ub+2/TzBhjRpbMICzIX2/CZ1TG5OaXQ4zBk0JZiIwfB2tOEAtdSrLW8gwMIs3B7L+4+ZY2kUlkK+eSpBlKGbMAd8wBrsruxrmE57RbzvFyPTjX8iBuP75CDVthEawlR5jJ6cf3v9KqPKDzUujUrILK+bNXynYloZC44nnOc5TnFu1E6nkJK+s5kHWcgQ/wCQWLG/yKwT/wDorzD/AJDkx/8AIcoh+s5rT/Z5ZmK+da1KZUZ71lvUbKpX1zUTqmKwryqbICG+2Zdnbqz7rOGFkWG1T4Yx5lWFZ0dTbkfiMtG49azjwZTAYQN+0sJ18N6iTe/gPce9nlFOld+Ras6epWj0llOM8yMV0jLuftMRihxr+N9TEy0+LjtclDybEJrKkHe6qtiZe9VpuJVuDHIFW1H7bFVZwXV/olp2e4u+SkaI+CpymPhI8fjjpfl2MXtbXOB4TNylDYcLp25VWK1yMhaBmdS2z5LGc4LDMTJNdnTssWoG5Tf2rq/KyrFC9pcatfgxlvtke/Qq9U/ib3t3ovtiND2+G43t/Lb5ansRFincE/kmMNrYwSu3Jft2M/Ou15j5LaVleZlIhAab8LqJZo4d+lsOzqPTuLX6M+jTe0A8ZJ5V4qg0Y1IMVfN2JsrjFItQ42JwFnAS4VNOMK/BZQA0rrqEuFcue3Z2zOAo38K12emYyxVCh7CB1O+wsx2TN/AGYuZZUel9R5hTy+0GxRLLRxozCM0IrfA/CzyMwlW6SP8AxPxZOSfnmYx/JnHyPA9zuf8A0Vh+AgiQQGcvP8Og7YRYeG7/AAljkRcoiXW7nM7J5MAZrytxC4dnNF8Bxo/z1HTAsd0tsCotKqdSpdQro60ywqrzIUgWodv6ZzG+VZNirNeccGcw0tqW0W1FWPGGaJnAiUI3PFZVQncyW0ubeWm/hr8FdhU9Gz3lbch9kd9RnYx5YxSZSd+YhyVWgWQxzHbxlvyuwl4Y34sjiGszkD1ZKXAbm4T5J1LG80nbQiEfAGAzfjl45evnsZVnFO4SoLNO3a0sxXSeUjQj4e4rTcWiYi6TuCM3p/jMH5be+N+9U81a3UZub88hHZYlsatXllSs74rBuz57T8U5iUosso2cnurH3ZO34AKxS0AcDF3vHGhfkJUuVltYxnbbQqYxqyo+KMAej5VIlRDp9jY6llk5aB204CGtYG4hG8MZYZdbxnSqfm88fiYzPxnttt6eyxFtxDRcDK3Vxrcs3PeLtYs940MWbnKFvLWfmq2xm+ZWSJiKGgrGzWpGXj0gtVXq1Cvwoq5ShIgEQcFyG4v39rS/JcwbRl3MYeWfTc9EXSu/YDchuNsTQh9MYnkU2LEsBRoglZG9amWqWlk7ToItPGWKAEWsTAqDFyVHV7G76LygqlOMBHVUjYllgt6W6rdW1bfDCsZLemXNZR9jzbdOxlY8P7M7KWaO2piv+UT4vuCi2s3HoVHy+MDNzc3OULy1/S/UXSL1Lk3KrInZAVAoh8Rm3KiC/Ga+Dn4bgecozS2VtMnypLA49ziJkHiMncPF58oGNmC/G3H4yndbVLKXHca7QutMrsOsF+SZrHs1n1Yh7av6h5029pYREv1KLg83EfQIRo1ZjdxQt1Vw7UWtSbKOB8gO/KOH4q4WHThwScYalHb5s3nqSq1go5Smuut/yApysba5NLMzrOo43dllZraVHTdAuNlP2PMX13eJ3lSM/ix/KuI+jA/Ei/a6JbFHdtU6HKc5znOGyMxMf2sxtnJqCzsskoe4xbbe2DtT4avzZNQxoYxhM5+FVni4rGDGVY1YhQaZVEZzWygWLvTcmSd/lL3Yh91vi3jiCQ4sJLnuArqYB0Mgs7bJYDcCTtztQ0w1QKVau07SwadmrarKWOeJtqZDjN44+F8Cz1S2uzjWrbJ8grGLmyqlWieJZlViZWRs99obGnMzmYtzLBmvEy+SZfrUwT/G3Hd+x5QOrn2LNWpWwsrtit45xj4ZxF52nDApQWTnOc5Tc36iDxG2sY6DNuWY3qV2WDzNnjYJieV+BhjQrBUzyrCJKoEBG5sSzcA5RqyGakrGo1LqxYuNcFsyMfmWru4jmScbUAZFrX0ezWfsT8upjuulfNVO2rxCYuBBgT/XiN02N0ww9NefIWz5SzTYDmDCuASi5Y9Dqa7GE2IwBlxastZXu3N8NlgxcrymQN2PsXex/GDqC3w0E/x6slx7fg9vriNzIxFsGR0u3fZzqHyLbILyB3mM/OaJjXtKcSwSvHaCgztThNQCYo5Ne5Z9cA/vYeIpsLt2twJ4lrgLif8APc3CYTAORoxIQtYHqnGFYwBnGBYV3LEnGZCEC5Q0s5tVi2Bxag3rw9UtcIdgqV5BxyV/bDx2ZsXG0EQD9LXw0I/BRk5uNXMnqQ5W5ztGtJhabm4lhE7k57jj9BZ/Gp/jyas+j/n6ErCkNQny6T5dRBQsFAnaE7YnCFIUhWMsX010Wcm/m0+Mmw23YuMtVbjUOpZYFj2G508LubhPww69LvxazNavg+8cQepwg+Lka2rxkBjUafie3WjraoDF2Fd2UX5X1nj2nLIjxcdmGPg7mNihAq6/UJAmb1FaBldSudnsLQtCYTN/g3NzlG/GkpG49YnQ6ig+z6mv0CsZIwjftwwO0zeMzbV9N/8AaZ9BrITMqyYVPEBJwnCdsymvbWOFhtMoflZvzMm0LXietjD4lz6GVmamDksYLISAQ4jNzbtM0+T7g+WdYMNiUwTKsGV4oEWsD9bq2aFl1pZiYfoD8E96KdrjUmy3GrCp+p7fi/n+PrrVjHjK7FrZiJewl57WRiXpdS48W36mNjWXNRicR2J2Z2p24BxmfY1a0ZVgvp0IsB8dTsMxjxDtuF51K/U/caD6kcxcW65aemSnCCFMQQY6QVIJwE0PoLP2dWK91/f4kQ/i1+IQwTFTbUr56Xjkfb/b8TIrS3p9NkPSwI/SGaP/AI/yif48ylejtKOk49RWtVmh8NQrCst8Nn+Uwq7Ls3C18xsElhOp3c7MTZxy0vtlzva9WFda2J0oyrFSsLXAg+mc6XrLFrG/RAmpqEfE/grTkcPHO8PB8VVitf19z3+I+3P7Wnz1NC4e2yqdBsCuTphZudU493p2WoqsyEY9k3nH6cqxKVQagXyPgPpT7dbrTb+5+JgUwqfiPwb/AAaJlOI9kwunGYmCEgAA/XP2E/AfQtUrS3CR5k9DVzZ0e2llOVUtjZNofpuW7Y/S8qYvS2WVY61gLCPqiNjPw2sGT0y0F8a1Z22E4mcTCPCiMPISe3w8wqxnZeDEtMTBtJx+k2ucXogApwK64tSr/StTX6OvqSAYaKjDhUGHp+PP9ZjmHpWPP9RjwdJxp/qseHpGMZ/p8eDpGOIvS8ZYMCgRcWpYKK4FA/8A9ue33P3/APwH/8QAKBEAAgEDBAMAAQQDAAAAAAAAAAERAhAgAzAxUBIhQAQTIjJBI3CA/9oACAEDAQE/Af8AgxUyOlrv6F+2zoncjsvx/agqpEVJVEbFNLqFQlbUp9T2P4/JWvRFqkeJ4sh4U0ScDZQpNZRT2Ok2q1BU0VDqSJzSJkpT/sVMH5HHY6TitChqWar9+sHiqoOSji35NUuOyWpCG78bGk5IiGfkP/I47GlDsqWQMiyHdGmyvUgbnsURIkjU1PDgob1V7Ih2YjwS/kx6f9rBueyQzghV8k06a9DJtp/yNWhqr2U/xgqhsi77GcEzkg4t+rK9lWpPBF32SUo8SL6WnTU/3M1fxlT/AGNHOM2a7GkZIrJwams6+T2cE2gg8btR2FLOSBEkjJw9E4tdgmcjRDRJJJNoIIz8SOtRwSTI0QQKkhIlHlgh4ukajq1iiCMkIfObp6lDOcJJJJwe211CORODkjGLyRmsWuoXA0Jk3ggknF7dS6el2aII+ZqOmXAmSeRJNoIye4101NotGT2Vdk4VLpUTJOM7aweNXHTu3q0EEbz6tP0T8jFjV0tOMnkT8lXTc5KB9zT9b56WnZjZWzV0qE85J24zfSrZi03faRsPFEXnrlhAxXi8WXZLFsW0+wpwq9KyyjffS02Vq7r5Gulpwq5vST8viR0SshjvTeBL5YPEggggggj6KbIqeCwXZqmTwIItVxgu2pUvB2d0t2Pjd4s/ipcPGbpXj4pJPIlEk4xjNqvk8mebJZJNli8I2ZJ2PEjCcqvqWDcEkixizZ5E7S3OX9vvBEiGSVVkvdW15Ez0ktEv4ZZLJPI8jyJZLPZH+x//xAApEQACAQQBBQABAwUAAAAAAAABEQACECBQMAMSITFAEwQyQRQzYXCA/9oACAECAQE/Af8Agw1KCrf1HzYVLkey6viAwiUntj4KqlO4m1B87Hq+oLid0ceFVSnuAQmdP3seoHTKYIosnDYwmdL3sep+0zy5R64VYwzojw9l2eYuOqf4nS/bsajBZx4GDCqClweNiZ6tTT+UuVn8FXa/EeH5X+0OU9R+MB42RvUKqC6YOnX1q+6qfzFbr/2yp+n6tKM6ZPeIMBsVgrOe4/4n9MGxKOkKdsfEcd6qiB4E6fVf8R8A2NVlDZQUCn1k47g7CoT1HZRWIw8xYg7AieoDARFFFFZ2eTgMetM9xRQGOOd0ZMUXE4C9UYcn8D1Jt6wUVlcwcYOoNjPUeT5RYHVq7j4RDwA6c4P5gXpqop5iis54jjj+AHTVWdn8qtTpTFFiuM8I96tx3fAdeR5iwV1F8BtTpaslYG6wGJzp1huOI4mCDTVcI4BDwjS1cLjjjjxOZtTpaooPoEGlNgLLICLAwbJx5iyiu49gbuOxv3Rxxx7M4gQ5nxs6sKfJscHHCY9nVhRYw7mrCn1eqKyi5xb1HHoqrGCC592ccJgzWYyccccccccf0VXpwOB4B8gHzmqd9nanA8I+U/RUVgIBBHHCeRwGP4hHZ/JWGMAIrk3dhwrNRRRRRcSgg+NTtE7RFhViLuPEXFlFm8VlT9KhFhakRRQ5KKdsXEdOoosDAIYIpTTFyniWlUQ+NRRRf7L/AP/EAD4QAAIBAgQEBAMGBQQCAgMBAAABEQIhEBIxQQMiUWEgMnGBYJGhEzBAQlCxI1JiwdEEM3LhgvCSonCAoPH/2gAIAQEABj8C/wD4mIVsO3x/uaHRkfHlLO5rhGvc5n+H1+JPQg1wtB36mnL+xb8J0NTX4jqxthd/QsrjafKyabrdHK5+91wlmWlwQ5qq6m8eB/q2v6ZUQQXwyyaFNU2i59rRb+ZDT1X3tx1fk2TG66lm6mjwnF/ETwjLcnloXctWvc82F5tsRsOqiqLE5pUaSKpJejFTlSOamTmpaLZvkeYsyJWNtRdyNV1kjY2XoTsP9Wj9PVRKLnf0ND/s0x7k0kcapZtkVVupU06wPL6EUfQyeVtwPSI1FRTVHDdOqPO3VpIlnNZZFMtvoOmZnXeOxaPYjX1Oak3j4mzRKkeQ1km5ypkulP2EoI3RK1JjceUvepFeqsU1L8z1KlR5kPjt88GSv8wqZmBU1alrHIVL8ypbT6dhXuO90TUk6eqwtihfqXVfqFP/ACEo53qRA41pFFmiML9B30H6n2fDTmobfnq1Z9l/MVU3yrRFedc0TUeXQs/YlaMll3YjePkNtS2T+aJNJMtL5+hOWOseBCXxFfapMcEk6yW3FJzXIZR/Loz0cDb9jNWoOFxdaZgdpXmkdb1qHux1UuGtO430sOdNRz1P3KZ1ZknXU/h6jzZqv+IpqdXrqsLYUz8R1J7oVVpi5p8hZdB7DTwphbl9GKnaolqbblXBiIFwdVVc4mX81hKjSkVX+n13FPmKI8l2xFnKF0wl+pL1Oo+Kp7rCGKFYddWlNMJfqFv1NkQQlj6FkW9yOpL2uWscV01epalRGpl1ppeoqOF56rCVV6tSou+2GmpckUks7Gar8ug6lZdixL1pKq/5n+nafquRaTdkbeHS2Gn/AEP++HEdVkzh06xeruVV7ptnE4ztTosFEwxPodMLXNDYvJYScjVKsK9xUU3zvKimhbfEXr4oZy8Ge4lxVkq7iaL4U1TuOXrocv5hU764JvZwLObl9zRwXNCC1M+h/tz6sT0O5w3UvLp+mX/V46YSyGyzO+xVxeI/4f7jzeUqdEVQU8PjPPw6nZ9CME6/5RKZKbaKx7YOriX6DfErSSHOYXMi3zRp4NC6J4c/8TtHxGyamZaZSE6nYhCpp/McKOhw6KNeI7lXZGbLd0k1eelw8NCVpqxU74/Z8G/Gq0M3FbrqZ9lnpTOVz3R9jx6mvUlaeNVfP4jdTdkW0FKIWFFaQuHU70ip/NTek0h1asa9kf6hd8X0Eowr4j/KpK+JxLtkcHV6iqpdyh9jh8Smz0E5qg5jzEpzhJfBfES4dMXOePUlCO5VRVozPSnl7HM4fRl6pfRG+XoQ/wA/iXCW+o6dyKtYFQ6Io/mFQcPg0a06lCjYiLHLMdTLxarFnYsNP5nX4icDbVkyxfGZn1Mr32ZKoysvLIpo9yuralQvCyrcVSm1yOJyvuc1aRl/0st/zLY+3/1Pri11Hl1RTv2g57E7E/ETHj3GnPqdexeJLKO5eqTeXsL6kbeCrqf1ClIlTT7k1S/c5KEjUnMWwnLcsoZyKr5GSuZ+Zy6fEfZkpl2eZFia3yi7i2LHcb32NDSC9jKZn539R7iy/UqdTsctXyMyqq9C+b0OiWx2RoWLogsJTL7/ABHc5KnB5Z7l6uJ7EOt+sD+0rdVJchNEJ6HKxVcPmp3pFw6qXTOk4fZysxdtvohaouOdDzF0TQ569DafQjKiKjuXwuTlt2qJi3dEPydUTS5XxFrLLrwWGyuin82tzLw9MKeLSrU3ZWZ+OnD0OShT1HVeEfbOcq7Gbhy/Y3PK7GjyEJ67ktotVPoakpmpzMS4bu+g02rajaFTVZHK/h54Sma27omfkb/PHKnLJZn3xircqz3pTsWWFOaeYXDq/NsOmnkT6FuJ9p7XLZX7kNEqUL7Ouy2LVEq5Gj7l6TK8xFLVVfUir6nQR0R5r/jH8Cf2IqLlkfxq3l/lpsZaKVTSuhZFmXdjm0LWSKpJ+g7EyKYbRS+FxaqUvyi4fEdLb0ekkuhepaqr9zVe6LqlmkHYuvoWREKOxLRlpfL3E9jWCJM1LFe/w/CJn5asimjKur1LljNV7YaYXGkTh6j7j+y82xl4qv1RdJozcGr2ehLWV7rHTDoMhWwtoL6WxZyM/iUstUeZfDzbuTV5exkSsumi+4sXLM6i66ozLSrVeHXBqm76HNyVdTmLVi09iaogn6YQ5a6I3XrhfUs4Irlo5X8OuH7ioS9e5C8tOvcnc10+7nHm5kN8GrN1p3NX6rUlxUv5lhkpirh9JG1OUtHvJp7jYt2djqaiy3ZDpVi9yaKnBFab79DlZb4YbWpleu+Df5nv0IVo5n959Sl68OpSKL01XTxnY/iKf6iV5Tku/wBiapn0LS13IsXIVNu1RN4Go5SGjsJbYcrPK4XRlyaS9dKNUWfws2PKlJFR2RHUthqRgkjXGuNUVW/KU1bmSLa0mT3p8Lirm7Gdr7LjdV5aiMmX9vYnb0ImSLe6xcSPMqhKIMty5H1Gq7L1KpeZ/sQowhQc7lE0v2+FbEOMEqU/UsLKjQtSc2rxpQoZcq9MYMxn+eHPYapNZZdIyvydKtizgir5MiDf3LjsOUKDfCw/7k/Mt+x5WRVNLHlZPCqq9TL/AKi/czUv4HX3t3bFl/E+x6oqd5WhFW4+xVT3gZVL7Mqor8rsVU12dJzaY5WrkwaKPU5qs9GxFPE/+RnXMuwkqYwlOKu7NvbDQg0w0zMy0xSUvPNXRGVt+w6nU5WE01W6Hf8AV7firQcz9jpI9S/3DNMLFSRm7JjvcVT9xvXLb2M9Pmp5av7Y21OZe5YdmQ9Og7366k0137Cltl1YvTW+6ZNyJ+aP+/BlnKjLw6m+rIq/YmInccpVUlo9sM1DNefp8Bd/vmdESsIbsK/3ixVTsvLV6dSvg8V8r5Kv8joqXMnBAsY1XZ4NqVWrktSKSxC+WGuEFlPoWpc+hzU3MtGRLc86q9C7bIenyHl0J2wlbE3zb/B7klKpupxoJvUuWUC25ty2n3WWqxSkyK+VkfUiryPU4ddWsZKvb/oo4jWqir1RZysdVV20ZmTq9zcTopVcfMbhrpOFydlhtPgbvQup58yNETDfvKwh39WS3mfRIbqiOknItT+WstEiqV/17t+Asb2FRVC95eFxpI1sc2v8pfUjF9Bogqa2QpUM4NU3zVf2E/rgrWZUnff5FVO22NWZaEfuy/LUWuzSIKb4f4JWCRDmS6NzmpT9mNpr9yOb2JXDdX/kRUmuxbTuL/Byw/USflqGpnCH5GJr4NcF7lda1ynM5eMrUkmrQ7iWwy5O7PVDT3q+mHDt+ar+xEcrNCME9iJP/bkPUkvyshaLpuTXU/fDqWJ3LEaEVSWNDLS4q/qGqoFDXoaVezH5qCGbEuq3YdNFKVK6kYdj7Li+z+DnY4k9P7kpwa3xvhbB4Keppc0tpgk+r8ElSTXoUTaV+xdzT1Qr8v7HNeBpVJdBaa3TKYLGpchsaVUnLUKaWW0La+hdU+rk5lSuywjX2k5qYntBpHqhUVX9GRkqynLSp61Eu3pc0ynMvpYbpTcb0mSp8y6/rPf8JdFURDRzCVLhETMdMLX8L8cnoZaXuONU2J701tfT/otdMl2Y6UpS6E0q5mqRqdjeCZLte5OWWWsKLM1Lan5vamUc1OUTj3E667+gk4qJWSehMZX6iiqov8zzHmwj9z7WjMn2FmUVfBsqmWPM7/sSqXH8zMuxY/iv/ozaU7E7koaFPUy9xlzUiYegkO43w6rHDb1kdS6lf/JP9xOIq7H2f0ZLTa6k037EVWfREUrcvmRuf5NBqGcopgixdHJXUjLWsz7ODNQ57MlS5EqtRJtv/kKM2VfIsvkc0fIs1hMile5d/QTp8m5P6m/xErDRF/YilT6F0dXhc9B0tDT6yS92x3hpWIKaW9zN1ckN4WKbaXM1PyKlk6FrMnzepK8uGso6iLl3boQql8yZSPMaSctML1NEONehXeWtBDytozTzHZlnYsvcvMGr9DrgkZWzNqZatH30+EbF8ZE3sWLF1uVt9DK0RuaSc2hEWej6CbX/AGcxsPZnclfQtl9TNVTK6kI1wmFHWMNSSUuXsKqPmimBzTEdTPw4NcFfQVk/Q6GXL7i29TRNn/ZsOulsiuTNStNDLVapW/To/HWL/eMknodnY5VqNVanQqVCJkZzaHLsc0pi6+hqcxC176FSqzU4blpgho0tg6diNFhqdxRBdnNPzIhGijq0Qquf0E+VPsLPvvqdVsyxFSXN8Fya3xv4M1W+E4vG+44JO5GzHFvUaJ2LaEtSsLMiodOvZln8/B2E9TRp9DSw2rL1LK+Fi5pJ/nDX6Dtf1HKvhYumvQ1FxGuen6lNSfwVoTwXlI4mv3TUWIOx3wnc5SS40tDqaScmnRmkH9h5Ldbmo/3nDTCzLiqFSzk1G7zuqWWmO6gcJl1go8EU8sdycctWhmRkzR6lfC+DM1Opz1X+8sSvcvoep+4srmS65f2JIT+h2wu46PY5uR/RlqrY2xWouuCm1SNpexFLyt/lqPy22g8rnqsFDg5nPqaE5Tmop8GaJ9BpJelRzKxw65t6CfwSx50rHLT7ss28e7ILeVeJqbofNeJFlXuNOnm7naZOonR8hTqWZnp+RO5mY4b9C+h27Y6m2CZGFi+/0IbXuZnNa6pkVP8AzhKO2HMq46pTAm076VKo1wsKfmi9quqIkTKH9Pglj/MZoiCmivN3ZywTOp3wtgylL3P/ACOXWRupvoJvCdiRp3p2LI6YymPRP6Mnys1TIdMPDb2xuO9mWNBxpqWbRFm103G6Pkc6n3OXMJ0nluNM5an8idHv3LQXWGpKZbQ5qfcq4NWm3wUqmrCzImlXM3F4zyr8tKLyktEhuZ7/AOBWv4JfU5ukm2gqloxudCFUNVVehytdu5BKwTTLDpn0L4PwQaXGrT3FImtS2pFRUquamSdBxVlbQ/5leMVI1mHS1VD3nDbHUhvUtqawyjo7OPgu+MRY8sFtcUcS/MVdYj2JbcaFK7MVXD8n7jqT1IgjVEb7STS9eoqly9ezHOvYTodyXhc5pHkdWCVSFOnctodtjoxSZkZNVUpX+BPWljl+ptVT0ZldDy+uhK3Oek7dRy6Pcara+zejTT8NjLV7GZF//wDBVrVXVSKKu3wU03LJpLlizt4eacl/czSPLTZaCTIiyHYho5lYlOUjOvcX1FeVsJss7MVyGPBbClSdh5RdRMsO8d+gqHNDTtOha39iKqE/TYhrT6exyVJ9iKfkQzlt6EdPkTEHfwqPqRVv1IEtBW+ClXFzY0eF/BB28Wg4iB9sJj1OxHQh3Mt136HM47ilx3RePYmSDy36DvhSyV6F3lzopb86s/6j6Gai/tMl71LrqsOame51G7/PQqdFdNVPclJL/jhzPwIy/m6o5nvsKIgq4Nflq+CrodLpf3vLaRUxbF2gmn3WFjp/YlWq3ReSPpi1UyHV7jW/YpqKZ0asyqdGf0zNLJ+aG3+xy1Q0Orhe9Jcv8nodDPw6nTG6HUql30uXLW8X9SEyNluUVV7OGL4KdSsRFurJ8KyEeDsZoJ8PYir5iWq2eOko5fqcpMksky6nD1iY9CdyuhLvlPNFe07ioq8z0HEqr+pXR5k/c0FF0J6ew3Tp1pUjdVOZvscqgv4JYpOUaOtL17DZQ94j4Lkyr0NfDP3Mbmyeh0wy1afsQ8bY2+THlUdiaTicsSplGRu+z6n8S3Epumt0RxFZ7mSFVw39BQ/+8E6rFnKJpqyxsx6tduY5k19C/wBDyN+55INGsUa+3UVZy6ncr4bfwY3q9jPxHp1E5w7+G3hszMnBH81zthFa9yNO5G5dG6xuWE9TPS5W/Y6Q5laM8vMtiacqr0vo+xzUZalqtmcpz1Qcqn3Pyz0Jq4bM1Lqo9WTnZLsjzT2ktPhhjTNbl1fZlDekw/gy+mFNO2479l4X0RbwcpDZO2hR2H0YhVUo0LHp4LlsIpazdDK1lY6aqZy9C1VSnfqa/IlvQp0cIsjyXPLBzSyK8rp/4/4MyiemhaH8mf7V+xfwwcrioy77ySzhVPWPgrl03ZfVk9RR1Kn7IUu5mQpwla+FwkxqulyxLuWVie450INCxphdCqp0IwvJTWtJM1fl3HVRqrr+qk5bUu67HciYFmILlnY0sW/Yb5n2G6Vlf9RLplf0HJPpmwvhOpFhVJWIqOxXwW9Lr4KY/kkJHa56lOUVPST3x7Ya2xdVL9yXalbisLwxud8ZXyJ2Y19GQ9DLv3F+39xx6nMpFLg5nc8lSXWZJbrOX9y9vU29iKoks1PqXoVTIv6blqmvVYxo+h0Y1PzJpconVlK6/Bs7FDXQTWhZlu5w0VIdDNbF9DsXLitbwd/A7jTs+py1X7Et5e46XHtdEZXG2UqyalNf5v8A2RJly0+pleuzbPP8i1TnszzvOeam5FUfOS/KctQ5qq9iK26/XVCipR0ex5qfbFKoipyTTUZkl7DVa+RS05uL8J2/VVWyZX+CqqRN9f7C7MRA56FF8M8bCqWjRcnxVGZjhiJ2LezLkbftjf8Acbfv/kc9dioS3kudTqeWMLWf7nO4Zbi5Rw165SWqfVODLU6n7FqX4F+4lN+5sQ0Waa+pTVT1KY0j4JqP5aFamn+450X1F7sffCRMy0y4LqK+5zXXRk8OqJ2LuSH0wtpixJlSXrhqJValtGXLsiq5ahipoSV+hn68jRHgun4OX5MVqav/ACgebhv3pOWUXpirDzOl+kk0VUcT/izf3w1gurvXvhoLYT7wUZtY+CaqWQU0r1Ixy9S60KMm+pVO15J/OQZq5jBFiaXKW/UvpSVJk+GG7HXoP/2DLHsXprXdlPrqV0T/AFYQsL3g3TO+EwTRU6exzK/Y8in0g1XuoIrRlqQ8rXEXezRv4+qiSHucPsvgrlp+hy0+5pdkQKUfacOlqlHIfZ16rQfDppjrhTTsJYW2FSXal6LZGSdLsqXYoS3SNN/DGxrmRmjMl9CabLsVVTLKuJXamlHEX5ss0lIxdTTTDTC2pzQ/YyV05vR3JyVRvDJVOanruiFNS7akrnpXfQ5f/jV/YurdfF6jdKt0OH8F6GhoLoeV5CaEctEXFKIKI8HKT0Kqt2XkphaKB8pZeC+mEpmZz8iinrdi4K9ThpbCeMFiVhqn7CnNHU/jVRUvzRdevYvUqkKqn6H8N660Ow313f8Ac6HN8zTwwVJMo+Du5c7DksaH2k+GmjbcpogULRHlw0uSlBNDNDQ0JauU8Km67Dq3Sgrqj0ILY+hCwuTRedhqqiaHsckOOo3Q3T2J81G5rNOxFfMaltMcrsyYeEp3GnqLs/vtfgC+FsNCUR4V+5zakb+GaS6JLlnfpJxOPVpojL7jXRFUdRfPG2N/mRXp1KnrSPR7WehH22V7Pf8A7JrWen+ahl/Z+CxMexoVemCmb9DucRdKvg2PDcsheGfzIZ1se8DWa53NX7D7F6oZzuxFNUmlylfmqxhfzI+mCjBpkkPcjTs9GfaUp1U6PqZ+BUv8Co46mNGZ+HzIhrL22LadCUreCadOnQnbcnocqmnDi8Pqp+C1C33O3jzfcMsoEntY9MHe+GppY69RHYUn/ke+PdErB8OtEU3avSeWFXaqLDpbVcWHmRKlf1I57990StOpZwXOxKdup/V+4knrthFOmzFOxwv6uX4JRVlF9o5q+4v9w7liVcvTjlqTlHY0uS2pP6VghMaF4VTXatEPy9iWrdS0yrSrjqal07o5KjmUllbG+g1sW1G1OYkydXJcoqWqclNS0an4J7eBwX8C+6usJw0wy0y3gl4nOEHckU3WhyvXroxp2/uZkZklSy5YnFMp4nDc9j1w/Yvhw+1vglyXs/uF44wlNQnBNUH9/BlpR3P2wjxMzbFvVCXyKk5ysa839yKuZbJ6ozcOqw04kU3Xh7H1KkrolEdccqdv5eoqqHr8EMzV6dPHL8eXbdkRqea5M8w8qnsZqJRHERaukvUrbIeW1JbViSJ8HrjO+Ml9GPLqRXenbqiqmp8uhbzLVDIemz8ElE2KsrcN/Jkv2HUVRo74JqrKZZy366Cz3W8E0VJ/B3N42jWxbC5NLLmpDbZ3IWHb7q2j0IqP6hunSTuR+ZY3wmCNyqjUbbmRrYVh+CE1fqZ1FLW9JetVL+s/i8F+tLP9zK/6rH8Oumr0fwUvG80yiKtf2wqld0Q05REE0nKpJfm8MixeD7eC7Nbj6O5l30LakiJp1LoTKa6LielWFfcjdX8Eq4rr3LVcvqO9PuRyP/yZcmmppluJmX9Vz+Lwfeln+5lf9RyVJ+j+ANfCk/uJSI6kPXQhjgj6ik5aWQi+F/DJ64ManQvboeaJ69R0VcnE/cvqvqOBMUlXDeqwvqVWHe1a+TMuMYMuXFD5WTwmlV1mDbNu0oOVue1UEcW3dlmmX8HLU16HLx+IRnVXrSX+y+RFXCofof7FPuy3C4Z5OH8i2Rex/vP2P9+stVV61H8T/U1R2FHH5e5biLiVEcWkvxaV7nJxKWTS/wBMkVXCcl3ZeCxma0+4uaDjwwiDUtqXwWMM9xZRudiVVcsy907MTV1sdztjTVs0Ut74NocmdeDtI2IXQSWX3ZeaX6F7d0a5vUy5F7s5Xb+WS6Zan6k3RqzVmooanokNKF2Lv5Yb4xSiWRYuy2Vj74p6+pepOrov0zLTt9T7Ktc26LUrw1Vbv7ixldiPDuafcwKOsHKVPZ7dGR8hU1FSe46qPdEbkEtnRFGbTQXe5BDWE0/LBP54RuXOtLHGhzXRCLxBCrdS6HKmn6YaYaCzXXdlkvmf7XErfdwh5eDRTT1Lx7GvgmIweU/p9fFysS4vEpnoSv0i7HlaKlxanV32My18PYoceOnh0LRXxfTwR9y8GfUvuT7DroUVUirTmmrURUm7PRl8YKqVvAqatUOfQ1HHqPL7MY6XoOeliF6ov7kkq8nMjlZelNFl8zyfU5qZ9UeVUvuW4f8A8aiyfuS/3Oapo5XJzW9WebG6KRFjmrv0kadSb7fcKn7NtdTp+k5qHzGVqO5z1T4FSjhp9PHmtJCqTHG2xBcvpjP3Lwd9ynuNdT2hlVrERKOqf3E4Zt19caVgpPqsL2LwaqujuTQrrbccp0f1I5Yq9BymjlqT7Miv6omKfYnKclU0/wDKDzX9LlnL6I5oQ8lNUFqcveDlg2foc9cDVLeXCTQv4LiVVLFGn6M2zsXLT4bmb8tF39w6vtXH8pND5h7OTuTNhYSrkL7lYPoU9FYutiTQ3RyOxphOCtrgspmWgoLWf9zQUambZwSsObFSk+6Jy6iq1X1JXNS9yGi0VLo0PKo7amaSHYtURVlzd9x2fpqclK9SXXTPRMum/wDyL/8A1LLL/wAryQhrYsXsfxJy9COGmzQT1toiKqcuNLo1F9or/olNPXBSWObTFzrOHcmqyHKu6p8bHKlojiUxcizIiERthlI+8sXTE4LkNHXuWsbF1DEV10/lRzPSkZExefQaf5XhZxJdalU3hvBEovh3Oq3RDuiVZl/oSnKIrUVkpXNIZamUTRV7M5qmmXoo4i9IYoopSLcK/Yh8Oqj1L39jkldmowTauOEUutqTNVWn6MpdMKNTlcGo6qdSKsEK36JQ+4xLr4IRKwmoyryrVkeLWDVjhSQ6PcdfBfYvpBS45ymxaLfdWOexZYWNIIjl6k0xJzak3aPNfujmSgcaHEvboSrk1OW7jFOhqf8AG0E+xb18Uovh1RFeh5ppZm1XY5XKP7HVHLV7omr/AOv+CaatDmSIplP/AJQPPnaWw6uF8nqc7REw+p1w1NcLMVxUddyUsbz+iudSnK+ejYnffxRMIheKN8IWxYiu6J4TiTLxEUtYW1G3r47I57HKrYzTcurnN5epKc09DPw7duov5tR8Kv5HLqfzEVq3oSsG24TRTBHW5V1E3uVFtPuNC6PKQNOkzU0tHNSyVhq0Zpio1NIeElnY/v8AeTS9Pw9/vrk8KszZZObhVJl0zyv5FuGy6ZoX8VdfyFw6Nd+xApJkeVEty/BPV+GxNfyNMLYX1xujsaexmotUU8RU8y3KakuZF7VLYnQuc1SXYyVUZnsUysrFgl2gkX3l8OaDVH8NWNbGvif3lNWn4a4vwOh5UeVGhp9xYqfcuMXDpYli9UKin3El4cz1wyr18D8LdLwzU6bkJ+hLHcSkcKZOH/MhN6iFYuvvrkUcw4rqpXQu/wAHAoTvv+F1O/4+5PXCtLoZqthNaY5US9X4b41OL4SNlVV76YXwakc4PBKi5y1QyK/OiE5NDQ0/AOlD/C2KU/KK1/1TmMmZQ3bCGPLoKHpthC1JVJfxSkfZ8UVXXGjhp+eq4sYoOZ4dWToXbZpBphoafgWPnn2/CohEv9VujQ5OLUkf7/0P9/6E0/6iPRHP/qa2iYzP+osvHE3OVyyuhV5lQMVziNVWpRS6i5LtScqZoTWWpNPw7Hq/b8IhQKUQvgRbJasf2VWVO1jiU1b6Fv8A2+FvmU08RwJUNGXY5iy/FXG1m+f4KyNC6JZb4EusJpE+HMoiqjORRwWiclV9S/D+ZzQiy/GuLnlPIzys0NMLj8GhoaHlPKzynMjQsvhK/wCLui9CP9tH+2jyHkLUnkPIeQ8p5TyHkPKeVFl/+iT/AF9/AC/X1/8AkD//xAAqEAEAAgIBAgQHAQEBAQAAAAABABEhMUFRYUBxgZEQIDChscHR8OHxUP/aAAgBAQABPyHwFVrXSDf1fs8Cly637/VXg3DwNVr2g39X7PApcut+/wBVa8/gg8eDTk3B9/p73rwn2Qz9JeCBXg0uXW/p92vCfZ9NfeB7+GS5db9/oOJvL4ZOSDf0F4IFeG1rJBv6G968NXJBv6C9NwK8/E/ZDPyrUC8viEuXw/Nd4IY8QnJuDw7+VxKvL7eIS/ODw/MvBuBXi05IN/Fagcvi/cfJvB4tLhfxWoF5fFOZry+ReDcCvGgTvINys2+MZb2Jcc+NA3PLBuVm3xjLexLmzECvHaZZGr414m05eO0Sypz8bp8TR44y9pUo6eNXg3KxmUSjxu3t8KOk14xah3lEo8d9nyJe5db9/FLwbgV8icm4N+fivs+RLl1vXXxS1A5d/JXJBvxfdr5XBO5ilVbKTHkZpXw68G4FfMly634j7Pn1rXSDfh1rzge/zJcHh8TvevmpO5DwIu8L6bgtuzEAiAMeEXggV9H3Hhu7X0U5Nwffwq+8CvP6G59nhnE3l9vnuAuSLtmEShnWJ4YW2tNQWcHDLkPglvBAr4MR4TNhjVc/NVag34JxN5fppcut+/g14NwK+nVa9oN+DWoF5foZXmFMogVkyw4mdQ7kblqnZDg5eYt6LMPb6y1BuN8QxFrcuaPWJ7yenEV9TqZuKF5PSOjOCbfKfMnvB4d+AcQzl+t9n13EG49oFfVT3g8O/jfD9Zagcv0RflQWtYZa8EV6OvSJLxZztlu8vVWZc4Heoga1tSk/Uncl+P6ZZfLEO1mGSLVoIQmtia8TP8TQKeSZm9xGuOJgE3Gtvzpc1vX1lqBy+Arkg39Rai4XC70WDZ9dLl1vXX4+4+otQOXf0hYdZzmRlrKXE6N11cHoQW7r3ahZFekvXy4pgG7HrmFKC6BUyLuAhOSoAs+daJabJ07zqQNcecyRnpGRpXAe/lcuyOcszrjO0zEpvyTiLXLmOpm+karXtBv6a1A5fBJfnB4fouCW8kvnqzmt3LdIFHgaTXt8arXtBv6K1A5d/UTu2OwZmLLyf2Dp9wMzGH15R2A89y3QWWmDrZJmraIjNjPb3x/iDxXua4R14nBCrxNOPXcvUnSr3J0I66ilbvOLWydtQCmfEl/J1eX8lJoulPxNADx7wthXohnK9M5G6yMKEQjCXr9JOTcH3+itQOXfhHM7tfQv1hq2JrjzldCvDp7weHfzrUDl39W0O9SqAmrPlLmaVwWWIoX02EqVi4IGiJXpKeuDfUlpzm2pU80aguGno8EvDagWxCkNls5qVAqJhLY7ei4gYF2AvL2qMK0WUcz0PUDUzmkye8sZHXvHPS6rB4t28IuNGF0goFLmqVFUVn6Iow12Y5jB+sswa7TgvEVhNPn9NLl1v3+dagcu/D1WvaDfxWoOJeGocEdPaV3x4lLmt66/KtecD3+tSIIRHpDxlGWOYqjkC5gQB1r8Sirrrf8AamDw84McAKxcS86J14UJxcHSNoamlMzNG+3xMloy74lV2kDsmH3WMBGVWnOYh3gMQCB119pgyQXjv/yK6FYuXa4sddfOh/KUx3s6haSle+J9g5PnKFVj/e0G7CdcxuxXBe2en1o/ZDPyLXnA678SnTcO/wAEm5sye00cQD/zxgVLPgvvArz+vmHU/hmCoNyHZfnHkn3Iq1tKVDgJMvbTG0UPsGeWRfeBM1BfripXIYrrvN8clm+0I+WNrOBPU4wQV6iNRhS/OLsbwQIfBm4BjKzrg4lN0Ix5MvTW3+POZXgCVhVVt4CXHBczEjyXM1pd9A/5LtHEzjHvMK2zsYfWrNyz4L7wPfxu65uelMHk5lF+Ndy50fAnYLGPf4TqCz0/9imkQuzp0gFcrKAo34Yh0FwkcAKNvUjOkNBS+U63UMYbuHt9fPTrMFUD5LhYCQgcPEKqjG/eK2yGbmBLNN+VhwxhSmIXFMofeVKHUZ88wFjFuUzpT+0CuAy7zpHootqUkmFiszJNc6XR6kG7oPKM4ixMuKLXH13ZLnfxjgj3XENkOnJPuyjxq1Hcrt4IdGoZmQsGHMVwFG2Bsm3bU5UFdqF2MIauCpTf+EzSpDfWXpm6/MlpXWCk5wP2lpal+mY2osd16f2WJUVn8SzLYHWYlp795Utn8ECurN28QdgBj1hv3pS9eJgPF4hfzrb8VObLXHb9RQ4ynSosW2jgPzMIlMSNP5jOK9VKVDGHV+stR3K8as5bzc0/7Mru9Yb15+NWoHLv5B9/AO29IzxByyjENZesxK45xEbfoxDhcUp9yW4K6HiEt6dPPiZKZZefH2lVVgbhX0A0hB2q/wBZSirbuZkiwa4vEVF+wguPSvxOXlhb/d4L7tVT9RlcdC+MQbppcQeb/wDIXhamuky9l2zk+bvHJXsOrGFCdEQIydiTyAPb6q1A5d/JfD4pekzsRqGXSoWnb4MG/FrXnA9/lS5db9/rms1cDntEVNUwX0lGVjrBJzY/scFc94FsfM6zJX2ZWGRe4cH1fRLjot3KfUqy7lGYWK/Z95Zh9q3qaEPrZv8Akxw4iZolofuMbuO0Dp6ukpjcamCcrAx06Ig3FJ0h1j75lDZqrQy33mBtXOPWNCIa6FdjpKT9TEAURhUPh3Pd+otecDl383uPEXeiZp85tvpMHyJybg35+JX3gV5/Q+yb+o2HeEo4Bcy2S8XMM6qLpTUzlhLcL6Vm44upezLtPXD6zvEHzIQqTH3mCNx1joGLh2CuDVY/kHeWo9ckUlWbV1Y7pLEkxBd4l0wrUzr8mNxGKo6F5YITZnLzYlRUIMiXPk9EZ6DWHeUjfbjvKdbRVQrgrocvP1F94Hv9Cq17Qb8HZdfBY0xq449cSutvzJcut+HXg3Ar6VckG/p1uUIkpSdAMwa56NRG3HW4wxdcF/MwFDRnf+QwpXqaiP8AZ4fOXM0/WdJi/YzIPOJdngt5LC0DrOouzLzBWvxBRmocj2mjAb7P+zv4Y1NYp5bgpyaq5QDkehLVw7yg9I6wMDkRK5p3hdEwGaHP8RAWtH016bgV5/ST3g8O/BOHOmc0y7y6xcO5tnf0fceEWtxeDcCvqJcHh+itFxbDa8korOxMhdjuVDt85zCrH+RhSlNsNq1R+0wbot2Jau77jFAR6Mq2+4oL+UCks1+paCqlkvFSjGdwihH1ibHpFAtTs7sUZ8Lc9RnzBdfRHBYO1qYjq6LLvU84j17zkIo94AzhvPMcSVn1QbBPorwbgV9RLmt66+BOOrM3ULTRKxmBX0qrUG/ArXnA5dwK+tufZ9BU4fo6jUwYU6QlfXcQRDNcQb1PfUd5RhhAmuNjbZ+omOsTo6QodIXx0P5liSxr1mil7SvO/wApZ3uanoE+tBmGGAs+fOMEC3dwmeQwXxcu8ybMETiKyUTmmZAPrKoA6qBbi+staHTzMSC5Y9M1en0F4NwK+vrWukG/r66+c8r8/rJ7weHf114IFeCqte0G/m33K1JXMe0N3SAqLrU5GXO19aQKRGoue3vLEXWQMUuoTUQcAj0dIv2hgGokuoZ7UBtUAio/MVxXZpZJYtQRmIiDLwSdGgoj8XkrLR7gw7j9URVddFVCwI8D0gtvUcHh5xNliGxn2Shu/nXggV4FOTcH3+qW548ClzW9fV7NTXhE94PDv5SuRdTVO2eYjGpDiFQPeYQ6MwmRXvUSs9gT2nkIQRQpyS91elymsQ805/8AeER5sBLfvKhzUu3MSw9oVKsNY6SsI4MQGBTSaL2YLi+FRIOu/gogzmV22seC+02EJEvzTIB/jmDU1gNCo4pxNZrlhlYFvlNF/MvBArwaXLrfv9Pe9eEqte0G/orUq966eHS5db11+T7CUqs8o4M6Spp7OFRCsPKYxFU4pYxWGQ4plP5m1EwKHl9oKUaxFKUFyuq9J+EEpgwzIt95QVplIE4MPblTKpWTpqNQs4MJRnz4qrrrUSUfILhVAGxJY1dZiiy3m44DOWok38kxFO8wBtV6JunomJ+VzggV4b7Jv53E3l9vDJybg+/zrXnA5d+Kqta6Qb+G+pT0zZVmZEjMQRYuprTmNS16ZgKVJpqda8kul+l3M1VjmCOqlRoGnnMUuus5Eu8as5DEzDAKU4d4/IpcNcTIEHhcx0k1jpOcYd5FUN3MAlt7xSPS7kFX+9VwlLgaiS0ZjVUbsxBi302eccuBmkpvk3ghjxFckG/lWoF5fEJcut+/y3wQK8YnJuHwMUmrtqK6XAdyiNhyce0C0DuqB2nzP3L7YaIzIrp5Qq5CUxvKo3dx1irAvW8p3TB1TFTuJQkBTQtrLZVhyQTCDi15hxpds/uWcTxemLhVVs5d51mPu/MRXO93EBFQv0wxTN6ykqIDlLi3up+zLMw5/wC0w1z2WSlrqHw3rXi0uF8/Fagcvi9a18d+U147ynrMuFd7jse4ZoS4dmIgBTBUWOsbRlSnMPs2rtFwcJcVMri4I9DisQkkZBqHlb3IqBDkC2IIAFtu/aL3osUkTfrr9yhvCql33g0cnONSmVNFj/MrpJtWMIXF2m++2UJJ7Q6KHXUddxsnUyIG8wv+ZQimeszf50A94KLOceO9YMrN+McE7SHb/wDCULBUy20INFmLNvuwRVEANAR7hsM15xLwDp1io7lYhljWbgiGhMJbeDIChY6R5pDhleyYHMDzTbmCsocLqvWZI0ZzRe0w6U9ITm4ysHMau6LTOUdll8PLBQlPGkBRDtkmfKHqesvYZk4ry/ssQvFVwlW5XZdy8VNx3K+5DwW5+NV45ujjp48zniVKIDSK+bD0S7H8JjWy8VAuTznvw9HzdwPoAYEYXg7sBD9iXPQ4lrXvogD/AKCc0nZDiqGmKkordxpThtbliGqsGPworJNmkA/4XHIB/m411PX9o37oG4jziNX+6CaGF8kG8neXPxA9SCgGuYoBed/3HCgFkiinoBE7Tv8AaG/sooFuXijOeJUo6TB4xfeEr4X4xxN5fkcyjGx29JkaOu8POlpcPEZiLrlvDglHiKywdeJZsV7o6znV5lRW4eRFTDEV9dy5nzWuSUxH1JiaevlBa+V4Zb1lmwfSbmDOIwBTGErPKcR2wH0ZX3aQ580XVSr8+SBYscQXmNkx33EC5UMTE2kPujzxLIVOswBjwu96+X3Hil6bgV5/InTcHh34pxDOX5kwtQOa3zGYR0YxebaBl8oGlbH/ABtlRXARXXV4iXL5tNStQXEFOM4krFUIK04DiI4Ud/D0mGH2p6/qKYYmNMPSNg4g2HC8G4wJOodwCo6OjynSCalEJri6hJu4uRQvIQJRsxWo1U1MgXbg8vowLUNd5hMYKeqg70lcs+TvL8C4m8vt89VqDfh14NwK+ZLl1v38QtQOX53URfoYBrPSLTHns6HaJta+pwESsuVHKVMbYj8MMfgKHwMvx14qOBUdvJKVCCFS3qIqR0HcorTsn+yjyBrU/sKDwMDLCBdc/wBliLkAWPaUg3ZMfZ6QQK/RRkOO8kJmiKjTmPiZNSggNM1cJCzvZUaHWbVHa8Mcq34R0g6qKANsYqMVDqizWwnIfL6y1AvL9FPeDw78KvBuBX0ezUG/CrUDl+jViDzV+0yv3r12lM4YiJgogLanuOPY+8qWqvR9j7EMwBc5Oc8FIiYmCWQM4+sMxLWQw69SFTUO5OPd3ROff8mzt6MNhu92bJyQeOH1mDb5Q9DSl5hirNrV5RUoz0Q4QB1SXFVi4OXEY1XUtFvg7KiPCsNxo6F9P3LVjiO8o703xxH0NaDmMeLnhbC4dGA3suoWO2aqZEz1uaIfL6a1A5fppc1vXg14IFfTTk3Bvz8FfwDNu/ohYwOr9oPUBZn/AJLyY2306xdUj0B2yu6H/kGsMPdTNnidnE3TvMYIyLu4kwhEvjT3hza1J5jf4ln4pkes6oD2upNK0+QzAaz8A5dCEN+0tlQ4y+0qK88/hKPS6Cq7/wAS3aU7JfiD8TMGHNrASwM8Yl2gBELgxxzMWjus3xSGAW9AjtUrpqXTbT0QLh03aEuEcZ9kR4p3mUvB0lLhdy2WrltG5RTfdmD89/AOXf1qrXtBvwC8ECvqpcut/G63rr9W+gsxVLUHWbPpM3uWsAXvCtr3wQdu9xLqtt0DpKhbZfsQCWOmWMemGMDdtz1bP8ica3N8exlMxuAY9oXrqfeCh88qKqnEEw4hYWHjzmoTz84k2xrslhOmGuYpVSooTXk3Ht5u2Egy+8djvzz5IIQLa6e8btq0mZn58WGvvMLF+6cEnMvHT3gcDRr9ylmktt3zmAQTieYrmNsN6tK4reA36wWEtF2UP+xdhfSZP6ypjEvmsxpIqBAHswfaH5fUzjdQ45PAJybg+/1nOCGPAe4+Ota6Qb+i7oi8JVzaxzAdfpPZWOsfSmfDkuoFK1BvUoU6UBGqTE7ES/suZTomYkKJWIvrt+xiZ0+ySyUQJ6zD2Kv3i50tCAqqR54m4GaejsfaaV536YCAwMOT/kZ0nP2ZtV9GZwzKxUcVUbKK82aNOZhAZkt0GvbTKAG+A/kmMhcu/wASu4DdzZh6xt7IR+0CZl/RGhMxpi3tOhg3jcCu71fzAC1nOuJoGb0oiURPaLQJ5BCqrpWdABJjdwqrqtuC6e/HwVvEX0ubXiOagengUuXW/f6m8EMeCr4k5Nwff51qN7qbz7zey/OB1+m7bK3c5o8AqoSNW/CBe5YMZlRaURW8Q6onUasEPSK3ZthMHuRDEpKaT8xesXK+cv2EXcJFm1sPPAYGwfZLp6OTzfr0juOOtM6qXtjolbYr1QGBriFqTydILNrdPuRinN3YfmBSjqsSvEnX/sQ1ajcPaDkEN09DH1vawl617Q+Gjyg4sdYhWiuhN53hqFqvODHvGkrzl2fWUeFsjMIyGhxDro7LUrG4Lode8OlQGYb3U3n3m9kDNvhPshn6PZrxCXLrfv8AJ9ksl2JiFZQPqWNdUXMoFDcDIs4j5jrMuX6dP9mdbD5QBiPwqdCAgfeJhNM+7CeWbrqqi2vHSXGLTO9yzcHvi/8AEoBX9u3HuplIpSrtNyrpcZcB1olBRZLpYLDMqrHzr94F77ZgQlopvHP9lkgvLiGnBoslzegnMNc2rPWZwbhowv2gWuPaYnLuEsKwdkpbHQ4SmLxvtB5Ipv1iQtB0alZcnqR2LPrh9oVI9aZD1qJrPPCzpjhvFkJihwHrKyqB4ZOSDfz/AGeLyeXxUHfmTVVzHvh6wu+IFfVuQnpLugTextx7TnqiKlkrZUvL1mAq/o6ekyXY5ZxfeYrt8Bu3ifdBqh3EvHEeQ85bWcjmckRY9Y+Qc1AwiO+3ec4XdHC+kRvlQdB/8GWY19X/AOHtGu5sr9T1KiXHoGoIF3AOMHMqFmNWfQSP5I6vkMMWa8ifuIsb6w31IhxEUXnvFLsSlZHYQQ244nbB1lcuICboz5wPT2YhHWrV/edUbobg3smsWwhd9Q/YnknQi7Bw2EHALVgDsalRZmxv2lHQi5gp1c9YJR1EzcX8tz4hLl8Py/Z42y6jnBC6xVSz1T3Qxr6xV4X5XCV7ZrMxwRfIo6S80zMi5hbbh+aDQRJor0P3KBZbpog1SERDJ8pVtFl7oQ1p1E5lI+ZicMlpOGbYAX/POZFvSCuH+zYYHMwTkA88PxMI5ZG8n/LhUJviHzCH1D+UTGL67P1D1fbXDBdGDFO5k6s24jFHgrzi4YiNqUYuHZuniC3eJWi60wzkeyAWH8zrS10jD3gPxHTvwXY94GAa6twISdX9IFr7KQEZ53wqGhR+E0m27/iAhdC+I5IBBbgJhXJ0iN2PicEs+H2eNUEVvmfdOLvEPt4C3WRbjy8oRDTD3IT7/WiVIG0tsCunpFbl1f8AbgzVcCKt6e0dNplmlibt/wDWIJ7FiYlGXMBskDyP9Y2dVzXf/EbfV/p7QmVh9mMWWGDQ0ahrFY1GywbVVwxE4ejk8kNY+FOyGMPUqY8B4f1O9MtXTrMa10Q70wcxKsO7FX7RzTfrKmaLeTcotaFTa3Wo2iK5nHTJM+58PX3mJ3JbXtM9Yb6xK247PeBTI9iLGskxcZ61Nr/2ZNp2YppdyoymXxy+8AdXQjgcxK8HUZIAjP8AjEQLNeHdTQTePHlsy0Qad4ayMquMdJp4A3SXgu9e8PkKjtwgar7fqD83vbZmGOIgA7upiPdA138Ow6xC4qC3unRljcEDgjABdSpvJ+PgQQsIhYxG4gT3ApfdqL0VVTCq6upDBkmBHqqnVHGuGAK78gf7zmhg8P6jQqa5IVdFs0wzTrpf9jAV9uZj8keAHnGgInVnHTzZhtpXLC5SBVdAfiH5Bgx0d+0I6eVhSwnAzt7y2Vpx++KKNeWPeMtWOGpgj9pLGBGsoNsdGCXwT2cEdt9fD7MDpnTbw93M1xASHjHEvq15TXRI3iA6/AeHwNnQp6ym9jxzv11FuHnDY9xhuitkYO3nC9khXL0REFbq6hYLDvDYVqXWlZjmBWObgZ12qGtsjhOQIq3LQOpWhc7E7K1nS4o1X5L8Rxr7EQx5xIhAL1qu51Yi4wFWXy4f4xZj9XiUn2cMDDqvMuyeoy0xHEyBV8ZQ6oHDqvvEAnKXuja7yraPTMzd2HWOLQOay36jsLl/vKYIK8KWEkDpRiWodw6IgVA6cnnL9XukLiuM7lHMvk5geCulSlUW9mLpbXPEzJc6sMxLGVMdm5L8L2a+RviDfilqNvSaXFytHrAr4uZ3a8BgO8DuUEepf44I7cA/iSwPQShCgd6PtKc24owRkb7hihvTtqGoRSCE2NXDhhoxaCcPLEBIcosol9UDmOPf/XELmx8qSjF8Z4ldxXXmNvnLy6RmHAD2uZNjbtmCqP8AxIuu5OD/ACGO99qpk+S8Mx2qjAmt0GisdE3cd+YXtHnENLviL6k9iKhZWt3KC0H0hBq1HGm/F3GIsNxkei816SxP35HvLlRDbgZR8tAIqcyvDSRgQ8CDZHTJf/MHO6gMMXIq6l7YDgX8yzY31JX7AUzQKPLiOci3SivKGc20uAQ58H9nzJ7weHfhxuLM31VMYrcq1gV81Vr2g39bEbIjLB2gvtFKVDTiWAdg3K7F27yrkKNpj2hzeOstYYdHSB0oZSjCVn7S6FXC9QIVRpl9GsRlhFtW8ajhR6b1iLjrPyo/FSzDs8qx/sGKqXMMgeZGblSp7SmKFYV+IAMMqvZc27Bi9SikyqkY/kxkjoFgtZedXmUk7LGSMDp1OJyi2XuHQK6Z3AUp3JUNPemkTgHeJyo5vRMxQ8jxBJstBC6NnTTHC48oqPJRbZ+8NQK3lP3OeZmmFpJW7zcqGvuRgq80ZZs8Mwjbkq8QBb5aXVUOLgjoscpd9Bq/SWlFDWtSnEuzHNTqEDA2X4H7PoJc1vXXwtnWGfMjp3jtXEuy/eH0E6bg8O/qs4Sp39Jz3lSZeDzhQROg9oMkt8EIaxCvTLOpQ+8AK61LilXUtrLKMCB2PfH7jbkRhppetzUUOEmAy4seFDHmMwLSmhEf+Efo210zGGBRl1cFpZppd+UJvdUWvSXpJ93vBlQxUz6zKw8v5BpMvMmPVnaWwF7p+XSJNZJbkox7GOqRA6leNv4uMY7CoILBvjGYk0heOE8yKkpyDaTBBXRICpkbzmBv70u8nLCdPqJgpi6igpS7JjnzxlStdi037B9o78HvN/kGLcr7BBrLdjwH2fT1rXSDfgUzmd0vD0IW81Lcd5S7lH0kuXW/f6gsjKAKZ0NjfNKcxrbLMxiNOoNDcc21xKWpxIpeC4cTmWqb3EA5jxi9pdcfaMxGAZhAUG8y2x1WGIARpOLsjmEXsXcQAaxUxRXj2lqG1ojmW9ZR3B5sOy5TucMwYRNMG+DoUXwSus2MfiU1pCb+YqVFC8+cDMAaqFrrP2gGgLavcdlFuI7La94/d5yjuhqmM0F5RpYFaGsNQzs2LRSorzmdRjclnBbsgZQFcZxqbAIBUCmDmV17+8QaTBCKyz63dr6qcm4Pv4BzvXSc5JhHc9GHV+t2ag39MEbs0VTZ0nFzAcy/Lolt68ppLBQqw9Q0JZaszAyOID20S8KQEqkdRojxKPSsJpAcJ1ivfXPMHDHZFflnvCsCWC6k7wzTL7R2pr55igKmSKMYdxKpm05vz/Epy78Ou4wjuXSCciUOSMPWLiwpxv5G8VKY9REy1XCtwmxfQ6TPB/ziNmavkxAZsSj8ksih9rLwRq4qiHZq4Gdqrs+8dgsNafuXg75pQ2bl5pXargVYjeP2gr3vqUxWkaGDAGzj6u8v10uXW/f6/b2nOfYgUeBTk3Bvz+kDTa9zFNb1KVmP3jfcQ7uHlqBflAb0IUgwK8xb1pjvAzxMQCIm1wOJ5r8JaxVDPnG5v7ytRToxrZGMMyerZGjR6zN7+0ojAcn+4i73mjBQ9XA9o9Up9NQLrMci4jVFelsSqFZ3ePWXUNvOR/7MGkC+pubcHrBS9JcfvRQDe7hvCzwR/wAhLJQ9Eajs4D/2A0Z6U/4h2cHOG/acsuDgjbQ86zMYtvuS2tc8Opzcd7ZXALllcVulz/G4wX7kDovC9xqdr3Kg2FYroitPP03Eq8vgvsm/qXbj4VXg0uXW/o8YtOsJZPNqcrf5xB0m/KKsG5YFbinknVUVo6TQIK9QpWJhBqpu7EvxGLm1aQPS5/KXOaMRSKmi9ekGmc4aypkIx21DpB0dIgWr6v7BwIekwBvsNu/SVT2v2oPD/KZyuGY1s6St5ekzXfrNDxzKSYoBQfvAHDdR8BKnO4SuZ2GBgPR1FSllwCe0EbrdwnmQt4V8NSni78PvFkEe0K4DXfcqVHZWU9ZS6Eq7aJhZmFg90sKE0c/2HGy1VWpSjXh7IRGk+itQLy+Erkg39Ls14j3H0B5lalGg4Z3EUQPIqFwntr+xcYekTzAAclQ6vgwxLf7pmLdVKN4qGcTMb1FxzrEsUgrrtDgB1MzCP5fyBZdvMzaGnmBDNjVznN/8lOmltfERUx55YlgD8QEwdZwKVGWHZOZXivdGirHRv7R3RfV/DOq8S7imOt5MXDLuSuu6Mwy1SXuyZvV7O8wW/wDvnBqm+cu5aWp0vNukC2iuD+SX04tuo5XQ0tfduWi2+8cLO9SlMX0MRCqHUQZbDCIqByIf5G7/AHIdxLUVUsoPK/MVXavMi3b3nUxLdko0prP8Qb+dagcvhkuDw/Q+zxVVkg38q9NxhDl5gignpqYPV0GpV+yF+sL3I9P9mUVDw7xkMZhe7z3g0MYgVEGfUIOXGSHSWfhNGq6x6PT3g8DWZLwK83DUwDqAsLe5VWaHkiMfg9pxSeZS0Dd94Im9TufyVgNnPPoR3QKb5GMuHd2vzKDa7b+pXa/WI3pAobYq9pb6VzH3UL65NyoFqctyohQ/zyl5bDnp2esdrsKYH+85da0WoujtN0rtr6MLNg96YZLJ6Q2cDyQ0OublBJjOLLdluw490F6k6RlLyEItrNWDyJhjt06jMFx9YM1gM9sTk3B67+Vagcu/EOZ9nzfZ4xPeHf4rwbgVHJE7VHRHCDjzjiI7oIqBjjdIBr5uvNh2COTryhXSXHwOruck1cJ2W2Zb0gBx2c2v/eUJymv7Re2Dyjrib8oGBby+vaGdrqeHRi5NK1XJEL9l4qArnNXAHYvWVSv+QA9vBrozdHkxa1XnMQQx7kdw32qCtX7xtDcLRATPOQs7zNHsCr7kB1SBQKbJU7lMdoZzOK/UBIbD/fqV2/VmvJhL2kRdesKqTMTXtLQsFb6QAWxrtGALMFtR0D5SRfWz2qCLs86i6C0wZFO5MXeSCNqUYLGb5mYE6HXmMrhwM/2OijnBsisGJcL5+K1A5d+Lqte3yfZ46holwrgV8WtKshpVb1gazshnJE6OZfmFiso1TzDB0maOuYNPAY86/wCR7ugV7I8wARNix+xqFPprs/cPiVj0eGALYb3FZtuSWhK7JZHp5T3QGVT0wv3IoYbYR0JJkHD3hBidZg8sfuYgKXVwV5HpdPvA48mgxyyc0HWa+8F4DzV5MC4DpGJdlh3sKPvMSEdQU6A3KNBcvC/57yxlXHUl1UVj/qV9WlUn+POJBDgXvysr3s0YQF3dJly0mDs84FJ6PD2zHUNFn+9mYaZfqReftMu8vDFWRe4ptpx/uIToWDk57pu1rAsjaPhUy4Vys34xj3ZfSVfjy5BM1phoz8ht6lPcxDiP5lcYnLUZQjVy/wDY6eXr0JzqaMRZ15wS5GT1VDskC6OkcRzQ7xbyF+xFUci79ZnlboxD5FZrtHQu6z9Ry2p5J5/2AsrjHmdURwLjScDJcJ0grFjkX8MfOgspAamWMjL2IvQwn6jXYnDC/dIGIOs46TkSro4gUq80bFVygtuEa6jAA0XR1O/abeuHJ+ma7ZzVZX8hn2yV+oNtBVZv1M+zUMB7yw/eWIbgEZ5VmX2TTnY9Igk2v/HU0wXpDqV9kVvO5uVGI9QZ4hc2GK2S1qy3r+47k4feIdpWLvf8fgGiEzWmFLvxxrrMU+OWoF5fitfIwVI1WM67Qdh5ypogGAOJhBTtMfI5gXgqASziWNTMxuZ91ZBtCW4WlJM7Hb1lWvUiqmwMB1eD+mXRc2QeTtG/dVLGyalSqwYD1g0Anlof1PyZyh8UVwpQTzLQcdOGtxMJvUuBm9+cemmv8+8OBYA8L/7Koddx0V3qPHLi/wDBm3QOKAdTf+9Zb4al8XZ5OzmYELNzQnUactPvHYFRTyi3g80MRDdacIrfeaKCuNsb6+8T1iXmeoloKD/STV55QvsMybP/ACW+bvJhnL8Vrxi8G4FfEfGLUDl+Xs1Bv4rKmpUYe7BBK+CQkmPENI4nOQb8usuVLyOhS3faW7AM95aQcsuuE12i7Jf+9IC0Nf47QQj5w7hXOOHqfyMCdx+kE8mNeZ/ImUqecvLd+h/7BocTBfiZe3S6SNcfUZo3weX+9o6TZvyhNjyZ0iqC2CENTefaH/VBxRLy8PbpBjR5u3v/AGWUdoM/b9ntHEBM/wAO0zBpL7h1C1HbyHi5YJ5Oj3NQlg9D+CYMqpwlJn4LY8MyxTshpWIWdyWEjMG9Ajli5Dk7wEGq+TWtdIN+JXg3Ar5EuXw+KWoHLv505Nwb8/gbJhkzmZMmtFexKq195cv4gWkXaxM1bMvecPMw+GCfNC6sk40Y4FGIF73smD6jis/slseGu0X4A4gRFbOxDz94Y1LSz7D6MBqt6coBuGsU/aUsU7EUDjoyofzLzAnEaqvKy5dJYdL4vlje0XJaUiXRVeg4YFZNm6+/RldRHP8A6n5mZO/MvvOpKZuUri+wI6QkadGHrzHq7FqKpbjSVvq5jTmYmp5Beusz34Ryvnf/AJNLM6l4SlX7oAnLOlSz5U5Nwffw68ECvn9x4hagcu/opcutxhjJBzKTJ/5Gjehgw8BOrd3CDO5Z8LtypVFGct8KXKlO2aqnutflL+ln0JA51bp1IzYVEdXw8qNgOoktkm+Ykz7Jf+pZbvMeyjwhYxBeT1YiyMTYbjE2B1lc1HGYBHh18/4Qrg4Zf4r8SsNoNcwJZF1yv9xqPFkDFunZ/uYhkySZyaYLZ8hw/wAl4NcqriNeBh+lyp8/nQm6F9kSVK7/AMR2cjPmioPFMG06cR63WdYOvJA2AmrJ0wP3IxGlmpfpmQ+ZLl1v38Kt4IFfRqte0G/CrUDl39TXc+CmYNXgod43uIt4Xx6G5kY/c0DrHrB1FTolVcQZY8IIGXDSA+RmsMFoeD/rEK2aeqMg8/tBY9CFFWegaZZ1bNLUNhDi3hlYqE4YXKLONkeWyHaYI5SpeRTtPPLFZ7pkrTxHB5cMdy2qmvMhlU419d0el1FiWFXg60wyAna7I+V88ks0PFIJhivIF/eERR7SlK8kiQo82NSgoLeat6hcCEKuiMFCfOWsDXnc9HwrEFDk66gfBHD0/wCQypU4CVQz2L0iXEfomO/ne48HvB7wx9NPeDw78GtecD3+sekyr4iYPVmWfF5lpHkl/wBzAVxvzOWNkQFQwFjohGPMjbCFRlhb4EXPvxFmS6b4l7ch7INXD93+4d5usg09uIpBfMEbwI7I163l2m0MTR9LqXPMsQlZgsyoINWiig4wZ9oFiRZfIPR6QXMmmn3d/eWFs8vKC4TSZ+5Tn/kurlekHkrdGIbvqMYOhi2z2g7/AA1ZXshLADh+kuAEd8s3YdTfxM4PTUWtMrvLEIju9Yh6+dVcywg6WvvAWwcWnwgMyvA/Qrkg39ZYOajn6yXNb11+PuPrL7wK8/r6QegF6EH3638la9Xil12rznZX/t+4Rtil/P5lxyNGZQ3LMGCuS4ddSKj+IfW+rC9JYWJUMTJywLmXCY6qVdbv7KlMOolNhE2xmaQ95Tm8sgNzbDNBi32jqlp05llKmDCnXpLGNWSpUUKcdR3Imd441yV/O0K3/GK/kw6AtVqU+kfchxxEFjeLT+SuFV9p0z7ai0b+wjZt5H9Q/QT/AHMcZYzSllkfVOPxA2BdqPtGHfpyfaWwRvox3hKV/wDYwkA4xuWhFe/8wTId5iDq4YgUn9TnQVfRS4PD9Rekb3h8oVdUzTwGta6Qb+FVqDf014NwK8A6gd6NMuvdTkbTuXRwWe0qCtIknlfVlFqDB/vSHR1h7QBvtm97/wAnqTmZUBPC4Xlla9XMyutVmbtWVfqJSgUlXNeWJQHdfqIIpmewla1AaRIsYZgLYw7RasYmGVe5VIxvlAqg5rePPkl2us9nszA5eEbDziX62Q0a2duGXJwmXlfQ9eGGQpQI89y3mRrMoYqFF1Kge3HX1jV+FHpKpauLII3PbKktnDnLV6JaWupGYYS1dJqU7bv2Zm1p1FCbKnT+UcPD5TUVcRFHqufKZQ3dplcxo67kAMggcY2TIvQd4rD6LmfZ9Li7nDfrMaQY2+CTph+Ke8Hh39FeDcCvAupajGeYr8EafeFlZfyWqq/vGEZDmdmO2i6323FQ8L+lRXsP9+ZlLOvabkDJ5R5qHUy0NGsLDj9oov2wxcjpNKlOKgDiCifYhm5FPevxAKneyBbZOAbC6ZTu07iG4hm1FTbdBcysHo5P7IAKu2lZN01NdWci1L5/4TYMX+YKjox6rO7FRXG9gPtAUF5YELYIM2Cke63qf3/iZQRWrqEyHnklf8DUHIW+8RUPRqk9AS6g/VRaD90qto91wdGpQk5hPxMg8yYeRo6ckQa1cmlzLxrDCTQhrfuvp1WvaDfz36E13jOxxKsy+HS5revnXg3ArwYHKqFioHP5xfaaL4IjqDCOh7A9af7KPIz3jm7qHRtl94eCNRb2t+8ahYxmD11DiHYwVxCoHpKcQxOjrvDUdStxmel+1RyWjTfvLYN9F3By7xcqOTMwamTIQKDvjj/d4FkNuu4R85bjEBb3ECqCqvWhhxl5PdzNjpr3mTdLXfEO8mmBlGkC6AtwsGPScxAIe0Ai+zAlIHXMMr0buPtHyH2if1NPv+5oE5D+mKYJ3hnA32geafsyhndeUJ7nVpq1WGWlHlBNgemIS42GoD7WSnpj6ie8Hh38VUuty+pDhjp7yjp4qq17Qb+ReCBXhKfnrLApkDnuiiLUe6/zCtdv5GWCvT7lTiy9OGpX2ncwhRWJxAsUeSKA6R4I4NNJRWxUd2CoNCO5jg0gQKzK3LONoIrrLY+00QyfpMuY1HIyRaZT7y2HD9JY3vFZgam+WYeFxpPSPH2UOgI74r4xmv8AecbJbT7nEANahwS9BpOHmagPONLgT7RLyJCF0qr/AGEpqcc5PvzKrHOU96/MSwOaRlBR9h9Ia6nSv+z1DrogCgcuT2gDTboP38JCcm46FQaairVwKYXLCvnqIsrq56d5VOjTz7/VS4d/gsOj6Q88x7WMDxmpfaXG9ECvC1oZIg6eDidAS3dYqdABMOOI5rWYhjfHzhCIKziCgpyUtHdKaTbwd1AWy8dfKNK1Md5YHTE3nFyhMKW1+8ZuFepCXgPvEvGsx17z2lCeG6nap5IhvNxyU38GZRWWe/tExrFXfVpe3eWiVd/4gVOg2te0rtyAc7nJyz7Iy11Ls3axKhOJ6KHNnRhrNw850imfOLBjDkZUMp2mEQf5hlgZmqFPpLm1HYj9SrDM6/8AJMDfe6/3nMI7eRyeTplJid/cxjL9iTTC3O6axYnZHErSZ4a8Hb+wRailes11tov6y0SkNHec1BWuv/wHR8OVxJ1eXNftFlldkU7k3KtqaCrpmJtB+493rZWUhQeo6wZAOzMjeJRGbccQx7oKuVgPYjAoukIXfPeZcrBBozS5Oe/eOGsflNxpVZ0lhhYiJDcHWdS1rDLEMPMjIHBlBdCuLllEaVhuDH3hfW3UsOe5Z/k6AP6mEVkJaa7u80WzEtaov2YTulOuky8F8nWCiwOJZpZOcoFF0YB6V9oZHo2UOv8A0hejksHpamYya/R/NzKbS5dnUiKPJ3/camULxEEe0scYnlEnUmDsoYx7jMXOytVHflfVdTriXSWa4ZzR45eDcSVK7+IEIm4tz8P70i5jzAWYILRuVKVH1DlZ1nX8KU3Hi0ahYN6uYncLkNylqZKM6idq9Wgm2up1f9XtF3uVx/vaEiNMO695POCFRDdmSUtR4Ljw7sPaGm7OSF2Y81KMmw7+shgsbb1FKZAM1rK3ADXrBAeOZnt0nFgKbI+b2InLI0/tHFIO4J6xMjqXnoN90pG8WbO52luiPCv9cs0XXcf3z3GqLvDkvp3d4cXLvH1leu/+wq0e+pSqz6y25jHAzV10/kaWTZAaeXl9V4mnAx6mpV7qU35eNXg3Ar5Lrfv4c8wfAdl12hPAgnKgOksj2QeOGX3ecynFgdtzT4Nt9JkdZSp5HLLsy5r8St1x+rACAqWbo6MEVT6NkVLAziC5HlGNvOFq1fSK+ez+fCMNCs5U4hvUU0d3oPJKRBzuGrybIinLOMKQ7PwjVE3/AK5kjruKtMzTj8xjCDJRNCbch8mBSAyAUnkkNBWe08j+RaNmCZPKVBbnuUPOA4FVncU1WO5kl9a+cvfnBDcyj5I70nXZhnXMxqVMS0uWHtKZ1D6j9iV2qDnMBf8APg9oPv4teCBXzdmoZ8I/DuD1hyNdoOrynV7IQtdUBkKY+7CMRAkDG5lQ4+BZKkMBv+JY7WcBMGzh/IK6tuseUpyzCqqDrhylRCgT0Y0KEJrA9OsNUHjgz5zPWmxu4WE5FeVweAyShuBgZtae0TlN7JhX+xMV6oKPGcM2aGZl4Jrqg7dzQ2f7rLqnNj8kvCjbA/sRrZ7aUHdrTvNunDex/Y3NHTzOTjrDLNjLefeBV1voxZFDq4l8pC4ccP3Mjt0mIoKDkXMwu+fqQl9Wpw5nmnpAx8iXLrfiVvBAr6CckG/BvslOzcKuxpzK3i7gweqVXxDkZUwzAkGAcT7ILPgWsGoXoviJhccv6mYq1hqZZeoHlD0Oji/KUCNSwL5CqU0uQo6gajuQFtcsXzLGLJc8bPFn7jGGyHnXi5gnDuYHJ/j7TJD0pKrv/Zl5XkYCiZAs7jsDxhiAUO7hmAmjfAefDODYpo9yJrV6pp7IVDplJ7YYmrfvt/u8DIT0Z/ybDHl/n5j5P7j3h7Skl09YybDv0ZToC+epLQmqQhg4LXJBEoc/9lXkyl2h9R9C+0vEtTrynN7n7ZXz+48Pd4PeGPpJcvh8F2esKJOJbBbZYwDiRF5vvGauLASZZYdK+KdPaD4IGNS0xNRe0Qcyrj5QN9Eqwr3HPnAeaxHhU6EwkxvHSWuddJiPcUhQyzK4CVtqsEoLWIBMjstsxPM/r4AcNQUBwlfecnYnTyphZpZe4ji8PpM1A2DV9pfbYq8h6aesAQt3KcWQKUoyb9ZVpOuwefbvH4Q6dF/3pCAMsgxMhRdncZqe9bldiHy48Re0gVrtFFLHlTfSHbkMefWMYn/slA2wnYSt6/Qejcr0SmnHMMP5mz9GuSDfg961N619b3HgeBMaba6zvwlFQpio/aBymWoxUl+gPlqw7zu3MIZTcQ5G4xX5bg1LbZAGwZUMNmyonN49oqWBQ1eOkfuwgKFgb6wrWDLUc6/rHQ6TDGgfhGsAxTzmVHJNNZmlEyRd89O8sAdY9+0dFV77IxB7BXvHW6AKVKTOYlk9J1FOM1Em+gGCEB5P5EF0u4M9GVGlrZOvKYz0GOq0P+7xRtyK95ZcQhoNhtJpbQg6sh8/B55h0SybYFfTS/ODw+B+zwNVr2g39evUhyuuyO7EfjB0dagQIbCpU/k0gvcdM6icPMausxiqMcxaW413dRaOmntG3j3lEMTdtVqXnTWOZhJDC5haB00TY7x9AzCyDRbmR8DJLbKpx1mMb/ZMj3CaoGn2EZ1d/wAv/E5NnOSAzTsqs+kSTO/v/wBm0JVD2lu/JnvE1mFYnB1fpC7enqPeUCzNyhK0hlEqy5uUD0gV20/OrpK8g+s5ndr6/wBng094PDv6i+8CvP4IFtriEBHQuUT4TYzA1FViCGiVA18mnw3VzSKNzRkY5bBqFKdErgRHhAZgekW5JkKx3iVtzneaCU6NQ429BuYO0rjtMSc3Lv3zExZmsQYO5m6m+0LbZ2QXBb/4iJkmufTvAwD1af2O5w5wPKlCh1a49OJSNI6UxIDM0xpY1Az3ltoxZhXnb7zMsJdIUwcB17TMDTkvyjhdIR6TqjG5tMse/Y7d5dApdfItQOXwVVr2g39T7PCpc1vXX6S8G4FefxQJyQtIq4gp8SLGADAIPMV758uvwOdN0z7Rf8HygaUs6iVtteHDAcE3bddpWVjpEgBgdQJtYpi60wFwo94aXaXLvRENKMrerDpFxjc5CLodLqKm9PM3UVy7y3DSTpYTiWlC1zXWVOLDPorNPP8A2WOa2/ZCyB7MsQ+6d/KYDl2n+/2IeQWYYOJumWiLVPUhZtXmuYqW+wNkzgN+7EzIdXBSmcIatDZemDeW6y3/AGRQDNSWTy6z9hTFqBy78InJuD139Lu14iq1rpBv514NwK+TSA1ifIiqeQZScg180sx5INXEoOrawG9niYM3Fx6hgmxTqaVnrNchgC8drh0O2WVEtb6w4RtBhHP2TY7TZ7z8BDO4XkRyxxevOWHvF0iqu+nWXymG057z+TA9Zl91xMCrpH9QKrD5R9N9oJoRaTkis+kb0unHJ1inqtUvIn9qXcm3eV1L6Oj1mcyEyekFZBziukwlEcbidJ0ZEpHMtowYeqh+5RrHImY5PSl9refBpcut+/0N714pOTcH3+VeDcCvmrF/BrFKpgAcynO/l0gu5khZK4lcSqlzpLKqMSgZnJXMQ1yYmPYGSVKVeYbwfKExGMMJ6Us9PzHyjw90VBMM95oSlkUF0zCTNK9ZuXh6/id0rhlUNXOKH4lqEKI/Q7QdVVbH4Y3tO7ymIwGdMuYQ7iGRqumAw+ke8UYy9/plu6c0Yc/5m1ytNYRtAxO5qO1avEP+xpeAv0JgH6HrARteLL+naLaa/N+SF9Chxg8txLWyR2dl8SvF6UiQM3MGF8lhLEP5n00G2oN/LrWoZ+RxN5fbxiXDv8V4IFfNYVQoM5l5AdIosfDo1xMcScdYKNfK6hyzKK1yysi6ZjEsFXeCGw4v8RkAeU5hjII2C3yxAaB3dTES6h9kJw33izcFotuJlacEC7oJ5tUwVWztlYSYJHNO3WUHs209pYDhYex79pqEzA6XZ6MxDbM9n9ifTEgWuaqGmrLp9f8Aye9AgCtPENilUwzqMl16xobihhsrv3jtTNrmCy+WpzSkyPWO8kG4O5Kjg8kdOBa4iVm8INtfWwevDABgLrIl1FPJv7Rca+0Oh8AV2TuYztg6mUQY6Lf5mqodCDb3zH7idi7maIfMirB92GdPq/spnnyVWzHoCf8AcQEuHn1Kll/zuXKvqO5gunKoIaBHcZefMoGsTswyk+XxWoF5fHdc/A7wK+e4w6Zhg4Tg1MrMirysvHWMx4ma8rLFu8hr5sFg6LiHYuN+KU9GYnsyjN+cF2J7QaIa6Rtyh6ESg5d4DByL65gW7hdjEsqnEeHaKAcAwEzD2nEtPoa2R7vPmMSX/wDkr4IqCFKT2i7RnuolPbiYSekXY1FD4LFzL8veN0CV5RjjCF+cqbrczMheLL4iS3ZmUVTguOLaDmAsMdZeA39x4i2iHuHabKXMXhNsZwuyA4tX31LvQ3Vh+JQ3FM0PtEUL9Ajlq+86LzBmVts63OZm7zMVPOMJNcR0yF8MzZVvUEVcDm3licup557kDGp5eTUECpq4hbwNRtRNVMOQ5VLdYDmcKrrSGGsaaCMMMFzK8f1v4GX52FbuQ0ZgJKUuyFYHpKDU6UWczou8QnN2T52GUXBYDAo6zMc1qOWNGHyjd63Dz3zKO19Jbh+EK4CYReCNW25x6RVFUGLiOg4PgjEF53jonHtmKBdVgebNdpymwUR5I3gf1NQnKpx0j5EtczKoZEQYZRwTCGzE5kKL1BgpqreyZ58c+ss0nFesApWAzDZR+6IpIXTmOzvOB23BVM1z1JYYdGVg0KezObL3ZxMHR+kyQN9ZdjSwlQZ3uJg9HEa+0wxF1WYXUesCox/lZVLd0KmVA9ksLl7ih7Y+8xQnJv8ALGhduz+THMu6fg+B7SnN9amJb37mL8dojWKxmOrwOlLlpRR0lhpKfguVzQ+UsOIbfWGRBPHLUDl38Vr5Vr4abE6xbFmy06CJYrcksMcx5xHrOBNXGaGUU+cjR2+CMaxmAtekzjd0mS4vcFUvBjzm1moN1vMJ3OmJnpCEa+sVRYlopTG4uc2R5HbXqlBKV+XWGpBbALQNp+f0zprR/uZeG2sjyn9ltyi+tAly5hIm3feALCYHCPRQr+hUvjnr3z+bmgQi1pmFGEWUuJQ1Ww12jLq9Jd3ICBo5KeiFZMWQXAbxFSs3h/sFoxySlOj8S4KGBSjc2TmQ6bESsJ8qQV43FFkxR2Cp9ohKFe5BmI7QUC1FDA1qh+8UUOu1zSpgaa+gsrwr6QZQK9IPNzw79o0qy8PSE5d1uLdURaAag06nhMM8zbGkcab+BiE22VAE3a5TtW8YtQOXfy1WvaDfwo4LY7lo6Sjd/eCrlOlxWGDomWRxA1xuI6lF9oOUfN7Y6pUO/mdTfg+WW7l8xQWcETMroXMNM6lgMFLBfWpTS8fc7RWWotzFGN6+GCaprYErGvR4l+y4Y9Lg9mDUX/f7AquzskwebovJKpbOVncl7eUGPTP+5mb7SnDAxGaZU5vZGssykwXRuPLer94QrYdTj07Ttz66Ji3QsPIvFy9ODX6/kuomsQLuy49ZWqWs2S5h7S/axOoz7ka6sMVwjbT3CC5Z8j1I0yDKLPnMwpt517w4gcAPvqLPodL5glHWVTDVrj/ko03YbhJUo2MNTYcExGD13/YiiV0EiAXqFMee4UetwZ94utOUOPWXXye7guVuHZFlmLTEMUdHMwA3Gwl4Jdwmi4iL7/8AjHq/Rcut66+KWvOB1386e8pZwwNERwGPrEXm1MtZjynNEttxNkavvBHZMJ2aPtMT5qCLroRj3mLihLeLiAnUd/8AZh6K1q3skR5sZiUQuz06xACP5n9lCjfMVekv4CrWorMszQ6xvcr8kS68Fw7eFlt20NfL7I8lC2gcEaiGXEbekXv9epvVT9+8rEUI3V11ilhu2jtKNsqfiPS4C/1FCMOMdd1LbG564zL6tfeWTRDDx2PZla6G7OkW0JmjEPQsIWeSXc079ZioMabi6pyMtoTyLi1XJ6IgUOt3QjijkGiR7hZ0zL0RdR/5Eqz1PD+wXodKE95igt6nozNuvXXzjLz/AAPVD0M3aHR2eRmGrFcA/Eubvlz7RbDO6F5i2juootdaHTiM0oeoMPrMofugF07ixbBcm1EqB/cJ2OTyPSIbbdfC40DRjYp1V8Na1Bvw6+8D3+ihowhz7SxFd9oRXLtEGD1TaG+cSnTdynuLLqWb7zKM+iMUt0Sn0fBEMpKRHwqWviU40amvVwQgRt1S+0DSsF1tgLSkrKkD0h7MlJONO07CPDgjgicRc1Nr5+BjMEFvbcVK4IqQXKGYOJU2jrtLalcD5TJrN4zAmbywj8xVc/RMRmF+1x7idKWO7rEsH7WI85edH/ZUdvTz/wCRuVALdXWBZp2nfn3CPnxmyuGJRYfSAkzovtcvQKUGNDeNdyXoanKJjLRnuYe/JOsywLALALe4Qrw7jcYT9JIjCXLi4vo3Vu/J3M985HCxclcRMRdQx/yIa4KY+14Ym47dUPaABFvNwXAa7wiIPp2lqvMKWQXtkP8AgQXU7xwF3PfvMpQdIcEHHS/OLlr4BgPLQnMxklFNISMPUP8AsRoGZ6S0EMC4G7+Kcm4Pv4Vem4Fef0rm6IrmIhtBEdveGYY5BjBr1jwhcQNFRKB1xOkhC3OX9UAhqHxvnmCW3sTJDc6iMLOyKWq2U/2YAwLpfWpZ6ClvWIcXBR5lggllisQ5Q410lRgwUQ1OKaO060EK2PSYXFOUHzgRxXlMVR8yMF9iLVf25dS3vA9Y5eYlKQXFCOiyUJXbL1kM10lMw2V0xFJX/wCxpaCnpmYQ7uKMgmmWNbn4lZ1Z6TzAomsvONTS7+DL8R7Z2p2IWdElTCUOJesxyMkg1dT6kroOvyIyDsDmoXyP86RKGeOtkpeoXzDzJeDYbRfr2feYK3wrcoNNrTZcCvZFozGC1/2ao88SJF3urFVUYK8S0rwPvFbUB0odVm4CVgug6yyHKzBAAPlBDmEBR7/r5EuXW/BXzx8Ar6aniyCbA7GWMgvVKnwMDoxU3xAFl3FK8XCxXm7gFCvOOqz9zku7es7kPjTviaedM449IsgoZjNgBBNFnWHbnycTQBvZ07SmWLKgFgvylnI4PSdKbT2lxYvhEscEUp1gTR0lPCKGsRNpxBWk7JYCmHoRWotbFyIuGWgHVgUlpj06ICrK6zmYdsHTH2hXVhc4GZBkrHnLRjFXAWTVtNwdo0XD83OUqyxUzjjrNIylBiMweUivMB0zgwuiUN2ltFillGYlaNdoQh26XNvTkmIeTq9MLvCfcmBq7NiS5PVpzAKAYvZ5Bi1zjjiByX+YDZOMzo56RbN7lxh8birEan9gtUyHM2JdsaNZmr5fcfHWtdIN/Ut7TsNQ4rnj6lSo2BAXt95gVfNcxJ7CmzvyhjkTyPzxGL8tOeEOEEmEw+HJmXC2LAMdS6P7KCGq9bmdDygosKbmZqmhXBKUQzvRENkbzLdWHWEFd8SpgqxIy/Gj1WfLMo00xhIj6kJXkyvrnjrLbIjCCMBVYRS3PbcbGODB9kGXNCVSCmAVcQHVoQwW853lw+s5gSoMU5hnq8Tk1mZijfMVgMMO2DmZpxAdfRqIeJQaHnFuCZwAl0KvYgLhDCHkPwIzHv8Ahc8usK51MNpks1GOoPy3ZWQkGJHMPNeH565IN/BOTcH3+iw3eZi2K9UD6qXAgvEfsRT+E41HlOGZ0KBcQgmdv4xgSAMNdAgBCrk/qLcS6VREzbKaX1erCF7mLNP7mQNEdp36CI1APhfgG2BV9ktkMqQ0H5QetCLilo6MTmWGMTkekRLinWDTR3m4FQm0FnFPFc/SCXsu9kDLFmo0+9iAc6IcQIZ3QSSiPsYbnNINkXuspxAQBKv1CbWI0C3Z1OBg5RpbonEu+Aw5+A1DGoM6zzSj5/EjK+G8p4azcc3Sqs6ZR0+gl/FLl1v3+dY5dLm4LurgV4CviVK6Qb+SoDMEySp0qqoIjkvlCEhqHZGR3KiC75u7HMcIza6mMr0uP1LxiX2TcxKloqdiaQV5QGhqpRxLkGJvMS1gahHXiYi0yXbvKGOsVqyOsF37y+qviZhVc3cUq911ghX3lfbQ9ZuE8tRBXeY+8frAo4V01LQpZzpo3GxPgoBr6jgl48+UbF33ivMXWMWFfB+TPwIxIfIOFy22xcEzKOlCn1fcfJbL6Fy/snRWZVrArwyXB4fmqzKzx6xjsBXqdVFKx3ne+J7yj9duiVOyibrcXeV1qUWzDsnliekaSxRKnlcGeYE2rUeYN9S1guO8qO7hFvQq1KLeOLla+JTtxMpGkitqPGY5QazKOvKIFu9vaFvzllUMxBAQpVBmsMB4Sjg8B1lTlhCvaXRHUu3cozx3xF8H4VAekFE95uVH5AZj4hT1j0v37QgyXlgUV9as4+K8gx46R75IF8teJcz7PkWoHXc0zLpasFrp7cv7XbpiZKubGX5E1eRFTJPrq4MFBAuJREQfh1JjETFrtMzbtrKRGKZ5uFO4lHR2ZR9TDjmNstC7le0oFqDrLkrpMBVeUFQ+kPhHeUZIoDxKo1ZA868ITlqcN/LWoXiGN5YvXESPd+XuQikslTXwBOH4apKKMSvacwgHgV2JlLuXnzMzTxl9CX2nGIHXfyVKlSvob5m4lTvrjyIqWJc6fObaz7o6Kcmouv2l9sG6P0l9OdZXgcs0hz6feUyLlYIh24lwgxdzk7mfDKq4QeQdLTGUcR+AiOILi/KahuC4laJ6RwRg7zZKlyFdSz8GAAalaHgd05I4e/WYq6h18Y6ZpCaeCoHzGIt9mBdwHpMcYbMR4jctHMcdqVuLQqObShfSEoGT4HkzTkmv7MJdQ6+GxErxlGaKXtxd72Y9fEeXtGriK4PpE1cxLziVai6jeqYHBTkEF5zVL2lOyeUqCoS3d4Zke01Z4JycsM4dwvtKd8wKPFrUO8rvK7+Gp0JToSvlcmrh024hc6rzAo8RpRn61zZe3Hwd41Fmkp0HpBcJ204BOynFJqB7TTCaYwDZLQh4NaJXrHGnDN0XfeBXw1vXilqBy7+RPeD134lwSu1xxrmbou+8Cvhk1mDfit718ie8Hh34peCb5Zy0kOO3y1WvaDfh1qBy7+ZLl1vXXw68E3yzlpIcVo+VOTcH38O4lXl9vmS5reuvhx6y+k6I54qBefnT3g8O/CrXnA5d/R1rUG/BLRB4dy/aciPfEOvzpcut+/hVqBeX6NVrXSDfhaU7ysQm499nH0UuXW9dfBrXnA9/ppybg+/gWqzKsz6SmoeY99n0vceDWoHL9NOTcH38H9kxVu5mzPErrn6mtag34BfeBXn9VLl1v38A7Jis7mceUr1+pXJBvwC1A5d/VS5db9/rrUMxLc6+H//aAAwDAQACAAMAAAAQ88888888M88888488888888sY08888wc8888888sY88888088888888M0888888c888888888M888gc8888888888Y088gc8888888888M884k8888888888sY8880888888888888sUkc888888888888ows8888888888888Y8M888888888888sQwk88888888888884gU88888888888884M88888888888888gQ8888888888888488888888888888848809888888888884c8408888888888888sY08888888888888s488888888888wc88xtB/88888888gY988sw888888888k88884088888888888888Y080888888gc888JZBMw88888oYNTV6888w8888884E888888sw888884Ek88888840sw8888k88888cxQZTz18/cI8PBqZ8888M88884M888888888Q8888gkc8888888s88w888888888usLlMOHJjM68YC5L88888Mw88c88888888888M0QAk8888888888888I08888888+2t28xAgwFyaSUDX888888sQ888888888888840AE8888888888888s8c8888888/XDEv5ZaAequNax3888884cs08888888888880c40888888888888888sc888888rfGH1icJOUx5pLWf88888888sw8888888880gcc8408888888888488888c08888kDt52/30ra6WwE788888888888w88888888go0888sw88888888sc888888sw8866gmSRfqwp+dV0jd3884k8888888M8888884M8888888w888888kc888888888w8oP/GF57RzD5vAH0BW84E888888888M0888wc888888888M8888M888888888888MwTy51OzA1v3GOn+Qw4M88888888888sc8gc88888888888M04M888888888888880e+0uVkM8dB60ziJId88888888888884s88888888888888Ic88888888888888kcAs2N37O4yWuXmt5go/008888888884MM08888888888888Ms8888888888884E884eZQQhPeI/at3jS8sZaxU0888888gc88sc88888888884c88Mw8888888888M888sZJsnqFTwr69DpbKTpgszG00888oc8888sY08888888gc8888sw8Y08884kQ8888rrVFDhR6uDJl1qW6KT8GjrMo0wo088888884088888kc8888888Y84080I488888sdZqwVmOSi1EXlENbgqkpMhUYYM888888888sU888s888888888888swMEc88888tV3Jja6dSRH2/vl4qiSDS5P6se888888888888Y0088888888888884Uk8888888+M82TM6wrKQAnEMcDK3rr6yzkB2888888888884Q88888888888880AU408888888MN7u5anQHkAsNRL3v1ehurpHl3c888888888888c88888888888QQk88sc888888yxZgd2+RlpwYrUafDq7eARpFG2Bc88888888888sY08888888800c8888sY08888v2pdm6Oz3xLfQ3z1BSn0HIN6RUTT888888k88888840888888oQ88888888408886W8Wp5Ft77p0Uqgv2dqWgzpISeSw88884E88888888sw88884cc888888888sw88vjmJj3AO9IBBorT/wDHFGisrkYHKrZ/PODPPPPPPPPPPPHPPPPPPPPPPPPPPPPPGMHPXSpDFMhHkaCrkwwLc2z+evyNmCcGOFPPPPPPPPPPPPPFMPPPPPPPPPPPPPPMPNPEhPOqWl7faomnkxfZo6ud1S1SceGNKPPPPPPPPPPPPPPJGPPPPPPPPPPPPPIHPLHL3e3XoQTN5QVc7UXi3Ep0TheEh9XdPDPPPPPPPPPPPOJPPGPPPPPPPPPPPLPPPPLHO7J/ipAuo6pBYwjI8QxPRaxakP73vPDNPPPPPPPPOBPPPPDPPNPPPPPPPPPPPPPPNp7LoK2EwJqsS4ABI+I/L399T9ufdPPLGPPPPPPAHPPPPPPDMLHPPPPOPPPPPPPPNb/W/wCWQN584H1soHvT0FW+iFT9tnzzzyxjTzzxSTzzzzzzzzzyxjTyBzzzzzzzzz4sx5ovFbtLhD/IcGL05RawEKMcy7TzzzzzjSgDzzzzzzzzzzzzzxxxzzzzzzzzzz9AukXIg7bl00oC4Wi00o4GlCRQAtTzzzzzghjzzzzzzzzzzzzzzgzjzzzzzzzzzzqlfV5XKS1kZN8m4pGfOQVuL8a+TTzzzzzzxCjzzzzzzzzzzzzyBzzwjzzzzzzzzyxAgR7+Pepk1p+ebSPqIuQhPm8E7/fzzzSQDzwzTzzzzzzzzzyRzzzzyzTzzzzzzzwUTRqPy7bPEljWs6FniT0XQkvzB1bzzyxjzzzyxjzzzzzzzyzzzzzzzyxzzzzzzzwDsNtTz0kQpHywElV7DdyFtoAP2D7TzBzzzzzzyxjTzzzzzzzzzzzzzzyxjTzzzTyVyDs3zvbZcR2hJWSb36CQNU3y3/xJDTzzzzzzzzzjTzzyTzzzzzzzzzzzzjTiTzya8EBXy5fG/QLdaHxkbwG5e+FW48P+PALTfXXnH1rS1TgTzzzzzzzzzzzzzwwzzzhESrPzyzH/AO6P0+2xaz0ptGvyykHofmeazX0HslkxA9kk88888888888884c8Y0uZ1OIo884o6e9PvHVmbYKKgIgDF6FEwor29HOSisPLlEZm0888888888888888878QXduH11nyVAeFV93ACI4OLIo3INSyw1SyQRRUh+NwI3WTsc888888888808888+FOgQpxR5oMlzQ6qWURM+WdutOUt0o5+ldVx07nLO6i3Qyl0sY8M88888os8888886Ni2iyqzhX4HHTYZySWnrcG55AJD8888McNK67b93RVPeM888M8M084w4c8888888Oec0sJjU+vxQYXSfCQBsM9r/gd888888YytAVT4UQFBaK88888880Mk888888888888s8kcZd1v8AHoQIK4ScC1HPPPPPPPPPJLkRc7fQ4YvK3PPPPPPLOGPPPPPPPPPPPPPJLPPPPPPPPLD2QXLfINPPPPPPPPPPLNFCugU3nlv/ADzzzzzyxyyzDzzzzzzzzzzyTzzjTzzzzzzzzzzgjxwzzzzzzzzzzzziTzzDzzzzzzzzzzyzRzzzzDzzzzzzzzzzzzzyxzzzzzzzzxRizzzwzTzzzzzzzzgTzzzwzzzzzzzzzzzzzzzzzwDzzzzzzzzzzzzzyBzzzzzzzxzzzzzzyBzzzzzzzxzzzzzzwDzzzzzzwDz/xAAjEQEBAQADAAIDAQEBAQEAAAABABEQITFBUCBRYUAwcXCA/9oACAEDAQE/EP8A8GINvQ+/1Db8MY0kTp/56/VmfY9hTDsurvAxlH/BzDhfnyEw+xfckfEo7t/VgbO+zgf1WP65Z9xgw6nfj7RRA8j7AXqA6lsRoWS51fyzeok9tdCW4OE8J9iS39kd122mfEHB/Zd39g1l14TpCHq/dZsAjw+xHHbo32RbZe8vBMjl50c7kOMonbTp6gQ8HX2O3bwy/QurrBW17PWt7tbbbLGzc21n8kSv2JwiNnc5wTBPd4GLtaHqQCRbGnVmcCnch7+xI9a3bovVmCmH2YOCzF6sAG0nbbXZJEiJ9vX2L0C3uz9xp5KM9p63q66WTgBvEciB8WF0+yAOBiS3eiymBA9f+dlDv4txZtl8dzh5Pa9O5D7F6ZLgl+bT9yISwv1nXs52gekY3q7zEzqQffsdg2/CWEseAnySexjxlfh23v8ATCx+1v4jX2O3hNlPPsMjYPnZ+TAv98MNuwmMdN19t3qL23OMJD5KPfrSZ3a9Lv7f04NxwFHcEZLbtjrrku+HrjIHyT6oe3yGHLqEJyG8fSWLBy+d8PHI8De9WfDfo+p9XWDGliWw8NRi3dvfAT+IMMifeHgIkdm37+o9SYtk1RBZZBsTOH9I1N4Rwjy8v7bvUFv2fULdW3ZIN39tN6gHgRxKvYNtyzfeBxnBwtmd3/tpYdn0/wAFkKz+sKxJWVsbILMm8kvmDjO4bYJzLLL+Wj6bvELPDNhs2VwyCXj28cHJ3Hd7Jl8Xz1BamSZ19L3ckzp5HTby7tbW/rJeAuj2e7Pwx+H9It4yd+leN8DaOpYb2EOI/qQ4Il1vj8Q9x3N4jjOBq+lHGATS8dxGCzYbxwQWFsuwcPDHkc+Y5TuZMc+lXoQ/m0Zhy1Zs/cJdSEFtsE23xFux7+Qx736Vd5GPTDkuvDSB+ZBkyHnJnyJ5Je4t42+IafSlnwnrg76kzj90j4jvpkyG2J7mJnnN4zg4TT6ZSWce2cbA/M98rbbwTElmHGcHJz6V2bd6mzeHgzY74JnGWWTxnxCVu4eMgiY/SvG19n8cjMuFbOM4bY4J/AcMdGPpPXCw228eSRqXI1ecjgNjY6lj8Ntvj6Ujs6l2TxuR3E8CHOGHUTMJeuG/hv1Ky22wZV+suE4YWcEhkuS8++RbwHO/THr8Dy2dnDw2cMdv4PjjyLOU65fX6VYRZZJ4FjD1EyWML5szh6eTjeu/xZvX0vYiXWSZPo4PbvY2clu87zl3+TafSvIie7Xrg/CHLT4vj/hv5Lwgk/pa+iMRkBLXeC8XtnISyeMk48t5yeGC2+OMH2Tw3bt8XHzwVY/5xhto8MB/Dzy8EkkyyOXgb5ifwJjgnjZbbNui2e5M/wAiQFry9RP8A6D8RmYLMt4ZggsngOfLRun8gvPZ75be8/xhgEOx/bGy5NerLHgcjnYeM4eMmJHUMT7MP45+QXZgseXxf8XcXpFkszLLRgPizbpZPXBbbDw5bLLDbbb3LZs2YrMH9ynGWWrMltt4vd4/xinkFwLc23m/l4W7+LLocLlvDPCxGqv5ifYBbLDnB4bI/wBXZ9Zwvd1GJ43rdE8JrGPbdYD2R8S2dsbPz922/jnKW5L2f6xTxlX5t/azl47JbCXSwXwFtxn/AD9cbyfhuSC19GyPAy86+tn+A/lb/Vr9Wv1a/Vt8cGL1gH/0f//EACcRAQEBAAMAAgIDAAEFAQAAAAEAERAhMUFQIFEwQGHRcICBkbHh/9oACAECAQE/EP8AsMBZA/f4Ms/U/RhE0/jxDv2PcMbwL6gP8Ama5L0+xPRZ42nC7jPTZgNpzi6u13YWUt+xkgzX2TncJbpw5uW/qO2bXzKAJ4aWsV19iVI/TGMfBD03fJedW5xkhvPY7dCbS+fsU0u2iMcZ1esWm3vcc5sMlXVFCvz9jl1w2RfpDkJf5wXXKcN8AYfYvWekq+XeGDF+zvu7HXB1OZ3ZSNj9QJXSW8IQ19iyy35YZsGnv/5YUwff+J9BEzuDp/j/AOwfiD/iwH/u2Be8F4+xeywdW8OvbcjteJ/8E9hSJ77ltyEgjz7Fq4/4h6nrtnjoyPuo3r5j3u04XuNgiW/YnGDgA+J39Rr23T5xhGvVj42pCX+Ih+7UtPsNCz5QFyTqIE9sHy/xgPmDqQl+F/q6PLyHbcgfr027sn9b98jk7WizJBLvZGvIOCY8mY+wH6192E6+XTgzxYAyU9wSMnj5iOdjP1Y8X7SbbIxsucN+botgvL5m+Y8i+b5vLYcj9/qfEd26y9kk4dLOARKHzfPB5F88PAhDpYfUeLxhpDDUtvBx0lYN/Bjl4bp3b9QM+5Dnsg8O8lTh6sWA4OPItldOWLfiG1tuvpz3aMbb+5Fo2FnAQEscbfF5PZwSW5bvI2D6boyGCdrViQPmGYsTA5+eA4SJkj8EHYd+l87e9li2fhe93TYWBb+oMiXjyzbJmXjI9sg2ZstM+lOk47LtBJwi37T/ALDBbwdfg8ti+eDnr9KTSRHtj2bt4xti205BH4+p5PeDh4HT6aP6XfGbwyzjoi27iWHbL2YviPfwEeS6z6UdbdkmwZxkzH4lPYdkngXt6liYOBFnD5Eu8+lZ6e44eod418QPzDnktJLJgj2Y4JWxbx44Lv6YRts93lv74yzY5+GFkzCWQ22w7wke243j6XxHV7+R1dOTcTdusvm84hZwMM3q9l9L4nF2sss42xgky3gIL4g2bNkt4Iy+Juk8fpRpZvBkxJ4LbSc8DDKGS5xt88HOWdR0/StsG7RwnxJkwQZJ1wCXGRO43bLOB3nOPn6VhZF0YLHcIe7Q5SY4Lt7B+Ic7Fnf0z7mHjbqjeO8EDZBt0cl8/gNs3zEex59LjZ5JwGTgYFiE8nXHvLEWcpEex9L0Zk72EY98eLrD+DZwWc7H4PB7bkO/SHZmOonY4fL3FCdW/m+eM/I4LeMzg9xsP3gP0SmcdYYZw+WZuRwu8NjjYsjVnOwT5wWXgONcMWPwGYDb/WZa2SRHI598EcBth5C7JRJJwN5b1bLHBNscZLktpBnG7/UE6JXzKPc8D3y3Z/D2SItltkJBEzwcLbycbwcbLuDfIMt5+P6WS3WSf8tZaewyxY4DZd4LJONsjqeQBnjIlkk/DbeC22W8TNjtwf0uggRnvkP2ttsCVYcu9sNeEss5CzgE5+GWrdu3atfqxPwWzYLLJN0vX9NHzKd8GCyyy9X+wa2frg9byw4BtmW8DgSQmMfm4t2yyTgfg3b+pln4M7t4OiTsr3ydSzYOBwt3y6EJhQLD+Jn8JJBhn9tEA+LD8WWWR0ycIox1lbY9tiz+ZnPnByKwPossJL7BWB/PlhYWP3Y/dj92P3YfuwtDyVf+o/8A/8QAKhABAAEDAwMDBAMBAQAAAAAAAREAITFBUWFxgZGhscEwQNHwIOHxEFD/2gAIAQEAAT8Q+wlff+lqASfUUCXFBk20m/2IC9CcY6fVJP8AgoQRK8v2KlPfooODqP1FglxWV7bd/sQF86O1CUdu76toF1goxelJQvSgAgAPspGSPdUrCRs+koEtigXIjQfZpJDUOF9upSBIyfSRdXV2oBB53+zC7CYShKO10fpKBLigVNmg3+zQSG5V8JfWUIkjJ9KKwSsFRXbrL9sAv5oSjHT6BAlxQLgg0PtkHC6mjRWYTI/QRdXV2oBB9qgkNyodbY1KASP81AlsUC5s0H5+2UOF1NGi4JkfoRMCVpWY3WX7hJIahwvt1KQJGT+ICXFIvCbfcBwTCUIcLo6P8lKXq7UAQY+4uyR7qlYI2fxQJcUJaOn3ALsDCUg4XR0f5NOT2VE3XLv92g4XU0aiYRMj/wBAS0i6uht90gkJJV8p3NT+CrwGrQAQEH3QCEoBhZNH/oCWkXhNvugCEkqW1l3an8En/FRC2dXf71WGZ4rmhvQSiSN6MhLpx94oKdR9Srcwm40WAMGtABBY+8VCU1zYb0cok60JyHQ2+8UC0hnuXqZs9LUzIonWgEH3yhnEUwLEmu9X9T73PqoN1RE+z7ffWs4irGQk13q8lx978NFmdKGVK9AffJmLD1pDkGuJ4ogsQfeRORelGBTzXW8tdbzQzj7wWYsdd6Qcg1xPFAWEE/eEN3Q3oMOc6bV1vLXW80RFvvFglxXK3v8A4EKGJCafl90k5PZRDdcu/wDC5h9DWM2GT7rw9/8AABDUrb/0v90XJcFRORen8FDhdTRoLMJkfulAlxQKmzQb/wAY85OhWNWRcljxDTyoLMB4Z9GiyC9gaMfbJP8AioBB3d/5BwTCaUJRno6P26gS4qG5tpN/5w33eh0oBI/b4hdYKiusrL/IOCYSkHC6Oj9woEtigXNmg/P8kOTqQfFSCWaQnbNACYlwEmd9qJDDi5ge2R6UfJdTD1vnzR1ROpt9oi6urtQCD6CCQklX3eqUIklz7RQJbFAqbNBv9G7h91S2bDT7WKwSsFZiysv0EBCSVLlffqUIkmPtUCXFArR0/mOAwsxDQiJvbMd6LIXA+akBkddTqUhQq4rQ9R+I4pCUGQLJqJj2oCJ6fZInuu1AIP8AiAlQOaKl8lNgK7VAii0df5KU95o0GGTI6fZIErBQLLBofTIXzo7UJR27vs4nIvSt5K5fpqU99AFu5t9mAlpF4Tb6BIAXketSK75vrrGtGFI0LeeOKLgIskyd7/ipCVq6nmYfWkUWNll11vQIpUThaKZimcgwjMo/uhkt9UMtcFBLImjU1rDVoAgxQCUBR11pJtPFIBfMEDdfW2KDWRgEbF1CmKKTKXftQQpwOIeNFpwVgLv/ACluMDWrsMeh+wQJcUFQ9Db6qCQ3KvhL6yhEkZPrIErBQYT3IppALuuhRDdcu/1ZWRjdV2CPd/0Q6ujo/WAS0i6uht9GPHLxRFuRUiJR80KcOWJvGm++nxOcFrMrDvl81aASM7Ea2ogejGQfHNqUIRLRKzuRCRRfgk2uZJLTDnWITFLk9Ecl/SPFCiHhO30xGLrsUm6UiBdK1xZOGlAmpNCDBLNF6LqyMwY1WIV5DM0Ba0MDEsxK56d6CEVQNnPTfJQJ8ZOkWvaPWkj1NUUgBsJvSI8QRmP5gIcVLvbtuv1gEtIurobfYKHC6mjQcEybfUDKhlkF8kXoBdAioB+uAhKlbf8Apf8A4gkJJV8p9UoRJLn0wF+xvST/AIvpcTEogkZUAMVEJXQHFNRFs4w02OYmpGYVgPQfxQcky7NxshSgqOML0figbFsMjnE+L0DA4wmCEQ65OatBiFWBspsap3qVNOdZjvUgRHX+cw7VuiMpQqXRJl+KS6KkTfSrgAW+6rdLLbAM9qg+ZFohq1wBowt6VxeY3M35wWqAyuzNHyc+tTA2bghhou9QKgqJY0Pw0KhS465KAvUdI801mxJff6Mr7zX8KASfTAS+N6RdXQ2+yC7AwlJOF30fooRcF6C1XNqJWN4B2KTKoGulGAgXRWoA+x5M/wClKe/Q0QtnU2+iQ3XBvSTk9n02nkEJh40WpgsNmEShR1Zjpyrz3gpQSpRgp1mV8lDstzYei8dqiQbsgPULHmgdC4FG2wpk2eaSliwxSCE2uCWzCc0rFEiFljSXexU8BglycSm/NG4imEBGM5XlEtqttBGm02ZNc60mLaMgveb9quYtAIICL1Lp3IQF9absgYn8pqzBmiGJ6Uc345CHRialyQkAL3KusDmcdqbFgHQutRBILwAvw0KgEk0RyRWxAVztDik1GCyEQSAiI0tARYoujSUluCGtob1pZABOMbd6hASYUw0zvehSWkWFzd505zTAjCFvxSizKhWo5r6H0pWSPdUrCRs+iQ50N6Sf8H2gBCSVLubtqGST+aZQHdFLDbIGluGRo+aFDJLVZaCADB9tKyW3Vdw+7+dpaVwVE5F6fVjnYStNBNq9yIimJF2Y7/sUHk/vJe/rRFNyyjG6YqGXFaz2LPimlFCJJWSMT8lImSgoIQRzlMbySUwJtsyFmz2Iq9QDcHfSL0UoLuRRM3zr0pmbRAKJCB1bl8UOixjDqFviagthJcU1Awf3SZiC2hZh/Ze9GIgVGIn8EVorfBlEbaI7sU/eYGAGQcih2Zq8FoFJyN3ZOlFEkWWmJq9YoMUIEkt3EvWjAxdhnyq2yuxep+mQViugSzdvu2xEssHYPO9mGy+WgiJgSPIv5pgsRzpwY9qmQExDYZz+Y4aJFQ2ZY3jjWlM6CmkxI2/daEIkSvY+mAvQnGOn80TdcG9NOT2fbqvx1/CgFv8AsDVdAoVOIzOlRZAoTFAyIRNmJoybcRC1NIX7qLH3ACEqW270Ov8AHECVgqKVusv1t3iPFMxs2rYkpxi04m81xigib/utNRswJeA38U1MkiULLmLzLoU+HlGY1mR/Yi+1RKB5NF3tM70zETmQteHpeHSgLoiTYBJ6xHao6RATYGJ7OO9BJxFvKYHVlDaslDPeC12M3bVCM1zrgnaBerQLqB0wrW5yUTBrbqyWB7r4pQPCAp5xtEGsNAmra/Rv660fNghFdnv+lPPg0sZl5wJ5q0AG5s/SpuBJhEMTvMxG+GpH3FaSFss4E5i2b0UMRWYIz780iy4CWLL8gpJJvS0gei31bU4JSYZFDzezqUWLFgKFk5kTpTkAhpLNLGzRzCZzC/pUfSFJj6iSQ1DhfbqUgSMn8MQJWComblr9zKyo3UlwhP8AhJdiLjtRDlyZN6lBmMzkUmjyNKViQAwPvAlGNtqS1oZxUVi6wVmLKy/XKTN28xQWmofecDsxtScEk5vJ2kqwgCi5JOXo8UjICLUWLM3T96oAgGcfuk06NXYibyJNTE0dLoLzwJjaokKWggmAPaF6UoAiUFymNLN8Q2Iwu6MhTzR0QAoUCaXmsGEO0S0KdTJ4lQsDyLG8UtSJBN0QdBjGaDkMS0E8X580LGF4yRdXaHPmnOj5ywiWNzXgoxYyCySJHMRNIoAQuWN9/wCmgqGwrdExflpsFHHObMzqxgjXdtUiGpUPMbxbxzQwbxcoI2SEmMlB1ERLjTiM30jmrgShAryXu3MbRilrYNpVjo5jihIDvV3w0YEJAKATAH1gCFt6S1oRw1FYJWCort1l+7UCWxQiSNq1ElcDgKiFgCTbDQSYFCc1mQT96BIkkVMbQG1BcIJdD7GbqEmYsfRp6CwQXiI68U8KSQ0BvYaNQVSyLq6kzqz2pQUXg1OQ3DaCYnqFslAgg3eWi/tRKQc7xqdg70GSkPIB+IaSEYsRQQlzEPtRXiSyYTbiYpgE8BXw9mCoLbkS0l10wwUwQxZgslO/SrOuJeQgpuOetCjEJKxsfuKFEdq6C/ASxvFS86mAFEOyCzzUCjLLsS3eyVOAQ4IRSNswat6YuIlbwBk2Yoksy2uyu2eI7xxSaEEllBwdD9JoaFsJAjaMvbHdpsEcASGBCVxHzUr0LmFlx+Ym9sVMcm7CDrFQgMQqmxrQKSJIvQzpwTWBdenr9cSTchaUTFg0qMWF4sfeNRCUqwkIInNRDcztQbSjByUqqCLa2CgogJCJ+9CE5cFBgl7RSlmzvULBABz9jmz1rRM0TCSRnYQxP92qAqYtGJ1P35ognihdJvPT11q8UJSYNf305rodEZOnP+0bhALG9/E96ThAVmQhmTtkHtapAYrhhD1vTQSRtxoT4KNMAWW7vPS1AKwk5EWv4o7woAYAJU7M6UgpocTLwbLrx4oN8maWv8KZiFBiJGOtjtUgeXNLyLwRNt6iYKBLMoSeAV61oYmjYY3HiI2u09Sl1TNh20jQqwCEFeRHcWe1O4lkHESuDdYisEaiYYs4EaU7OACxYYjcs7xanrPwgDKtsForAvLKGjKhmVdC2GaLZEikRBsdv1qMedltIzHSf2KJ68zBMaTUkSgYQfhv9YBfxQYJeKUsx61CwQAXz94xAXWhAkDJDFQuRM+j81ckpGuBxUmYifvRclwVE5F6f9Zi2ealYSNn2B4ELSfSiWNsAQxQaPkElnP+lK4tKMEX9v0qd7zoWRlhP3as1FX6Ru5L9qiTGWIkc5x0pJVLLlLnfGaCwscGDf4dYpm8CMISMI3vQIsDFGGD4KKOQXN8dL3pRBACCCwd1/HSooSjmjeI4PNCIsJkoROc5Q70xdshu5HpUcLJKUQ3bOrU2mI5dQgY2WVOMX4JkXVrnrMu1IBzJAEiu84gzvUtkgC0AESc0lUkCnnY7Od6UL6SWBMWMyx5oY5kiL3cS9NPaioQJwNuY+Z2oepd3Esx2zanYxGEYcy3XVd/NSsZWDmbWq0SxUm7CerRLCOUaD2lfqkN1wb0k5PZ/AQ4XR0fuklIWyulKmU6MUyAkZaMC0Gzr/xISE9KASNvu8QusFRXWVl/iAv5oVmOn1igS2KJqSKDBw4pY5wyMMDmL0CgLEN4jvUsqdRItjSilhdbPw+aBDw2Rn5pB1aRKTqjDzGNahAQHCS/3T3o4Msvfjb/ACnzOaM+jWJWOKLEIoBztTHLab0r97X9K0ssVEIhHZ4rVRC0UsNSKZuCCjICfIp7UwMIfpSQNGHZz5aXo8JncYNnXrvRJQ8ENzn5odEKQXiXa94sbfFBljSVYvoZ6YqQyAF3Q2N+aExWgRdiLuh6rSYmuECJa7r4N6j0CypF1RGoTE5sUYLN40bqd206xYi9EB9GJRGLRflaToBeyZG03L3XagDfhGs29L9aj0QRHUXzP1MQusFRMkr0/igkJJV8p3dShEkufbjumN1ikUhe6N6mGCEpUigZMk3iaLFv+pOH0NYzYZPuYrBKwVmLKy/zSSGocL7dShBIyfUcjCwUxQOF3GNY8tArkEkS+tQuipBt4adUGRYz5t81OGPolvJ70ojEykkaa+1KrZDZvDGHzFJKGxmNIBm+KlMwERIkGHcaOckELMGIjm7TzglbFmIf6oHsE1rszpjwTTBG5KQN8slowTSCaAG18vcog5qXMADfqDQoG4b7lXUgyTBk8n7BRiBCSOu+PT5pReQYIHtL/lKcLUFjQ9+aLAHdCM4uZ9qvSTSzCw6RpUQ1oRv1qQSQxbmaZbKDCCuJePWKCJPCEyOUF12I4tq4HN4nIxC8s72oDaAsG5uON9/ao+hyYby0gCPPFHH04rF1gqKVusv0FKe+gC3c2+zSuXpQJbFS4gwS1IyEGBxWSCw+Co6uB/kHBMO1CUdrv9vE5F6VvJXL9JQ4XU0aCzCZH6YwqAtm0u5SMIDCEMxyzQlghLeTa+s8xRFjYSpLrketqA2TAgc20aVIWEVMarAXpiU2GUGvdPWliIKIAdulGACk2Jw1KWaG8hSYew6c0pEkt/Up7A3G36Tv1oi5KYThR4vtNQ7Ao2Tc54mxSOIAv38nbVrRKyISAzLY8ParkcCTGH3u0QAIjwGGXsztQgMCgQnhuvm1A5icANOfHXSoMcgGkLib45imViEyEvmlthoZoYLLcxETy6ULW+vZx11pi4lyoBUlTUKC/CQ1PIREwNnl0oairyBHKz2bbVpFANkj6cVrlgrMWVl+lKyW3Vdgj3fZQQ/s0DG4Eo71kOR+GKQx2SVcnD6dPoIJCSVfd6pQiSXPswEqCknJ7KIbrl3+oHBMJSDhdHR+iSrQo6Aosl/GCkLlwER2LT60QqTAu45inj9YFZGpids0FwuxZtQfIxM2NLy5aB3Qmti+s0kw+4wU8p4qcwMRIHae5SMeM4Bh8lMcPMbBHx7Upy5db2mpsACJI6tz+qhAHQAhXuWoimAhgb7w9yjQQQP5Ry2aAJcAnfHxRtARyMdQ2434pKrKFAvLf2KEzg1ZWtm7fFTAuZdnZNHvinQ6IX5Ozv5pCoJKDPpSHCugAmHvirmZs7qicGJsj+KXXmMGSO+aC2XI4nXGtAQOG032qUUGAhYPpHNHjCSfRici9KLkuXf6gCGpbb/0v9ilkRll0KEJIsSNICXr3aL0pW60G5XK/SUp7zegwyZHT7HECVgq7l9lEIO7v9ZAQklS5X36lCJJj+YLWLUY9m9x3eY0qxcyEWXXpTN1hXIXvKVF4ikWeHSgMkFvIu2696cEdfMDRZC2rkreYlzaFOknxV4RTMQY5Lfim9BU03xdq5q4/HwoJNIbdr/ipCRIOgz86c1CYCoE0mIeLzG1CRXII3QbOnxSAJYRGutJ0KQbsIHWYppRq3RKv4OlPaQ4llwg6F48UPG51EoUDGxhTfrSkCbV5a9KEwhJLLMGpOjpVtE6on38MUGnXhHEMTreKuJ8pTmoMkWbFTtUAsuEgksenZogZJsxOeaIiRzOLdmmb0xj6CT/AIKIc6u/14b7/wBLUAk+ukAbDA0qJkkWyiggg+rJctuq7h9D9dF1dXQouS5d/slKe+gC3c2/kTbBtUCshZME699aVSeBUxbpjiajzllGnxUgQbe7tzWVErCJ564xDVgVlDnRBqdAkWjLDFSXQEjrG7aJ1qZoJCNu1qFJNhLB+ealWXfGQeKkSmDKFGHALhjFQgYKfmat+sjgcMfmkuOIYtpTUpgmLGBKJoJDxKOOtCOyKGUbkBrIdaWPo+03I7u2mtDHQOZ0LUFFmshcHWK1Dp2ObwzTd06kUONyrRjwhO7CZ27xUJh3BusJeKQyaBGZ4t/tG2LjBCHd/McVKDMngDjnSkAOU6GT80pIOFwfzRdXV2oBB3d/sbske6pWG2z6igS4pJo0G/2ICEtUu9u26/Vl2N29ACAg+0lZGN1XYI938T9CSIavxEoQpWmhOEbP7pDUyjcXnNLc5IIY7UBEJ5DpvUDFmYgbos7dauti5Ay7WtTAmvIemJ7Us2pAQdcrT5tGyT0cG+9BEDkFhWOWCakS7iBpEAowS0jQpCGCLM+nmhSIuaHrUz5gnLMcdqNkyEZtXzegbWlWYvN6vmOCPQDmzan5CJGHVyUeE8noJJe1NitM56UxHFQ0ILEP0pgAIW8Hq0P+CWczZIntigSRJZkSfCLa0XSDhsYjU9KL4/QpXSTnkkoapYktb8nmgALMrZE60nfR/JF1dXagEH2YC/Z2oSjt+kUCWxQLmzQfaKc3mv4UAk+iAlqV9uj8vtwEJUrb/wBL/wANMLsCoGTLKCE6nzQsQS705iClbUMqBeVH3odrEFBI2u0mWASDkXuFOWvRzJpHzrxViiCwnS1i8k/pTB3iGz1M9460AO0wN9ZPa1ppGE54ChkGpaJ00oWFhIwmO+1KCZDqjxmdsUJIwGQN500OlTRF4sNqAzgK4kzGaPmCSW98dGL1NKsJEptana9zlODMcVNZDbCHv62pVC7jS20mgBAWlo6gUJkyUjskzPZoOsCWZ9+vWmSoi3C7znvisXA2IWnSMImAR4PilwNWSA30fxJGzUEPQiyHTRvmiZlMM7P3mhBJQD+KV5XagEGPtUEhxUOEu3UoQSMn80CXFAsGDT7ZKyR7qlYSNn88AusFXMvs+6lfd6HSgEn/ABpfTGQpU8kHwRmTM85ouKIuM0iA2jF6YAOybxwbUjkmzjrxV5aWBdE50ShPghCxmXYtTALJBDGDE8eHtTANwYm3TOKOBBZGJ9ZmhSk5Mi2n1pE5Monn+qZFGah19c9abhpYICq0gII6LzntXELmhoN8XovEEtDIpkooSlwYbbH63poS2UFzoRKuvSokaQLtHWM9rOvFXtr6EfDkdN+lSPspFAurrO+1PorCxtbDJZaNSYJl/wBHpQXXErOOmnFQIeeGN6moTRCZTW3vSklagPrmhfRuzAfRTkUAFkjRTPWpHaYvH8FXJBq0AQEH3Chwupo0HBMj/EBLSLwm33AC/wDlCcY6fxKXV1dCg5Ll3+8u4PdSUuQ1ei2NpoGZdhi8dbFqJGiopT1XHpS1CiYA4B/c02MkbF+ixcKF8yJWes3NJu4oYd84pjobGFjk4mi3UBUg/up1HKiybpY6ULBjhpxU0ZSpES8p141oVXuAQi0THfegpAkmetBnUkGBNnE0hJoBnnRC/o05JJMUa32acALgT4p1KtAC7785aYRqmQQHZETONaggoRQJ9GSybt2mhxgGE1GZjpzFAuSmZhAebu0tN2IpHBvtUjpuQxfnSgK0iyN/OJobOgT/AEo4Ahe8RSj1YWrEKYUiHRJPUNqREguOQNYfMUweKSYergIvpRFKP+CrizU0AEBB90V2EwlPAXNdH/oCWkXV0NvukkhqHe2an/WbS27VoAQEH3ysoC27SqIBekUCWZKhltYtnrS4MmFGfFE4a+McjRoAkbFJMUwYTlmhSAYbiKnc7DP9pgLMzL047UHILCCt2831ostVtv5plYEDe15/NJFsxyy6daSYUm5G/m9Li80Sv3xU0eCVjYzSaOAAB0TNJnCTetwmjRggdgbPLpQBSsjZuEOJ0mlj1BKJuztzioTaLCIxZjsbxTiHxjXrtzSsA4C0w8+lHKl4XcLrzOcNHMMF/ZUiEHliaBBbQQ9L+lWmzuz7CaPMT1qSBiOGNAJj3pn5VciE4J/NEXCLmcAvG0RzNOpaSyI60AEGPvFVQi29S7+5amWGjIZdOPvEIuCmeZ62qbKHX/wIkBv8UCuKvqQ4Uz0z60rVcZiI5dA7q0Ve0Nk0XybYfyVCkVPdgCmAi2LqFjyVZvaJIJc5pbXWDhdNKjUSWWFPbLRx+gcFRlFEgRXTl+aO7dprb30b2o/ZVizb4xSpEBsSy/ryNS7CNlkxhcHemrDEJAHJD/Y6TUOQEmTtQbvdLgHdXtxUZILZRwiJni1AYTaGPms7SAcu5zvTckJS3OdZjmm37GQkbHFCAsJUTf8AHFTAXCyI72LclLsS0rBxr0iSoM2ZGYyZlYOqkVaQQqBdDaX0Njehug1DdGPmgmYWMjO3xWcihbc2hx+61HXMp1OQ23yNCmhkWIoZJPu8omJ/FSXasjp976KgI1ikMW/z98oEtipMUmgpCyl64qfIu4qapDAJM5vrWCyd0l0Iv7VE6aQuTYKQoOgYetCIBagGwXdJqyKgUHY59aXlC3YpN5/WkoE30QcTefFTGyaJh61yqAvmpaJmbWbce9OCBJyDmEO+KALxTZLOfUo1Q4F95z80AxtAWS07R81lvV+AnTjDSlVlujBosRRURlHNcklcLbxVxLyIfAvPipcwWCI91Ekwrkp6j8U/QBeGfFA/IH9qdSxnPx80XILGChxOlSJ0b7E6xntNXhdSYWtjPeos5mTYNxL9rVGQzdF72P6cU5CrcvHWIrUS5ERj+pM04TS4tBtN2kR2q/jLKhN4PzFIFjINr+8c0X+4UCWxUmKQYN6Q5BrieKw4J+8igLrBQQuyuahsVBsUBmHH3iBKwUCywaH8ABEkqdncD3U3cdwOiHQ/ZKSDkwAx+Y66VOQlFZuwbu/G9qEsFlvEDvzQSEraDwb8/qgunWrBb2KVqgTEfuKEVKX7cFLyxMAsMWoKZx2aas76USFYSj0qIqCEQ60QBcW0xNnqXxRCdrJRLOtn5NmhpASWwIx79Kx5ekwwxjee9LIGWciYFzG2U3CyQuWTPcwmzj2pjsj1pM+0mHtU5mObjNnShBB7T2xUqBthYB849qVqoEBFW8YTijLswXEvWM40qSewRJdcT59qeUMoME5CznipWkQIQXrMwRgoDSpAvzoe9A7Ai9i0bJR9uZDBSVPNcJMz1GnTIGTHWbxVviZbQ7XaLO6DKpAp+0UCWxQLmzQfwQSEkq+71ShEkufcxMXLSrxbrL/CVlRuqVgjZv8AdIEuKCvCbfyQDuMjUAwjMGtFZGtbf1oZPiRgmgNIm+O9CBRggw3u5h1wNr2akJAlJlvvz7tDA45u/bUUsWxaojOpT387aJQGaSw3x2/NGzZ6jTV0axPxTTJIidtYp4IxLFtnssU/BwvIu4RROaTGkcDB4wt7OjKEERSbiJ826VIYDqw0/B0UpEIMxeOvFSw6jTvjvRwBLAe4bek80YEoEmZubx3kPSjGjeJy731nfWkGd4WE127XqDChLSzyNvXFb3mCHYtM0TSKBHKjrbBrVxQFm5Mcv7aiGBwMTpe3WaCjPKXF7Fja63oGEgsmJ71cVkgC48QUiMxiSviKR0dplhqBnwHvUsG4F52oDhPsUCXFAsGDT+ZSnvNGgwyZHT7e9k9lEN1y7/yAQ0Jxjp+X3ACWkXV0Nv5iYVYZXC5vQrKNl8m3GelFGwJNEjwcMvSpLUthdML3d84qZs3KMZ1lscC1cPqom6xHv3Gi0Nx139HxQFkZsc0okCk1dsUSQFXRGSh2G+vn+qlEhEe0R8Vq6U8o0TKycxSUUSZ/NEEpxeoMOp4pKSzoA4c96uoIwQ9wLw4pRy0EXbkg4YkddmsBidxE4eRLO9F4TCLZOj5q1z2GSMqZHMkI0uXCKRMoF1fnctem/pSsYnOWexQGJnCWOrDaInmrhcwGJ3XKYjPxQIFJRvHXT9xTyCFoIhlS2bRa1QyiQDDOsTd+bZq9JzhCl9JtU1QVzfUsWJe5Rt4FIQBESuNPmplcQI2OxZO92rkzNaRzGnq6VAEYG5DVQu2vpQgO6YO9Fk3lP1gEtIvCbfRluMDWruH0P2qT/gohzq7/AEYdzZt0oBI2+1AS9jekXV0NvoOLVIkJZzH5c5psMpbO58uvNqmJS4cWyfmr4pRSQ2Y2dB5nal0GUNwnUIp3UxwhItJmDp8lS9RS6xEHtNDQwWAPx+aJIJEuu1CltJNBupUu4lLmSiHSgKyMev8AdFMYBnmfTNMKSo7B6mtPdcs1WEnhyaU4TaTqW86NJJkNpjK02eubUDCDMly+GlhtAiak9ef9q6BZIS27HrnrSqJiEY4kyPLSRZLOUlpYwc2nWG1MgVcBPcdb0e2BQXWxxxIUQGCQlxJ7XCpOOQWNW1i0etGiCrKJdUbJtaKWobZ1OJ+b0TESQZR1v8UoIFJvXM5abVFAjKxZigEMJMELXuF1oShljMsO1nfXtTBUKbp7sDGNicTQ3YCoyc4mc4+KCcexed+kerRqrqkvcze5sFAAixMg534uVGhNkSl64pWEcXTH0wEtIurobfTAQ4qXe3bdfs0XV1dqAQd3f6dzD6GsZsMn2SRYFjMaUMklbg0cfRQIUAxILGE5m9uetQEm4L6zq80RWmZN4Xk+vXtTuAG667F87UJEyAmFJ09fFMCOAjgIdr0dEHPN6WEBCrOCxE0AzUTE4JPzTYrsoetMChSPYmgMMRKfLURAEWi+maT3Yt0jNCCmtptDTWnEG7oLyknUqML2EKPpnrUmlgCTJ1OS0bk01NIk2tAhw7b0dZdIILO1YAhfb3o0GVhcTv8AvFMy4STh7UoPYBXOyrftqFpVhITa43nqYautnCR5IfV10jlMgWA83MZmgtw1rDLrMNJENliBtAX0/wAojRNBUPW8cXahASbDK7aYb69aQQy6JZ3oEDTqpooRThImO0+9OzIS7j19adgC2Dhyx3oKCLQOyW8E4d6D9JcqJOW4c22xVxsGKE4Tx4q4M9jDsu8eu7VinYbt9Zaa2BYsBe0a9c7USJbMhI4CPWh9nXgh1KBLfzSKXYzBipkkvST4W31pX3mv4UAk+wRdXV2oBB9UOCYdqEo7XR/7K2/9L/VvwG5UooRnmorElrmPpFRmsQVhIkISTvRiZukF6BYPFJ1gxlGQZv3ighMjZFgutld796BMCi0BgzbIXPiiAZSdPzOtDyAITl7+n6CUoFg2Ntr2/N6noO+3jTYZZp6LGSnd48UGQnD60UlSRDERBE9KGyQt2I1UQMRIL+j9xenUSPoXirAYDvJ81Y4lT00qEyRvmOj46lMSV7EtAqOAb1G6dKmC6mReH73qFQC6EbD7Wo8Ii0UHgb8Ykp7lLrkjy3KaEognn2PIdKSb4gvDk5J0kTRG9DAAoVF0evDDvOVKY7CU9Nz1pp81hu8LniGpULtG4TwYnFQlMiEuZ2vmiYMRZygMRntmiZXIwDOwrGSIlD4f8oNJJFhOen90FEAAq2A1W/zSxE7kG8bzOkuLS0PA24PjQpewsYAu5bzxbtRDksyM2sXeAo45CVG2NtV9qlmEZQue6z0qVQiUWJ1dB1pK6+1nXT0qFj2VFe1ZZS6df4w0OQKEY3xZnWmmUlun2ErJHuqVhI2fWSvK7UAQY+ugkJJV93qlCJJc/wCQ33eh0oBI/RbCCYm9MhAcuaC4UiwDEUE4K76mfikkYAYD6RN2b8O3Vo5BU4nX4pmEvMEA1denNKII8TGODaKOaViQdLaU6UjwCUZ8DRZCb318Y96UwczTKQTOBmiYyTJnfP78UKEBi2amJm0m36UVHci2RWfSgiAc6lFuNeaReeRsjLMbMP7FWBRsXwt0uVpkrTlhh6ZpCAalJlieN6b5IQ1pLTs71DgEjNxPIC9RKIwslSQZs8XE3PWzxAwQMBs7HTpetQLIWg1JtFt4pMKumXTpkd7pQrcyRjFBCPeBHOY9KbXMwJDqfFZg1nVvK2HX3tasgduxNBuC0mHN6KLwYI0t84VFW1ZWNJkR4aVxEIm53T93osgjncNokZ9KRmMo4WW0htazbaiDLF4e1w+Cjpc8/nNCraC7JjnbvikpeC6UrXGp2pkIDlqeXW16JHuBiRz+CnBPY4BObuuL7VbokkqgW8dcfrWDhagWhZne+Vwa0nEWQAWNUv3vSYAwMWJdVudYb1AYXzvQjpciOooiQJZ+mhkkqIIzE3p0BGSPWggSgsBQS7SsPIf560kkgDAfYgL0Jxjp9Qq2watAEBB9ksZgLkcf9u4fdUtmw0/mAlqeBBOa1gvgUSgFRZspJmE8afThrMBk6RJLxUZVWDg2/WoBAXYlg48g9ioygQaxTdVdIg0L0iAZxz+xSCbXSbRNmpEgGZmoFey2K0izmkRkOlylEzH2KFUCj2owghjvirrBZuTcn4aiIEzmIxWIyq3RRQM0t9LgcYKjhL23gIc2nrUwIrbHf0eKGE0BNLI9RBOTmnZkQEypVGxMdIKYgGgFwncEFYZhnOKHLBEWNOGkMD4IIfileYnIk7694ailnCSfXT9amYQuolOT/SgqksKS3jMTqKUdwl0sRMNvfRviiJZi2chtZxl0nZ0VMqtJrgfWpw8QZSputzSAlwQhHUzRkOJBF5vHFwqZTZYQtpMhxRaIKfJtKSmSG42GeNChEmE5TxNYEquqwvC0DbKC5bdbQd/NTnKQqADiPmZqcKshODqz670dU6HByrhRxIBCC9YDHPtSItVKWDJF43tmmwAkgXKI3+fakgUrjP5/FFMgkEIG16fpVLmeCL9qSgO29KGyWIGp0qZRK6OJKTAxAGn2aSQ1DhfZqUgSMn0VVCjU70AEFj7cBfOjtQlHbu/gwW1llpJi68E1CAyQx1rUnzvNQWFGC5+9KgvKu79SID+h1ouiGdVVLa7VbAhcXI60kRoMoll2NW1S04kPQ5S69CnQEKBMsbZxRTMfFQmzLGKQxHWmRjNior5OTRpA2iNKlLZXpNY7EVJApD71EwJQz3PxRECSWotxIqdhSjHBO/LmhkiANjrvrNREI0UkA6wq4QqZCWDIbBwHZi2tO4hg1SJfN57UwCJckTO2nrRIo3IWTUqNA4JadPM96C8lzljdi8VAJSJKZ9jEcE84qJByqL0eDS2z4q9wCc5CHEaJmJikp5hCHnTWoICJ+naIoEASwA3XnSrqbNgsJsDMW2iLWptEAuxr0HGOaVAocRJfZoREJEYR41ppIDqKOi60HoZESR+faoYCLOJj1u/rRmD5kQI12jrNOZSkmlGJGu0XvNIESY04Xtb9mlRZi5AHARHelkArAgeC6nJpJZJdIA7XaVKQwjWmQbmY08X0q3ugJiWSuODRNlEmUMFyoGVV+2QcLqaNFZhMj/NWwtrd6ACDH3KCQ3KBIL+z/rJhfUqIBwLOaAvaDFJozNQqBvqu/wBUGhDJOlqAGRFCAtEwnETSPLFyN8FGUlYM/wC+1RFLIAnLOWP21OCRkqiznqXZYMtBFMBsu5x+9ZLGBuq1uKFBmNFKZIA9qhJqYpjYsCRqdBN28/rRFqu70wZizqUzaIgHULzUnBSbFxb1oDhfOoCQ8xJ6O9SZqDGQxDWJzAkUxERYIhlLYbJpLpSvxfGDChsPVEUa8tamYwej6pKQZjMUANky+s0TCzkibtTaj+IRJpPH5KKqgYE+Thomq8oFLHI0prJLATFMwLJwwVZSAauxwtJ0HrQS+MGhMja9pHNDBi2JKuczDHWhthYll760GSWUQvgttTPa6kCDra4TtJO1D81hgz5zQJhKyYLwn72qQWOyVx0vxQIk7gPrYKBwlLa3SiJa6ZB0DA9aYSW5ACHfQO9SZthLdZIfUolkJJE8kYscBRhCRhsQPQEPJUUWG5CbQYiNUomosEhbuG7mngvZgGLdGhNS1gqiehaj+aYEy+aKNUTIDpvFBHDKIzrbT7guCYShDhdHR/j4e/71AJvTsTOUqRRGg3qALWZ6UpEWAxO9AEADj6x8Fy9AoAxguIldWDSZaDQGEqQYFgxu1dg2utp/FFwIECmOhTLvA6GMmww42q0N0Aspy82P1oiiVzA04N/29KS8kuwOppPeo1ZWxrN48fNLhIIG+aNZsSemKJYyJ9P7pAJQWOtMUG6KU+E6uMgI1vNKWMJ0wZ+EealBzQZtFouLK1AFEMEzEF9ZiyUENyIm4DTpRhozzYOk5H4pEAHyTrF5VNTSY5hDY8hUIwEIn2fig7LiYWL9HSmAxCD2OYsOpnSikSciIbvoZ6EbYqax4QpsRjRpBdBuN3jxU4CuSq7xI+lKRAObwzfy6lMMQG84g3NKQAsigMaozHrRlWsJdwm2mm9CZI7RsbQ0ixMX4R66W18zQoIF89juc0sLInD4TUGdoSfTaiadMmHxmd6ZlnIoEwlmfDTnIFlJcxpQdpomNbqH3pPAMyuHaLnvUBGYBA4QPz2qVcREDAdae0yhsuZDEeJpEUdgzdOM9qdwGT9zUhV75/2iMEGDLWW8UWYYiP3CCQklSETQ2vm3/Lq9vf8AesOUIkg1oAjEG+9RCQgYDUqxAx8UZZiAQFFsfXhbCWltPNMYnkSELp/XmpPBB3k87XaEwe6c97E+aI5M05IIhI2nSjsVREPUGO1r8VaAtluKub6rp4LVfCJMGY0NIzB3qXBkxxOpzF6mQS9X9imklfBjF46UkDDcrZz8BThBDcXmA4unior5noWSSeketEVJm6Ms9IDpFRUU5ZLaWNjZvaoTUhG8hv5elEpa9y+0nqUlAgSTD/lmjRCzDianqC/CRMd6noIZzE/FE4gxFJe5PnNMyE43hOq3nOGLk1CoLE3chcLqPUaDFhZ95G+4lQwBlVZjWy57azRwWBIBsN9TROMVdpsS0jhvanewxCGI1qOEjcg9E+Spls4khaMSxeaROUgx0Do6mZqSkA9EdmmJKYEL9cPvttUAVi4xIcsY9KASmyQpWIqskT5PiKASWYmANRUzxDU5JwvctzPFD4aEhcdBHSmJYCYR0RI7RenBJmYXqEPQq49YpJdokbU0KZZmZNwJP8oamZs2dO7pmntnkgtEYuDEeaSQLcSeIQdaXIzTBnjejhA3mvZiS08VOHYYIjdQlRWE+3yU4ReKFzHXNYJsv30xkYsZqKiInmroIDEZOKFJLudlBCP2EkNSpE8F1tUr7BQIFC0iD9MU98LKZk6s0UQSjceFNaUICcEz61YYJXNRDgXLZqCG1ZMc/FT4HO5qYL17G/sVeUmzQoSJhrZgONKjMhJlaZ+KGE4U6lGxjWn+MLta8qneai0IjtIwTO+O5Sl9hd38PSsYIAW2lBQEP2aRqg+9XUBEmGLN/wC6VgRRISLAk2zacTZjNNMEaDdHB1gHMT2aKPFg1Em8Yc95K3Js1XP+XOZpEsYITHG7HM9aGJ+EKyc2GZvZGzNA1mgiDyNl6h60HgmqCym413zUBVF0UI25pUIvAknCa0SIoJxce6p6OqSMNGSJvUiytkh6b+lLEBskQTZW23FAi86HDqcXNqRgAiZkuwWojhkulF8N080+YpvKC0QqfBFLZZWTR3ifegRkSva7iNPZpyEGPhEW9MMhSxPIlHQyyFB0F4oS51nhGgbnelZipAo+amS9xK8B3DU7NEpI2qQdFYWetTSTmwZvkyvilLZxkG5mb0wUhxQC94HbE70JTFJEoMmv7mj7YCQxvUQCKNZrQDz/AFQgvmZ+8QFcFK1E6CYpU6i51qQTBK1IK5O3/FmGHTZ+wajJBZQXYbd6AtMLwgCt1PRtFWKU7ImNA2oELYQwXoXS/d8UdJoY6B11NAotsZx159adBAwxz8U65IG8e390pIdJE50qaETcaby70OJszr1oJBMkPf8AZpYAiPoR7UIhE8m/tTQTBd3f3Q9lhE1ioCwQDGc/mmhI1TkiaCFiDJoO/HtmgjZkmmNbcOaGPkorYqJIvE21BTRpXJEd1hcLKC5HkpXowzmEO91rUbMAsQE9dT3pMcSFFZMpmO8nSgStRW8Dz39Eo12/L3xOTcgeKc5G8uQ74xpYqzmDgBB00fJShJuEExO1reahE1WECztp6tWhEZRmeL0N4Pk8v3WjqEWVEjP6g4oodIQRtsxI9qekLCuZb4jtRBBJEoExvkaCR35COphCiddReDfXyoBF5TMT1kno8VANopO2iCR9aTTARA6mKJKu+8YkGO+Ki6dIHISQ7TpQK6ABPM60UHEEGXnM0TcTCp6eCnOD631/ponOe8APFpnxQrdmIbW/o1GJBbFv0lD3qGBeWTsmAxxR3AQDC7N/tVlHVd6ACDH/AG5N3G9ALdzb7q0AlcFQk8Zq6hB2q6QuqjYocC//AEAhJKl3N2pQySfXJIWTYOKkVmIbDG78VdLPLDY1I0gCocisiBdgtOdX5oqjrhTXHJvjvmiG2kDO0i59Di9EUpYt7EoZb6S+rSgBbyYu2tmNdd6UsG5ZK0m7R6+AGLq2OXHarzgJL3edcU/UkJMwMk+JqUSTHcyj1o7wc6AX9aW2SgDdCbfulKwScPUMR0oTkGy2FD2mZ4aO6Ze6hfTJkeYSSjEuRe2bcel704RGFOpkRpEptFBEjfOQnUi3SmanSpvNZ4vnGlTCNlbNkjmEpKtBejtNl6PFIAVpFWMJNh1Ee9Ha8yQ3sxc6y7k0MU8VERw7lIAiIlm2Tjv4p4FRJyOjikhYcCAN42fegKMuyIe+M+KwYxlkj2phKJMiRrnftfDvSPihZMHDb2dqn1+sfgzfi1PUAIoYLZigKNsUEm5xzQS0sxBbzPpV2JRdk0th2mSpsQrIpyWW5aYkDIsTuMPpUKgFxj2az1sty+jQIEvJ7jMlGk0ITAum4qKRWTJbnae1JyRYZ1GZ9KmrtIkE8oWrL4XBh62KhGMjBB7xKtWi44AKNpJpI203Aksh08nSpibviJbyGQv0oQkBNz7O6299Fi38ZWS26rsEe77cJRMmjUDAK8VKsQLKvActrnWgLlCdGgwP5Kc46/hQC31izYLk2omLS9FAeTBXrQ12YWBNpXX2pSaGCQr8becVBVJa6R3KT3exSvpgCDxkvpR5wjdLP5dgirwws5YG+6/0UUoBINwipaYBZrM4npQ3rCR2B4lXrRgF4sg8DHSjHYOSRI7nagVAu4zRnckqKMSeRcyh5pBHlCQqnWaBWb3shEJ0tTcbAvhi13fT1pgnCZMiQjV+hFeE+Zh7UySKVld2b8bYo2EkBqD0G7/WKEenC3WxDr7mZpMlNSnC3Vo59a1ZG9im9nS+mKkG04WYlzf0T3oikCsL3WQZ4bpxrVjcs30HUw+KgHBS2J3stNBzEWCd/wAy0lLTCshO2ntSu0pJwjTMLr+xUCskYM8DZp4I3cpvtfrnvVwmYbEjMmMcQ8UoiIwyJsuZ9aPqmSr7yMaaw0apJzUdlSNv7qw30MthgMzo+aZjIi2gyiXpRa8AEAoEwU41Fye7PxFSJAZBgKYlImipa2NzqWGo7PKi3RpJeO00owNk6Y64d8NC90BCL8e1JNgdXHOnpSZwYhPbTx4q1CgulNZXe0Ue/gDkNHXoxFBgqAhFmON/Ss/7X0GwKTBt2qIGv2Ph7/oAIaltv/S/2qTCJpJk62jSTIKvUlLFTL0psSkYGaABGPoSsqN1SsEe76ryvIZaiRP01m80whgeRirAZjNKlecwmggggvP9VLQjdpNzE1HEUZiGEIzHprQ+RdA80IIkXHb2IoNLv0ATwFCmPgYRc1LtJREWfibVAQOS9yDD3ojFJ8axlxlV6JIHEJ7lz3p4MNxwDE+bJV27qc/v7cqfJBiDM4k9E0b1DZXoJysiZSb77TiiLKIyQb8Yi3i9E8YIRC92F+MdKk5lk4aDacxNtKaBQOXRztNt6SkiDAgZs1PO1RxJFQMNzPP9VlA2KOLXRPa9FIYKy64XTm9ChVJtj1UOYvuRATqfiTpUQCdAhVIltovGaMIaVni4i6xkie9SpVvZk/uiYGCIjXrQVEglgs2vxQk1oLzuT8m2aHFMgRnkKlROyQjYLDnbbagHzSxAMXAzqlT1y5e+ibyVPJDNhO/WmIB2JXYs3x0LdKywUMJjuTf3KRFsYKTxM0yMcJS94+aiQLTsSgaZjO29FCRcam40BSOAlS3azQXICZEV1s3jv2pABs4ROIxc9TrNZtFeGImYjaGpQU0gFkd95ztRVTAR7Xb2J/bU3Q8hGY5LP11glxV7m23f6aN9/wClqASfYlvjYdqVtJLruVbCBBHmoCkEwAVMMCzDWwBqGtLMp/f0gENCcXmn5fUBxMlQ5Fyp8UPNDEY/FRkUjb9vUEMDioRa2+9BeDgoSMEx6UwkAYnWmx0rjar4XKDzrU8AS74/2m9yWPFLmKUltGKkIOCyfutqXihgExd/NC6E7sYRifzWcmrILjnvbvQ5krDek9b0MUXQCTo+5tjFLPvG4Z1/s6NShCCF46ho0gNBFhFnmdcYp7lEBAU2No/eaRJLZJUJ3Lj2TWiuizJmU54d4igFK5bGbTmPSaGGTsnTXluvHtQSbGWivDFlii9FC00x8/NOwCwF09f3tRJI0mAnaYtwwntRVlgSGz0yR2oaLXKmVKFUkTFyemnWs4giJQk141dYq2WS9BlyLxD/AFU5Ekew0d/NJZmJF1BM9ulJZibYS7KBDxmrChJSKmTEfilaQuZy1xUgJAxIbBpFGKzkqCeIbVo0LusMLzakoZgAkOUvPcpMBE4QprclKsmLgEhbJjNEAASBd2gv0xSxWuvCRpOnapH5EIpyFp7FKIFoIO189c0bygGwD1ntajXgCZBO7r7U6hYyJZsk3m/NCaWT6qgS2KBU2aDf6t2SPdUrCRs+wVzJlBuobCB0vNMRFzeBpiWRXIYaDMEWgNvrQ7mzbpQCRt9JxT+GSAmzO8XortgEHyakQMNy1AcJTipQENMv7x7FIAUOE556VmWV0pQ4yA93FNKs+/b99KZAWADkqAhEgz7tXBMmxtN/xSQYWvaye3NIqhDpDOvZphQJlld+1RgZI8C5+elYjG6SyZHx80wkEw2bJJ64j8U1KE3Xd1Sxv3WVNJ0eHNFJQUCWlbs7lRLkjLCOi5O3NPABiNYs3myZhmRsyXJoM0wvQmTbrxeho5XAl7VG/fPWkiBYnM839aNGxMSnRzHkqJCrApEJonbne9YgFKZB0nRi9k5rbMhUoMHPGJxfFFIosNve2sTxFZ5CLWbX0vb2pjJyCZpfAG2jD+7UOUHul5dRN9zXhpUZITVLD7XJKkzKwgFc389aFliYABvWr2w1OjpHWI3p9Muizi4xGpEntVpG3aPz61Lici781aAzNht01qdnKSShDkS/a9LDCnDtJZ96nAhcWh7X+KmAuAVDjQUjIpukW1hMtdSmSAwK2A5ZnrSwsDGkVBkSziW4c+aJgwAihcIrnZhpTEisuTyOPKUQ2o5yDIyWNePaizdxUw7MfUUCWxQLgg0PrgL9nahKO365syYvKaWAoXSiJHOv2N3D6GsBsMn0g2QCswJi/wAUIFTIijGl7e9Leloi64HTlKOSy8UoqhM09sgft+KJLDsMXokQwdKhoLljiptMoCpIrJPT9KSGxyzNv8psqxwzEaL+7UdlzC3gWfHxSmG4lm8I0nZxQOdA7lKQrMcmNTn3vTWBGPFnDHUzvQ5EJ6CPpkpsFLNoenqUpu0kFtpzr+tXIzCMDBLJyfHarjAi6X2dU5wTm9XHIhD9f1smKFQbbKSTdk32ms8hCxDrM3E1zSAlCYUjFkyeKaggJAbjW0bLcxSgewTpI3Fz1OlQIW5oAb6DwlBF1dEANzTuWqDdC6h6mtMBiDCCW81cRdLChQmqJmDG3Nv6qAUx4G39T1mrOmUQhi2EunF6hnuY/i/o0FIqJihIsNvASLbUcuMjS952X2A3qHqf6KeMU8TUkiP7qZIZ/ZpLaC4gHrN/UetE3GC0szoOY4u9agMEwmD8valBSILqwbRf5qJkkLGHqPWKSyyyg27Ui3U5GDUnBJoEazVRHXS0aG9KwcwW42Z628UFEtB3TstjoxTK2JA2f7I1v9NAlxQlD0NvsUEhxUOEu3UoQSMn1JQYGWkkvQMAOn2YdRh2oSjtdH6ItKYL2qNCU4q0JaBfDFNmE8NgvsbPFT4xTMPu1GrD1a0lK3SoIMme7v0oSsABfvVgGA2PzV3JlHOlBE3YjzU56UnvloEnB80CBevL/jSXCQnWf1qVCiQHcdDfHmmrNBMYtdu74vUQAExmRv4KvFj2iYFtd0+bNqjVh4l83zrazvZyNKybBlsk23O5F6E3bF806Ww9r60JohIyDaSNHH6UEjhQ5nThtRVAG4STxpzmiATIkk9LH4dKlZXlvsbsuHFynmCllAdTbSbm8VBYEXCPNopWCYliWJ2G3pVhPZzl9KcIuxBm+3SnJBN0KmYLYTTb5mmFsXgiPJifItRAIgrCK47ftqFoRJSEpomhtm9NEW+EfOp6lTcxJFlSIyRxo1OJCBELWbYtxvV8JX9SjXmR3qcBLGL+KhmQhyfzSDBtwJB6H0qO9BKs+8mSkCHVj2JI80uiZLM5qi6cRVgN7bWlactE0YRLr+KtpJG4QYkvEdeahxs3hDQTCtDryw0cIFLgxGlztVllGbmWIzalRECI5PogJaReE2+0UOF1NGg4JkfpKqLNTvQAQWPtkEhJKvu9UoRJLn8wYFikGsVPdqLqw2G9TSJCsJc47XabPXQTyxwAvBmmAAHCn3z1q42c61eC9gM0RhIJMxF4U4MUoNJwN0ZfxSQQAAfmoErLY5qZwOrdpUQMKQQQ2HIx+alW4k6mz0pgxYi4iXGtpI7VO6owJSDBOsiR1M1DdIALA4XRSR80UlSEmQCIsX0Z1zRUvAktw1Gm+zFGRWXWWo7mza1raqVpByCNd3SdTml4wYMq6mSMPmrZKMA3/vw5s3pAD1oFk1/W9CVuL6RziSz4600d5S+Tm2hyYdjNXSvmwA8K3tUAMOJLUZQmL62OTahRELCOetNBQOJjB01/FSLepC+b+lIiRIQYj9/usfrEyHEaNv3NQUncQcJ0Yp2URCEhg43GzoxNoaAnIiQFmB09nWKSCTBiAGSX06nJYYD7Vw8jyO9g6ZoGerIRdS5feGpxFsITaF3SaRAlvcs315pFAkSOk4hsnareK3AH77U/HuVp2jemOMMALdi8TqC1FgkLBLWMqNLNZIxdPnx605Zk4Y9KSaQ20ai3Cw2LHoefNGICTceCOTXiO1aX0JlIxfprRB4eEAtG5k19nN5vTIljrwf6oBJ/MBLSLq6G32xXYTCUg4XR0foXsLb96CCDH3Kl5TRoMMmR0/jExctKiSlqilI4otQLquHxQ2GoJjkSRPOmkUKdEwVidJMu7fra1CkhIohjbgZ0N6KYF189zrR1bxgnC5X0OKklFUpXVdTzTxkDaOdfVqQjGdaCmcU4nTtfrSj3IDiI9ZtUKlFZ4yRzrSVIRTHEnJH8qOh2LVobdJv36UoasVN9c5M9Si7dkYUxenJIgbl9xLzrxRDNE1AzM7XdqIwSKd95Gho+Smknov70dKhEhWw+tBSSSdPJxPcaBEhEl38bz6+KFWjIzA6uXi/tTPFULxt9Di9nvescAHGnJN+0tSbMYlW8H1pXFW6xM74PaKiDDWQ6UoTF0R3q6WsZtRIL7XQooKbG+JP91pSGwHktnk/d6eTWgQQp8WmphToKZuRegWQxIpGrbMomLgziow6KBGbktjAMTF9qmhnFVHBcewkyNDXKgEuqIU3M+9X4wxLD2jbilCWWgT4pFJFIxCXW0R28UoGDMXHManRSgCNjZk1uNk9dKVR53FddEfWNqMZTdLGqSR7x0rLxdH4pES07wx01KAWZXW3vQ6AVlJjXJqc35isQbCLRki09usZoFmTEEgN7OYm8RJikBZO2YwxZOakmXkcym3TUqVkjdvUrAjZ/EhfOhvST/i+4AISSpcr79Shkk/j4e/8Ak/bSXLbqlGE8f9vZPZRDdcu9EQQ8UWVYSFz3Wh6YIGQfFT4vIhbbcHSFqIp1UsiwLRMb71EBcOABackcyGvNTwzmlhvXeXC32qRBmymJvDsadahMqBMG7zSy6G/GavoUDBYl062pl6xLcOnzUJeZXSS/x1tUQonEM3J7REOtO7gckIIYoIiBDk6r9qYhFGkN+iba7aZigZyg4g3DrtGb33oZuSsEDQnOz5hoI7yeQixuSkVEE1x5Zubzi3bai2IKRuGUNTczFFQiZs4BjvbitMUVB7uQ32fLOJJWiRWg3MNm29kmRnIOTzh4zJRTEFhLDzf1qJ0Dcsfp0qyUmiHbrUxJiITNo3yeUo8ljUF3pQpyYnMchh8UiM2EwNktPc2aeRkSWkmQuM355xT8ybM5b0IcoY4bOefxemnDWyyL24mZ4pDJZNtRdb4YFtMJapeEEFgcItxlyxh5ZAQsVdsGTS8yZ5DRoJyeJlFpkZkGzvVxjAkh1Dl4Ml+KhGGZv+am6RFkt3Y1ji3ereK7F9Fw8dqvkBIu+zEne1MqlbdiEyTqlQkWlmS/etXCS7d6Vtg2JPDrSiAk2qMgZYk7jp61a2RRtC82ttfRo4gEG4hvAsmHep9VgG4Do3NzJzmrK/ggjbGsnCeaAxkTNAIaitds/wDYm64N6acns+7kpx1/6WCWuX9/vnMJWo7yJtFR3FtqAW1y/wDRSi6SVGEQTo8aFSQG1liPXFIRAyRrTZWRTCZvolXyAQKygXtpHATN7VBMWoNqSAZud2KcBN3b81IwAP5PYqSoQdZJ4EtSQD4kkQDpa9YwOawBx+5oSIZZdAWdwO9L4YTaEgpoBRNSn7wBJM6FiMidzRoQsTvDyOdyc6M0+SG2POozPJnhY7qLG4u1YY1v2oCyWE6CI08m196kHC6rPF4XtvGaOCAEXC8e87Om1BWEekI5iya+SoJBVGGWztrG3FGFKg0y4fig7VGy6ZtWLFeFhwNeJZ21qUbFsAjEqz3vWXRrHzQiFG5XoWTrFJRh2Qi6C8e1BUq68ppP4cjZmUpjsiEznMGnakGAZCdno281IkUSBKE26xKb4qTypAWuGuzF9ppEJyCTSoi4sSbDmnGzMhg5bTpslrNKRzURE4U3DAOjZtem0lZGZsLF0kkbOHaj8nJIal4jYw8ZoUFEJnvzv5vmgMVgEIm8Y+KQowZehY3jzVv6X/ktg5uBvTdPlIRvEjk/QpKn0I9qtQ9QvRCExvC/Upmtl5PikzodSiJwyGEvPX3plsSjEE1sOZTyOZzTFzV2OB66JvtVoILIRMymvHMlqt4WFGzycf8AFICZqO8ibRV/i21AFkv3jQtlYqzI9GKkEpTm8UgE4zH38ShIpYySOKRIJfX+DAMt6OSxQZwcBp2pgshmIuemPd6UMmLJHxFg805U9Yifmmi0WbCzvo9X3oeS9fRsGv7u1kELWe9QSwg31eaa0VDy2qwxIM7ycECdPU88GFu1/fxRvjQAKI8fNRGuQDB383Vos6Q0aMPNl6FW0IEGV8eMUvLTSC7LJ03O5ekAsxJEcp9saVaPeEkToMxsJB1oAKYWgO6YeuFvbFAGpUSFvz6ONWnBRxCzy2E7j2ahSAAApqG+H1piBumZT2eNS5tWYWbJZM4bHpuTmoJtnEzHb971bH0KuxQZXmryhGAumzUrsxC5jzSi7GBPm81eQReRtyFX4ZEoMjfD/nSli5YgYlDPtU9lhgQuN4ec1AcpjeekcNDnuyZG0dzZf7qPTyKFKEHARE3Eidwrc2UEncw6CNKsZUgyFLgN1YUhIyRejDYhEjdFoHUWS9TKWGRM2iz1pKVMUbmqa9b9qQMhmULtQynqclI0UQWldFWTsVc4RGRV7MAX3J00aTJoIIHfKeYpFw8Td+PapkBDOSr5X9aOHSGKXDWzmGkNCoZEeCLztrSYCQtRTRi8Yva2b1AyK7gyWyTTp3pPKrsQDojS83N6SUcKQi09i48b/wDEIGKkksGkUBAk7/e4HCU0yDzQgpFSjB96AlpF4Tb/AKEJw6/wwvSkQwRuZusAeakwZbz0q0ZbNzf4D1qJEIzGCoPhtzWkr878tFyoSXu8u/8AeKFIX2FIAAO2eOlFyFqgXF+KkEM4mlNlRfnimyEmA1aTRNV72LVLUkA03OedIohTBhZHHEQ+lJzGG4WjS3EZKIQRQ2neNHfRttQm8bLTY1Hh10mcKVD2Eiwy9xmNSY2QcSEnfRZHaPSisA7TNxMbQ643pJEvPwNEb9TOtClVJki6ajsXsw3qdAmZMQnKYnux60clpSJPeM96nQ2sXsc2vHFqlUzFgChqL5CnfBAzIhpiJ0ybcUyYEr9re0FCNQwkMi3852oKBGaSYlWGNPd2p22kwUe5CHDLTLjNLAXJyBDhQEpRAgpuD2G+l+NShoEqxKMYx6j2oC8ZKXGPhhzUyQ2Tr2o/J7gqaQXUzaErVg3WoDUwXOYfejomyQgvOycsmtRvUAoaRMCkZmIJvzRF51JCawW9CkCBU2gmXikAQKCFjtjyUeqdX4sUbEXqNRIDiMVKYYkJj99utWs+AG+xkHdvPu1gCUTlZkPczUPKQ6lpnd6LFqhYJGbwKeuOpQWYNDb/AKGWN/vEnJ7Kibrl3/6CpqaP3gCWkXV0Nv4w7mzbpQCRt/1wj1pJajJ7Zmnp2KsQNt7/ADUYFiTBtQb0Ezerg7UxNIETG0+9L5AbnX/PFQgYW8/1V8jbmGf6omiDi1qd1CuCIVdqOI0RDIHPie9BaTp5ATLofu1IgICUy1yHEz+S+MJUqMG2RAluaMvS3NN3Su7waxvdjJi9lSBCQJDOok2c65LUShaghEeu3ObhO0JekiGyllHEzGxREZrZG3aHXdcbxUndwWlj3z8YpBhfJdI01P7F6BazIY7betK7LhI3dx15qcICwbIgR+G1FQQ5ZVSTGzGdWowhToOrUeyjUYaWXLoAiQnrE1AQGFmUKu14ljq9KQwuVCNk5x3vTMxhiw8TOw5GjfEtML2QYwyrNzMRA2tQRjJIjaBheLm45KEc6E6m8RIyCZ1VcqILkbvXcWTpeiCCSTb84oAikGAPTThtelB3zlHOZ2ynSjSmuDunIpL6ca0jUwdWTdlC72O1aCPSHt+xUBmUYYunK3fQqwbkdQoQ3napkC+aWBV2MYpipo2b9v2KKG6QxAPZtaMJtmlIheJFbGHh3MyX3pXNqvCvouIwl7RUxAyclmRl5zrWVkINv4Q33/pagEn3KT/ioBbu7/wLgmEoQ4XR0fuiEvY3pJ/xfzu4fQ1gNhk/4aiNyGPzQYQGIZUy7vN2hJNbLKP0lgC9EkbSTcxouesRUVgM3pIwXfakJBoggXzVuIN17RFjfTpQFkZJmS4nVwrgwa1jTOS58UIS5W3FIb0TsykBaeJpruETqFgNgwb32pwCUh54jbFv7pwLD4/SnGSA8mlJdQuRuNznenALLSOQm50vRcsqZbtJ2c0sZwmwl4cnrqa026CHN5Y5LJvMleXJCgZA/vYpEIm8MHIa8QlIMFkgEbOn91YkktCkTDI5tGKcqDMWG3k30hxRJmUqT/vkderkW0AwZGbLvPR0at5qHJ+y0GNjCMNpeWBzcnaKDJxZJA4dZIDe1MMr1bIJkzJhLcREMjK2xMhZYsOpkGg5Qw5roKzpYh2L1MApuEHiIHSzO9PLxvZDmIPvQzkJYgiNXRL/ADVi1OGL6m0MyIdMU3CgMgjvEXA6JWpX6wYwYzzJtvT/AGFQCXYmTcqdXIwn4n1ou6yQNXm9RCVB2n+qVWITlrKQnaKgiQECWXDoUl6G0J6IxFQKOAJIfZzpUAFF6den7aoiECXBtZrzmzUI0JcZ1TPahXbKTi38bske6pWG2z7dF1dXagEH8kEhJKvlO7qUIklz7chuuDemnJ7PohlkwmlCUdro/wDKUJIi9TcLBQY5FY952xR0YjPZ4G0buJ70BCcsyG6auQXdDgESZXZ9qWYEmk2y0Kd3tTgBcu9SBZtYv++akoLDi1HU2pNLRSkjNLJfP4mmCQIpiTck9N6FhAhKtCot3osstuC6hchfP4alQjWVEM6aPqNLhbtJpfbX3p5PJIkqtMbWJNcl6OGmJKyOomSgFBOujRCVs688lSEExdOf3ehQObCrMmjumjl1oFCMomJ/d6mo6WQdkf74jNCugWKeQTf3oyT86Ibazr+cU6TJKP1A5i+lAVFumLQ4REOGUdaeQQkAusl2VtZRMxSM0oWF6dGMdO9FNoKJ3QOMyhZXIzUuVJnOhLdjaAxfFFw1zt1pQ0OwybaWcOL+1DcqSjyI5eSsLHJZNhFTfXtV3RiRADFibftS4IYM7S0HajlKswM93XwU2KtYPQWKGyUsjKMcDdalRy5WiSdROlRi4MNqYLECySPzUhRORPgQb6XqB0t2l7M5taW+lX4IAuRYnuRpTEIBLs67fNSCNjXAv59aLn8QF+ztQlHb9qReV2oBB9FSnvoAt3NvtdpK4Kici9PpoJCSUidfVKikjTgIPzQEI2G0reKjAnNS5Eo3FcwF7iac97Nk66a8FqwRdKMSv7etJQooiKQzOpFQw1LUSBuUipfXipUuOrt1okzNFMtATNICkkucFBg5kxaxnoRnemWPJcDZ9F4KvT7xYSZ80FF2N0XI0vRkgWKxoX8VCRRaCTaWydpqfxcRVdYx1uTtmjjg6A8a6Ozj3pSzlCOpo7NRBAQvzDkfO16au8FNgkjz7cU8yU2zqc0UhNUZ8NFpkKoTo78NORQMCM2Ya2yX3KSLOOUyysY1HF7lmSTojUKbSNwRjW8ciTMG/IEy4GJuJtLZopuS0htGSHRRnU1oCKrpExcm8cXiriNIvM77JpUYqcS7DtY7fmolyyoWdEMvRHimLC0kZDWC3lqwvJ0DaC34qBKsu5523Vikb3AiRuUh1DnakugxIx1IPei0VJWZfrHrih6QC7v3ipMgzndvUuUF4JpkEzOKlOFmF5Hk5pIV4nLnnd4dyGr50J1kuuY2+K25JXsTJNNtvWkEhWyUACXEkf5IJDcq+E7OpQiSMn2Sq0daAEGPpyslt1XYI932eIErBUV1lZfqtKS95vUWuFiIv0qx4BLVBr1+ahFwlWmAJsNppSbh1jScE5RpQ8CwEhld5l7FqcJ7hDvIM38UNCxnmpCIpbpV0I3qcDU3NRRsZwH+0Msk3aACdqkX0o7IsbqAbr+tPyboKC7wENvelWTPI2dXvfrUySszwyhQE7UtgcPUaIlGs0TWrYgmF5tmNKnAdhucUYSUJSyd/wA0Elig1mxNQ0e2IgAk0nXrhqfsQkGQ5H+96uQgWkMU0sxeYpVIfmpwWcQgzvM2qCBJRCvDnw0nFilCETDgkTpEX5rFrxTUtTjomYvTmOgp2NkNwIOQknRhImLIluFuMYtRU7coIRecGnFHxbaQgnLcelM67CwXmzNNyUF0US/ioiai2FDfJ60xjiVGHKs96Wo10sbSB6pVi3BsGO5HvQCiMF4Lwjg8OvFaA6Jgk7jtajoLIspR1nD5oEiGYFEOm1LtbOwzUHfaZoIsEwC0i+2vXtVgqbw4Vm+DpbSlk3jO30VnyNI9O0GTtOJ1P1pWTLKIqTMMO0jzTEY6LdS1/H0FDhdTRoOCZH60UASuCmUo3tRRAwa0AEFj6oCGpbb/ANL/APb7vVKESS59WKwSsFZjdZfr5KPqA5UGSOdeNqLblyb3Osy8tCSxCTrLGKyWUuyUFvC1LUsSXBlXWZLzR37mpYBQbWBz2qeAO9plt1s1KCUS7sUxYGSOq0ww1w0nBbEErvUaIwDyxPihkizN2vLxFREJjg8UkgX9qXMiDj58VAiYJFvFiffMUhUFQ0DB5ZaeCSSWyT7wS1LAzo4iv5oOdESbLHmXxQloJiMj82alRF1jS7FurRMO6flw6PFBL0WtidJ1KCMIyQWepvs1PWguXMdbPWgiYDcp31PnSW1GcAkyhwZ9KEI1LcnejSlFkwy2Rv60wCBkweq44cVCkQKwGmYEkEsPGsigoN8wzo76FUU7py6fZo7MUcrG4gdWTFu1RuQkESFmIwnN5KKZWVwQX4HN4asBDQkPQLPkob4RoizrmpBqbgXndzHimbiSDJ1X9aiAgrRHyFnzFLXlBul1EH0KcIbGDRyjALdqEhdC7oyR9I2pLMXQKO6/uUbuTZAt3P6oSoFdeaiBH9ZosECjBb3NHpZppQ0KYQjYSMdSmrAohvpEJHc9adQuJJtw7m2pyVLzaKRyJO0fNLPTMtBshuTDRj6BXYTCUg4XR0fqJMCX2pSLQzSeAuZxSW++SfsIb7/0tQCT/ilPeaNBhkybfTici9KLkuX7DNRBIIXYv+/7QU4CSrK7235qSCrCMEsR7UbBHNEB+VqBAPeuR/XWoBmz2z0x4qRiKDoFpfVzV9UCA7Ivtt+2ouwRI7Ht/dESrbrYy9aCyIGewJ9CsD35jT+qiSfqDdsX7FWCVRJ+9KRhTuafuaUCIZRSdOXPin/pyFxn09UKZEhCJDBeWUHkoBGh0sI9qtnFnkaBITKtxFagXl/eKCszriOBNaKos2AzOtrTZ60QBKSGD4/damF2FmZdr3nhmbnV5CCARNjpcN59KvFpRICL2ML0RS+aCWhcaxceS5QHqCT5ZkLJzQtGYL2MAC2YnTN6CoIXDARfA3vSJAxMgkjRWABEkLLNBjWBIIhonDc1BZo1cAFkfmiOgVscFyIJj3p4sEwEk6gA06dM0CqbIxdxFvc5pkiaqaCciEh3irOQYBGb6uR8U3adwR8X9KIJAsrbs3+Gmjqhg7bjdI60jfeU4OdOL81DLrIgGwpE8WpUgNmVP3biczQZjDVX66Kk5JbqR6T/AFUSRGAEhpsxBKLDdDje34q/TCYNzRDXmkABMvcNC4d3vTrVsYxH7ajkliWJMP8AdXxkltzo/uakRqfRAISSpcr79Shkk+gzDGaJIrYlm9XYl5EG1EgmwXYqzsDeCgAAsH2MrK5P+y3GBrV3D6H6KTk9lEN3V3+xEqkgQBPstzTEkL+kUKoMKyJuRSxglg6qe8K1L2JxHCZ/elPgkj6B1JY6UBJBHOxPTHikaKzN9noJ60GcCL7oX9VR6QSL4kS+RpUwc15UEPI36UKtUtqG/iikegMTF/39moTQMSzA+ebVPQBwCJo5hT0U20lEECTgqIARftUInX4ocTEoejNNSYIJOYn3xRSCx26sPJerwFEpkjfd81CVgczJ217UlDJmCQvZ41xvRp1iFwbX1zF2YdqIVFDaO89daTZCDGCMym3F2iZJEUKJyTY11BzFDzIihOsFj0d96g6m4YEFy5cbc1eyKMsxLI3y5JKgmGe06Sv0uUI1Es9LNBGkQDBLWC88z21qe2s3pGBol74YafghueLfemEJCJGk8d7WxUPgBByoaZDbW7rmpxoDR9yDiJoLLawDq16OKjS9iWCpaEs+aCvFabhOlu+N6H3YQEvtceyVJkCZyQ3uUPPDl82ZScCclNAlnK8W9aDIPWFjw02iFHRoZNK8sz0O+tDIpsB3M5S23NH3rRE4XtDM8ed6iKIiQozuOvluU9ibV3I1jCc6a1EOOVEibNm8/N6ZHKF9/pqc460AW/mtuJuOtS3yNZDSkBAhcZ02oRTI6RH24CEtUu9u26/zRe6dqAQd3f7JxWWlgJ3tY35qYgMbAkq0mMGdalkgIqINetyeWKlAAyZw5Y2FPNQRQXrOkHiIUySbEGg39qbLiUOZGY7QtSGsAmMglnpNQa2QLqXU65qKBMIL2TL3C9QNMTGZh90gpAaiLmpxz8UlNAg5CzPvTwoAhZKY3YM94+auQiRugZ6VBC9qaKC7SQMxGcalE+5Rm7JR4V7UUEvZUNhHqUFoAAJTEDtts22ouILMxoojz80KAYCL6+alMBl2YxGZo6HMsl04HTdZtUhLAQG3HDtGO9QIJ1RjuVrEcx70xlxMCHxUIghDGRCS6Fp4oCJAiFBJZh3m2u9QZOJHawpRtUDcARHaimNNEAxHfpVyC5IiOzml6Chx4R+aML84ZFtGYqLJgmR2/bUJlhQuPgPMR0zWsuAwIclo8NBrhlQJXjf0hpKiXihJusJ8PVpombhUebJ6Cdmit45KG+0JHRTanko0IIdKistiQvj4qzh2YOOvFRognPyKkSOgA7Tj0GhgDcUkO1nb8UdAZSxe7l8tMYSGarOmizvUxhbCB3HcneItWSwKyiUccnh0qVM4RsbfUlZGN1SsEe7/AKgIi7EulZjLSNaWDIG5enYiQItpVyxFgHNXphP3Ur7zX8KASfwRdXV2oBB9m0EAoBQx/eKTGBlJayhldI2sb0i+QCcpM9HY6UykCy7gT6NJjgIbKh8Sd6DdxKHF/wC6sOGV3Qw9qadwQJzGT5oKIwCbER62GjYtsCJ0fWoJM2qLW9DLGKmZvY01xarrYA6RHvU72GItjVeunSlRD2BeakjFid3MHGlDhmLcUtQkkHtemxtwvALPpQrprqIGEOmsUyaVjwkg7hTkpt5vVrKUkb6STriTmiJ1uNorFtJtUoQyolkbm3uNElZLoTrpz671OIzkC3neoSY2JCu7Hkp+gb3kGiL8nerRxCkQljdj0pOGJEtcUHyJ4KJkGVzeLp3u/M1IOot/xTiStpAGhhZbNlxpNMqLYg0FAcwSxD7RQOFwkEd0PXzUMiYVcTv+aRyIp0mtzRtOT3oBnlo3m8GOoMmkmaTTV5G4EieDGqRegkyFMQ6a/OtMNlMzZN1WnuUXAJpZRDa+HN6ILCaOXZLh5asUzAjuh90qGhXCRjtz0QaGiJI70IkUBGIT0oVECyAWRjA2nfmLVIlxczpUWXUEy/FvSp0AEGVzVI13ymcVNUQcaiyTE741q2gC4Fv7c9vqgIaCEKdn/hYSZ0CncBtk0W4IORw0LsNmYaEZVXd+8UU6uxUnCigLFx5KmcG7QCD7WEwOXL9uaUCs7aC8elBUwJNx+AKhgjqmLzSwQwCejBSimAz5qB1IAnErPvPFQ68ShDtQpB2N1glOb05XZCkWbPJFCJBxqIRf2pbkwXwTy470kVsaScuuOtOUMi/Uzk0s4qByluiRS35qCOAQLmZe1u/FWl4Ow20jTaelFJYB5d4ecAZiWnpHBxEcstTUqMFOcr9xKnAcpGbtutqJFIcMEZ16UjhAwMiJ8daREURL8lMvjRZuLExtGY0v1kQI2BEBmeqXhykcUABJkJtWBl3CDGOKaYmzBBOqbnWUpI0QrF9TPvSKLNESRNQtte/SkETHxhNnlooGaGJvM/msJSZZTpC7VBFG4S0d6agUJTY/qDcwwwU5hLIFkbQ5I1vR6NtHSBrGvOaBAxINP64p1WhCiSTWOm0UuThRXJ1jBd0TepdXQJScuzO51hqUXgQDbDZcadKGaurE6itjhuwlxpkj0gZBGo5jGLNNqmgrwIY1e5reHmamEgIBT1Uc3HRoKgRtk6697VgQC2/rk8VCSI3tePCUgt7Tb10opRLgoejqUVMAx6nFMoiXxipkIwlNjFtQTbxxSRnEZgBpOm4YSkveQQYfH1rg0SQyOvFJbkLlaTKqJN9KAcOF9E++0dKZVmotqKfbsAFTWp8zi6Vzf9B6UdQllZBoOh7+09i8AThvPgaaa0CIzLPxSqkYRaYb+1PZJMM2/CaymX6RTUzmwloGk7lWTcIhTh5qACVh3kx14wlIp7Ejo/mo9gVZKRUSZM2A/Wj5JIOf1ilQVkO7jeOIO+vIViaOQGLvBHe1KBTIrBEzu/oU26AGbkofdDvSjB8JCST1imAyBNsXNsJTJHKRfriiwBZFJZHyVcxEddGmhLIjOpqbMWo7KCJ2b409pvs0HCBgyhnG2uU6UATJNwHipMcUKYE3nW3rFTYQN4YHN8bUzSgA1GYnJ6tMEX0OsPeaViLCI1P8qdAGyTBMOkU0AjhbN46U8sQkOtqe0Pv2AGbFxls4inIAI2LYX/fxTQvLFJ7T+81Mk4EIRHMb+9Id4ROTaVzylNJzTyDLZLbGDE6gjvo7HmQmrlBJ0cDF6SQFLBCLwNXVhDJalCjIpJS3Jc7R7Up8OGYNsildg3KdXxZSHctPegQlu01pHD+nWpUuUqZES5rrVhgWdqc0kCeV0Vqa6lTnWb8lMk5kcbJFGwbYcce/1QqBhi1I2ELaOHemxBnKOpRLJm4cO1RcUbq3aLH3tyCfZUiIw0tZUnpUpJlH25kaGy3DGtLoIiIiwG1GWEmJC0VNKCJJMJtWPbkDMuPWiYFIQt9z2qc1Dt06UnqBycsUjhGqI70rkGBMh+NY0ya00W9W8G/xQQIreO9MAAsuxUwIbNqdEqcnQPaxjW7RVOc4E0NO/coDlTBDBCvSYlHiDlM6R8lEAWpZBY9cUsUQbwuXzmkd7Bg1JTbmjwXJfrSVhq9CNscVYl0S7LCc464pHNPAmU1nZLlDFe6tv0xQQQCRGAve7RmqyTgLB4KUYxwpgCAjaRXpUvxi2TJ6dKxBICdpPYKBgYFYkl+fNAGJsPa3+0DYKFE1iNdqVDIRvGqf1Jz7ivasg4H9I8UlIYRJDwiTSqNuDkm4H1+aBHRAp0NWtnpnFBuI6SYB2C+G1sUBuuHWXKRCssSOab0K0LM6ZgcWktxVhzp6o9YlqWF5mSyWwNaPGFrJPBMqIvl1yUMLkgInguB5ai4Q2A3O200MKKWgQ/iiAQX1f6q1cEcWorC5MJt2pReW6iYJzqHpnFLfDY2GG3WLanmtEskRlNz5OH6rbC0sTUsttZ5qEDQrzs0uwA1jWiIqRhu/epP+KgFs6u//AFJIv2oTjHT7ZhQhGk2rR80F06FGkkLEampJeYm40qpTmFArMlWplYYnZNadZCXjc+H/AHGGIVHULnmguazvCD1x08VJIxIXooQLatELIhFQKBKS3NTEIZWU2DYl668U2RZ1JgBxLLRsNGW8oq85zQCJGnb4pzMwQWuc+9NUTkTI0ey2q8ExhGckYjjekxWEiInhNGnszGAMd9SoaIN4X/feteSGi9rPyOSmUIt8sHIXppebagLCZnXaKglxw2PNqQ4oqTA58d6Z6klZtGNm1ERIToOnq0kVoY4Rn+qCEQhAjf8ASoglVurTriiEkiRHDp1U2IFsugevPk7UC1eQCRs0dmiEtwhl3Iy6uHbar/gtKLUTFnDMJWJqeC63BsiJpi9K2F2cmwwk3uehEUZMvmJVurUxmzkSZlxSCY6WByYxxHartIyyiG07awydKBEBxEWwmTig6LOoTuaNJoSCxjD1qfhEWtJL6h6UcwicDOLDaeid6SgbJQbmTU8VEQQWAoFrOXi+SXwNRQPASGXvIlThZU5Jk+T6jlZUyRq0lQU3DNPooyOtRlZBZ/4Cl0NSsNtn3aLq6u1AIP4pJDUO5s1KQJGT7TCrWgVYDKPY1qBLzwC9Am2FlUkmKcA1oTQnpTAqBc609LDCRnpUm1WJI/FTY1mDf2oAoTklmkxUqtanupBekQg2xQZIyS3TcxrRPNVjAX8fMc0xiuAOJNWhM+tMpElOwDPS9XFmACxMTr0qICd4R40e01ZxEoSLZ0X99qUUsuGjWdBoZjaNqMHRdudfekGHIqwIsnHTHSnLAZK6BfpvTx2SE5OWdTQrOFuoAL8xNQOYj1KW/NBCIgc3n8FJgIZTj4We9E0BbmyfihiLkSdTD1m1SHZYux+3oLphId+epFSnBF22Z0fPfOaUEGKMQ2nR4dcWoyStFinJieEWzJMLYieIM4LkXIHXmppJvXmWfBdA30aaopIabNidDbXFPSDxyS1gxZIP5osnLCQW+kXhJIE1qMIrC26hILdFyoAGNEHJs8UdVAuFk2vV/RZ9homu+tFZujYZeefcvGlRBVJhKMWDHre3FCDeUqktzBbrSEYIAFeUcmEwxOSh0ZFu5nxHenWZZPIP0lglxSmFJYAvUEjapd0aW42mDU1FdlZ/gGWTCaUJR2uj9yi8rtQCD6CDhdTRorMJkfs7CxYwtIFxWP3FYPpYa7G/epEjUiaWopkZkbFJnAA7FCXjRr/VCKAd6chSEMXowagCWejUYybir5S+sopSEqaVmKlBM1L3ONKXG+22euCqATfQZ1Z8UJiQGWEqSkd6EjQu4bp8eIijIQTfZiSTnCRnrQWAENzZhNI49zGthijVMvO2LcVpscChkl1GQnmpsWYZD0S881bUKA5PJydmmDY3ITdMns0zFABPX29lOzSo3lgl9Vy06SyJY0Ik6vtTdxjtt8U76tE3WX2D0pKYISO7EeqlJLIlTG9FrAQCbDVxol3eN+slCFLIdce0UGhH+xUKMEkiPM7ehnWgBSUCVzY/oT2UC5RHuiEs7ngYigUlTPbA5QhCMZDcunVFIHo8Dw9cUJ+xyFLh0cYFIF5kiO4N3Msk9ilZHZmQ62x/qKN6Jk7As+jQJQuzD8NEw2iDfm5qUYLQgN+w+1FjFc2cWcw24i3NMtgBMiccwzGHfZ6s3FIwXO2Te1JQsgF4GbNoUTamQEXw/FKzkT1Ix0fT6C5YkGaSBLziNammehQ4RCaaVDhLyRsUAwB0/kgkNyr7vVKESRk+2UtHWgBBj6RcEwlCHC6Oj9kt0Znsqb1Axi1K60MS63Y/etLMpkGjNGm9N5Zqdhd6chrV6NGmGT1ozJ707EBTrfvUQW/5DL36GozFoybVEt0KWirZ1WaZLCL9alAFuuIJlfWk8gqCLrl6xNGJOF4ywO5dKErKlI2E4Db3o0YUEacE3jjG0UQlM1GynHbDRTBAZXs6b/OtKAlszbddp7UKJ3koPn1mlKXPlk45eJ80a18CjAbfHmklw5bMzEPrRbOU2wyx1xRYQ28CKZ4iXPRfa9ShneXaG/z5qZroXZPmagF2SXOvjNGM+ZG19fUprmbWefbTpSQbsmwSbrC7YkkebRGrIbdGGI3gMjQBs/JZDLkEgbOjurgCJEJfUJGMkY2I1gpGLYDZifxZpnEASKTgOTDJhzaGmAbe2aYxwxIe9Qq7QYO5o8kjzUZ2xLBBeM0AZmcEO2X1pTmRdOG8+PWnbKV6r7WvRCDgrAMb427cUoFkMQJkTZxaXpQVQBKSBNrNMDG/ajJwLG5EPIk6NQ2BGwyN5naZKeewjmgh6h9CwRnV0q0Juts0BIlh3qTXkzwaiAXMz9FQ6upo0HBMjp9mq4UbqVcKNT+KACCx9RBISSr5Tu6lCJJc+u4YohQ2SerRUlNSA6uhSgSAuEvBoetCIeVTCCChko4oBJDM04M3+KuAKeKLSjZn9ilBom2f4DIW3VAU6RvQkTW9OJRbxQciFRw7cVNgqVmFNvERR5Qrc2WLncmroOiYSOHSKGUaRMkeDUohULtbvOParARnI4SizDfpbairkIVkfDcoo5xKCw1X32osgvBi/QPm+0QEvSO8n0mOvekRSMn1pLVCPMz/AF4poBZkTlf1q50G/vQCGoLbx/tO7IST961KSwAzfJH7emZwMnUH96VBGAXGXoOJ8NGgFGwI14MYyN96k3nKbmBtDe1kbXIlpnKZBL2Fxuw4vFqls4YxFidEzsiaZpBSFNHhXUQTEkl73a0ES5kLZBddtEs3vW+wKbZL36k0AOiUshddE2vYn1oCRaAIJjJtyb02qBjvzRRQEJQ7pECLdHHcfTF8xhiFFshcBMOYdy21SAwBGF2TYQ3xT/EwC1mqeJ0kqbHIGjGOl5qIQLjSItTFJ1YEfcr0e2En+ZrWFSqBDCL8UAreOKAQUAEFj6WcWGGruF9H7G+Ft+9BBBigAgx9dSnvoAt3NvrSTE3pYIBsOlCwwLo1vQACubmKndHvQURiI961KIgcv9TQZhLLxfFSwMTSLiQ5/DQHWcG9SJGJ/g411Ha226WdutKMUjXUpxIwx2/uhIdmV11j1aCkjs2sulAh4LufagJRMQsT5qwE2HRRbFFHk+00pIjqFTSgpS9HD1xQw0beYN77f2tqJCC57aT780UkYbX5z6USYZHtaPzUIXE6u9AgEihDht7UkByXc7UwQoqSa2keHNSliHykWepNIGWR4I08X6lKN8Cr0GTx4b0AIWWbSRfrgeaUEklHPRO/Ub1b7PJpgy3RSSIGYbtqQNDRAtYuG02vF2daBKTWuejkjvDSJfQMDmyIuZtnemTjAlvZadzsnqUAkiXBvxzUZdlh1D+KgbMns046mpQlItmzYEn16NR5RuLcLy450cVH1FpWEaLEmHRL70QnG8mR3N8j5qAmKa8xJDsz5KGwMwEWeKxUim+ptSZcHrjHpbt/NQrBHI0JITYGv1gCEkqXc3bdfr34e/7Oe5bdV2CPd9SKAusFXisrL/xPICSF6y4BOTGJX9KbOymeJ0oNiZq6AhtfrWMaq0lhFXQPMZiohWFu0DJQWn+LetMY0htvQJ3MaJQu30JfNqjILRkbQ7dmi0wXMFgXUL30maAHi8bSnsTcYimLLxA5vfbUeaCDJJlF+bUR1uM+KYip7re5SyFsmH8/mlJFAXSMLaDQ3ebYmi3swWxMT1bXomBGs9neljDAL3fipSGGeWsXCRUEGwT3/sqCVC0Bw0qhUJEZD59/FX1LBNZhk/Dw04UIEc361nAdw4fWk1hRBGBv+VSbMQbAkXgEtqFpxUc5ZXQeoL3yWmbheg8zBbwtp7TmL1uRYxLn+wHisG+IlRpJr/lSVCmPENxdxt/VRTSrsOhtzOSkRSwVtMLqd4fNQcgRUgzJUSDkENsP6qGWAJZkuR+zUINWeOXS7b4sxTFORtEBEdI/ZozA0pTd3Qv5pQKytWjJB303qKZcJPSnY41JsWehZ0mo/i4EJ/ABL2N6SdXQ2+yVfjr+FAJPprBLXL+/2oCGpbb/ANL/AEoGCV6VmN1l/wCyDKpbLV2M7y3LXPWc7WoIr5u0NR7d6LCLzUKcM0nkv0pCkFA7daABlsgyNBBB/HsHerxjOHaDBpObcxQmWGcSBbIMM3TYpYjd+htD3w6NOg5bsSLJ/d83LUBIMlgWCLEmoZL5CpoQmz1f8iatE8rBvniZm1qamyJBK7DifWkc8bgrxGaE4LZ7L0pgSRyhZlPMdaBw0doH8NCjEFjoZrKYkeQ/un6o9iilKwk6H9NQmjBfYPiiSC5L960sNLItHl/eKADYTTRSIgnIbJ+pSXL7Br6xR3MoDZkObW1s1NcCLQjxzrFnSkoKwJJBo5LOHXigBLpRLpeBpfpF6XLPWsNxdZHuPq5ygYuNkZR4b4vTuktJM2FjeM8h6AzFnMOk8aG41faKUIMpj8Vl1lg1qyc6QYuaUUJRBejY8XM6cUSMWWJkqZE72tRGssRBC6OsvkjahgkjbMXj0mklwkmYm/i7RlRP5o6jkMwGHUsvatP1JxLMi5I2GMzQaGBJRwiYO4M3oaAiUGzqZKAbuhvSTk9n2krJG7epWBGz6KgS2KBU2aDf7iV9/wClqASfzScnsohuuXf+F8KnAWlXlaaGIgqQ9L026uaGL607YhpkFsA1IbW4vH8TKohLjWt9gSFj1jxNX/OLYLx7UJlmmDMSz5l9KbwC8TEQnzRakgAa8/3UhAJV9c/JFQCCcQi3NErComdNt4p7HYEF1lv60DZVlSF8fmhIjBFtO9AFi2DsRL0IigMGNJiaZJICPSlsdV5WrixDPRpVyRZHhorjLI6lZAhy4rEZFn89MNK2TVnJMe9R3SEqwlhfZbTvTJ7HYkrUTHbXSkHEbsiJWScHdhqRqCbe3G4ddxvekoRKdMng34mSg6bAO5GHki25baoLBYbChqd9na1LcnIfVPW01LorLo3837lTIC2ua0wHDUoFKYJdShUZhRkIc76TxMF3amdM1EHInW9PghTdQZeec0j0K6rQYpZoZGkFU27TSgAZLhWPTSrRw0ggSbJyVDkjaZxSG3TErEaNo4x0p839wPzfZzFTqHCMOkb06AsWFeQYUpHQqKR10Kl7Zmy+Gp+yAQ0K3HT8v5qBKwUC5EaD7q7JHuqVhI2fxSf8VALd3f8AioJqEOXWmeBgpzMUZmOKiketSmXSaTfBB5pi1xP8cvSnIO1AFFkGJIoIX5eIKi43QwJRvzfnapiAtGbyNl20x0oc2yPKEI7CY0nvTS+QixucDkIs1FYHqao5/dGrYIwknv13KEElBbI60CWm2On+0yIN7EUwrZJE2/2hiHGwOVv0xVhJBPTb4qXeQOhtxTSd1v71CSwfOiSbiPekpFgNd2PyURAA5tj+wqHwI3LaDtpo+aEiUigMCArmQ4qCiQILlnQ32vmpHjJMmv5+akIBNbui+seeabEljWZGISyc0nALQUSQLLUwj/dCveRaJsPDYeU0olEyFmbJagwLCBYR02zTwIARcGY9zSkFJDATr682miJI3i18JPemQyQIizJw/maQQZRbITMBaIk0hDiphaMkgpE0cB7OjVh1H7NQiQMaXqzMC2pCjbD3qC84K7Qmna+pDqNbpa8c71bhhK3h4fw04GETZC+Ri+slAgkWpvIz0a5qEAiVyOzQfYcRQcCB1gpUhgLixOJM270eQZms7l4pmAkEwjhbnmlE6BYOyfNQIL6fvx60Ab8JD0qfoTUlF2upoBIiVPP/AFvmod7ZqUgSMn8ECXFAosmn3gBfs7VILpd/+ourq7UAg/kklcLUIUSnXWhFzscfsUIEYn0qFMWqd3W9X2g0TMVJhZtp1LUZBAH8TLq6WmLUpcpCZuv78VNw8Ei62OhBVzuzwYmO9BUI2BJNbtTalY9ksGM+eKFVkY2SdE11og73W5G/DQQu3kiXFWomxj2q2hLi7QY3GIR6VLZE4JoCbLBzR8Rg/qkgt4OlWhmo9YaZI5Pn3pgoWchZV7ZqQacnofHkokbJXxZgtOzIzpT/AALlJx3vpvan15Kjh7s3Be44GmAwYMEQi5gJyi5OKmtTODCECyHrDxSjM0DiX0Drh9zBok7SZROM0zhQTra3m1JSwRuBhI6h70xu8HZqOyd5pZOG6zDDniFkpTZFspo6Iw971DCABLujmY7SUFWmCiGSHqW5s0gSD0B15n06UlwnWlESQkJeZMNRAImvDb3vRYYEibBY07tFgIy2xT3UxJi8Y6TRXUwaHWmHN1R3zqb4c5qHdZQSvs3DO5OZzQ8iJAETIDzgOtH06BlDkYI4mOlPhTAhhiRkPlpJNG0TDyHmoHVHRmfFBkwH7zUogmyg0mYAOlT5RoI8UeGcQva6owKuVUdYouF0wsqgnUpH6NKWZxB+KinFQ3uUyJLgbFGslyn1WtsHPaSagcMWfTzzmlABKhOV7rxehw7lQl+qLHEfNT6CSlfLSgpgvgGsuX0p/wDuTodsnko4/wBSixwrtIQC63D/ANAS0i8Jt98y5ANqEnU5mmzEsTegEH8mnKZqCdjl4oFLBZPR5jzQVu4axI9iAqDssA7xUgRb+qebaNadGm8G0/FHSAumDs9qME/i4o3GWp52HZp2oFKJiHffNTgqxBkB7POpQJM2bZyRbvQQSmIGcET7NAECEt8k02pCgAWVqYhkQJJTPoSCQy0WCRfOKtQkyyY4h1pXam92mAQMP44oisB8fmrdLAl5/WkPUefy0miUj2+alIDJ7lqQEi4R3LT4804oq1MjMSa7dLUkBCTKOqjcv6zReAAEWZ0KZIj9gq/l4YZDFtWLjfHaloVlmDjcjTJScTDZm0P4c0yBGEE6VYJL5XDfzo0gkgJej5kkooEPsDc3tHbrUTsIdbj7a8UAomOojB5himeG8YuuBObyf5STRSyIhn1aS3Vgzp85q+gRipzk4GqaPNIoJDqh0e1G+HYExParlcA2TvxpUjXItZTh81K4nJL6hyOKQrLAxzFhjabbFRmTSma5FLI7wc70aDxQCRLu4zvEaUgDuYJOCLegUUiFHgBAE9kaycwsNOTMcLJpRR8d1jfrUGKGVkY6RFRgzmCJ6lDJXWpLTXQ8jxvpTkkhe9npEHq1hCoODRS2WgBdcG9TYPepYSugdEL+tJSjPLL5qCKbZHqzUqpguJmmeaCissft/bVg6mqOz9n2oJBAsFj19aGpCcZ31Csu8sEg82pxquWG7xV+ZzmkrKob7invMVdYxIDoXi/mgCB0KEwh7ZpCi5PvlCJc0oRUS1abpFK6Yj+agqcOQOS0I9ZfWrvrhJTKrnq2PQoUklyAR+s3oSihGO9QvlSWZbNNnRD0a9SnYbFtjX1ot/FqMIlHvRUhIbLmghlIa1N8bdqiALMnnTwxUAdhkypieuKdiDZCfveokmELN4MeL+lBdwi4JpnmSMbI2/yiqIGZOs0IKisVAIJ0mfSiCp5tB0KyBbJ54qImP3+qAZut+hQXTp70cJEFzsf1TUQgd4ifXzRZCVDhItPekVlMOpLjWUOROKhgmzIAOoSGIaOIXO5INb8JmaA4SgTCajU2wlDJzCuCZs5NzMX3qYUhdwajtch27NKoSbhqOOH/ADamCMDIuRPiK0pkmeI1Wxbq0wCDOGYf29M5Le2QHjONShM5avhP50pFhE2Y7hjp8NA5ib1YSN95uVFybANkLQ869e1Y7IqsOTRIvueqAHqc7NXXYCxwiWExzThAkkzs2t380hSGCtYxykNGhZornb+upSHE4T1IfFRPFAfKN8m/tQs4UjIXnaew0yCTBgnF880hwslRftC2mkFSXiQb+wjtVsR2CtllO9qkUUWR0qZJ2JpLBG/Sn4RMQqO8UKk9ggHF7VAEhYBTrGX0KtUSucNbAewoa4UgYzm54aBOWcM7GFHb+q+ekkd2jZHmIqWIT+60Ucz0MVAOdcZJtpp80KIDCyh6E/iiOuNC+360ywPcJX7l0lxUiVmwVju3aEoag2js0ILUJLtSZGI5oYNnF8vWphOxIB2QPelVK8iP3wC+dDekn/F/3IhTXihEkufwASoU1YJxUziU2QPOtSNViLmIC7GDRq2zaYlQ0eKsmzqvNNfEtl0qN0mZ7XvVzKJlOlNZYR6c0oFNZ0/mSjRgiRtnSPXpR6MREqkH61ehCiYzG+1RKxyk5Lfn0pcRWLIszD/c1AWYsPEXH0q5aAZBZ6dJ9akKQmLkBGOltaNUpkJMlquEng+aALCPmriA5RiiJcGJpQBsoXf9KIyf7+5rJYzauIGPWKYCFp9aAhoJvql6jPHRXEs1OIGKLgNg6N09KQatKbTsvqdb09pHDS4WOLwbM6XSAbrDKWRi4PJbNAzVX3Ll2RnUzDif4h9ojIJvC+zpQMGaO63OjQAGmiJRkNHc7lTEMj4miBCuXs5pOwmBjMO8UMtbkSSCacmyVAMiomcgx5iGlZLmGZT+vSnbDsKYm3DfijiQ3BUZWr+pVolmLSOhGlDAEq1tIPigRQAmAWydyiXZrZgW5O5ZohC2WsgkJ6PigLoM5rqANn3aYBGPFc6N/wA0mQxtYR5cfvaGBS+BYcph5/WhtpAyXg2eJTUpDldtAhmJs+o+9SjSFSZta/qlS0MKkIaKXTSc02YiUmPDcdIa0MTmLya9qFC5lYTzTsbiEBHWad5gAHoiB7NNRSYoVxIZpgXSC4vJQECQ/sFCUAaTCtq0gZpocCQbudVMRiBggbm37er+WJkTjwFNvLzl6ulJMpJWIaqmN8VCYCgAG3oalSQFJNxq8jN3eZpmjFtmb9cURGg212plaThPmjpAaDHtSrVAMlrt9om1T600WfvIm64N6acns/ipT30AW7m3/BSYCkSkvCoOvBlEc0d3qT9K4ctsvsPNEFYMgdDU96iwMhRddV5rAZhLlGL0B5/qjNODxNS2wIJmZYiKD4Ytjj+Si6i1DpbjB169qiL0WKaS38dqvivMZsX33qJUJBdCMdYaVcgFREWAc8Xq6KwUMspJtcKFUBBwRLHHH+1LAoJNyJ6jXjzCWEywadOKJQOfWjUQRWUToaIEh70BAbRdoQTnPSaYA1h8w0jleU62pFKSg7C/4q6EEEvL+KbGmCbWRprgE2VSWPYe+lSsqZ0arszj+6yANLxaQbXmLTnXcqSkkRiITfa1nSkLAmYDO07HfR9aO8iQ7q5E0u6JSQZUAlvFWAf9GlkW4L6Jj0onklfBmp0qACM2n8RQAFhJa2wHF6uoXLq4ehQlDOcJPilhDKC7HQxrFOoSNrJBIXe3nmjCCgQ5mfepIR1QCbEzSOEXVEkN3MPZV0g3HoQxtalxEC76LPxUluQy4cQ8acUXGCrKwr++zSEWVEtvV0oN4KYYbmzo+T0aI+sI4Rq+sb0cjT0EcOS3WKtjiJGftcxajcR4pA7G6dm1SZacIMulx4KtVhREDt+QahGZC6h6ketaIcLiekWO1FdOS3L1HL360mcOgjRJCfVrPiVLtlC9MtJpL22nzQC4psc+h+FNJlmd6pdOJppAwzA3S+RWbazAndV/eOKGztcFyrPrTZ4CLRR2PxYp6PhgZNYyVMyst80M1uViYnThpqUCYWO+nFJEgiCMTf2okYesU2gYmeaGsaXtioiIRiaMKiMRb/poUYQgWEalbf8Apf7rELrBUTNy1/nPctuo4Y+5SRS7iPZpwAhYzZ1o8RiLaL9tKTNjZWzxtQZErF0X7U5ipMTEIb/uajyqoB/NOKEnSd3f9tUGDpJ3l1pUq49TSjYlIzYgkDQZoAgQH8p0EoLhzNg21Zjc7UUDuBZq6Zliw0KRDDvKEM7Ey3ioYpStpMy8VCbGhNWD5KYKgkDiG0UgbILPSTbrE9mKkGhEz7lhDMZJoDjZO6djR5xTlUdzM9qtSya0rMYqU2R05oQbC60gTCT+/FFHoWI0g/qp8mwvUwIJBu4l7FHA3MX2mgSUIJwBHm9qnCjROqj5ig1hGQySP91EIEYXro+KCVpe2n5pkokq5I4MntvFW4NulIYTRmr4Ab6A0stSpjBeelRWtlsWxUrlCSaBlfQq0KQC6RCY0sxPFIVECTZnPOZKEpGl1CEHEqeaTwuUcJAN71eIuDgrHbTrmltgKwwRYbXO01FhqgZi7F7wb53qCpQBIhZPJV+iQDYghtvJFAsJknZb9KlMKwI0OaBYHL1n9nrSBYa8hirhIs6h7NT77EihvFhjf+6BABcGU5jZ2/YqAHEMAEIOomj2uUdLZUgentaoTZyOKelw3ITW1a80dFsjK0tBTmS1vVjRHNQKASFBO6CQ58xmhyBbomtj2blIBdBQliaIRTiWoaTAupidiFt4nNGUL4AJ1HEbb02nFlIngYD0qCTLsL66DvepZxaRhdEsb2KtiwCJ91p2takhkZZybxEwPjapqDlGNmgYmNKm6tBGGxjpxipIsja5I1zFDa0N7lnbX/KCXqA3FrwrgoytDOIzONWL3t0qQQMEDlF98Oalj1uXGx3wOs3p+kEJzA86nesdKLpHWrjbCKfRwh5def8AkO9s26UAkx9vFYJWCorrKy/RT6DZwSbtJNzOuBRiEkiy8NPTbImV+IpO5IRHWhS4hL0a6XbVOFAaky7dbYvUBvShBC3tPmmZLJLkKXwOEbycc1keY+metLJnJcpBGfNERSi9FfNQKAMlBakJtvTKwLi6SkrgPVpTYMYaYheCzFBOEolxGU+GaSeFPSDHa3rQvQARAXGx1igiKKsNy8eGiG4atSHT9xSFq5F3QSTvuO1IcA+3NAADY60bC8/3UBKQqFhzu1MU4BbagAbzMdQogWSX06Uyhcs96YoUhJ4Le7RKCHB+9WmUUysC65fFFFFJDMa7NNKETLXUcsVljSQ5lZ8USWdAsEdk5wjjwoxqJAkvgb+ntRsiCt45HPvSUVhvR/XtTkAFVhjb1pIEAhOWTtZqZXOEOcQd/SlsV0MxKA9WhngCs9AQnaHegE0qrYCEYML3aA6hCWGfQngNQCdywLgw7HpMUdWUvItjpeDmb0CeCBa5gG8yw0B0ATEFweRk5KECSmQWRkeGV60ZhkNbga80pCJw0riyPNCOJekRs5ZeNJOnpSYLte8Dh6dOtAtHyRfZ82ydmlalsLack0eT1oU6WLgjQnWrALIvUbjtLDi1To6iRE9A5J8lEgMSOG+ja5GvvQ3lp3RoPto4o6qSsBItJu7jOIxRwlm6HS6HJDfml6ybgruKPElX1MJJeESfetLuIQuwME0RUSiWvKGOYY1oottmY5C9yMWrRwSAY1V7jfrRMIJGEym0+L5rNQpZA6tttrWpWpCENYddIs2J71HhpBCLV3X4oUiEgg6jaKZUECUdTg5pKGIoogGgF5vvvTSGd8sQ6mkTmrl4zICHQygNLHrTVQYwybiWikizypWEIk80UQYSbdYI32f+3ZY9DUrDbZ9rExctKzG6y/SEAQpetvmkARQtDmojQRewRNn9mosUVrMnFSGWBJ3NZy8xS2rifrxTyNlY8/N+aO4IhNIHHOtASjcpxK29qkIlJfPvihIzSRaPlxUcILF9NqHRoBrSAz60/s0RJbHNIFYgYRN+akwAwcu99Y02o5hkFybxt7VAxhEgAXljq/ulTtvciSnk+aEAVVkC6Otp80alGhs3g0ULc0yAYS472v596S3iF1F14j1vQwADIX49PSi3FbhSrLrQpBejUpSKixWNch4q0YDANND3k/LasAQ4Emi1PEyojpilyL1Bgxep0nzFA4rUka9KCRPJKO7XtrzQE8lDht771E5lq6H6xnNMxLSMdHDxekvFUYdN/WmEOTKkeTUaUQKBOYCZP8opkxIZUodwcUpS4xFluF4lmNRjFNIgIzAsxo3NninYUhROQvbfXmpADkizCX7TVyisQ2vcdrW5tU8qVk5Il5iKt1GAMWNvUGglKRAve40k4Yi1tKUWokZRSavxSDlSynEf3ShAkVGQxz1mzuUD12Q0nIca0ZjK15yPPv1pPUkrjecj/mzQVEiMhMLs82NLUCTb6Db88UxlbmImIjUm0ZrDmqqUTk/u8UXELMp25s8lxoRb9EgpaUvOnpCVF2mD4dSzuIBm9T6oFiEaGZi9rpSpZXGUt5In12o4YE2BtotvapfMLikcrxfMNqtpdhYTtZM3NM1wSKFzrh9JKgCqAOY0Tbn5pWEuketuuu1TmxZGUT335tUyqWzK+GaGgxGBaE6UJHG1QVkq3lRF2LXqUeBNeBbxGJ1tQ2QKpkDOl5uMRejZSbZmoC2piBteIecOjJRc/wCh1aO1CUdro/ZLhAQ3c1ktUTdcu/04AtpipliRqjcaMUCzjB0NbUItuboaRtzU7hCcGlrVAVzAP2M4plIwRvFBtcLgHS1IYiQdwc/uamvW6ftvirRcm4jXXemQ+VFGXzWVl81J381JdXmjAlhLFj5qLmU3gUCiTnMgaB+tSzMi7k0SbuYKLERA6FnOn7eoFZpLmOY3tDTQFnKzIEw1xUmCQRvEYn5P6oAAZZRfCRvV8hUskOqHRMUhCzTTRtuVHQYo4ip5vTmakwUjSKtutIXNixqc6NLpj3TPDRM8DY0qZQu/hz4pFNlZNHrV6Zl0Jw028UXgXa3zU0aNb0yN8yNTCPuLI6Lno32mkBaruCB6TkpuIHAwwWZ0ydYKGtGXUGidr+tP9JMIGb658x0qQii2QjdWn9vT5oLYd5bxvWNQdmEduOKVCgUuGJ4iKZHiCyJPvR5gxKZzN+0xT7PilcTpe3FKogY6AQnOOKJwkzYTXrg6UlDCVGg29Y5pjwkjGW3wV+PaLFIOkf8ACDsKItVcWeKuBMYpg02t81eMsAxOPc42tUtzFyLUBN4RPo43o6CSYDIJ8TfNSMTIyw7236Q0PEUPMcaTxSPVZEJfZw8Y2pldCBC7FnpowjHmkcicwtjN/k9aiQisggswmEm+jU9STFiPGvJ3zUVWtNDzVxGGwh0TH7mpAV82gEkNyzlzSar3uhJL9tzvpeMwmeQjfeiAJg4nRrC7BV2uPWgKylOTelZImjC9GJetZkzI6gTX96U8iskWvRlLrMPFG3jAVwt7DO1xO+sgnMfwQSG5V93qlCJIyf8AIb7/ANLUAk+moCuK4RtLerAJXCGrFhCxX1DdBUCFdT3piFoJEd6upIQOQ887a1DHheJA5slKjCEri/G9CMroiaZg3xQfNH9esGL6U8LealQQv0oAle1CyGlDDUzSgJMAu9CkRlxJoWmdtKKJIlyiOxmRYxaWxcPrcyTry9Ki68twzplg4mtYYGIWcuIs2/qjEWL8HKus4Ios3pbYXAGC8Z1pGJOsERiPOaIbhmyJenb9igMyEL4fw6j2qbMADMC/sUEWbVzUDlvWa9ACR2ezNJJ0FoJJm7maIBCLE5760RGHhs5/uoJULOXWnmkW6WP1FHAAIRiRoOplAsXpoIs4c2p5EgCS17660iBBcgkjrToYAlz6TUYAkDYUwHIX5pAYayEaPFonak1TiULDhWR+c1FhbSRPTR80oEW0fCro5FouTUJEghXl5vRbQ2QqAFUGLvf91o5BIZGqTb19KcFJEDVRGeSApXicLYvr6UWGciSZn+6wu9E0PgTUbfxioKg2KhsUNcVIuDSHvQ14qDOZAoe5AYH2ueEphCJtMT8PtS6J7bFoxj0HpTEyuyXadZUaTIt6GNlkvGlBIRBc1FCgK5mBUmkACl2BreKKukZL4pYbM0oRbZpcJTlq8gTLapQrEL0OVzkY+acgzpz1q7AlioW0dd6MXz/JQ6upo0HBMjp/y7JHuqVhts+jNBKWk60oBCSLBimECVdTJUmDICelQMqrz9UxCUrIVJSHtS912Gnbv1NDLjZkVldiFA0OxWnKEYKgWCslM1vSo5tUl5cjzaoUiGDERY4qI4W4mkD0pAkSqjFiTejzXXM2sDjTFCcRLLrgXQurQqEydRHL4q1iJiRhDr+96sVIysMQi0OtKK8FYtbKNHxjeIssvBWICBtEUy3ms8VyNLBNRHDUkYN6gQHXerKrShMQ762jvTAQDdCREyYfzSEii6MHgPmllMUMno1ZsyAITRmhMSL3AxRgixaTb3mmEOBMziOmCnQgXu034qARNeEyfvFXZNMmk2xQtO8oWLJMczefO9EhxElhtnzOlLShSWoYR0d6ngLGid+GgsqNiwfu3FO3DITsqeAKSXT9+Kavtl9qfkBKLsZ/NDypQFDM/wCVFLQyBKd45oYLXE+96MyDt9RSI1TU5HMD/ap9gt1ro0JJMz/lTolHNGtCkbF+9JEMWpgaZ36Uqh9KsVPwVCXDvRIJuzSGSYe1Ro0550rK80JlvxUgm8UA41pAZmMWpkUlWWEO+aEz8ewgLI5Hfm1DEwpJNnlN+aP5ndcdz/oC/Z2oSjt/migCVwVIIg7UZjALI6lEqDE7xQSbq5X7BDSKBUNqYs2upo0HBMj/AAQkNYCKYTFqIhzQiCZYMtRwrDmJLbx58UTpYTDomvialuggNBM+QOjT+WCRayHi8UNEUmHGH470KENN9obbZDhvTiSYBUL6xGOtKmFJg7vHGcbVMAjupBo/moyzHSmLDS3D4pklVQBAXx9aFsFhBMtqiXJiBJycZxG01GYgKyQaEYzjfE1Ggzji9oDaooC4YSe8bUZcTKzERs5LcVBBRptKM8tPFJQqAu5jiKJkmxDHWl8SGBHicVmQmU3tONs+NqaK9Jzc+Z+M0BaFKNnT40pL2xN9CeaBKBzGRpM64rPQJSxG9vEUZfjF7UpItonhRJBy9FNlrKlJSz1KZkJQBBaoaxajYB9RCLgp+bhDJM6znTQGlBXKSpzzenlQ65p2SHRCmAw6aFac26UoLelMlLYpXSY1pzJQ4l9YqLM2vFAuImsEc0blcF6GEaInFSxoU3RNajQMWvtQsBfKeZvrJUskhUIhm0mjJm1YfyWM/UQSG5V8J2dShEkZP+3ltAwmtTdJvNQYYVEOlZEx0WO9AekmKAQEfbHdhMJSDhdHR/ikkOKhIM4DWnGG1ASwalEqeR1yqj4tRlsWJsWhG186UIYIm5ONiKWBR9LJTbiolMLhK2eKAkPchzN89qjpwkDOuQ2tQEJZcDrUeDZvTRWBmgMUNYqRSF4imhnbqVMEcatJYAEXbLNtcelSAg0AZAYy5jfFRsVLKFkmJe0a1aEIWW898/NBaQPwkK8Wi2KIZycl15izrG3FAQw1Nf7zTgg3XPTjDRmfCYYh/byVG7arkcTQZ0rkyJrx/lRMlS1xjp/lPhgxMl8taVHKHhaaHsMXpMETXQ5oKJjFCmBxQVvFRiF2oAwH1xfVAyUeW2vjLLlG7igRLHqU5AbU8pw5mKUAx5Wo0FMhRLtlpJgSmdnipNkbUjGYohyUBye1SBw9aQu/rejKYvV3Ub0RwRFXGzQYmbnFaFCKmo2qNCXCSW64oENIQjqEvoulAQKMm8F6Ihg+tbJRuaP/ABQJbFXL50zUERJri0NBiDyGSmTLadJoAICD7gAhJKlyl36n8Im64N61Yq9KERo5tS6aalQibDYHmihyzJ7tuKZkiRLp81uWRSVPJxiAX70IRut9GKEoBAFisAK4il5KQMFETJQkQEI3/elNNBeC9zZkPenN04cwd/baoSCMwHJxY+KijACdJul46VdcMsBaS8Ve0aXQujhWKaIHvPHXpUFQiBbzL76RSpDRLlbTm2ZpegG5InWdqurWQkrP7FKpE3Vr+K5AUL+tOhx2yUFBrkLQ71iQ9UqZZdmWgAgsfZxnYTN/i9GjEkFkbDhPFJctaC1RJipJ/wBKmNI6Ur5emaGMHRirXYJpuzLTKNyizCdqhvaBlvWBJi2avnYp0Dy1EgG83qU9aJbz4oka01qLtNCiREDBbOYpaETMRkTPXapG0SU7u7vQ0JCFPsECzMFpqAtLqNGTjtoUoCEkgqcpmJtOY+85D6VIyu16mZXVEzctf4If+8PoQGhadQYm9LCyjQDLA5bltMsU1rrF55HKXVsvS1Wl5V8Kb23tFqE7PXyCek9qICgyl2Um4aMt/NBdkUCSRuneZpHYYbkI23tWkSb2EmYLrNAgWKBy5UYMzJGKIHcWAoxvYtPNBMIiWH95q7SH2qWYNQUEG0Ghx9qAspemJklwHmMFTaRiXxTCy+aC2tM70l7uc1cIi3FBiO+9ilybnVTNiIlOREK+lSQQ5dqwAnFEyRhhqUl5mmFdXNKGcG7TZmL+l80AJDF6AhF6NIO4bUJBVw2oZUgielGiAfYBuxJEF8NDWQkmrhXcLCbUrZTuT70WVIrt956apQjajKiW2a9x9/sHFS7A7lPhrsJQgauW57YqQIZAiW/LTN5EqGYS7tGKQoskzZEidCowzdgre9ppFFkSexrUgbN4p85q7FC6sr3qELBQksK0X0ovYEm1MKVu3PhUoMnUot0iu3201OJ1pzEijk86UmIhaQmaIgTqSqbEPagL8t1Q+RJrvFSRb5HpS4tRxTZADuT6BQoRamI8UHZ1qg3L0pZB3OGnLzvGtQEvXKsAYluoWWWVSkULLwoqJ6ULtuaIi32OQkjAGlNBKHC60YIFjh06VEwSWdmog+7AS1JG2+lYxKO1EcI7FABB9o0rlu1A4LtUNAqOP4C4pqkbVJCY1GswRJkfihCi5m1mog+4Ogrkmp2TNJuiCVE6VIshgqDMGIgqBAuwPxSsiuVgpfPfCgL9kqeYLpQ0EHSrrPytzUJcl5inJ70q5g3iio6WR9nMJnBUFSFmVasyxuaNREJBlGldQuV/4q9W7UoZJPuQF+xvST/i/hIyMDWrsCPd9y5EzpSFS6ZWrAtBRGzQBCwy7KAaq5X/AIiTIan4oBI/cqBLYoFyI0H8JLjA1q7h933STYNVdKsgvTJJZqYyDI6VegZJK7v8VKcdaALeNvtyG64N6Scns/kAhqVt/wCl/t2mQLSu1QQ3bLhpQgTqNEXJcnd/jdw+6pbNtn26BLihIw6fyAISpbbvQ6/boqCEpTkBiWiVRu4d6TCYBlVopILskn85WRjdUrBHu+1xC6wVA5F6fRh3tm3SgEj9leKScHupTMIC0tEqW7YaShCAyq0ZlGWSf5kL50dqEo7d32oCWkXhNvoyvv8A0tQCT7UuMgw0uGJiJ9L+9JcyQqctMY1Xd9EBDUrb/wBL/Z4gSsFRSt1l+ndlj0NSsNtn2LC0UKCyG7WmIiYb/mi3shMnLTkLNI3+igkNyr4T6pQiSMn2QCWkXV0Nvp3ZI91SsJGz7O+499ZV8rlXBIbmKLxSjE1BMxf6cO9s26UAkx9hFYusFZiysv1QF8mHahKO3Q/YdvfzRNOv3OlQkqjlFBmVVz9RQ6upo0HBMn2AC+dDekn/ABfVAX80KzHT64MmkCSk2DTf/n//2Q=="
\ No newline at end of file
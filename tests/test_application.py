@@ -1,13 +1,21 @@
+import base64
+import json
+import time
 from unittest.mock import patch
 
 from flask_testing import TestCase
+from sqlalchemy import select, text, update
+from sqlalchemy.exc import OperationalError
 
 from config import create_app
-from db import db
-from models import UserModel
+from db import db, has_writes
+from managers.auth import principal_cache
+from managers.catalog import CatalogQuery, catalog_version, invalidate_catalog
+from models import CatalogVersionModel, JacketModel, UserModel
+from schemas.responses.jacket import jacket_serializer
 from services.s3 import S3Service
-from tests.factories import GuestFactory, CreatorFactory
-from tests.helpers import generate_token, sample_pic_of_cat
+from tests.factories import GuestFactory, CreatorFactory, AdminFactory
+from tests.helpers import generate_token, sample_pic_of_cat, QueryRecorder, mock_photo_storage
 
 ENDPOINTS_DATA = (
     ("/jacket", "GET"),
@@ -25,11 +33,14 @@ class TestApp(TestCase):
         # Set up the test database
         db.init_app(self.app)
         db.create_all()
+        mock_photo_storage(self)
 
     def tearDown(self):
         # Clean up the test database
         db.session.remove()
         db.drop_all()
+        # Close the pool's connections, each test app has its own.
+        db.engine.dispose()
 
     def iterate_endpoints(self, endpoints_data, status_code_method, expected_resp_body, headers=None, payload=None):
         if not headers:
@@ -336,6 +347,26 @@ class TestApp(TestCase):
         self.assertEqual(resp.json['description'], data['description'])
         self.assertEqual(resp.json['size'], 'Large')
 
+    def test_post_jacket_invalid_body_raises(self):
+        headers = {"Content-Type": "application/json",
+                   "Authorization": f"Bearer {generate_token(CreatorFactory())}"}
+        data = {
+            "photo": sample_pic_of_cat,
+            "extension": "jpg",
+            "brand": "Marccain",
+            "description": "This is a great jacket!",
+            "size": "xxl",
+            "price": 100
+        }
+
+        resp = self.client.post("/jacket", headers=headers, json=data)
+        self.assert400(resp)
+        self.assertEqual(resp.json, {'message': {'size': ['Invalid enum member xxl']}})
+
+        resp = self.client.post("/jacket", headers=headers, json=["not", "an", "object"])
+        self.assert400(resp)
+        self.assertEqual(resp.json, {'message': {'_schema': ['Invalid input type.']}})
+
     def test_register_schema_raises_invalid_first_name(self):
         data = {"last_name": "Test", "email": "test@test.com", "phone": "11111111111111", "password": "12345@assd1",
                 "iban": "DE89370400440532013000",
@@ -452,3 +483,355 @@ class TestApp(TestCase):
         self.assertEqual(created_user.last_name, data["last_name"])
         self.assertEqual(created_user.email, data["email"])
         self.assertEqual(created_user.phone, data["phone"])
+
+    @patch.object(S3Service, "upload_photo", return_value="some.s3.url")
+    def test_get_jackets_paginated_with_cursor(self, mock_upload_photo):
+        user = CreatorFactory()
+        token = generate_token(user)
+        headers = {"Content-Type": "application/json",
+                   "Authorization": f"Bearer {token}"}
+
+        for brand in ("armani", "marccain", "gucci"):
+            data = {
+                "photo": sample_pic_of_cat,
+                "extension": "jpg",
+                "brand": brand,
+                "description": "This is a great jacket!",
+                "size": "l",
+                "price": 100
+            }
+            self.client.post("/jacket", headers=headers, json=data)
+
+        first_page = self.client.get("/jacket?limit=2", headers=headers)
+        self.assert200(first_page)
+        self.assertEqual([jacket['id'] for jacket in first_page.json], [1, 2])
+        cursor = first_page.headers['X-Next-Cursor']
+
+        second_page = self.client.get(f"/jacket?limit=2&cursor={cursor}", headers=headers)
+        self.assert200(second_page)
+        self.assertEqual([jacket['id'] for jacket in second_page.json], [3])
+        self.assertNotIn('X-Next-Cursor', second_page.headers)
+
+    def test_get_jackets_invalid_cursor_raises(self):
+        user = GuestFactory()
+        token = generate_token(user)
+        headers = {"Authorization": f"Bearer {token}"}
+
+        resp = self.client.get("/jacket?cursor=not-a-cursor", headers=headers)
+        self.assert400(resp)
+        self.assertEqual(resp.json, {'message': 'Invalid cursor'})
+
+        # Well-formed cursors with values the database would reject.
+        for forged in (["price", "abc", 1], ["price", 2 ** 40, 1], ["price", 100, "1"], ["-price", [1], 1]):
+            cursor = base64.urlsafe_b64encode(json.dumps(forged).encode()).decode()
+            resp = self.client.get(f"/jacket?sort={forged[0]}&cursor={cursor}", headers=headers)
+            self.assert400(resp)
+            self.assertEqual(resp.json, {'message': 'Invalid cursor'})
+
+    @patch.object(S3Service, "upload_photo", return_value="some.s3.url")
+    def test_stream_jackets_as_ndjson(self, mock_upload_photo):
+        user = CreatorFactory()
+        token = generate_token(user)
+        headers = {"Content-Type": "application/json",
+                   "Authorization": f"Bearer {token}"}
+
+        for brand in ("armani", "marccain"):
+            data = {
+                "photo": sample_pic_of_cat,
+                "extension": "jpg",
+                "brand": brand,
+                "description": "This is a great jacket!",
+                "size": "l",
+                "price": 100
+            }
+            self.client.post("/jacket", headers=headers, json=data)
+
+        resp = self.client.get("/jacket?stream=true", headers=headers)
+        self.assert200(resp)
+        self.assertEqual(resp.mimetype, "application/x-ndjson")
+        rows = [json.loads(line) for line in resp.get_data(as_text=True).splitlines()]
+        self.assertEqual([row['brand'] for row in rows], ["armani", "marccain"])
+
+    @patch.object(S3Service, "upload_photo", return_value="some.s3.url")
+    def test_get_jackets_filtered_and_sorted(self, mock_upload_photo):
+        creator = CreatorFactory()
+        other_creator = CreatorFactory()
+        headers = {"Content-Type": "application/json",
+                   "Authorization": f"Bearer {generate_token(creator)}"}
+        other_headers = {"Content-Type": "application/json",
+                         "Authorization": f"Bearer {generate_token(other_creator)}"}
+
+        jackets = (
+            (headers, "armani", "l", 300),
+            (headers, "armani", "m", 100),
+            (other_headers, "armani", "l", 200),
+            (other_headers, "gucci", "l", 250),
+        )
+        for request_headers, brand, size, price in jackets:
+            data = {
+                "photo": sample_pic_of_cat,
+                "extension": "jpg",
+                "brand": brand,
+                "description": "This is a great jacket!",
+                "size": size,
+                "price": price
+            }
+            self.client.post("/jacket", headers=request_headers, json=data)
+
+        resp = self.client.get("/jacket?brand=armani&size=l&sort=-price", headers=headers)
+        self.assertEqual([jacket['price'] for jacket in resp.json], [300, 200])
+
+        resp = self.client.get("/jacket?min_price=150&max_price=260&sort=price&limit=1", headers=headers)
+        self.assertEqual([jacket['price'] for jacket in resp.json], [200])
+        cursor = resp.headers['X-Next-Cursor']
+        resp = self.client.get(f"/jacket?min_price=150&max_price=260&sort=price&limit=1&cursor={cursor}",
+                               headers=headers)
+        self.assertEqual([jacket['price'] for jacket in resp.json], [250])
+
+        resp = self.client.get(f"/jacket?creator_id={other_creator.id}", headers=headers)
+        self.assertEqual([jacket['brand'] for jacket in resp.json], ["armani", "gucci"])
+
+        resp = self.client.get(f"/jacket?sort=created_on&cursor={cursor}", headers=headers)
+        self.assert400(resp)
+
+    def test_catalog_pages_use_the_partial_indexes(self):
+        # Tiny tables are scanned anyway unless the planner is told not to.
+        db.session.execute(text("SET LOCAL enable_seqscan = off"))
+        for sort, brand, index in (("created_on", None, "ix_jacket_created_on_id"),
+                                   ("-price", None, "ix_jacket_price_id"),
+                                   ("price", "armani", "ix_jacket_brand_price_id")):
+            catalog = CatalogQuery(brand=brand, sort=sort)
+            query = catalog._ordered(catalog._filtered()).limit(20)
+            statement = query.statement.compile(db.engine, compile_kwargs={"literal_binds": True})
+            plan = "\n".join(db.session.execute(text(f"EXPLAIN {statement}")).scalars())
+            self.assertIn(index, plan)
+        db.session.rollback()
+
+    @patch.object(S3Service, "upload_photo", return_value="some.s3.url")
+    def test_listings_load_rows_not_entities(self, mock_upload_photo):
+        user = CreatorFactory()
+        headers = {"Content-Type": "application/json",
+                   "Authorization": f"Bearer {generate_token(user)}"}
+        for brand in ("armani", "marccain"):
+            data = {
+                "photo": sample_pic_of_cat,
+                "extension": "jpg",
+                "brand": brand,
+                "description": "This is a great jacket!",
+                "size": "l",
+                "price": 100
+            }
+            self.client.post("/jacket", headers=headers, json=data)
+        db.session.query(JacketModel).update({JacketModel.thumbnails: {"webp": {"320": "some.s3.url/320.webp"}}})
+        db.session.commit()
+        expected = jacket_serializer.dump(JacketModel.query.order_by(JacketModel.id).all(), many=True)
+        db.session.expunge_all()
+
+        self.assertEqual(self.client.get("/jacket", headers=headers).json, expected)
+        resp = self.client.get("/jacket?stream=true", headers=headers)
+        self.assertEqual([json.loads(line) for line in resp.get_data(as_text=True).splitlines()], expected)
+        self.assertEqual(self.client.get("/jacket/search?q=jacket", headers=headers).json, expected)
+        # Only the user the request authenticated as was loaded as an entity.
+        self.assertEqual([type(obj) for obj in db.session.identity_map.values()], [UserModel])
+
+    @patch.object(S3Service, "upload_photo", return_value="some.s3.url")
+    def test_search_jackets_ranks_brand_matches_first(self, mock_upload_photo):
+        user = CreatorFactory()
+        headers = {"Content-Type": "application/json",
+                   "Authorization": f"Bearer {generate_token(user)}"}
+
+        jackets = (
+            ("marccain", "Warm leather jacket, pairs well with an armani scarf"),
+            ("armani", "Light leather jacket for the summer"),
+            ("gucci", "Wool coat"),
+        )
+        for brand, description in jackets:
+            data = {
+                "photo": sample_pic_of_cat,
+                "extension": "jpg",
+                "brand": brand,
+                "description": description,
+                "size": "l",
+                "price": 100
+            }
+            self.client.post("/jacket", headers=headers, json=data)
+
+        resp = self.client.get("/jacket/search?q=armani leather", headers=headers)
+        self.assert200(resp)
+        self.assertEqual([jacket['brand'] for jacket in resp.json], ["armani", "marccain"])
+
+        resp = self.client.get("/jacket/search?q=jackets", headers=headers)
+        self.assertEqual(len(resp.json), 2)
+
+        resp = self.client.get("/jacket/search?q=cashmere", headers=headers)
+        self.assertEqual(resp.json, "No jackets found")
+
+    @patch.object(S3Service, "upload_photo", return_value="some.s3.url")
+    def test_catalog_reads_are_cached_until_a_write(self, mock_upload_photo):
+        user = CreatorFactory()
+        headers = {"Content-Type": "application/json",
+                   "Authorization": f"Bearer {generate_token(user)}"}
+        data = {
+            "photo": sample_pic_of_cat,
+            "extension": "jpg",
+            "brand": "armani",
+            "description": "This is a great jacket!",
+            "size": "l",
+            "price": 100
+        }
+        self.client.post("/jacket", headers=headers, json=data)
+
+        first = self.client.get("/jacket", headers=headers)
+        second = self.client.get("/jacket", headers=headers)
+        self.assertEqual(first.headers['X-Cache'], 'MISS')
+        self.assertEqual(second.headers['X-Cache'], 'HIT')
+        self.assertEqual(first.json, second.json)
+
+        # A different query is a different entry
+        self.assertEqual(self.client.get("/jacket?brand=armani", headers=headers).headers['X-Cache'], 'MISS')
+
+        self.client.post("/jacket", headers=headers, json=data)
+        third = self.client.get("/jacket", headers=headers)
+        self.assertEqual(third.headers['X-Cache'], 'MISS')
+        self.assertEqual(len(third.json), 2)
+
+        admin_headers = {"Authorization": f"Bearer {generate_token(AdminFactory())}"}
+        stats = self.client.get("/metrics/cache", headers=admin_headers).json
+        self.assertEqual((stats['hits'], stats['misses']), (1, 3))
+        self.assertGreaterEqual(stats['invalidations'], 2)
+
+    def test_catalog_writes_do_not_lock_the_catalog_version(self):
+        db.session.commit()
+        version = catalog_version()
+        db.session.commit()
+        invalidate_catalog()
+
+        # Another writer can bump the version while this transaction is still open.
+        with db.engine.begin() as connection:
+            connection.execute(select(CatalogVersionModel).with_for_update(nowait=True)).all()
+        db.session.commit()
+        self.assertEqual(catalog_version(), version + 1)
+
+    @patch.object(S3Service, "upload_photo", return_value="some.s3.url")
+    def test_failed_catalog_version_bump_keeps_the_write(self, mock_upload_photo):
+        creator = CreatorFactory()
+        headers = {"Authorization": f"Bearer {generate_token(creator)}"}
+        self.assertEqual(self.client.get("/jacket", headers=headers).json, "No jackets yet")
+        version = catalog_version()
+
+        with patch.object(db.engine, "begin", side_effect=OperationalError("UPDATE", {}, Exception("gone"))):
+            data = {"photo": sample_pic_of_cat, "extension": "jpg", "brand": "Marccain",
+                    "description": "This is a great jacket!", "size": "l", "price": 100}
+            resp = self.client.post("/jacket", headers=headers, json=data)
+            self.assertStatus(resp, 201)
+            db.session.commit()
+
+        self.assertEqual(catalog_version(), version)
+        self.assertIsNotNone(JacketModel.query.get(resp.json["id"]))
+        # The cached empty page is gone all the same.
+        self.assertEqual(len(self.client.get("/jacket", headers=headers).json), 1)
+
+    def test_cache_metrics_require_admin(self):
+        headers = {"Authorization": f"Bearer {generate_token(CreatorFactory())}"}
+        resp = self.client.get("/metrics/cache", headers=headers)
+        self.assert403(resp)
+
+    def test_pool_metrics(self):
+        admin_headers = {"Authorization": f"Bearer {generate_token(AdminFactory())}"}
+        stats = self.client.get("/metrics/pool", headers=admin_headers).json
+        self.assertEqual(stats["size"], self.app.config["SQLALCHEMY_ENGINE_OPTIONS"]["pool_size"])
+        self.assertGreaterEqual(stats["checked_out"], 1)
+        self.assertGreater(stats["checkouts"], 0)
+        self.assertEqual(stats["timeouts"], 0)
+        self.assertGreaterEqual(stats["wait_seconds_max"], stats["wait_seconds_avg"])
+
+        headers = {"Authorization": f"Bearer {generate_token(CreatorFactory())}"}
+        self.assert403(self.client.get("/metrics/pool", headers=headers))
+
+    def test_has_writes(self):
+        db.session.commit()
+        UserModel.query.all()
+        self.assertFalse(has_writes(db.session))
+
+        # Statements sent past the unit of work count as well as flushed changes.
+        db.session.execute(update(UserModel).values(first_name="Changed"))
+        self.assertTrue(has_writes(db.session))
+        db.session.commit()
+        self.assertFalse(has_writes(db.session))
+
+        db.session.add(GuestFactory.build(id=None))
+        self.assertTrue(has_writes(db.session))
+        db.session.rollback()
+        self.assertFalse(has_writes(db.session))
+
+    @patch.object(S3Service, "upload_photo", return_value="some.s3.url")
+    def test_catalog_conditional_get(self, mock_upload_photo):
+        user = CreatorFactory()
+        headers = {"Content-Type": "application/json",
+                   "Authorization": f"Bearer {generate_token(user)}"}
+        data = {
+            "photo": sample_pic_of_cat,
+            "extension": "jpg",
+            "brand": "armani",
+            "description": "This is a great jacket!",
+            "size": "l",
+            "price": 100
+        }
+        self.client.post("/jacket", headers=headers, json=data)
+
+        resp = self.client.get("/jacket", headers=headers)
+        etag = resp.headers['ETag']
+
+        resp = self.client.get("/jacket", headers={**headers, "If-None-Match": etag})
+        self.assertStatus(resp, 304)
+        self.assertEqual(resp.data, b"")
+
+        # Another query has its own tag
+        resp = self.client.get("/jacket?brand=armani", headers={**headers, "If-None-Match": etag})
+        self.assert200(resp)
+
+        self.client.post("/jacket", headers=headers, json=data)
+        # The version moves when the write commits.
+        db.session.commit()
+        resp = self.client.get("/jacket", headers={**headers, "If-None-Match": etag})
+        self.assert200(resp)
+        self.assertNotEqual(resp.headers['ETag'], etag)
+
+    def test_authenticated_user_is_cached_until_updated(self):
+        user = GuestFactory()
+        headers = {"Authorization": f"Bearer {generate_token(user)}"}
+
+        self.client.get("/jacket", headers=headers)
+        with QueryRecorder() as queries:
+            resp = self.client.get("/jacket", headers=headers)
+        self.assert200(resp)
+        self.assertEqual(queries.touching("users"), [])
+
+        user.first_name = "Changed"
+        db.session.commit()
+        with QueryRecorder() as queries:
+            self.client.get("/jacket", headers=headers)
+        self.assertNotEqual(queries.touching("users"), [])
+
+    def test_cached_token_still_rejects_other_tokens(self):
+        user = GuestFactory()
+        headers = {"Authorization": f"Bearer {generate_token(user)}"}
+        self.assert200(self.client.get("/jacket", headers=headers))
+
+        resp = self.client.get("/jacket", headers={"Authorization": "Bearer eyJ0eX"})
+        self.assert401(resp)
+        self.assertEqual(resp.json, {"message": "Invalid token"})
+
+    def test_user_changed_while_loading_is_not_cached(self):
+        user = GuestFactory()
+        token = generate_token(user)
+        generation = principal_cache.generation(user.id)
+
+        # The user is changed after their token was decoded, but before the row loaded for it is cached.
+        user.first_name = "Changed"
+        db.session.commit()
+        principal_cache.set(token, user, time.time() + 60, generation)
+        self.assertIsNone(principal_cache.get(token))
+
+        principal_cache.set(token, user, time.time() + 60, principal_cache.generation(user.id))
+        self.assertEqual(principal_cache.get(token).first_name, "Changed")
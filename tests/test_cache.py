@@ -0,0 +1,54 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+from managers.auth import LocalGenerations
+from services.cache import LRUCache
+
+
+class TestLRUCache(TestCase):
+    def test_evicts_least_recently_used(self):
+        cache = LRUCache(max_entries=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("c"), 3)
+
+    def test_entries_expire(self):
+        cache = LRUCache(max_entries=2, ttl=10)
+        with patch("services.cache.time.monotonic", return_value=100):
+            cache.set("a", 1)
+        with patch("services.cache.time.monotonic", return_value=109):
+            self.assertEqual(cache.get("a"), 1)
+        with patch("services.cache.time.monotonic", return_value=111):
+            self.assertIsNone(cache.get("a"))
+        self.assertEqual(len(cache), 0)
+
+    def test_generations(self):
+        cache = LRUCache()
+        self.assertEqual(cache.generation("catalog"), 0)
+        cache.bump_generation("catalog")
+        self.assertEqual(cache.generation("catalog"), 1)
+        self.assertEqual(cache.generation("other"), 0)
+
+
+class TestLocalGenerations(TestCase):
+    def test_generations_are_forgotten_once_cached_entries_expired(self):
+        generations = LocalGenerations(ttl=10)
+        with patch("managers.auth.time.monotonic", return_value=100):
+            generations.bump_generation("principal:1")
+        first = generations.generation("principal:1")
+        self.assertNotEqual(first, 0)
+
+        with patch("managers.auth.time.monotonic", return_value=111):
+            generations.bump_generation("principal:2")
+        self.assertEqual(generations.generation("principal:1"), 0)
+        self.assertEqual(len(generations), 1)
+
+        # A user changed again never gets a generation an old entry was cached with.
+        with patch("managers.auth.time.monotonic", return_value=112):
+            generations.bump_generation("principal:1")
+        self.assertNotIn(generations.generation("principal:1"), (0, first))
@@ -0,0 +1,157 @@
+import threading
+from collections import Counter
+from unittest.mock import patch
+
+from flask_testing import TestCase
+from werkzeug.exceptions import Conflict
+
+from config import create_app
+from db import db
+from managers.order import OrderManager
+from managers.shopping_cart import ShoppingCartManager
+from models import JacketModel, JacketStatus, OrderModel, ShoppingCartModel, UserModel
+from services.s3 import S3Service
+from tests.factories import CreatorFactory
+from tests.helpers import generate_token, sample_pic_of_cat, mock_photo_storage
+
+
+class TestCartConcurrency(TestCase):
+    # Many threads, each with its own session and connection, editing carts and checking out at the same time.
+    threads = 8
+
+    def create_app(self):
+        return create_app("config.TestConfig")
+
+    def setUp(self):
+        db.init_app(self.app)
+        db.create_all()
+        mock_photo_storage(self)
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        # Close the pool's connections, each test app has its own.
+        db.engine.dispose()
+
+    @patch.object(S3Service, "upload_photo", return_value="some.s3.url")
+    def create_jackets(self, prices, mock_upload_photo, creator=None):
+        jacket_ids = []
+        for price in prices:
+            data = {"photo": sample_pic_of_cat, "extension": "jpg", "brand": "Marccain",
+                    "description": "This is a great jacket!", "size": "l", "price": price}
+            headers = {"Authorization": f"Bearer {generate_token(creator or CreatorFactory())}"}
+            jacket_ids.append(self.client.post("/jacket", headers=headers, json=data).json["id"])
+        db.session.commit()
+        return jacket_ids
+
+    def run_concurrently(self, target, args_list):
+        # Starts every call at the same moment. Each call commits like a request would.
+        barrier = threading.Barrier(len(args_list), timeout=10)
+        errors = []
+
+        def run(*args):
+            with self.app.app_context():
+                try:
+                    barrier.wait()
+                    target(*args)
+                except Exception as ex:
+                    errors.append(ex)
+                finally:
+                    db.session.remove()
+
+        threads = [threading.Thread(target=run, args=args) for args in args_list]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=60)
+        self.assertEqual(errors, [])
+
+    def assert_cart_totals_match_jackets(self):
+        db.session.expire_all()
+        for shopping_cart in ShoppingCartModel.query.all():
+            self.assertEqual(shopping_cart.amount, sum(jacket.price for jacket in shopping_cart.jackets))
+
+    def test_concurrent_edits_of_one_cart_keep_its_total(self):
+        jacket_ids = self.create_jackets([10, 20, 30, 40, 50, 60, 70, 80])
+        buyer_id = CreatorFactory().id
+        db.session.commit()
+
+        def edit_cart(offset):
+            user = UserModel.query.get(buyer_id)
+            for round_number in range(5):
+                for jacket_id in jacket_ids[offset::2]:
+                    if round_number % 2:
+                        ShoppingCartManager.remove_jacket(user, jacket_id)
+                    else:
+                        ShoppingCartManager.add_jacket(user, jacket_id)
+                    db.session.commit()
+
+        self.run_concurrently(edit_cart, [(thread % 2,) for thread in range(self.threads)])
+
+        self.assert_cart_totals_match_jackets()
+        shopping_cart = ShoppingCartModel.query.filter_by(user_id=buyer_id).one()
+        self.assertEqual(sorted(jacket.id for jacket in shopping_cart.jackets), sorted(jacket_ids))
+
+    def test_buyers_racing_for_the_same_jackets_never_share_one(self):
+        jacket_ids = self.create_jackets([10, 20, 30, 40, 50, 60])
+        buyer_ids = [CreatorFactory().id for _ in range(self.threads)]
+        db.session.commit()
+        outcomes = Counter()
+
+        def shop(buyer_number):
+            user = UserModel.query.get(buyer_ids[buyer_number])
+            # Every buyer wants two jackets, each of which another buyer wants too.
+            for jacket_id in (jacket_ids[buyer_number % 6], jacket_ids[(buyer_number + 1) % 6]):
+                ShoppingCartManager.add_jacket(user, jacket_id)
+                db.session.commit()
+            try:
+                order = OrderManager.place_order(user)
+                db.session.commit()
+                outcomes["ordered" if order else "empty"] += 1
+            except Conflict:
+                db.session.rollback()
+                outcomes["conflict"] += 1
+
+        self.run_concurrently(shop, [(buyer_number,) for buyer_number in range(self.threads)])
+
+        self.assertEqual(sum(outcomes.values()), self.threads)
+        self.assertGreater(outcomes["ordered"], 0)
+        ordered = Counter(jacket.id for order in OrderModel.query.all() for jacket in order.jackets)
+        # No jacket went to two orders, and a jacket is reserved exactly when it is in an order.
+        self.assertTrue(all(count == 1 for count in ordered.values()))
+        for jacket in JacketModel.query.filter(JacketModel.id.in_(jacket_ids)):
+            expected = JacketStatus.reserved if jacket.id in ordered else JacketStatus.available
+            self.assertEqual(jacket.status, expected)
+        for order in OrderModel.query.all():
+            self.assertEqual(order.amount, sum(jacket.price for jacket in order.jackets))
+        self.assert_cart_totals_match_jackets()
+
+    def test_cart_edits_racing_a_checkout_do_not_deadlock(self):
+        # Checkout and removals both lock the cart row and its link rows. Taken in different orders, the deadlock
+        # detector kills one of them.
+        for _ in range(5):
+            jacket_ids = self.create_jackets([10, 20, 30, 40, 50, 60, 70, 80], creator=CreatorFactory())
+            buyer_id = CreatorFactory().id
+            db.session.commit()
+            ShoppingCartManager.add_jackets(UserModel.query.get(buyer_id), jacket_ids)
+            db.session.commit()
+
+            def edit_or_check_out(jacket_id):
+                user = UserModel.query.get(buyer_id)
+                if jacket_id is None:
+                    OrderManager.place_order(user)
+                else:
+                    ShoppingCartManager.remove_jacket(user, jacket_id)
+                db.session.commit()
+
+            self.run_concurrently(edit_or_check_out, [(None,)] + [(jacket_id,) for jacket_id in jacket_ids[1:]])
+
+            # Every jacket was either removed first and is still on sale, or went into the order.
+            db.session.expire_all()
+            ordered = {jacket.id for order in OrderModel.query.filter_by(user_id=buyer_id) for jacket in order.jackets}
+            self.assertIn(jacket_ids[0], ordered)
+            for jacket in JacketModel.query.filter(JacketModel.id.in_(jacket_ids)):
+                expected = JacketStatus.reserved if jacket.id in ordered else JacketStatus.available
+                self.assertEqual(jacket.status, expected)
+            self.assertEqual(ShoppingCartModel.query.filter_by(user_id=buyer_id).one().jackets, [])
+            self.assert_cart_totals_match_jackets()
@@ -0,0 +1,40 @@
+import base64
+import hashlib
+import os
+from unittest import TestCase
+
+from utils.encryptor import Base64Stream, hash_base64
+
+
+class TestBase64Stream(TestCase):
+    def read_all(self, stream, size):
+        chunks = []
+        while True:
+            chunk = stream.read(size)
+            if not chunk:
+                return b"".join(chunks)
+            chunks.append(chunk)
+
+    def test_decodes_and_hashes_in_chunks(self):
+        for length in (0, 1, 2, 3, 1000, 100003):
+            data = os.urandom(length)
+            encoded = base64.b64encode(data).decode()
+            stream = Base64Stream(encoded, chunk_size=999)
+
+            self.assertEqual(self.read_all(stream, 4096), data)
+            self.assertEqual(stream.hexdigest(), hashlib.sha256(data).hexdigest())
+
+    def test_ignores_line_breaks(self):
+        data = os.urandom(10000)
+        encoded = base64.encodebytes(data).decode()
+        self.assertIn("\n", encoded)
+
+        self.assertEqual(self.read_all(Base64Stream(encoded, chunk_size=100), 333), data)
+
+    def test_hash_covers_unread_data(self):
+        data = os.urandom(5000)
+        stream = Base64Stream(base64.b64encode(data).decode(), chunk_size=300)
+        stream.read(10)
+
+        self.assertEqual(stream.hexdigest(), hashlib.sha256(data).hexdigest())
+        self.assertEqual(hash_base64(base64.b64encode(data).decode()), hashlib.sha256(data).hexdigest())
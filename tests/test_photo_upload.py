@@ -0,0 +1,348 @@
+import base64
+import hashlib
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import boto3
+import requests
+from decouple import config
+from flask_testing import TestCase
+from moto import mock_s3
+from PIL import Image
+from sqlalchemy import text
+from werkzeug.exceptions import InternalServerError
+
+from config import create_app
+from db import db
+from managers.thumbnail import ThumbnailManager
+from models import JacketModel
+from services.jobs import job_queue
+from services.s3 import S3Service
+from tests.factories import CreatorFactory
+from tests.helpers import generate_token, sample_pic_of_cat
+
+
+@mock_s3
+class TestPhotoUpload(TestCase):
+    def create_app(self):
+        return create_app("config.TestConfig")
+
+    def setUp(self):
+        db.init_app(self.app)
+        db.create_all()
+        self.bucket = config("S3_BUCKET_NAME")
+        self.s3 = boto3.client("s3", region_name=config("S3_REGION"))
+        self.s3.create_bucket(Bucket=self.bucket,
+                              CreateBucketConfiguration={"LocationConstraint": config("S3_REGION")})
+
+        self.user = CreatorFactory()
+        self.headers = {"Content-Type": "application/json",
+                        "Authorization": f"Bearer {generate_token(self.user)}"}
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        # Close the pool's connections, each test app has its own.
+        db.engine.dispose()
+
+    def jacket_data(self, photo_key):
+        return {
+            "photo_key": photo_key,
+            "brand": "Marccain",
+            "description": "This is a great jacket!",
+            "size": "l",
+            "price": 100
+        }
+
+    def upload(self, content=b"fake jpeg bytes"):
+        resp = self.client.post("/jacket/upload", headers=self.headers, json={"extension": "jpg"})
+        self.assertStatus(resp, 201)
+        upload = resp.json
+        uploaded = requests.post(upload["url"], data=upload["fields"], files={"file": content})
+        self.assertLess(uploaded.status_code, 300)
+        return upload["key"]
+
+    @staticmethod
+    def stored_key(content):
+        # Where a photo with this content is kept, however it was sent.
+        return f"{hashlib.sha256(content).hexdigest()}.jpg"
+
+    def test_create_jacket_from_uploaded_photo(self):
+        key = self.upload()
+        self.assertTrue(key.startswith(f"uploads/{self.user.id}/"))
+
+        with patch.object(S3Service, "hash_photo", wraps=S3Service().hash_photo) as hash_photo:
+            resp = self.client.post("/jacket", headers=self.headers, json=self.jacket_data(key))
+        self.assertStatus(resp, 201)
+        # The request does not read the upload, the jacket shows it where it is until it has been stored.
+        hash_photo.assert_not_called()
+        self.assertTrue(resp.json["photo_url"].endswith(f".amazonaws.com/{key}"))
+
+        # The upload is copied under the content hash and removed, in the background.
+        self.run_jobs()
+        jacket = JacketModel.query.get(resp.json["id"])
+        self.assertEqual(jacket.pic_hash, hashlib.sha256(b"fake jpeg bytes").hexdigest())
+        self.assertTrue(jacket.photo_url.endswith(f".amazonaws.com/{self.stored_key(b'fake jpeg bytes')}"))
+        self.assertEqual(self.stored_photos(), [self.stored_key(b"fake jpeg bytes")])
+        stored = self.s3.head_object(Bucket=self.bucket, Key=self.stored_key(b"fake jpeg bytes"))
+        self.assertEqual(stored["ContentType"], "image/jpeg")
+
+    def test_uploaded_and_base64_photos_are_stored_once(self):
+        photo = base64.b64decode(sample_pic_of_cat)
+        first = self.client.post("/jacket", headers=self.headers, json=self.base64_jacket_data()).json
+        second = self.client.post("/jacket", headers=self.headers, json=self.jacket_data(self.upload(photo))).json
+
+        self.run_jobs()
+        self.assertEqual(JacketModel.query.get(second["id"]).photo_url, first["photo_url"])
+        self.assertEqual(self.stored_photos(), [self.stored_key(photo)])
+        # The second jacket got the thumbnails of the photo too.
+        self.assertIsNotNone(JacketModel.query.get(second["id"]).thumbnails)
+
+    def test_photo_is_locked_until_the_jacket_is_committed(self):
+        photo = base64.b64decode(sample_pic_of_cat)
+        lock = text("SELECT pg_try_advisory_lock(hashtext(:pic_hash))").bindparams(
+            pic_hash=hashlib.sha256(photo).hexdigest()
+        )
+        unlock = text("SELECT pg_advisory_unlock_all()")
+
+        self.assertStatus(self.client.post("/jacket", headers=self.headers, json=self.base64_jacket_data()), 201)
+        # The cleanup job of a deleted jacket with this photo would wait here.
+        with db.engine.connect() as other:
+            self.assertFalse(other.execute(lock).scalar())
+            db.session.commit()
+            self.assertTrue(other.execute(lock).scalar())
+            other.execute(unlock)
+
+    def test_edit_jacket_with_new_upload_deletes_old_photo(self):
+        old_key = self.upload()
+        jacket = self.client.post("/jacket", headers=self.headers, json=self.jacket_data(old_key)).json
+
+        self.run_jobs()
+
+        new_key = self.upload(b"another photo")
+        resp = self.client.put(f"/jacket/{jacket['id']}", headers=self.headers, json=self.jacket_data(new_key))
+        self.assert200(resp)
+        self.assertTrue(resp.json["photo_url"].endswith(new_key))
+
+        # The old photo is only deleted once the edit is committed.
+        self.assertEqual(sorted(self.stored_photos()), sorted([self.stored_key(b"fake jpeg bytes"), new_key]))
+        self.run_jobs()
+        self.assertEqual(self.stored_photos(), [self.stored_key(b"another photo")])
+
+    def test_create_jacket_with_missing_upload_raises(self):
+        key = f"uploads/{self.user.id}/never-uploaded.jpg"
+        resp = self.client.post("/jacket", headers=self.headers, json=self.jacket_data(key))
+        self.assert400(resp)
+        self.assertEqual(resp.json, {"message": "Photo has not been uploaded yet"})
+
+    def test_create_jacket_with_someone_elses_upload_raises(self):
+        key = self.upload()
+        other_user = CreatorFactory()
+        headers = {"Content-Type": "application/json",
+                   "Authorization": f"Bearer {generate_token(other_user)}"}
+
+        resp = self.client.post("/jacket", headers=headers, json=self.jacket_data(key))
+        self.assert400(resp)
+        self.assertEqual(resp.json, {"message": "Unknown photo upload"})
+
+    def test_jacket_without_any_photo_raises(self):
+        data = self.jacket_data("unused")
+        del data["photo_key"]
+        resp = self.client.post("/jacket", headers=self.headers, json=data)
+        self.assert400(resp)
+        self.assertEqual(resp.json, {"message": {"photo": ["Missing data for required field."]}})
+
+    def test_base64_photo_is_streamed_to_s3(self):
+        data = self.jacket_data(None)
+        del data["photo_key"]
+        data.update({"photo": sample_pic_of_cat, "extension": "jpg"})
+
+        resp = self.client.post("/jacket", headers=self.headers, json=data)
+        self.assertStatus(resp, 201)
+
+        photo = base64.b64decode(sample_pic_of_cat)
+        key = resp.json["photo_url"].split(".amazonaws.com/")[-1]
+        uploaded = self.s3.get_object(Bucket=self.bucket, Key=key)
+        self.assertEqual(uploaded["Body"].read(), photo)
+        self.assertEqual(uploaded["ContentType"], "image/jpeg")
+        self.assertEqual(JacketModel.query.get(resp.json["id"]).pic_hash, hashlib.sha256(photo).hexdigest())
+
+    def base64_jacket_data(self):
+        data = self.jacket_data(None)
+        del data["photo_key"]
+        data.update({"photo": sample_pic_of_cat, "extension": "jpg"})
+        return data
+
+    def stored_keys(self):
+        return [obj["Key"] for obj in self.s3.list_objects_v2(Bucket=self.bucket).get("Contents", [])]
+
+    def stored_photos(self):
+        return [key for key in self.stored_keys() if not key.startswith("thumbnails/")]
+
+    def run_jobs(self):
+        db.session.commit()
+        job_queue.drain()
+
+    def test_identical_photos_are_stored_once(self):
+        other_user = CreatorFactory()
+        other_headers = {"Content-Type": "application/json",
+                         "Authorization": f"Bearer {generate_token(other_user)}"}
+
+        first = self.client.post("/jacket", headers=self.headers, json=self.base64_jacket_data()).json
+        second = self.client.post("/jacket", headers=other_headers, json=self.base64_jacket_data()).json
+
+        pic_hash = hashlib.sha256(base64.b64decode(sample_pic_of_cat)).hexdigest()
+        self.assertEqual(first["photo_url"], second["photo_url"])
+        # Once the scratch uploads they went through are cleaned up.
+        self.run_jobs()
+        self.assertEqual(self.stored_photos(), [f"{pic_hash}.jpg"])
+
+        # The object stays while any jacket still references it.
+        self.assert200(self.client.delete(f"/jacket/{first['id']}", headers=self.headers))
+        self.run_jobs()
+        self.assertEqual(self.stored_photos(), [f"{pic_hash}.jpg"])
+
+        self.assert200(self.client.delete(f"/jacket/{second['id']}", headers=other_headers))
+        self.run_jobs()
+        self.assertEqual(self.stored_keys(), [])
+
+    def test_duplicate_upload_reuses_stored_photo(self):
+        first = self.client.post("/jacket", headers=self.headers, json=self.jacket_data(self.upload())).json
+        duplicate_key = self.upload()
+
+        self.run_jobs()
+
+        resp = self.client.post("/jacket", headers=self.headers, json=self.jacket_data(duplicate_key))
+        self.assertStatus(resp, 201)
+        self.run_jobs()
+        self.assertEqual(JacketModel.query.get(resp.json["id"]).photo_url, JacketModel.query.get(first["id"]).photo_url)
+        self.assertNotIn(duplicate_key, self.stored_keys())
+
+    def test_edit_keeps_photo_shared_with_another_jacket(self):
+        first = self.client.post("/jacket", headers=self.headers, json=self.base64_jacket_data()).json
+        second = self.client.post("/jacket", headers=self.headers, json=self.base64_jacket_data()).json
+
+        new_key = self.upload(b"another photo")
+        resp = self.client.put(f"/jacket/{second['id']}", headers=self.headers, json=self.jacket_data(new_key))
+        self.assert200(resp)
+
+        self.run_jobs()
+        self.assertEqual(sorted(self.stored_photos()),
+                         sorted([first["photo_url"].split(".amazonaws.com/")[-1], self.stored_key(b"another photo")]))
+
+    def test_thumbnails_are_generated_in_the_background(self):
+        resp = self.client.post("/jacket", headers=self.headers, json=self.base64_jacket_data())
+        self.assertStatus(resp, 201)
+        self.assertIsNone(resp.json["thumbnails"])
+
+        self.run_jobs()
+
+        pic_hash = JacketModel.query.get(resp.json["id"]).pic_hash
+        thumbnails = JacketModel.query.get(resp.json["id"]).thumbnails
+        self.assertEqual(sorted(thumbnails), ["jpeg", "webp"])
+        self.assertEqual(sorted(thumbnails["webp"], key=int), ["160", "320", "640"])
+
+        thumbnail = self.s3.get_object(Bucket=self.bucket, Key=f"thumbnails/{pic_hash}/320.webp")
+        self.assertEqual(thumbnail["ContentType"], "image/webp")
+        self.assertEqual(Image.open(thumbnail["Body"]).width, 320)
+
+        # The thumbnails go with the last jacket using the photo.
+        self.assert200(self.client.delete(f"/jacket/{resp.json['id']}", headers=self.headers))
+        self.run_jobs()
+        self.assertEqual(self.stored_keys(), [])
+
+    def test_thumbnails_change_catalog_and_cart_etags(self):
+        jacket = self.client.post("/jacket", headers=self.headers, json=self.base64_jacket_data()).json
+        buyer_headers = {"Authorization": f"Bearer {generate_token(CreatorFactory())}"}
+        self.assert200(self.client.put("/shopping_cart", headers=buyer_headers, json={"jacket_id": jacket["id"]}))
+        db.session.commit()
+
+        pages = {}
+        for url, headers in (("/jacket", self.headers), ("/shopping_cart", buyer_headers)):
+            resp = self.client.get(url, headers=headers)
+            pages[url] = (headers, resp.headers["ETag"])
+        self.assertIsNone(resp.json["jackets"][0]["thumbnails"])
+
+        self.run_jobs()
+
+        for url, (headers, etag) in pages.items():
+            resp = self.client.get(url, headers={**headers, "If-None-Match": etag})
+            self.assert200(resp)
+            self.assertNotEqual(resp.headers["ETag"], etag)
+            jackets = resp.json if url == "/jacket" else resp.json["jackets"]
+            self.assertEqual(sorted(jackets[0]["thumbnails"]), ["jpeg", "webp"])
+
+    def test_lost_upload_jobs_are_swept(self):
+        jacket = self.client.post("/jacket", headers=self.headers, json=self.jacket_data(self.upload())).json
+        db.session.commit()
+        self.app.extensions["job_queue"]["queue"].queue.clear()
+
+        self.make_due(jacket["id"])
+        job_queue.drain()
+        self.assertEqual(JacketModel.query.get(jacket["id"]).pic_hash, hashlib.sha256(b"fake jpeg bytes").hexdigest())
+        self.assertEqual(self.stored_photos(), [self.stored_key(b"fake jpeg bytes")])
+
+    def make_due(self, jacket_id):
+        JacketModel.query.filter_by(id=jacket_id).update({"thumbnails_due": datetime.utcnow() - timedelta(seconds=1)})
+        db.session.commit()
+
+    def test_lost_thumbnail_jobs_are_swept(self):
+        jacket = self.client.post("/jacket", headers=self.headers, json=self.base64_jacket_data()).json
+        db.session.commit()
+        # The job is lost, e.g. with the process that queued it.
+        self.app.extensions["job_queue"]["queue"].queue.clear()
+        job_queue.drain()
+        self.assertIsNone(JacketModel.query.get(jacket["id"]).thumbnails)
+
+        self.make_due(jacket["id"])
+        job_queue.drain()
+        swept = JacketModel.query.get(jacket["id"])
+        self.assertEqual(sorted(swept.thumbnails), ["jpeg", "webp"])
+        self.assertIsNone(swept.thumbnails_due)
+
+    def test_failed_thumbnails_are_tried_again_later(self):
+        # Not an image: the job gives up, and so does every try of the sweep.
+        jacket = self.client.post("/jacket", headers=self.headers, json=self.jacket_data(self.upload())).json
+        self.run_jobs()
+        self.make_due(jacket["id"])
+
+        with patch.object(ThumbnailManager, "generate", wraps=ThumbnailManager.generate) as generate:
+            job_queue.drain()
+        self.assertEqual(generate.call_count, 1)
+        failed = JacketModel.query.get(jacket["id"])
+        self.assertIsNone(failed.thumbnails)
+        self.assertGreater(failed.thumbnails_due, datetime.utcnow() + timedelta(minutes=1))
+
+    def test_photo_is_kept_when_delete_rolls_back(self):
+        jacket = self.client.post("/jacket", headers=self.headers, json=self.jacket_data(self.upload())).json
+        self.run_jobs()
+
+        self.assert200(self.client.delete(f"/jacket/{jacket['id']}", headers=self.headers))
+        db.session.rollback()
+        job_queue.drain()
+
+        self.assertEqual(len(self.stored_photos()), 1)
+        self.assertIsNotNone(JacketModel.query.get(jacket["id"]))
+
+    def test_failed_photo_delete_is_retried(self):
+        jacket = self.client.post("/jacket", headers=self.headers, json=self.jacket_data(self.upload())).json
+        self.run_jobs()
+        self.assert200(self.client.delete(f"/jacket/{jacket['id']}", headers=self.headers))
+
+        delete_photo = S3Service.delete_photo
+        attempts = []
+
+        def flaky_delete_photo(s3, key):
+            attempts.append(key)
+            if len(attempts) == 1:
+                raise InternalServerError("S3 is not available at the moment")
+            delete_photo(s3, key)
+
+        with patch.object(S3Service, "delete_photo", flaky_delete_photo):
+            self.run_jobs()
+
+        self.assertEqual(len(attempts), 2)
+        self.assertEqual(self.stored_photos(), [])
+
+    def test_client_is_shared(self):
+        self.assertIs(S3Service().s3, S3Service().s3)
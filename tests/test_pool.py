@@ -0,0 +1,19 @@
+import sqlite3
+from unittest import TestCase
+from unittest.mock import patch
+
+from services.pool import MeteredQueuePool
+
+
+class TestMeteredQueuePool(TestCase):
+    def test_retried_checkout_is_counted_once(self):
+        pool = MeteredQueuePool(lambda: sqlite3.connect(":memory:"), pool_size=1, max_overflow=1)
+
+        # Another thread took the overflow slot first, so QueuePool tries again with a nested _do_get.
+        with patch.object(pool, "_inc_overflow", side_effect=[False, True]):
+            connection = pool.connect()
+        connection.close()
+
+        stats = pool.stats()
+        self.assertEqual((stats["checkouts"], stats["timeouts"]), (1, 0))
+        pool.dispose()
@@ -0,0 +1,138 @@
+import json
+import os
+import tempfile
+from unittest.mock import patch
+
+from flask_testing import TestCase
+from sqlalchemy import select, update
+
+from config import TestConfig, create_app
+from db import db
+from models import JacketModel, ShoppingCartModel, UserModel
+from services.replicas import replica_router
+from services.s3 import S3Service
+from tests.factories import CreatorFactory
+from tests.helpers import generate_token, sample_pic_of_cat, mock_photo_storage
+
+REPLICA_PATH = os.path.join(tempfile.gettempdir(), "jacket_store_replica.db")
+
+
+class ReplicaTestConfig(TestConfig):
+    # Nothing replicates to it: tests copy rows over with replicate() to play the part of replication.
+    SQLALCHEMY_BINDS = {"replica_0": f"sqlite:///{REPLICA_PATH}"}
+    # One process, so the in-process cache can track sticky users.
+    DB_REPLICA_STICKY_LOCAL = True
+
+
+class TestReplicas(TestCase):
+    def create_app(self):
+        return create_app(ReplicaTestConfig)
+
+    def setUp(self):
+        db.init_app(self.app)
+        db.create_all()
+        self.replica = db.get_engine(self.app, bind="replica_0")
+        db.Model.metadata.create_all(self.replica)
+        mock_photo_storage(self)
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        # Close the pool's connections, each test app has its own.
+        db.engine.dispose()
+        db.Model.metadata.drop_all(self.replica)
+        self.replica.dispose()
+        os.remove(REPLICA_PATH)
+
+    def replicate(self, *tables):
+        with self.replica.begin() as replica:
+            for table in tables:
+                replica.execute(table.delete())
+                rows = [dict(row._mapping) for row in db.session.execute(select(table))]
+                if rows:
+                    replica.execute(table.insert(), rows)
+
+    @staticmethod
+    def headers_for(user):
+        return {"Authorization": f"Bearer {generate_token(user)}", "Content-Type": "application/json"}
+
+    @patch.object(S3Service, "upload_photo", return_value="some.s3.url")
+    def create_jacket(self, creator, mock_upload_photo):
+        data = {"photo": sample_pic_of_cat, "extension": "jpg", "brand": "Marccain",
+                "description": "This is a great jacket!", "size": "l", "price": 100}
+        resp = self.client.post("/jacket", headers=self.headers_for(creator), json=data)
+        self.assertStatus(resp, 201)
+        db.session.commit()
+        return resp.json
+
+    def test_replicas_require_a_shared_cache(self):
+        class SeveralProcessesConfig(ReplicaTestConfig):
+            DB_REPLICA_STICKY_LOCAL = False
+
+        with self.assertRaises(RuntimeError):
+            create_app(SeveralProcessesConfig)
+
+    def test_reads_are_routed_to_the_replica(self):
+        with self.app.test_request_context():
+            db.session.info["replica"] = "replica_0"
+            try:
+                self.assertIs(db.session.get_bind(clause=select(JacketModel)), self.replica)
+                # Locking reads and writes stay on the primary.
+                self.assertIs(db.session.get_bind(clause=select(JacketModel).with_for_update()), db.engine)
+                self.assertIs(db.session.get_bind(clause=update(JacketModel).values(price=1)), db.engine)
+                # So does everything after the session wrote, to read its own writes.
+                db.session.execute(update(JacketModel).values(price=1))
+                self.assertIs(db.session.get_bind(clause=select(JacketModel)), db.engine)
+            finally:
+                db.session.info.pop("replica")
+                db.session.rollback()
+
+    def test_catalog_is_read_from_the_replica(self):
+        creator = CreatorFactory()
+        reader = CreatorFactory()
+        jacket = self.create_jacket(creator)
+
+        # Not replicated yet: the replica does not have the jacket.
+        self.assertEqual(self.client.get("/jacket", headers=self.headers_for(reader)).json, "No jackets yet")
+
+        self.replicate(UserModel.__table__, JacketModel.__table__, db.Model.metadata.tables["catalog_version"])
+        resp = self.client.get("/jacket", headers=self.headers_for(reader))
+        self.assertEqual([item["id"] for item in resp.json], [jacket["id"]])
+
+    def test_streamed_catalog_is_read_from_the_replica(self):
+        creator = CreatorFactory()
+        reader = CreatorFactory()
+        jacket = self.create_jacket(creator)
+        self.replicate(UserModel.__table__)
+
+        # The response body is read after the handler has returned, and still comes from the replica, which does not
+        # have the jacket yet.
+        resp = self.client.get("/jacket?stream=true", headers=self.headers_for(reader))
+        self.assert200(resp)
+        self.assertEqual(resp.get_data(as_text=True), "")
+
+        self.replicate(JacketModel.__table__)
+        resp = self.client.get("/jacket?stream=true", headers=self.headers_for(reader))
+        self.assertEqual([json.loads(line)["id"] for line in resp.get_data(as_text=True).splitlines()], [jacket["id"]])
+
+    def test_writer_reads_own_writes_from_the_primary(self):
+        creator = CreatorFactory()
+        buyer = CreatorFactory()
+        jacket = self.create_jacket(creator)
+        headers = self.headers_for(buyer)
+        # The buyer's empty cart is all the replica has.
+        self.client.get("/shopping_cart", headers=headers)
+        db.session.commit()
+        self.replicate(UserModel.__table__, JacketModel.__table__, ShoppingCartModel.__table__)
+
+        self.assert200(self.client.put("/shopping_cart", headers=headers, json={"jacket_id": jacket["id"]}))
+        db.session.commit()
+
+        # The buyer just wrote, so their cart is read from the primary, not the stale replica.
+        resp = self.client.get("/shopping_cart", headers=headers)
+        self.assertEqual([item["id"] for item in resp.json["jackets"]], [jacket["id"]])
+
+        # Once the sticky window is over, reads go back to the replica.
+        self.app.extensions["response_cache"]["backend"].delete(replica_router._sticky_key(buyer.id))
+        resp = self.client.get("/shopping_cart", headers=headers)
+        self.assertEqual(resp.json, {"message": "Your shopping cart is empty"})
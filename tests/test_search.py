@@ -0,0 +1,35 @@
+from unittest import TestCase
+
+from utils.search import InvertedIndex, tokenize
+
+
+class TestInvertedIndex(TestCase):
+    def setUp(self):
+        self.index = InvertedIndex()
+        self.index.add(1, "marccain", 2.0)
+        self.index.add(1, "Warm leather jacket, pairs well with an armani scarf")
+        self.index.add(2, "armani", 2.0)
+        self.index.add(2, "Light leather jacket for the summer")
+        self.index.add(3, "gucci", 2.0)
+        self.index.add(3, "Wool coat")
+
+    def test_all_terms_must_match(self):
+        self.assertEqual(self.index.search("leather coat"), [])
+        self.assertEqual(self.index.search("wool coat"), [3])
+
+    def test_weighted_matches_rank_first(self):
+        self.assertEqual(self.index.search("Armani leather"), [2, 1])
+
+    def test_limit_and_empty_query(self):
+        self.assertEqual(self.index.search("leather", limit=1), [1])
+        self.assertEqual(self.index.search("  "), [])
+
+    def test_words_match_their_other_forms(self):
+        # Like the english configuration of the Postgres index.
+        self.assertEqual(self.index.search("jackets"), [1, 2])
+        self.assertEqual(self.index.search("coats"), [3])
+        self.assertEqual(tokenize("Lined jackets, quilted lining"), ["line", "jacket", "quilt", "line"])
+
+    def test_stop_words_are_ignored(self):
+        self.assertEqual(self.index.search("a jacket for the summer"), [2])
+        self.assertEqual(self.index.search("the"), [])
@@ -0,0 +1,55 @@
+import json
+from datetime import datetime
+from unittest import TestCase
+
+from marshmallow import Schema, fields, post_dump
+
+from models import JacketModel, JacketSizes, ShoppingCartModel
+from schemas.compiled import CompiledSchema
+from schemas.responses.jacket import JacketSchemaResponse, jacket_serializer
+from schemas.responses.shopping_cart import ShoppingCartSchemaResponse, shopping_cart_serializer
+
+
+def make_jacket(number, **kwargs):
+    data = dict(id=number, photo_url=f"https://example.com/{number}.jpg", brand="Marccain",
+                description="This is a great jacket!", size=list(JacketSizes)[number % len(JacketSizes)],
+                price=100 + number, created_on=datetime(2023, 5, 1, 12, 30, number % 60, number * 7 % 1000000),
+                thumbnails={"webp": {"320": f"https://example.com/{number}-320.webp"}})
+    data.update(kwargs)
+    return JacketModel(**data)
+
+
+class TestCompiledSchema(TestCase):
+    def assert_same_dump(self, serializer, schema, obj, many=False):
+        # Same values, same key order, so the same bytes once encoded.
+        self.assertEqual(json.dumps(serializer.dump(obj, many=many)), json.dumps(schema.dump(obj, many=many)))
+
+    def test_jacket_dump_is_identical(self):
+        jackets = [make_jacket(number) for number in range(1, 20)]
+        jackets.append(make_jacket(20, thumbnails=None, created_on=None, description="Ünïcode ✓"))
+        jackets.append(make_jacket(21, thumbnails={"jpeg": {}, "webp": {"640": None}}))
+
+        self.assert_same_dump(jacket_serializer, JacketSchemaResponse(), jackets, many=True)
+        for jacket in jackets:
+            self.assert_same_dump(jacket_serializer, JacketSchemaResponse(), jacket)
+
+    def test_shopping_cart_dump_is_identical(self):
+        for jackets in ([], [make_jacket(1)], [make_jacket(number) for number in range(1, 10)]):
+            shopping_cart = ShoppingCartModel(id=3, user_id=5, amount=sum(jacket.price for jacket in jackets))
+            shopping_cart.jackets = jackets
+            self.assert_same_dump(shopping_cart_serializer, ShoppingCartSchemaResponse(), shopping_cart)
+
+    def test_falls_back_to_marshmallow(self):
+        class LabelledSchema(Schema):
+            id = fields.Integer()
+            label = fields.Function(lambda obj: f"{obj.brand} {obj.size.value}")
+            price = fields.Float(data_key="cost")
+
+        class HookedSchema(LabelledSchema):
+            @post_dump
+            def shout(self, data, **kwargs):
+                return {key.upper(): value for key, value in data.items()}
+
+        jackets = [make_jacket(number) for number in range(1, 5)]
+        for schema in (LabelledSchema(), HookedSchema()):
+            self.assert_same_dump(CompiledSchema(schema), schema, jackets, many=True)
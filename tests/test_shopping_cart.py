@@ -1,14 +1,22 @@
-from unittest.mock import patch
+import threading
+from datetime import datetime, timedelta
+from unittest.mock import ANY, patch
 
 from flask_testing import TestCase
+from requests import Response, Session
+from requests.exceptions import Timeout
 
 from config import create_app
 from db import db
-from managers.shopping_cart import ShoppingCartManager
-from models import TransactionModel, ShoppingCartModel
+from managers.order import OrderManager
+from managers.thumbnail import ThumbnailManager
+from models import TransactionModel, ShoppingCartModel, WiseRecipientModel, JacketModel, JacketStatus, OrderModel, \
+    OrderStatus
+from services.jobs import job_queue
 from services.s3 import S3Service
+from services.wise import WiseService
 from tests.factories import CreatorFactory
-from tests.helpers import generate_token, sample_pic_of_cat
+from tests.helpers import generate_token, sample_pic_of_cat, QueryRecorder, mock_photo_storage
 
 
 class TestShoppingCart(TestCase):
@@ -21,11 +29,18 @@ class TestShoppingCart(TestCase):
         # Set up the test database
         db.init_app(self.app)
         db.create_all()
+        # Checkout tests run the job queue, which would also try to make thumbnails from the (mocked) photos.
+        thumbnails = patch.object(ThumbnailManager, "generate")
+        thumbnails.start()
+        self.addCleanup(thumbnails.stop)
+        mock_photo_storage(self)
 
     def tearDown(self):
         # Clean up the test database
         db.session.remove()
         db.drop_all()
+        # Close the pool's connections, each test app has its own.
+        db.engine.dispose()
 
     def test_get_jackets_from_shopping_cart_when_empty(self):
         user = CreatorFactory()
@@ -290,8 +305,9 @@ class TestShoppingCart(TestCase):
         self.assertEquals(resp.json, expected_response)
 
     @patch.object(S3Service, "upload_photo", return_value="some.s3.url")
+    @patch.object(WiseService, "_get_profile_id", return_value=100)
     @patch.object(
-        ShoppingCartManager,
+        OrderManager,
         "issue_transaction",
         return_value={
             "quote_id": "11-22",
@@ -302,7 +318,7 @@ class TestShoppingCart(TestCase):
             "shopping_cart_id": 1,
         },
     )
-    def test_cart_checkout_happy_case(self, mocked_transaction, mock_upload_photo):
+    def test_cart_checkout_happy_case(self, mocked_transaction, mock_profile_id, mock_upload_photo):
         data_jacket = {
             "photo": sample_pic_of_cat,
             "extension": "jpg",
@@ -337,24 +353,191 @@ class TestShoppingCart(TestCase):
 
         resp = self.client.post(self.url, headers=headers)
 
-        assert resp.status_code == 200
+        assert resp.status_code == 202
         resp = resp.json
+        order_id = resp["order_id"]
 
         expected_resp = {
-            "message": "Purchase successful"
+            "message": "Order placed",
+            "order_id": order_id,
+            "status": "pending"
         }
         assert resp == expected_resp
 
+        # The payouts are made by a background job once the order is committed.
+        mocked_transaction.assert_not_called()
+        db.session.commit()
+        job_queue.drain()
+
         mocked_transaction.assert_called_once_with(
-            user,
+            ANY,
             cart_amount,
             f"{user.first_name} {user.last_name}",
             user.iban,
             cart.id,
+            None,
+            ANY,
         )
+        self.assertEqual(mocked_transaction.call_args.args[0].profile_id, 100)
 
         transactions = TransactionModel.query.all()
         assert len(transactions) == 1
+        assert transactions[0].order_id == order_id
+
+        resp = self.client.get(f"/orders/{order_id}", headers=headers)
+        self.assert200(resp)
+        self.assertEqual(resp.json["status"], "completed")
+        self.assertEqual(resp.json["jacket_ids"], [1])
+        self.assertEqual(JacketModel.query.get(1).status, JacketStatus.sold)
+
+    @patch.object(S3Service, "upload_photo", return_value="some.s3.url")
+    def test_get_shopping_cart_conditional_get(self, mock_upload_photo):
+        data_jacket = {
+            "photo": sample_pic_of_cat,
+            "extension": "jpg",
+            "brand": "Marccain",
+            "description": "This is a great jacket!",
+            "size": "l",
+            "price": 100
+        }
+
+        user = CreatorFactory()
+        token = generate_token(user)
+        headers = {
+            "Authorization": f"Bearer {token}",
+            "Content-Type": "application/json",
+        }
+
+        self.client.post("/jacket", headers=headers, json=data_jacket)
+
+        resp = self.client.get(self.url, headers=headers)
+        etag = resp.headers["ETag"]
+
+        resp = self.client.get(self.url, headers={**headers, "If-None-Match": etag})
+        self.assertStatus(resp, 304)
+
+        self.client.put(self.url, headers=headers, json={"jacket_id": 1})
+
+        resp = self.client.get(self.url, headers={**headers, "If-None-Match": etag})
+        self.assert200(resp)
+        self.assertEqual(len(resp.json["jackets"]), 1)
+
+        resp = self.client.get(self.url, headers={**headers, "If-None-Match": resp.headers["ETag"]})
+        self.assertStatus(resp, 304)
+
+    @patch.object(S3Service, "upload_photo", return_value="some.s3.url")
+    def test_shopping_cart_etag_changes_with_its_jackets(self, mock_upload_photo):
+        creator = CreatorFactory()
+        buyer = CreatorFactory()
+        jackets = [self.create_jacket(creator, price) for price in (10, 20)]
+        self.client.put(f"{self.url}/jackets", headers=self.headers_for(buyer),
+                        json={"jacket_ids": [jacket["id"] for jacket in jackets]})
+        etag = self.client.get(self.url, headers=self.headers_for(buyer)).headers["ETag"]
+
+        data = {"photo": sample_pic_of_cat, "extension": "jpg", "brand": "Armani", "description": "Changed",
+                "size": "l", "price": 10}
+        self.assert200(self.client.put(f"/jacket/{jackets[0]['id']}", headers=self.headers_for(creator), json=data))
+        resp = self.client.get(self.url, headers={**self.headers_for(buyer), "If-None-Match": etag})
+        self.assert200(resp)
+        self.assertEqual([jacket["brand"] for jacket in resp.json["jackets"]], ["Armani", "Marccain"])
+
+        etag = resp.headers["ETag"]
+        self.assert200(self.client.delete(f"/jacket/{jackets[1]['id']}", headers=self.headers_for(creator)))
+        resp = self.client.get(self.url, headers={**self.headers_for(buyer), "If-None-Match": etag})
+        self.assert200(resp)
+        self.assertEqual(resp.json["amount"], 10)
+
+    @patch.object(S3Service, "upload_photo", return_value="some.s3.url")
+    def test_get_shopping_cart_query_count_does_not_grow_with_cart(self, mock_upload_photo):
+        buyer = CreatorFactory()
+        creator = CreatorFactory()
+        headers = self.headers_for(buyer)
+        statement_counts = []
+        for _ in range(3):
+            jacket = self.create_jacket(db.session.merge(creator), 10)
+            self.client.put(self.url, headers=headers, json={"jacket_id": jacket["id"]})
+            db.session.commit()
+            db.session.expunge_all()
+
+            with QueryRecorder() as queries:
+                resp = self.client.get(self.url, headers=headers)
+            self.assert200(resp)
+            self.assertEqual(len(resp.json["jackets"]), len(statement_counts) + 1)
+            statement_counts.append(len(queries.statements))
+
+        # The cart and its jackets are read together, in one statement however many jackets there are.
+        self.assertEqual(statement_counts, [1, 1, 1])
+
+    @patch.object(S3Service, "upload_photo", return_value="some.s3.url")
+    def test_cart_edits_are_single_statements(self, mock_upload_photo):
+        buyer = CreatorFactory()
+        creator = CreatorFactory()
+        headers = self.headers_for(buyer)
+        jacket_ids = [self.create_jacket(creator, price)["id"] for price in (10, 20, 30, 40)]
+        for jacket_id in jacket_ids[:3]:
+            self.assert200(self.client.put(self.url, headers=headers, json={"jacket_id": jacket_id}))
+
+        for method, jacket_id, expected_status, expected_amount in (
+            ("put", jacket_ids[3], 200, 100),
+            ("put", jacket_ids[3], 404, 100),
+            ("delete", jacket_ids[0], 200, 90),
+            ("delete", jacket_ids[0], 404, 90),
+        ):
+            with QueryRecorder() as queries:
+                resp = getattr(self.client, method)(self.url, headers=headers, json={"jacket_id": jacket_id})
+            self.assertStatus(resp, expected_status)
+            # Finding the cart, the edit itself, and reading the cart back for the response.
+            self.assertLessEqual(len(queries.statements), 3)
+            self.assertEqual(len([statement for statement in queries.statements if "shopping_cart_jackets" in statement
+                                  and not statement.startswith("SELECT")]), 1)
+            self.assertEqual(ShoppingCartModel.query.filter_by(user_id=buyer.id).one().amount, expected_amount)
+
+    @patch.object(S3Service, "upload_photo", return_value="some.s3.url")
+    def test_bulk_add_and_remove_jackets(self, mock_upload_photo):
+        buyer = CreatorFactory()
+        other_buyer = CreatorFactory()
+        creator = CreatorFactory()
+        headers = self.headers_for(buyer)
+        jacket_ids = [self.create_jacket(creator, price)["id"] for price in (10, 20, 30, 40)]
+        self.client.put(self.url, headers=headers, json={"jacket_id": jacket_ids[0]})
+        # Checked out by someone else, so no longer available.
+        self.client.put(self.url, headers=self.headers_for(other_buyer), json={"jacket_id": jacket_ids[3]})
+        self.assertStatus(self.client.post(self.url, headers=self.headers_for(other_buyer)), 202)
+
+        with QueryRecorder() as queries:
+            resp = self.client.put(f"{self.url}/jackets", headers=headers,
+                                   json={"jacket_ids": [jacket_ids[0], jacket_ids[1], jacket_ids[2], jacket_ids[3], 999]})
+        self.assert200(resp)
+        self.assertEqual(resp.json["results"], [
+            {"jacket_id": jacket_ids[0], "status": "already_in_cart"},
+            {"jacket_id": jacket_ids[1], "status": "added"},
+            {"jacket_id": jacket_ids[2], "status": "added"},
+            {"jacket_id": jacket_ids[3], "status": "not_available"},
+            {"jacket_id": 999, "status": "not_available"},
+        ])
+        self.assertEqual(resp.json["amount"], 60)
+        self.assertEqual(sorted(jacket["id"] for jacket in resp.json["jackets"]), jacket_ids[:3])
+        # Finding the cart, the one statement adding every jacket, and reading the cart back.
+        self.assertEqual(len(queries.statements), 3)
+
+        resp = self.client.delete(f"{self.url}/jackets", headers=headers,
+                                  json={"jacket_ids": [jacket_ids[1], jacket_ids[3], jacket_ids[1]]})
+        self.assert200(resp)
+        self.assertEqual(resp.json["results"], [
+            {"jacket_id": jacket_ids[1], "status": "removed"},
+            {"jacket_id": jacket_ids[3], "status": "not_in_cart"},
+        ])
+        self.assertEqual(resp.json["amount"], 40)
+        self.assertEqual(ShoppingCartModel.query.filter_by(user_id=buyer.id).one().amount, 40)
+
+    def test_bulk_cart_edit_validates_jacket_ids(self):
+        headers = self.headers_for(CreatorFactory())
+        resp = self.client.put(f"{self.url}/jackets", headers=headers, json={"jacket_ids": []})
+        self.assert400(resp)
+        self.assertEqual(resp.json, {"message": {"jacket_ids": ["Length must be between 1 and 100."]}})
+
+        resp = self.client.delete(f"{self.url}/jackets", headers=headers, json={"jacket_ids": list(range(101))})
+        self.assert400(resp)
 
     def test_cart_checkout_empty_cart_purchase_failed(self):
         user = CreatorFactory()
@@ -384,3 +567,275 @@ class TestShoppingCart(TestCase):
 
         transactions = TransactionModel.query.all()
         assert len(transactions) == 0
+
+    @staticmethod
+    def headers_for(user):
+        return {
+            "Authorization": f"Bearer {generate_token(user)}",
+            "Content-Type": "application/json",
+        }
+
+    def create_jacket(self, creator, price):
+        data_jacket = {
+            "photo": sample_pic_of_cat,
+            "extension": "jpg",
+            "brand": "Marccain",
+            "description": "This is a great jacket!",
+            "size": "l",
+            "price": price
+        }
+        return self.client.post("/jacket", headers=self.headers_for(creator), json=data_jacket).json
+
+    def checkout(self, buyer):
+        resp = self.client.post(self.url, headers=self.headers_for(buyer))
+        self.assertStatus(resp, 202)
+        db.session.commit()
+        job_queue.drain()
+        return self.client.get(f"/orders/{resp.json['order_id']}", headers=self.headers_for(buyer)).json
+
+    @staticmethod
+    def fake_transaction(wise, amount, full_name, iban, shopping_cart_id, recipient_id, payout_id):
+        return {
+            "quote_id": f"quote-{amount}",
+            "recipient_id": amount,
+            "transfer_id": f"transfer-{amount}",
+            "target_account_id": payout_id,
+            "amount": amount,
+            "shopping_cart_id": shopping_cart_id,
+        }
+
+    @patch.object(S3Service, "upload_photo", return_value="some.s3.url")
+    @patch.object(WiseService, "_get_profile_id", return_value=100)
+    def test_cart_checkout_sends_payouts_concurrently(self, mock_profile_id, mock_upload_photo):
+        buyer = CreatorFactory()
+        for price in (10, 20, 30):
+            jacket = self.create_jacket(CreatorFactory(), price)
+            self.client.put(self.url, headers=self.headers_for(buyer), json={"jacket_id": jacket["id"]})
+
+        # Every payout waits for the others, so this only completes when all three run at the same time.
+        barrier = threading.Barrier(3, timeout=5)
+
+        def issue_transaction(*args):
+            barrier.wait()
+            return self.fake_transaction(*args)
+
+        with patch.object(OrderManager, "issue_transaction", side_effect=issue_transaction):
+            order = self.checkout(buyer)
+
+        self.assertEqual(order["status"], "completed")
+        transactions = TransactionModel.query.order_by(TransactionModel.id).all()
+        self.assertEqual([transaction.amount for transaction in transactions], [10, 20, 30])
+        self.assertEqual([transaction.quote_id for transaction in transactions], ["quote-10", "quote-20", "quote-30"])
+
+    @patch.object(S3Service, "upload_photo", return_value="some.s3.url")
+    @patch.object(WiseService, "_get_profile_id", return_value=100)
+    def test_cart_checkout_failed_payouts_release_jackets(self, mock_profile_id, mock_upload_photo):
+        user = CreatorFactory()
+        jacket_ids = []
+        for price in (10, 20):
+            jacket_ids.append(self.create_jacket(CreatorFactory(), price)["id"])
+            self.client.put(self.url, headers=self.headers_for(user), json={"jacket_id": jacket_ids[-1]})
+
+        with patch.object(OrderManager, "issue_transaction", side_effect=Timeout("Wise timed out")) as mocked:
+            order = self.checkout(user)
+
+        self.assertEqual(order["status"], "failed")
+        self.assertEqual(order["attempts"], self.app.config["JOB_MAX_ATTEMPTS"])
+        self.assertEqual(order["error"], "Wise timed out")
+        self.assertGreaterEqual(mocked.call_count, self.app.config["JOB_MAX_ATTEMPTS"])
+        self.assertEqual(TransactionModel.query.count(), 0)
+        # Back on sale.
+        self.assertEqual({JacketModel.query.get(jacket_id).status for jacket_id in jacket_ids}, {JacketStatus.available})
+        self.assertEqual(len(self.client.get("/jacket", headers=self.headers_for(user)).json), 2)
+
+    @patch.object(S3Service, "upload_photo", return_value="some.s3.url")
+    @patch.object(WiseService, "_get_profile_id", return_value=100)
+    def test_cart_checkout_retry_skips_payouts_already_made(self, mock_profile_id, mock_upload_photo):
+        user = CreatorFactory()
+        for price in (10, 20):
+            jacket = self.create_jacket(CreatorFactory(), price)
+            self.client.put(self.url, headers=self.headers_for(user), json={"jacket_id": jacket["id"]})
+
+        attempts = []
+
+        def issue_transaction(*args):
+            attempts.append(args[1])
+            if args[1] == 20 and attempts.count(20) == 1:
+                raise Timeout("Wise timed out")
+            return self.fake_transaction(*args)
+
+        with patch.object(OrderManager, "issue_transaction", side_effect=issue_transaction):
+            order = self.checkout(user)
+
+        self.assertEqual(order["status"], "completed")
+        self.assertEqual(order["attempts"], 2)
+        self.assertEqual(sorted(attempts), [10, 20, 20])
+        transactions = TransactionModel.query.all()
+        self.assertEqual(sorted(transaction.amount for transaction in transactions), [10, 20])
+        # Payout ids are stable per order and creator, so Wise can recognise a retried transfer.
+        self.assertEqual(len({transaction.target_account_id for transaction in transactions}), 2)
+
+    @patch.object(S3Service, "upload_photo", return_value="some.s3.url")
+    @patch.object(WiseService, "_get_profile_id", return_value=100)
+    @patch.object(WiseService, "create_quote", return_value="quote")
+    @patch.object(WiseService, "create_recipient", return_value=555)
+    @patch.object(WiseService, "create_transfer", return_value={"id": 777})
+    def test_cart_checkout_retries_unfunded_transfer(self, mock_transfer, mock_recipient, mock_quote, mock_profile_id,
+                                                     mock_upload_photo):
+        user = CreatorFactory()
+        jacket = self.create_jacket(CreatorFactory(), 100)
+        self.client.put(self.url, headers=self.headers_for(user), json={"jacket_id": jacket["id"]})
+
+        # Wise refuses to fund the transfer the first time, e.g. for a balance that is too low.
+        fundings = []
+
+        def post(url, **kwargs):
+            fundings.append(url)
+            resp = Response()
+            resp.status_code = 422 if len(fundings) == 1 else 200
+            resp._content = b"{}"
+            resp.url = url
+            return resp
+
+        with patch.object(Session, "post", side_effect=post):
+            order = self.checkout(user)
+
+        self.assertEqual(order["status"], "completed")
+        self.assertEqual(order["attempts"], 2)
+        self.assertEqual(len(fundings), 2)
+        self.assertTrue(all(url.endswith("/transfers/777/payments") for url in fundings))
+        # The retry sends the same transfer again, so Wise does not pay twice.
+        self.assertEqual(len({call.args[2] for call in mock_transfer.call_args_list}), 1)
+        self.assertEqual(TransactionModel.query.count(), 1)
+
+    @patch.object(S3Service, "upload_photo", return_value="some.s3.url")
+    @patch.object(WiseService, "_get_profile_id", return_value=100)
+    def test_cart_checkout_pays_each_creator_once(self, mock_profile_id, mock_upload_photo):
+        buyer = CreatorFactory()
+        first_creator = CreatorFactory()
+        second_creator = CreatorFactory()
+        jacket_ids = {}
+        for creator, price in ((first_creator, 10), (second_creator, 20), (first_creator, 30), (first_creator, 5)):
+            jacket = self.create_jacket(creator, price)
+            jacket_ids.setdefault(creator.id, []).append(jacket["id"])
+            self.client.put(self.url, headers=self.headers_for(buyer), json={"jacket_id": jacket["id"]})
+
+        with patch.object(OrderManager, "issue_transaction", side_effect=self.fake_transaction) as mocked:
+            order = self.checkout(buyer)
+
+        self.assertEqual(order["status"], "completed")
+        self.assertEqual(sorted((call.args[1], call.args[3]) for call in mocked.call_args_list),
+                         sorted([(45, first_creator.iban), (20, second_creator.iban)]))
+
+        transactions = TransactionModel.query.order_by(TransactionModel.amount).all()
+        self.assertEqual([transaction.amount for transaction in transactions], [20, 45])
+        self.assertEqual([[jacket.id for jacket in transaction.jackets] for transaction in transactions],
+                         [jacket_ids[second_creator.id], jacket_ids[first_creator.id]])
+        self.assertEqual({JacketModel.query.get(jacket_id).status for ids in jacket_ids.values() for jacket_id in ids},
+                         {JacketStatus.sold})
+
+    @patch.object(S3Service, "upload_photo", return_value="some.s3.url")
+    @patch.object(WiseService, "_get_profile_id", return_value=100)
+    def test_orders_are_processed_without_their_job(self, mock_profile_id, mock_upload_photo):
+        buyers = [CreatorFactory(), CreatorFactory()]
+        for buyer, price in zip(buyers, (10, 20)):
+            jacket = self.create_jacket(CreatorFactory(), price)
+            self.client.put(self.url, headers=self.headers_for(buyer), json={"jacket_id": jacket["id"]})
+        order_ids = [self.client.post(self.url, headers=self.headers_for(buyer)).json["order_id"] for buyer in buyers]
+        db.session.commit()
+
+        # The jobs of both orders are lost, e.g. with the process that queued them, and a worker died while it
+        # held the second one.
+        self.app.extensions["job_queue"]["queue"].queue.clear()
+        stale = OrderModel.query.get(order_ids[1])
+        stale.status = OrderStatus.processing
+        stale.attempts = 1
+        stale.locked_until = datetime.utcnow() - timedelta(seconds=1)
+        db.session.commit()
+
+        with patch.object(OrderManager, "issue_transaction", side_effect=self.fake_transaction):
+            job_queue.drain()
+
+        self.assertEqual([OrderModel.query.get(order_id).status for order_id in order_ids],
+                         [OrderStatus.completed, OrderStatus.completed])
+        self.assertEqual(sorted(transaction.amount for transaction in TransactionModel.query), [10, 20])
+
+    @patch.object(S3Service, "upload_photo", return_value="some.s3.url")
+    def test_cart_checkout_of_reserved_jacket_conflicts(self, mock_upload_photo):
+        creator = CreatorFactory()
+        first_buyer = CreatorFactory()
+        second_buyer = CreatorFactory()
+        jacket = self.create_jacket(creator, 10)
+        for buyer in (first_buyer, second_buyer):
+            self.client.put(self.url, headers=self.headers_for(buyer), json={"jacket_id": jacket["id"]})
+
+        self.assertStatus(self.client.post(self.url, headers=self.headers_for(first_buyer)), 202)
+
+        resp = self.client.post(self.url, headers=self.headers_for(second_buyer))
+        self.assertStatus(resp, 409)
+        self.assertEqual(resp.json, {"message": "Some jackets in your cart are no longer available"})
+        self.assertEqual(len(ShoppingCartModel.query.filter_by(user_id=second_buyer.id).one().jackets), 1)
+        self.assertEqual(self.client.get("/jacket", headers=self.headers_for(creator)).json, "No jackets yet")
+
+    @patch.object(S3Service, "upload_photo", return_value="some.s3.url")
+    def test_reserved_jacket_cannot_be_edited_or_deleted(self, mock_upload_photo):
+        creator = CreatorFactory()
+        buyer = CreatorFactory()
+        jacket = self.create_jacket(creator, 10)
+        self.client.put(self.url, headers=self.headers_for(buyer), json={"jacket_id": jacket["id"]})
+        self.assertStatus(self.client.post(self.url, headers=self.headers_for(buyer)), 202)
+
+        data = {"photo": sample_pic_of_cat, "extension": "jpg", "brand": "Other", "description": "Changed",
+                "size": "l", "price": 10}
+        resp = self.client.put(f"/jacket/{jacket['id']}", headers=self.headers_for(creator), json=data)
+        self.assertStatus(resp, 409)
+        self.assertEqual(resp.json, {"message": "Jackets in an order can no longer be edited"})
+        self.assertEqual(JacketModel.query.get(jacket["id"]).brand, "Marccain")
+        self.assert404(self.client.delete(f"/jacket/{jacket['id']}", headers=self.headers_for(creator)))
+        self.assertEqual(JacketModel.query.get(jacket["id"]).version, 2)
+
+    @patch.object(S3Service, "upload_photo", return_value="some.s3.url")
+    def test_deleted_jacket_leaves_carts(self, mock_upload_photo):
+        creator = CreatorFactory()
+        buyers = [CreatorFactory(), CreatorFactory()]
+        jackets = [self.create_jacket(creator, price) for price in (10, 20)]
+        for buyer in buyers:
+            self.client.put(f"{self.url}/jackets", headers=self.headers_for(buyer),
+                            json={"jacket_ids": [jacket["id"] for jacket in jackets]})
+        versions = {cart.id: cart.version for cart in ShoppingCartModel.query}
+
+        self.assert200(self.client.delete(f"/jacket/{jackets[0]['id']}", headers=self.headers_for(creator)))
+
+        db.session.expire_all()
+        for shopping_cart in ShoppingCartModel.query:
+            self.assertEqual([jacket.id for jacket in shopping_cart.jackets], [jackets[1]["id"]])
+            self.assertEqual(shopping_cart.amount, 20)
+            self.assertGreater(shopping_cart.version, versions[shopping_cart.id])
+
+    def test_get_order_of_another_user_is_not_found(self):
+        resp = self.client.get("/orders/1", headers=self.headers_for(CreatorFactory()))
+        self.assert404(resp)
+        self.assertEqual(resp.json, {"message": "Order not found"})
+
+    @patch.object(S3Service, "upload_photo", return_value="some.s3.url")
+    @patch.object(WiseService, "_get_profile_id", return_value=100)
+    @patch.object(WiseService, "create_quote", return_value="quote")
+    @patch.object(WiseService, "create_recipient", return_value=555)
+    @patch.object(WiseService, "create_transfer", return_value={"id": 777})
+    @patch.object(WiseService, "fund_transfer")
+    def test_repeat_purchase_reuses_wise_recipient(self, mock_fund, mock_transfer, mock_recipient, mock_quote,
+                                                    mock_profile_id, mock_upload_photo):
+        creator = CreatorFactory()
+        buyer = CreatorFactory()
+
+        for _ in range(2):
+            jacket = self.create_jacket(creator, 100)
+            self.client.put(self.url, headers=self.headers_for(buyer), json={"jacket_id": jacket["id"]})
+            self.assertEqual(self.checkout(buyer)["status"], "completed")
+
+        mock_recipient.assert_called_once_with(f"{creator.first_name} {creator.last_name}", creator.iban)
+        self.assertEqual(mock_transfer.call_count, 2)
+        self.assertTrue(all(call.args[0] == 555 for call in mock_transfer.call_args_list))
+
+        recipient = WiseRecipientModel.query.one()
+        self.assertEqual((recipient.profile_id, recipient.iban, recipient.recipient_id), (100, creator.iban, 555))
@@ -0,0 +1,32 @@
+import io
+from unittest import TestCase
+
+from PIL import Image
+
+from services.thumbnails import THUMBNAIL_WIDTHS, make_thumbnails
+
+
+def encode_image(width, height, image_format="JPEG"):
+    buffer = io.BytesIO()
+    Image.new("RGB", (width, height), (200, 30, 30)).save(buffer, image_format)
+    buffer.seek(0)
+    return buffer
+
+
+class TestMakeThumbnails(TestCase):
+    def test_every_width_in_both_formats(self):
+        thumbnails = list(make_thumbnails(encode_image(1200, 900)))
+
+        self.assertEqual(sorted((width, image_format) for width, image_format, _ in thumbnails),
+                         sorted((width, image_format) for width in THUMBNAIL_WIDTHS for image_format in ("webp", "jpeg")))
+        for width, image_format, data in thumbnails:
+            with Image.open(io.BytesIO(data)) as image:
+                self.assertEqual(image.format, {"webp": "WEBP", "jpeg": "JPEG"}[image_format])
+                self.assertEqual(image.size, (width, round(900 * width / 1200)))
+
+    def test_small_photo_is_not_upscaled(self):
+        thumbnails = list(make_thumbnails(encode_image(250, 100, "PNG")))
+
+        self.assertEqual(sorted({width for width, _, _ in thumbnails}), [160, 320])
+        sizes = {width: Image.open(io.BytesIO(data)).size for width, _, data in thumbnails}
+        self.assertEqual(sizes, {320: (250, 100), 160: (160, 64)})
@@ -0,0 +1,27 @@
+import uuid
+from unittest import TestCase
+from unittest.mock import patch
+
+from services.wise import WiseService, get_session
+
+
+class TestWiseService(TestCase):
+    @patch.object(WiseService, "_get_profile_id", return_value=100)
+    def test_profile_id_is_fetched_once_per_token(self, mock_profile_id):
+        token = str(uuid.uuid4())
+
+        self.assertEqual(WiseService(token).profile_id, 100)
+        self.assertEqual(WiseService(token).profile_id, 100)
+        mock_profile_id.assert_called_once()
+
+        WiseService(str(uuid.uuid4()))
+        self.assertEqual(mock_profile_id.call_count, 2)
+
+    @patch.object(WiseService, "_get_profile_id", return_value=100)
+    def test_services_share_a_pooled_session(self, mock_profile_id):
+        first = WiseService(str(uuid.uuid4()))
+        second = WiseService(str(uuid.uuid4()))
+
+        self.assertIs(first.session, second.session)
+        self.assertIs(first.session, get_session())
+        self.assertEqual(get_session().get_adapter("https://api.transferwise.com")._pool_maxsize, 16)
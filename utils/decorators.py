@@ -1,25 +1,24 @@
-from flask import request
+from flask import g, request
+from marshmallow import ValidationError
 from werkzeug.exceptions import BadRequest, Forbidden
 
 from managers.auth import auth
-from models import JacketSizes
+from services.replicas import replica_router
 
 
 def validate_schema(schema_name):
     def decorated_function(func):
+        # One schema per endpoint, reused by every request.
+        schema = schema_name()
+
         def wrapper(*args, **kwargs):
-            data = request.get_json()
-            # I get a string value in JSON that I have to turn into an enum object, so I do this here.
-            # I am not sure that this is the right way to do this. The way I imagine it is that the front end will have
-            # a drop-down menu where you select one of the size options, so a non-valid size would never be sent.
-            if 'size' in data:
-                size = JacketSizes[data["size"]]
-                data["size"] = size
-            schema = schema_name()
-            errors = schema.validate(data)
-            if not errors:
-                return func(*args, **kwargs)
-            raise BadRequest(errors)
+            # Loading validates and converts in one pass, e.g. the size name to a JacketSizes member. Handlers read
+            # the loaded data from g.request_data instead of the raw JSON.
+            try:
+                g.request_data = schema.load(request.get_json())
+            except ValidationError as err:
+                raise BadRequest(err.messages)
+            return func(*args, **kwargs)
 
         return wrapper
 
@@ -37,3 +36,14 @@ def permission_required(role):
         return wrapper
 
     return decorated_function
+
+
+def read_replica(func):
+    # For read-only handlers, after login_required: their plain reads go to a read replica when there is one, unless
+    # the user wrote something a moment ago. Writes in the handler still go to the primary. A streamed response is
+    # read after the handler returns, so its generator routes its reads itself, with replica_router.reads_for.
+    def wrapper(*args, **kwargs):
+        with replica_router.reads_for(auth.current_user()):
+            return func(*args, **kwargs)
+
+    return wrapper
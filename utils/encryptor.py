@@ -1,5 +1,6 @@
 import base64
 import hashlib
+import io
 
 from cryptography.fernet import Fernet
 from decouple import config
@@ -19,19 +20,49 @@ class CryptoHelper:
         return decrypted_data.decode()
 
 
-def decode_file(path, encoded_file):
-    with open(path, "wb") as f:
-        f.write(base64.b64decode(encoded_file.encode("utf-8")))
+class Base64Stream(io.RawIOBase):
+    # Readable file object over a base64 string. It decodes one chunk at a time and hashes the decoded bytes as
+    # they are read, so a photo can be hashed and uploaded in a single pass without a full decoded copy in memory.
+    def __init__(self, encoded, chunk_size=1024 * 1024):
+        self.encoded = encoded
+        # Whole base64 quartets, so every chunk decodes on its own.
+        self.chunk_chars = chunk_size // 3 * 4
+        self.position = 0
+        self.leftover = ""
+        self.pending = memoryview(b"")
+        self.hasher = hashlib.sha256()
 
+    def readable(self):
+        return True
 
-def generate_image_hash(file_path):
-    hasher = hashlib.sha256()
+    def _decode_next_chunk(self):
+        end = self.position + self.chunk_chars
+        # Line breaks are allowed in base64 but would misalign the quartets, so they are dropped first.
+        chunk = self.leftover + "".join(self.encoded[self.position:end].split())
+        self.position = end
+        if self.position < len(self.encoded):
+            split = len(chunk) - len(chunk) % 4
+            chunk, self.leftover = chunk[:split], chunk[split:]
+        else:
+            self.leftover = ""
+        decoded = base64.b64decode(chunk)
+        self.hasher.update(decoded)
+        return memoryview(decoded)
 
-    with open(file_path, 'rb') as file:
-        while True:
-            data = file.read(8192)
-            if not data:
-                break
-            hasher.update(data)
+    def readinto(self, buffer):
+        while not self.pending and (self.position < len(self.encoded) or self.leftover):
+            self.pending = self._decode_next_chunk()
+        size = min(len(buffer), len(self.pending))
+        buffer[:size] = self.pending[:size]
+        self.pending = self.pending[size:]
+        return size
 
-    return hasher.hexdigest()
+    def hexdigest(self):
+        # Whatever the consumer did not read still has to be hashed.
+        while self.read(self.chunk_chars):
+            pass
+        return self.hasher.hexdigest()
+
+
+def hash_base64(encoded):
+    return Base64Stream(encoded).hexdigest()
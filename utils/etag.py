@@ -0,0 +1,20 @@
+import hashlib
+import json
+
+from flask import request, Response
+from werkzeug.http import quote_etag
+
+
+def make_etag(*parts):
+    return hashlib.sha1(json.dumps(parts, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def etag_headers(etag):
+    return {"ETag": quote_etag(etag)}
+
+
+def not_modified(etag):
+    # Returns a 304 response when the client already holds this version, otherwise None.
+    if request.if_none_match.contains(etag):
+        return Response(status=304, headers=etag_headers(etag))
+    return None
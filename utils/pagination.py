@@ -0,0 +1,38 @@
+import base64
+import json
+from datetime import datetime
+
+from werkzeug.exceptions import BadRequest
+
+# Range of the integer columns cursors point into (jacket id and price).
+INT_MIN, INT_MAX = -2 ** 31, 2 ** 31 - 1
+
+
+def _to_json(value):
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def encode_cursor(sort, value, jacket_id):
+    raw = json.dumps([sort, _to_json(value), jacket_id])
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _to_int(value):
+    # Cursors come from the client: a value the integer columns cannot hold would fail in the database instead.
+    if isinstance(value, bool) or not isinstance(value, int) or not INT_MIN <= value <= INT_MAX:
+        raise ValueError(f"Not an integer cursor value: {value!r}")
+    return value
+
+
+def decode_cursor(cursor, sort):
+    try:
+        cursor_sort, value, jacket_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if cursor_sort != sort:
+            raise BadRequest("Cursor does not match the requested sort order")
+        if sort.lstrip("-") == "created_on":
+            value = datetime.fromisoformat(value)
+        else:
+            value = _to_int(value)
+        return value, _to_int(jacket_id)
+    except (ValueError, TypeError):
+        raise BadRequest("Invalid cursor")
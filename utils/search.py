@@ -0,0 +1,88 @@
+import math
+import re
+from collections import defaultdict
+
+TOKEN_RE = re.compile(r"\w+")
+VOWELS = set("aeiouy")
+# The most common words of PostgreSQL's english stop word list, which the full-text index leaves out.
+STOP_WORDS = frozenset("""
+    a about above after again against all am an and any are as at be because been before being below between both
+    but by can did do does doing down during each few for from further had has have having he her here hers herself
+    him himself his how i if in into is it its itself just me more most my myself no nor not now of off on once only
+    or other our ours ourselves out over own same she should so some such than that the their theirs them themselves
+    then there these they this those through to too under until up very was we were what when where which while who
+    whom why will with you your yours yourself yourselves
+""".split())
+
+
+def stem(word):
+    # The first step of the Porter stemmer, the part of what the english configuration does that matters most here:
+    # plurals and -ed/-ing forms ("jackets", "lined", "lining") are indexed and searched as their stem.
+    if word.endswith("sses") or word.endswith("ies"):
+        word = word[:-2]
+    elif word.endswith("s") and not word.endswith("ss") and not word.endswith("us") and len(word) > 3:
+        word = word[:-1]
+
+    if word.endswith("eed"):
+        if len(word) > 4:
+            word = word[:-1]
+    else:
+        for suffix in ("ing", "ed"):
+            base = word[:-len(suffix)]
+            if word.endswith(suffix) and VOWELS & set(base):
+                word = base
+                if word.endswith(("at", "bl", "iz")):
+                    word += "e"
+                elif len(word) > 2 and word[-1] == word[-2] and word[-1] not in "lsz" and word[-1] not in VOWELS:
+                    word = word[:-1]
+                elif _short(word):
+                    word += "e"
+                break
+
+    if word.endswith("y") and len(word) > 2 and VOWELS & set(word[:-1]):
+        word = word[:-1] + "i"
+    return word
+
+
+def _short(word):
+    # One syllable ending consonant-vowel-consonant, like "lin" of "lined": the stem gets its "e" back.
+    pattern = "".join(
+        "v" if letter in "aeiou" or (letter == "y" and i > 0 and word[i - 1] not in "aeiou") else "c"
+        for i, letter in enumerate(word)
+    )
+    return re.fullmatch(r"c*vc", pattern) is not None and word[-1] not in "wxy"
+
+
+def tokenize(text):
+    tokens = (token.lower() for token in TOKEN_RE.findall(text or ""))
+    return [stem(token) for token in tokens if token not in STOP_WORDS]
+
+
+# In-memory stand-in for the PostgreSQL full-text index, used when the database is not Postgres (e.g. SQLite). Words
+# go through tokenize() on both sides, so "jackets" finds "jacket" like it does with the english configuration.
+class InvertedIndex:
+    def __init__(self):
+        self.postings = defaultdict(lambda: defaultdict(float))
+        self.documents = set()
+
+    def add(self, doc_id, text, weight=1.0):
+        self.documents.add(doc_id)
+        for token in tokenize(text):
+            self.postings[token][doc_id] += weight
+
+    def search(self, text, limit=None):
+        terms = set(tokenize(text))
+        if not terms or any(term not in self.postings for term in terms):
+            return []
+
+        # Every term has to match, like websearch_to_tsquery does for plain words.
+        matches = set.intersection(*(set(self.postings[term]) for term in terms))
+        scores = {}
+        for doc_id in matches:
+            scores[doc_id] = sum(
+                self.postings[term][doc_id] * math.log(1 + len(self.documents) / len(self.postings[term]))
+                for term in terms
+            )
+
+        ranked = sorted(scores, key=lambda doc_id: (-scores[doc_id], doc_id))
+        return ranked[:limit] if limit else ranked
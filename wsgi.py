@@ -0,0 +1,6 @@
+# Entry point for production servers, see gunicorn.conf.py.
+import os
+
+os.environ.setdefault("APP_CONFIG", "config.ProductionConfig")
+
+from app import app  # noqa: E402,F401